@@ -59,7 +59,21 @@ const PlayByPlay = ({ gameId }) => {
           console.log("PlayByPlay data received:", data);
           
           // Handle different data structures that might come from the backend
-          if (data.game?.actions) {
+          if (data.type === "actions") {
+            // Incremental update: merge new/edited actions, drop removed ones
+            setActions((previous) => {
+              const byNumber = new Map(
+                previous.map((action) => [action.actionNumber, action])
+              );
+              (data.removed || []).forEach((number) => byNumber.delete(number));
+              data.game.actions.forEach((action) =>
+                byNumber.set(action.actionNumber, action)
+              );
+              return [...byNumber.values()].sort(
+                (a, b) => b.actionNumber - a.actionNumber
+              );
+            });
+          } else if (data.game?.actions) {
             // Original expected format
             const sorted = [...data.game.actions].sort(
               (a, b) => b.actionNumber - a.actionNumber
@@ -3,25 +3,28 @@ import os
 import sys
 from logging.config import fileConfig
 
-from sqlalchemy import engine_from_config
-from sqlalchemy import pool
+from sqlalchemy import engine_from_config, pool
 
 from alembic import context
 
 # Add the parent directory to the Python path
 sys.path.append(os.path.dirname(os.path.dirname(__file__)))
 
+from app.core.config import get_settings
+from app.core.database import Base
+
 # Import your models
-from app.models.players import Player
+from app.models.players import Player, PlayerGameLog
+from app.models.scoreboard import Game
 from app.models.standings import TeamStanding
-from app.core.database import Base
-from app.core.config import get_settings
 
 # This is the Alembic Config object
 config = context.config
 
-# Interpret the config file for Python logging
-fileConfig(config.config_file_name)
+# Interpret the config file for Python logging, unless migrations run
+# in-process from the app (which has already configured logging)
+if config.attributes.get("configure_logger", True):
+    fileConfig(config.config_file_name)
 
 # Set the SQLAlchemy URL in the alembic.ini file
 settings = get_settings()
@@ -30,6 +33,7 @@ config.set_main_option("sqlalchemy.url", str(settings.SQLALCHEMY_DATABASE_URL))
 # Add your model's MetaData object here for 'autogenerate' support
 target_metadata = Base.metadata
 
+
 def run_migrations_offline() -> None:
     """Run migrations in 'offline' mode."""
     url = config.get_main_option("sqlalchemy.url")
@@ -43,6 +47,7 @@ def run_migrations_offline() -> None:
     with context.begin_transaction():
         context.run_migrations()
 
+
 def run_migrations_online() -> None:
     """Run migrations in 'online' mode."""
     connectable = engine_from_config(
@@ -52,13 +57,12 @@ def run_migrations_online() -> None:
     )
 
     with connectable.connect() as connection:
-        context.configure(
-            connection=connection, target_metadata=target_metadata
-        )
+        context.configure(connection=connection, target_metadata=target_metadata)
 
         with context.begin_transaction():
             context.run_migrations()
 
+
 if context.is_offline_mode():
     run_migrations_offline()
 else:
@@ -0,0 +1,79 @@
+"""add player game logs table
+
+Revision ID: 2026_10_18_player_game_logs
+Revises: 2025_02_17_games
+Create Date: 2026-10-18 12:00:00.000000
+
+"""
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "2026_10_18_player_game_logs"
+down_revision = "2025_02_17_games"
+branch_labels = None
+depends_on = None
+
+STAT_COLUMNS = {
+    "pts": sa.Integer,
+    "fgm": sa.Integer,
+    "fga": sa.Integer,
+    "fg_pct": sa.Float,
+    "fg3m": sa.Integer,
+    "fg3a": sa.Integer,
+    "fg3_pct": sa.Float,
+    "ftm": sa.Integer,
+    "fta": sa.Integer,
+    "ft_pct": sa.Float,
+    "oreb": sa.Integer,
+    "dreb": sa.Integer,
+    "reb": sa.Integer,
+    "ast": sa.Integer,
+    "stl": sa.Integer,
+    "blk": sa.Integer,
+    "tov": sa.Integer,
+    "pf": sa.Integer,
+    "plus_minus": sa.Integer,
+}
+
+
+def upgrade() -> None:
+    # Create player game logs table
+    op.create_table(
+        "player_game_logs",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("person_id", sa.Integer(), nullable=False),
+        sa.Column("game_id", sa.String(), nullable=False),
+        sa.Column("game_date", sa.String(), nullable=False),
+        sa.Column("season", sa.String(), nullable=False),
+        sa.Column("season_type", sa.String(), nullable=False),
+        sa.Column("team_abbreviation", sa.String(), nullable=False),
+        sa.Column("matchup", sa.String(), nullable=False),
+        sa.Column("wl", sa.String(), nullable=False),
+        sa.Column("min", sa.Float(), nullable=False),
+        *(
+            sa.Column(name, type_(), nullable=False)
+            for name, type_ in STAT_COLUMNS.items()
+        ),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint("person_id", "game_id", name="uq_player_game_log")
+    )
+
+    # Create indexes
+    op.create_index(
+        "ix_player_game_logs_person_date",
+        "player_game_logs",
+        ["person_id", "game_date"],
+    )
+    op.create_index("ix_player_game_logs_date", "player_game_logs", ["game_date"])
+
+
+def downgrade() -> None:
+    # Drop indexes
+    op.drop_index("ix_player_game_logs_date", table_name="player_game_logs")
+    op.drop_index("ix_player_game_logs_person_date", table_name="player_game_logs")
+
+    # Drop player game logs table
+    op.drop_table("player_game_logs")
@@ -1,10 +1,11 @@
 # app/api/v1/endpoints/__init__.py
 from fastapi import APIRouter
 
-from app.api.v1.endpoints import players, scoreboard, standings
+from app.api.v1.endpoints import admin, players, scoreboard, standings
 
 router = APIRouter()
 
 router.include_router(players.router, prefix="/players", tags=["players"])
 router.include_router(scoreboard.router, prefix="/scoreboard", tags=["scoreboard"])
-router.include_router(standings.router, prefix="/standings", tags=["standings"])
\ No newline at end of file
+router.include_router(standings.router, prefix="/standings", tags=["standings"])
+router.include_router(admin.router, prefix="/admin", tags=["admin"])
@@ -0,0 +1,39 @@
+# app/api/v1/endpoints/admin.py
+from typing import List
+
+from fastapi import APIRouter, HTTPException
+
+from app.schemas.admin import JobStatus, JobTrigger
+from app.services.jobs import scheduler
+
+router = APIRouter()
+
+
+@router.get("/jobs", response_model=List[JobStatus])
+async def list_jobs():
+    """
+    List the scheduled jobs with their status and timing metrics.
+
+    Returns:
+        One entry per job
+    """
+    return scheduler.status()
+
+
+@router.post("/jobs/{name}/run", response_model=JobTrigger)
+async def run_job(name: str):
+    """
+    Start a job run now, in the background.
+
+    Args:
+        name: Job name (see GET /admin/jobs)
+
+    Returns:
+        Whether a run was started (not if one is already in progress)
+
+    Raises:
+        HTTPException: If there is no such job
+    """
+    if name not in scheduler.jobs:
+        raise HTTPException(status_code=404, detail=f"No job named {name}")
+    return JobTrigger(name=name, started=scheduler.trigger(name))
@@ -1,70 +1,199 @@
 # app/api/v1/endpoints/players.py
-from fastapi import APIRouter, Depends, HTTPException, Query
-from sqlalchemy.orm import Session
-from typing import List
+from typing import List, Optional
 
-from app.core.database import get_db
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import get_settings
+from app.core.database import AsyncReadSessionLocal, get_async_db
+from app.schemas.players import Leaderboard, PlayerAverages, PlayerBase, PlayerStats
+from app.services.http_cache import response_cache
 from app.services.players import (
+    data_version,
+    get_league_leaders,
+    get_player_averages,
     get_player_recent_games,
     search_players,
-    update_player_database
+    update_player_database,
 )
-from app.schemas.players import PlayerBase, PlayerStats
+from app.services.stats_engine import LEADER_MODES, STATS
 
 router = APIRouter()
 
+
+def _players_max_age(_) -> float:
+    return get_settings().HTTP_MAX_AGE_PLAYERS
+
+
+def _player_stats_max_age(_) -> float:
+    return get_settings().HTTP_MAX_AGE_PLAYER_STATS
+
+
+# Concurrent requests for the same response share one fetch (response_cache),
+# so each fetch opens its own read session rather than borrowing the session
+# of the request that happened to start it
+
+
 @router.get("/search/", response_model=List[PlayerBase])
 async def search_players_route(
+    request: Request,
     query: str = Query(..., min_length=2),
-    db: Session = Depends(get_db)
+    limit: int = Query(default=25, ge=1, le=100),
 ):
     """
     Search for players by name.
-    
+
     Args:
+        request: Incoming request (for If-None-Match)
         query: Search string (minimum 2 characters)
-        db: Database session
-    
+        limit: Maximum number of results (1-100)
+
     Returns:
-        List of matching players
+        List of matching players, best matches first, from the response
+        cache with an ETag
     """
-    return await search_players(db, query)
+
+    async def fetch():
+        async with AsyncReadSessionLocal() as db:
+            return await search_players(db, query, limit)
+
+    return await response_cache.respond(
+        request, fetch, _players_max_age, version=data_version()
+    )
+
+
+@router.get("/leaders", response_model=Leaderboard)
+async def get_leaders(
+    request: Request,
+    stat: str = Query(default="pts"),
+    mode: str = Query(default="per_game"),
+    limit: int = Query(default=10, ge=1, le=100),
+    min_games: int = Query(default=1, ge=1, le=82),
+    min_attempts: Optional[int] = Query(default=None, ge=0),
+):
+    """
+    Get this season's statistical leaders.
+
+    Args:
+        request: Incoming request (for If-None-Match)
+        stat: Stat to rank by (e.g. pts, reb, ast, fg_pct)
+        mode: "per_game", "per_36" or "total"
+        limit: Number of players to return (1-100)
+        min_games: Minimum games played to qualify (1-82)
+        min_attempts: For fg_pct, fg3_pct and ft_pct, minimum season attempts
+            to qualify (default: LEADERS_MIN_ATTEMPTS)
+
+    Returns:
+        Leaderboard, best first, from the response cache with an ETag
+
+    Raises:
+        HTTPException: If stat or mode is invalid
+    """
+    if stat.lower() not in STATS:
+        raise HTTPException(
+            status_code=400, detail=f"Stat must be one of: {', '.join(STATS)}"
+        )
+    if mode.lower() not in LEADER_MODES:
+        raise HTTPException(
+            status_code=400, detail=f"Mode must be one of: {', '.join(LEADER_MODES)}"
+        )
+
+    async def fetch():
+        async with AsyncReadSessionLocal() as db:
+            return await get_league_leaders(
+                db, stat.lower(), mode.lower(), limit, min_games, min_attempts
+            )
+
+    return await response_cache.respond(
+        request, fetch, _player_stats_max_age, version=data_version()
+    )
+
+
+@router.get("/{player_id}/averages", response_model=PlayerAverages)
+async def get_player_averages_route(
+    player_id: int,
+    request: Request,
+    window: int = Query(default=10, ge=1, le=82),
+    stat: str = Query(default="pts"),
+):
+    """
+    Get a player's season averages, per-36 rates and rolling averages.
+
+    Args:
+        player_id: The NBA person ID of the player
+        request: Incoming request (for If-None-Match)
+        window: Games in the last-N averages and each rolling window (1-82)
+        stat: Stat for the rolling series
+
+    Returns:
+        Player info with season, per-36, last-N and rolling averages, from
+        the response cache with an ETag
+
+    Raises:
+        HTTPException: If stat is invalid or the player has no stored games
+    """
+    if stat.lower() not in STATS:
+        raise HTTPException(
+            status_code=400, detail=f"Stat must be one of: {', '.join(STATS)}"
+        )
+
+    async def fetch():
+        async with AsyncReadSessionLocal() as db:
+            result = await get_player_averages(db, player_id, window, stat.lower())
+        if result is None:
+            raise HTTPException(
+                status_code=404, detail="Player or player games not found"
+            )
+        return result
+
+    return await response_cache.respond(
+        request, fetch, _player_stats_max_age, version=data_version()
+    )
+
 
 @router.get("/{player_id}/games", response_model=PlayerStats)
 async def get_player_games(
     player_id: int,
+    request: Request,
     last_n_games: int = Query(default=10, ge=1, le=82),
-    db: Session = Depends(get_db)
 ):
     """
     Get a player's recent game statistics.
-    
+
     Args:
         player_id: The NBA person ID of the player
+        request: Incoming request (for If-None-Match)
         last_n_games: Number of recent games to return (1-82)
-        db: Database session
-    
+
     Returns:
-        Player info and game statistics
-    
+        Player info and game statistics, from the response cache with an ETag
+
     Raises:
         HTTPException: If player is not found
     """
-    result = await get_player_recent_games(db, player_id, last_n_games)
-    if result is None:
-        raise HTTPException(status_code=404, detail="Player not found")
-    return result
+
+    async def fetch():
+        async with AsyncReadSessionLocal() as db:
+            result = await get_player_recent_games(db, player_id, last_n_games)
+        if result is None:
+            raise HTTPException(status_code=404, detail="Player not found")
+        return result
+
+    return await response_cache.respond(
+        request, fetch, _player_stats_max_age, version=data_version()
+    )
+
 
 @router.post("/update", status_code=200)
-async def update_players(db: Session = Depends(get_db)):
+async def update_players(db: AsyncSession = Depends(get_async_db)):
     """
     Update the players database with current NBA players.
-    
+
     Args:
-        db: Database session
-    
+        db: Async database session
+
     Returns:
-        Success message
+        Success message with inserted/updated/removed/unchanged counts
     """
-    await update_player_database(db)
-    return {"message": "Players database updated successfully"}
\ No newline at end of file
+    counts = await update_player_database(db)
+    return {"message": "Players database updated successfully", **counts}
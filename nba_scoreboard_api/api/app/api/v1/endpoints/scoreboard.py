@@ -1,42 +1,68 @@
 # app/api/v1/endpoints/scoreboard.py
-from fastapi import APIRouter, WebSocket, WebSocketDisconnect, HTTPException, Query
 import asyncio
-from typing import Optional
-from datetime import datetime, timedelta
 import logging
+from datetime import datetime, timedelta
+from typing import Optional
 
+from fastapi import (
+    APIRouter,
+    HTTPException,
+    Query,
+    Request,
+    WebSocket,
+    WebSocketDisconnect,
+)
+
+from app.core.config import get_settings
+from app.core.database import AsyncReadSessionLocal
+from app.schemas.scoreboard import GameBoxScore
+from app.services import games as games_archive
+from app.services.http_cache import NO_STORE, response_cache
+from app.services.scoreboard import get_box_score_fixed  # Import the fixed version
 from app.services.scoreboard import (
-    get_box_score_fixed,  # Import the fixed version 
+    box_score_cache,
+    box_score_ttl,
     get_past_scoreboard,
+    is_placeholder_box_score,
+    playbyplay_manager,
     scoreboard_manager,
-    playbyplay_manager
 )
-from app.schemas.scoreboard import GameBoxScore
 
 router = APIRouter()
 logger = logging.getLogger(__name__)
 
+
 @router.websocket("/ws")
-async def scoreboard_websocket(websocket: WebSocket):
+async def scoreboard_websocket(
+    websocket: WebSocket,
+    version: int = Query(
+        1, ge=1, le=2, description="1=full game list, 2=snapshot + patches"
+    ),
+):
     """
     WebSocket endpoint for live scoreboard updates.
     Streams game scores and status updates to connected clients.
+
+    With ``?version=2`` the client gets a snapshot with a sequence number on
+    connect, then patches holding only the changed fields of changed games.
     """
-    await scoreboard_manager.connect(websocket)
+    await scoreboard_manager.connect(websocket, protocol_version=version)
     try:
         # Send initial scoreboard data
         await scoreboard_manager.send_current_games(websocket)
-        
-        # Keep connection alive and handle client messages
+
+        # Keep connection alive and handle client messages (resync requests)
         while True:
-            await websocket.receive_text()
-            
+            message = await websocket.receive_text()
+            await scoreboard_manager.handle_client_message(websocket, message)
+
     except WebSocketDisconnect:
         await scoreboard_manager.disconnect(websocket)
     except Exception as e:
         logger.error(f"WebSocket error: {e}")
         await scoreboard_manager.disconnect(websocket)
 
+
 @router.websocket("/ws/playbyplay/{game_id}")
 async def playbyplay_websocket(websocket: WebSocket, game_id: str):
     """
@@ -52,42 +78,88 @@ async def playbyplay_websocket(websocket: WebSocket, game_id: str):
         logger.error(f"[PlayByPlay] WebSocket error: {e}")
         await playbyplay_manager.disconnect(websocket, game_id)
 
+
+def _past_games_max_age(date: Optional[str]) -> Optional[float]:
+    """Archived dates never change; the default date (yesterday) moves every day."""
+    if date is not None:
+        try:
+            if games_archive.is_archivable(datetime.strptime(date, "%Y-%m-%d").date()):
+                return None
+        except ValueError:
+            pass
+    return get_settings().HTTP_MAX_AGE_DEFAULT
+
+
 @router.get("/past")
 async def get_past_games(
-    date: Optional[str] = Query(None, description="Date in YYYY-MM-DD format")
+    request: Request,
+    date: Optional[str] = Query(None, description="Date in YYYY-MM-DD format"),
 ):
     """
     Get scoreboard data for past games.
-    
+
+    Finished dates are served from the local game archive after the first fetch.
+
     Args:
+        request: Incoming request (for If-None-Match)
         date: Optional date string (YYYY-MM-DD). Defaults to yesterday if not provided.
-    
+
     Returns:
-        List of game results for the specified date
+        List of game results for the specified date, from the response cache
+        with an ETag (immutable once the date is archived)
     """
+    max_age = _past_games_max_age(date)
     if date is None:
         # Default to yesterday
         date = (datetime.now() - timedelta(days=1)).strftime("%Y-%m-%d")
-    return await get_past_scoreboard(date)
+
+    async def fetch():
+        # Concurrent requests share this fetch, so it opens its own session
+        async with AsyncReadSessionLocal() as db:
+            return await get_past_scoreboard(date, db)
+
+    return await response_cache.respond(request, fetch, lambda _: max_age)
+
+
+def _box_score_max_age(box_score: GameBoxScore) -> Optional[float]:
+    """Box score TTLs, but never cache the stand-in served when NBA.com failed."""
+    if is_placeholder_box_score(box_score):
+        return NO_STORE
+    return box_score_ttl(box_score)
+
 
 @router.get("/boxscore/{game_id}", response_model=GameBoxScore)
-async def get_game_boxscore(game_id: str):
+async def get_game_boxscore(game_id: str, request: Request):
     """
     Get detailed box score for a specific game.
-    
+
     Args:
         game_id: NBA game ID
-    
+        request: Incoming request (for If-None-Match)
+
     Returns:
-        Detailed game statistics including player stats
-    
+        Detailed game statistics including player stats, from the response
+        cache with an ETag (fresh for seconds while live, immutable once final)
+
     Raises:
         HTTPException: If box score is not found
     """
     try:
         # Use the fixed implementation
-        result = await get_box_score_fixed(game_id)
-        return result
+        return await response_cache.respond(
+            request, lambda: get_box_score_fixed(game_id), _box_score_max_age
+        )
     except Exception as e:
         logger.error(f"Error fetching box score: {e}")
-        raise HTTPException(status_code=500, detail=str(e))
\ No newline at end of file
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+@router.get("/boxscore-cache/stats")
+async def get_boxscore_cache_stats():
+    """
+    Get box score cache statistics.
+
+    Returns:
+        Entry count, memory usage and hit/miss/coalesced/eviction counters
+    """
+    return box_score_cache.stats()
@@ -1,97 +1,118 @@
 # app/api/v1/endpoints/standings.py
-from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy.orm import Session
 from typing import List
 
-from app.core.database import get_db
+from fastapi import APIRouter, Depends, HTTPException, Request, Response
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import get_settings
+from app.core.database import get_async_db, get_async_read_db
+from app.schemas.standings import StandingsResponse, StandingsUpdate
+from app.services.http_cache import conditional_response
 from app.services.standings import (
-    get_conference_standings,
-    get_division_standings,
-    update_standings_database
+    StandingsView,
+    standings_store,
+    update_standings_database,
 )
-from app.schemas.standings import StandingsResponse
 
 router = APIRouter()
 
+
+def _standings_response(request: Request, view: StandingsView) -> Response:
+    """Serve a pre-serialized standings view, or 304 if the client's copy is current."""
+    return conditional_response(
+        request,
+        view.body,
+        view.etag,
+        view.last_modified,
+        get_settings().HTTP_MAX_AGE_DEFAULT,
+    )
+
+
 @router.get("/conference/{conference}", response_model=List[StandingsResponse])
 async def get_conference_standings_route(
-    conference: str,
-    db: Session = Depends(get_db)
+    conference: str, request: Request, db: AsyncSession = Depends(get_async_read_db)
 ):
     """
     Get standings for a specific conference (East or West).
-    
+
     Args:
         conference: Conference name ('East' or 'West')
-        db: Database session
-    
+        request: Incoming request (for If-None-Match)
+        db: Async database session
+
     Returns:
-        List of team standings for the specified conference
-    
+        List of team standings for the specified conference, served from the
+        in-memory standings store with an ETag
+
     Raises:
         HTTPException: If conference is invalid or no standings found
     """
-    if conference.lower() not in ['east', 'west']:
+    if conference.lower() not in ["east", "west"]:
         raise HTTPException(
-            status_code=400,
-            detail="Conference must be 'East' or 'West'"
+            status_code=400, detail="Conference must be 'East' or 'West'"
         )
-    
-    standings = await get_conference_standings(db, conference)
-    if not standings:
+
+    await db.run_sync(standings_store.ensure_loaded)
+    view = standings_store.conference(conference)
+    if view is None:
         raise HTTPException(
-            status_code=404,
-            detail=f"No standings found for {conference} conference"
+            status_code=404, detail=f"No standings found for {conference} conference"
         )
-    return standings
+    return _standings_response(request, view)
+
 
 @router.get("/division/{division}", response_model=List[StandingsResponse])
 async def get_division_standings_route(
-    division: str,
-    db: Session = Depends(get_db)
+    division: str, request: Request, db: AsyncSession = Depends(get_async_read_db)
 ):
     """
     Get standings for a specific division.
-    
+
     Args:
         division: Division name (e.g., 'Atlantic', 'Central', etc.)
-        db: Database session
-    
+        request: Incoming request (for If-None-Match)
+        db: Async database session
+
     Returns:
-        List of team standings for the specified division
-    
+        List of team standings for the specified division, served from the
+        in-memory standings store with an ETag
+
     Raises:
         HTTPException: If division is invalid or no standings found
     """
     valid_divisions = [
-        'atlantic', 'central', 'southeast',
-        'northwest', 'pacific', 'southwest'
+        "atlantic",
+        "central",
+        "southeast",
+        "northwest",
+        "pacific",
+        "southwest",
     ]
-    
+
     if division.lower() not in valid_divisions:
         raise HTTPException(
             status_code=400,
-            detail=f"Division must be one of: {', '.join(valid_divisions)}"
+            detail=f"Division must be one of: {', '.join(valid_divisions)}",
         )
-    
-    standings = await get_division_standings(db, division)
-    if not standings:
+
+    await db.run_sync(standings_store.ensure_loaded)
+    view = standings_store.division(division)
+    if view is None:
         raise HTTPException(
-            status_code=404,
-            detail=f"No standings found for {division} division"
+            status_code=404, detail=f"No standings found for {division} division"
         )
-    return standings
+    return _standings_response(request, view)
+
 
-@router.post("/update", status_code=200)
-async def update_standings(db: Session = Depends(get_db)):
+@router.post("/update", status_code=200, response_model=StandingsUpdate)
+async def update_standings(db: AsyncSession = Depends(get_async_db)):
     """
     Update the standings database with current NBA standings.
-    
+
     Args:
-        db: Database session
-    
+        db: Async database session
+
     Returns:
-        Success message
+        Success message with the changed teams and the standings content hash
     """
-    await update_standings_database(db)
-    return {"message": "Standings database updated successfully"}
\ No newline at end of file
+    return await update_standings_database(db)
@@ -1,51 +1,217 @@
 # app/core/config.py
 from functools import lru_cache
-from typing import List, Union
-from pydantic_settings import BaseSettings
 from pathlib import Path
+from typing import Dict, List, Optional, Union
+
+from pydantic_settings import BaseSettings
 
 # Get project root directory and env file path
 PROJECT_ROOT = Path(__file__).parent.parent.parent
 ENV_FILE = PROJECT_ROOT / ".env"
 
+
 class Settings(BaseSettings):
     # API Settings
     API_V1_STR: str = "/api/v1"
     PROJECT_NAME: str = "NBA Scoreboard API"
     VERSION: str = "1.0.0"
     DEBUG: bool = False
-    
+
     # Database
     PROJECT_ROOT: Path = PROJECT_ROOT
     DB_PATH: Path = PROJECT_ROOT / "data" / "nba_players.db"
     SQLALCHEMY_DATABASE_URL: str = f"sqlite:///{DB_PATH}"
-    
+
+    # SQLite storage profile, applied with PRAGMAs on every new connection.
+    # "tuned": WAL journal (readers never wait for a writer), synchronous=NORMAL,
+    # memory-mapped I/O and a larger page cache. "default": SQLite's stock
+    # rollback journal and synchronous=FULL.
+    SQLITE_PROFILE: str = "tuned"
+    SQLITE_MMAP_SIZE: int = 256 * 1024 * 1024  # Bytes ("tuned" only)
+    SQLITE_CACHE_SIZE_KIB: int = 64 * 1024  # Page cache per connection ("tuned" only)
+    SQLITE_BUSY_TIMEOUT_MS: int = (
+        5000  # Wait this long for a lock before "database is locked"
+    )
+
+    # Async (aiosqlite) pools for request handlers. SQLite serializes writers
+    # and each aiosqlite connection owns a thread, so keep the pools small and
+    # make excess requests wait for a connection instead of overflowing.
+    # Reads use a separate pool of query_only connections.
+    ASYNC_DB_POOL_SIZE: int = 2  # Read-write pool (refresh endpoints)
+    ASYNC_DB_READ_POOL_SIZE: int = 4  # Read-only pool (GET endpoints)
+    ASYNC_DB_MAX_OVERFLOW: int = 0
+    ASYNC_DB_POOL_TIMEOUT: float = 10.0  # Seconds to wait for a free connection
+
     # NBA API Settings
     NBA_API_DELAY: float = 1.0  # Delay between NBA API calls
     NBA_SEASON: str = "2024-25"
     NBA_LEAGUE_ID: str = "00"
-    
+
+    # Upstream fetch settings (all nba_api calls run on a bounded worker pool)
+    UPSTREAM_MAX_WORKERS: int = 8  # Worker threads shared by all nba_api calls
+    UPSTREAM_DEFAULT_TIMEOUT: float = 10.0  # Seconds, for endpoints not listed below
+    UPSTREAM_DEFAULT_CONCURRENCY: int = (
+        2  # In-flight calls, for endpoints not listed below
+    )
+    UPSTREAM_TIMEOUTS: Dict[str, float] = {
+        "scoreboard": 5.0,
+        "boxscore": 8.0,
+        "playbyplay": 5.0,
+        "stats": 30.0,
+    }
+    UPSTREAM_CONCURRENCY: Dict[str, int] = {
+        "scoreboard": 1,
+        "boxscore": 4,
+        "playbyplay": 4,
+        "stats": 2,
+    }
+
+    # Upstream source: "live" (NBA.com), "record" (NBA.com, saving responses to
+    # UPSTREAM_RECORDING_PATH) or "replay" (serve a recording, no network)
+    UPSTREAM_SOURCE: str = "live"
+    UPSTREAM_RECORDING_PATH: Path = PROJECT_ROOT / "recordings" / "upstream.jsonl.gz"
+    UPSTREAM_REPLAY_SPEED: float = (
+        1.0  # Recording seconds replayed per wall-clock second
+    )
+    UPSTREAM_REPLAY_START: float = (
+        0.0  # Seconds into the recording to start the replay at
+    )
+    UPSTREAM_REPLAY_LATENCY: bool = False  # Also replay each call's recorded duration
+
     # CORS - Default to allow all
     CORS_ORIGINS_STR: str = "*"
-    
+
     # WebSocket Settings
     WS_UPDATE_INTERVAL: float = 1.0  # Seconds between scoreboard updates
     WS_HEARTBEAT_INTERVAL: float = 30.0  # Seconds between heartbeat messages
-    
+    WS_SEND_QUEUE_SIZE: int = 8  # Pending frames per client before it is evicted
+    WS_SEND_TIMEOUT: float = 5.0  # Seconds a single send may take before eviction
+    WS_PATCH_HISTORY: int = 120  # Patch frames kept for delta-protocol resyncs
+
+    # Play-by-play polling intervals (seconds), picked from the game's scoreboard state
+    PBP_LIVE_INTERVAL: float = 1.0  # Clock running
+    PBP_BREAK_INTERVAL: float = 10.0  # Between periods, halftime, and after errors
+    PBP_PREGAME_INTERVAL: float = 30.0  # Game not started yet
+    PBP_UNKNOWN_INTERVAL: float = 3.0  # Game not on today's scoreboard
+
+    # Live scoreboard polling intervals (seconds), picked from the games' state
+    SCOREBOARD_IDLE_INTERVAL: float = 10 * 60  # No games, or all final
+    SCOREBOARD_PREGAME_WINDOW: float = (
+        30 * 60
+    )  # Ramp up this long before the first tip-off
+    SCOREBOARD_PREGAME_INTERVAL: float = 30.0  # Within the pregame window
+    SCOREBOARD_TIPOFF_INTERVAL: float = (
+        5.0  # Scheduled tip-off passed, game not started
+    )
+    SCOREBOARD_TIPOFF_WINDOW: float = (
+        60 * 60
+    )  # ...for at most this long (then delayed: idle)
+    SCOREBOARD_LIVE_INTERVAL: float = 1.0  # Clock running
+    SCOREBOARD_CLUTCH_INTERVAL: float = 0.5  # 4th quarter/OT, close game, clock running
+    SCOREBOARD_CLUTCH_SECONDS: float = 5 * 60  # Clutch: at most this much clock left...
+    SCOREBOARD_CLUTCH_MARGIN: int = 5  # ...and a margin of at most this many points
+    SCOREBOARD_STOPPAGE_AFTER: float = (
+        5.0  # Seconds the clock must be stopped to slow down
+    )
+    SCOREBOARD_STOPPAGE_INTERVAL: float = (
+        3.0  # Clock stopped (timeouts, reviews, free throws)
+    )
+    SCOREBOARD_BREAK_INTERVAL: float = 10.0  # Between periods
+    SCOREBOARD_HALFTIME_INTERVAL: float = 30.0  # Halftime
+    SCOREBOARD_ERROR_INTERVAL: float = 5.0  # After a failed poll
+
+    # Box score cache
+    BOXSCORE_CACHE_MAX_BYTES: int = 32 * 1024 * 1024  # LRU memory budget
+    BOXSCORE_LIVE_TTL: float = 5.0  # Seconds a live game's box score is reused
+    BOXSCORE_SCHEDULED_TTL: float = 60.0  # Game not started yet
+    BOXSCORE_FINAL_TTL: Optional[float] = None  # Finals never change; None = no expiry
+
+    # HTTP caching of the REST GET routes: rendered bodies are kept in memory
+    # with an ETag and Last-Modified, and Cache-Control max-age follows how
+    # often the data changes (box scores use the BOXSCORE_*_TTL values above)
+    RESPONSE_CACHE_MAX_BYTES: int = 16 * 1024 * 1024  # LRU memory budget
+    HTTP_MAX_AGE_DEFAULT: float = 60.0  # Standings, past dates not yet archived
+    HTTP_MAX_AGE_PLAYERS: float = 60 * 60  # Player search (the roster changes daily)
+    HTTP_MAX_AGE_PLAYER_STATS: float = 5 * 60  # Player games, averages and leaders
+    HTTP_MAX_AGE_IMMUTABLE: int = 365 * 24 * 60 * 60  # Sent for data that never changes
+
+    # Past games archive
+    GAMES_ARCHIVE_DELAY_HOURS: float = (
+        6.0  # Hours after a date ends (ET) before it is archived
+    )
+
+    # Player game log store
+    GAME_LOGS_REFRESH_INTERVAL: float = (
+        3 * 60 * 60
+    )  # Seconds before the store counts as stale
+    # Season attempts (FGA, FG3A, FTA) needed to qualify for percentage leaders
+    LEADERS_MIN_ATTEMPTS: Dict[str, int] = {"fg_pct": 300, "fg3_pct": 82, "ft_pct": 125}
+
+    # Startup: "background" serves from SQLite immediately and refreshes players
+    # and standings in the background; "blocking" refreshes before accepting traffic
+    STARTUP_MODE: str = "background"
+    PLAYERS_STALE_AFTER: float = (
+        24 * 60 * 60
+    )  # Seconds before the roster counts as stale
+    STANDINGS_STALE_AFTER: float = (
+        6 * 60 * 60
+    )  # Seconds before standings count as stale
+
+    # Job scheduler: refresh jobs tick at these intervals and run when their
+    # data is stale or (standings, game logs) on game nights
+    SCHEDULER_POOL_LIMITS: Dict[str, int] = {
+        "live": 1,
+        "refresh": 1,
+    }  # Concurrent runs per pool
+    SCHEDULER_JITTER: float = 60.0  # Max random seconds added to each refresh interval
+    STANDINGS_REFRESH_INTERVAL: float = 10 * 60
+    PLAYERS_CHECK_INTERVAL: float = 60 * 60
+    GAME_LOGS_CHECK_INTERVAL: float = 15 * 60
+    GAME_NIGHT_GRACE: float = (
+        60 * 60
+    )  # Seconds after a final that still count as game night
+
+    # Multi-worker fan-out: one worker (the leader, holding a lease on the
+    # backbone) runs the scheduler and play-by-play pollers and publishes the
+    # encoded frames; every worker forwards them to its own WebSocket clients.
+    # "local" is in-process only (every process leads itself); "redis" shares
+    # one poller between uvicorn workers and nodes.
+    PUBSUB_BACKEND: str = "local"
+    PUBSUB_REDIS_URL: str = "redis://localhost:6379/0"
+    PUBSUB_PREFIX: str = "nba"  # Channel and lease key prefix
+    LEADER_LEASE_TTL: float = 10.0  # Seconds a leader's lease lasts unless renewed
+    LEADER_RENEW_INTERVAL: float = (
+        3.0  # Seconds between lease renewals and election attempts
+    )
+    PBP_WATCH_INTERVAL: float = (
+        15.0  # Followers re-announce their play-by-play games this often
+    )
+
+    # Metrics: counters and histograms for the hot paths, served on /metrics
+    METRICS_ENABLED: bool = True
+
     # Testing
     TESTING: bool = False
 
+    @property
+    def SQLALCHEMY_ASYNC_DATABASE_URL(self) -> str:
+        """SQLALCHEMY_DATABASE_URL with the aiosqlite driver."""
+        return self.SQLALCHEMY_DATABASE_URL.replace(
+            "sqlite://", "sqlite+aiosqlite://", 1
+        )
+
     @property
     def CORS_ORIGINS(self) -> List[str]:
         """Parse CORS_ORIGINS_STR into a list."""
         if self.CORS_ORIGINS_STR == "*":
             return ["*"]
         return [origin.strip() for origin in self.CORS_ORIGINS_STR.split(",")]
-    
+
     class Config:
         env_file = str(ENV_FILE)
         case_sensitive = True
 
+
 @lru_cache()
 def get_settings() -> Settings:
     """Return cached settings instance."""
@@ -54,4 +220,4 @@ def get_settings() -> Settings:
             f"Environment file not found at {ENV_FILE}. "
             f"Please create one from .env.example"
         )
-    return Settings()
\ No newline at end of file
+    return Settings()
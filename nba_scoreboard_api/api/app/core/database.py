@@ -1,11 +1,20 @@
 # app/core/database.py
 import logging
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker, Session, DeclarativeBase
+import time
 from pathlib import Path
-import subprocess
+from typing import AsyncIterator, List, Optional
 
+from sqlalchemy import Engine, create_engine, event
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.orm import DeclarativeBase, Session, sessionmaker
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+
+from alembic import command
+from alembic.config import Config
+from alembic.runtime.migration import MigrationContext
+from alembic.script import ScriptDirectory
 from app.core.config import get_settings
+from app.core.metrics import FAST_BUCKETS, metrics
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
@@ -16,17 +25,139 @@ settings = get_settings()
 # Ensure the data directory exists
 settings.DB_PATH.parent.mkdir(parents=True, exist_ok=True)
 
+SQLITE_PROFILES = ("default", "tuned")
+
+
+def sqlite_pragmas(profile: str, read_only: bool = False) -> List[str]:
+    """
+    PRAGMAs to run on each new connection for a storage profile.
+
+    Args:
+        profile: One of SQLITE_PROFILES
+        read_only: Connection serves reads only (query_only, and the
+            persistent journal mode is left to the writers)
+
+    Returns:
+        PRAGMA statements, in order
+
+    Raises:
+        ValueError: If the profile is unknown
+    """
+    if profile not in SQLITE_PROFILES:
+        raise ValueError(f"SQLITE_PROFILE must be one of: {', '.join(SQLITE_PROFILES)}")
+    pragmas = [f"PRAGMA busy_timeout = {settings.SQLITE_BUSY_TIMEOUT_MS}"]
+    if profile == "tuned":
+        if not read_only:
+            pragmas.append("PRAGMA journal_mode = WAL")
+        pragmas += [
+            "PRAGMA synchronous = NORMAL",
+            f"PRAGMA mmap_size = {settings.SQLITE_MMAP_SIZE}",
+            f"PRAGMA cache_size = -{settings.SQLITE_CACHE_SIZE_KIB}",
+        ]
+    elif not read_only:
+        # The journal mode is stored in the database file, so switch it back explicitly
+        pragmas.append("PRAGMA journal_mode = DELETE")
+    if read_only:
+        pragmas.append("PRAGMA query_only = ON")
+    return pragmas
+
+
+def configure_sqlite(
+    engine: Engine, profile: Optional[str] = None, read_only: bool = False
+) -> None:
+    """
+    Apply a storage profile to every connection the engine opens.
+
+    Args:
+        engine: Sync engine (``async_engine.sync_engine`` for async engines)
+        profile: One of SQLITE_PROFILES (default: SQLITE_PROFILE)
+        read_only: Configure connections for reads only
+    """
+    pragmas = sqlite_pragmas(profile or settings.SQLITE_PROFILE, read_only)
+
+    @event.listens_for(engine, "connect")
+    def set_sqlite_pragmas(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        for pragma in pragmas:
+            cursor.execute(pragma)
+        cursor.close()
+
+
+db_query_duration = metrics.histogram(
+    "nba_db_query_duration_seconds",
+    "SQL statement execution time, by engine",
+    ("engine",),
+    buckets=FAST_BUCKETS,
+)
+
+
+def instrument_engine(engine: Engine, name: str) -> None:
+    """
+    Time every statement the engine executes into db_query_duration.
+
+    Args:
+        engine: Sync engine (``async_engine.sync_engine`` for async engines)
+        name: ``engine`` label value
+    """
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def start_query_timer(conn, cursor, statement, parameters, context, executemany):
+        context._query_started = time.perf_counter()
+
+    @event.listens_for(engine, "after_cursor_execute")
+    def observe_query_time(conn, cursor, statement, parameters, context, executemany):
+        db_query_duration.observe(time.perf_counter() - context._query_started, name)
+
+
 # Create engine
 engine = create_engine(
     settings.SQLALCHEMY_DATABASE_URL,
-    connect_args={"check_same_thread": False}  # Needed for SQLite
+    connect_args={"check_same_thread": False},  # Needed for SQLite
 )
 
+configure_sqlite(engine)
+instrument_engine(engine, "sync")
+
 SessionLocal = sessionmaker(bind=engine, autocommit=False, autoflush=False)
 
+# Async engine for request handlers: queries run on aiosqlite's connection
+# threads, so they don't block the event loop driving WebSocket broadcasts.
+# aiosqlite defaults to NullPool (a new connection and thread per session);
+# a small queue pool keeps connections open between requests.
+async_engine = create_async_engine(
+    settings.SQLALCHEMY_ASYNC_DATABASE_URL,
+    poolclass=AsyncAdaptedQueuePool,
+    pool_size=settings.ASYNC_DB_POOL_SIZE,
+    max_overflow=settings.ASYNC_DB_MAX_OVERFLOW,
+    pool_timeout=settings.ASYNC_DB_POOL_TIMEOUT,
+)
+configure_sqlite(async_engine.sync_engine)
+instrument_engine(async_engine.sync_engine, "async")
+
+# Read-only pool for GET handlers, so reads never queue behind a refresh
+# holding a read-write connection
+async_read_engine = create_async_engine(
+    settings.SQLALCHEMY_ASYNC_DATABASE_URL,
+    poolclass=AsyncAdaptedQueuePool,
+    pool_size=settings.ASYNC_DB_READ_POOL_SIZE,
+    max_overflow=settings.ASYNC_DB_MAX_OVERFLOW,
+    pool_timeout=settings.ASYNC_DB_POOL_TIMEOUT,
+)
+configure_sqlite(async_read_engine.sync_engine, read_only=True)
+instrument_engine(async_read_engine.sync_engine, "async_read")
+
+AsyncSessionLocal = async_sessionmaker(
+    bind=async_engine, autoflush=False, expire_on_commit=False
+)
+AsyncReadSessionLocal = async_sessionmaker(
+    bind=async_read_engine, autoflush=False, expire_on_commit=False
+)
+
+
 class Base(DeclarativeBase):
     pass
 
+
 def get_db() -> Session:
     """Dependency that provides a DB session."""
     db = SessionLocal()
@@ -35,21 +166,56 @@ def get_db() -> Session:
     finally:
         db.close()
 
+
+async def get_async_db() -> AsyncIterator[AsyncSession]:
+    """Dependency that provides an async DB session."""
+    async with AsyncSessionLocal() as db:
+        yield db
+
+
+async def get_async_read_db() -> AsyncIterator[AsyncSession]:
+    """Dependency that provides a read-only async DB session."""
+    async with AsyncReadSessionLocal() as db:
+        yield db
+
+
+def alembic_config() -> Config:
+    """Alembic configuration for running migrations in-process."""
+    config = Config(str(settings.PROJECT_ROOT / "alembic.ini"))
+    config.set_main_option("script_location", str(settings.PROJECT_ROOT / "alembic"))
+    config.attributes["configure_logger"] = False
+    return config
+
+
 def init_db() -> None:
-    """Initialize the database by creating all tables."""
+    """
+    Bring the database schema up to date.
+
+    Compares the database's Alembic revision with the migration scripts'
+    head and runs ``upgrade head`` in-process only when they differ, so a
+    normal restart costs one small query instead of an ``alembic`` subprocess.
+    """
     try:
-        # Create tables using SQLAlchemy
-        # Base.metadata.create_all(bind=engine)
-        logger.info("Database tables created successfully")
-        
-        # Run migrations using alembic CLI
+        config = alembic_config()
+        heads = set(ScriptDirectory.from_config(config).get_heads())
+        with engine.connect() as connection:
+            current = set(MigrationContext.configure(connection).get_current_heads())
+        if current == heads:
+            logger.info(f"Database schema is current ({', '.join(sorted(heads))})")
+            return
+
+        # Run migrations
+        logger.info(
+            f"Migrating database schema from {', '.join(sorted(current)) or 'empty'} "
+            f"to {', '.join(sorted(heads))}"
+        )
         try:
-            subprocess.run(["alembic", "upgrade", "head"], check=True)
+            command.upgrade(config, "head")
             logger.info("Database migrations completed successfully")
-        except subprocess.CalledProcessError as e:
+        except Exception as e:
             logger.error(f"Error running migrations: {e}")
-            # Continue even if migrations fail, as tables are created
-            
+            # Continue with the existing schema; endpoints report their own errors
+
     except Exception as e:
         logger.error(f"Error initializing database: {e}")
-        raise
\ No newline at end of file
+        raise
@@ -1,8 +1,6 @@
 # app/models/__init__.py
-from app.models.players import Player
+from app.models.players import Player, PlayerGameLog
+from app.models.scoreboard import Game
 from app.models.standings import TeamStanding
 
-__all__ = [
-    "Player",
-    "TeamStanding"
-]
\ No newline at end of file
+__all__ = ["Game", "Player", "PlayerGameLog", "TeamStanding"]
@@ -1,46 +1,94 @@
 # app/models/players.py
-from sqlalchemy import Column, Integer, String, UniqueConstraint, Index
+from sqlalchemy import Column, Float, Index, Integer, String, UniqueConstraint
 from sqlalchemy.orm import relationship
+
 from app.core.database import Base
 
+
 class Player(Base):
     """SQLAlchemy model for NBA players."""
+
     __tablename__ = "players"
 
     # Primary key
     id = Column(Integer, primary_key=True)
-    
+
     # Player information
     person_id = Column(
-        Integer,
-        unique=True,
-        index=True,
-        nullable=False,
-        comment="NBA.com person ID"
-    )
-    display_name = Column(
-        String,
-        nullable=False,
-        comment="Player's full name"
-    )
-    team_name = Column(
-        String,
-        nullable=False,
-        comment="Current team name"
+        Integer, unique=True, index=True, nullable=False, comment="NBA.com person ID"
     )
+    display_name = Column(String, nullable=False, comment="Player's full name")
+    team_name = Column(String, nullable=False, comment="Current team name")
     team_abbreviation = Column(
-        String,
-        nullable=False,
-        comment="Current team abbreviation"
+        String, nullable=False, comment="Current team abbreviation"
     )
 
     # Indexes and constraints
     __table_args__ = (
-        UniqueConstraint('person_id', name='uq_player_person_id'),
-        Index('ix_player_display_name', 'display_name'),
-        Index('ix_player_team', 'team_name', 'team_abbreviation'),
+        UniqueConstraint("person_id", name="uq_player_person_id"),
+        Index("ix_player_display_name", "display_name"),
+        Index("ix_player_team", "team_name", "team_abbreviation"),
     )
 
     def __repr__(self):
         """String representation of the Player model."""
-        return f"<Player(id={self.id}, name='{self.display_name}', team='{self.team_abbreviation}')>"
\ No newline at end of file
+        return f"<Player(id={self.id}, name='{self.display_name}', team='{self.team_abbreviation}')>"
+
+
+class PlayerGameLog(Base):
+    """SQLAlchemy model for a player's box score line in one game."""
+
+    __tablename__ = "player_game_logs"
+
+    # Primary key
+    id = Column(Integer, primary_key=True)
+
+    # Game identification
+    person_id = Column(Integer, nullable=False, comment="NBA.com person ID")
+    game_id = Column(String, nullable=False, comment="NBA.com game ID")
+    game_date = Column(String, nullable=False, comment="Game date (ISO 8601, sortable)")
+    season = Column(String, nullable=False, comment="Season (YYYY-YY)")
+    season_type = Column(
+        String, nullable=False, comment="Regular Season, Playoffs, ..."
+    )
+    team_abbreviation = Column(String, nullable=False, comment="Team abbreviation")
+    matchup = Column(
+        String, nullable=False, comment="Game matchup (e.g., 'LAL vs. BOS')"
+    )
+    wl = Column(String, nullable=False, default="", comment="Win/Loss result")
+
+    # Statistics
+    min = Column(Float, nullable=False, default=0.0, comment="Minutes played")
+    pts = Column(Integer, nullable=False, default=0)
+    fgm = Column(Integer, nullable=False, default=0)
+    fga = Column(Integer, nullable=False, default=0)
+    fg_pct = Column(Float, nullable=False, default=0.0)
+    fg3m = Column(Integer, nullable=False, default=0)
+    fg3a = Column(Integer, nullable=False, default=0)
+    fg3_pct = Column(Float, nullable=False, default=0.0)
+    ftm = Column(Integer, nullable=False, default=0)
+    fta = Column(Integer, nullable=False, default=0)
+    ft_pct = Column(Float, nullable=False, default=0.0)
+    oreb = Column(Integer, nullable=False, default=0)
+    dreb = Column(Integer, nullable=False, default=0)
+    reb = Column(Integer, nullable=False, default=0)
+    ast = Column(Integer, nullable=False, default=0)
+    stl = Column(Integer, nullable=False, default=0)
+    blk = Column(Integer, nullable=False, default=0)
+    tov = Column(Integer, nullable=False, default=0)
+    pf = Column(Integer, nullable=False, default=0)
+    plus_minus = Column(Integer, nullable=False, default=0)
+
+    # Indexes and constraints
+    __table_args__ = (
+        UniqueConstraint("person_id", "game_id", name="uq_player_game_log"),
+        Index("ix_player_game_logs_person_date", "person_id", "game_date"),
+        Index("ix_player_game_logs_date", "game_date"),
+    )
+
+    def __repr__(self):
+        """String representation of the PlayerGameLog model."""
+        return (
+            f"<PlayerGameLog(person_id={self.person_id}, "
+            f"game_id='{self.game_id}', pts={self.pts})>"
+        )
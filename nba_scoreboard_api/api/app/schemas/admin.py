@@ -0,0 +1,45 @@
+# app/schemas/admin.py
+from typing import Optional
+
+from pydantic import BaseModel, Field
+
+
+class JobStatus(BaseModel):
+    """Status and timing metrics of a scheduled job."""
+
+    name: str = Field(..., description="Job name")
+    pool: str = Field(..., description="Concurrency pool the job runs in")
+    running: bool = Field(..., description="Whether a run is in progress")
+    runs: int = Field(..., description="Runs started")
+    failures: int = Field(..., description="Runs that raised or reported failure")
+    skipped: int = Field(
+        ..., description="Ticks dropped because the previous run was still going"
+    )
+    idle: int = Field(..., description="Ticks where the job had nothing to do")
+    last_started: Optional[str] = Field(
+        None, description="Start of the last run (UTC, ISO 8601)"
+    )
+    last_finished: Optional[str] = Field(
+        None, description="End of the last run (UTC, ISO 8601)"
+    )
+    last_success: Optional[str] = Field(
+        None, description="End of the last successful run (UTC, ISO 8601)"
+    )
+    last_error: Optional[str] = Field(
+        None, description="Error of the last run, if it failed"
+    )
+    last_duration_ms: Optional[float] = Field(
+        None, description="Duration of the last run"
+    )
+    avg_duration_ms: Optional[float] = Field(None, description="Mean run duration")
+    max_duration_ms: float = Field(..., description="Longest run duration")
+    next_run: Optional[str] = Field(
+        None, description="Next scheduled tick (UTC, ISO 8601)"
+    )
+
+
+class JobTrigger(BaseModel):
+    """Result of a manual job trigger."""
+
+    name: str = Field(..., description="Job name")
+    started: bool = Field(..., description="False if the job was already running")
@@ -1,10 +1,13 @@
 # app/schemas/players.py
-from pydantic import BaseModel, Field
-from typing import List, Optional
 from datetime import date
+from typing import List, Optional
+
+from pydantic import BaseModel, Field
+
 
 class PlayerBase(BaseModel):
     """Base player model containing core player information."""
+
     person_id: int = Field(..., description="NBA.com person ID")
     display_name: str = Field(..., description="Player's full name")
     team_name: str = Field(..., description="Current team name")
@@ -13,8 +16,10 @@ class PlayerBase(BaseModel):
     class Config:
         from_attributes = True
 
+
 class GameStats(BaseModel):
     """Model for player game statistics."""
+
     game_date: str = Field(..., description="Date of the game")
     matchup: str = Field(..., description="Game matchup (e.g., 'LAL vs. BOS')")
     wl: str = Field(..., description="Win/Loss result")
@@ -39,21 +44,98 @@ class GameStats(BaseModel):
     pf: int = Field(..., description="Personal fouls")
     plus_minus: int = Field(..., description="Plus/minus")
 
+
 class PlayerStats(BaseModel):
     """Combined model for player info and game statistics."""
+
     player_info: PlayerBase = Field(..., description="Player's basic information")
     games: List[GameStats] = Field(..., description="List of game statistics")
 
+
+class StatLine(BaseModel):
+    """Per-game, per-36 or windowed averages; percentages come from totals."""
+
+    min: float = Field(..., description="Minutes")
+    pts: float = Field(..., description="Points")
+    fgm: float = Field(..., description="Field goals made")
+    fga: float = Field(..., description="Field goals attempted")
+    fg3m: float = Field(..., description="Three pointers made")
+    fg3a: float = Field(..., description="Three pointers attempted")
+    ftm: float = Field(..., description="Free throws made")
+    fta: float = Field(..., description="Free throws attempted")
+    oreb: float = Field(..., description="Offensive rebounds")
+    dreb: float = Field(..., description="Defensive rebounds")
+    reb: float = Field(..., description="Total rebounds")
+    ast: float = Field(..., description="Assists")
+    stl: float = Field(..., description="Steals")
+    blk: float = Field(..., description="Blocks")
+    tov: float = Field(..., description="Turnovers")
+    pf: float = Field(..., description="Personal fouls")
+    plus_minus: float = Field(..., description="Plus/minus")
+    fg_pct: float = Field(..., description="Field goal percentage")
+    fg3_pct: float = Field(..., description="Three point percentage")
+    ft_pct: float = Field(..., description="Free throw percentage")
+
+
+class RollingPoint(BaseModel):
+    """Rolling average of one stat over the window ending at a game."""
+
+    game_date: str = Field(..., description="Date of the last game in the window")
+    value: float = Field(..., description="Average over the window")
+
+
+class PlayerAverages(BaseModel):
+    """Season aggregates for one player."""
+
+    player_info: PlayerBase = Field(..., description="Player's basic information")
+    season: str = Field(..., description="Season (YYYY-YY)")
+    games_played: int = Field(..., description="Games played")
+    averages: StatLine = Field(..., description="Season per-game averages")
+    per_36: StatLine = Field(..., description="Season per-36-minute rates")
+    window: int = Field(..., description="Games in last_n and each rolling window")
+    last_n: StatLine = Field(
+        ..., description="Per-game averages over the last `window` games"
+    )
+    rolling_stat: str = Field(..., description="Stat the rolling series is for")
+    rolling: List[RollingPoint] = Field(
+        ..., description="Rolling `window`-game averages, oldest first"
+    )
+
+
+class LeaderEntry(BaseModel):
+    """One row of a leaderboard."""
+
+    rank: int = Field(..., description="Leaderboard position")
+    person_id: int = Field(..., description="NBA.com person ID")
+    display_name: Optional[str] = Field(None, description="Player's full name")
+    team_abbreviation: Optional[str] = Field(
+        None, description="Current team abbreviation"
+    )
+    games_played: int = Field(..., description="Games played")
+    value: float = Field(..., description="Stat value")
+
+
+class Leaderboard(BaseModel):
+    """Top players for a stat."""
+
+    season: str = Field(..., description="Season (YYYY-YY)")
+    stat: str = Field(..., description="Stat ranked")
+    mode: str = Field(..., description="per_game, per_36 or total")
+    leaders: List[LeaderEntry]
+
+
 class PlayerSearch(BaseModel):
     """Model for player search parameters."""
-    query: str = Field(..., min_length=2, description="Search query (minimum 2 characters)")
+
+    query: str = Field(
+        ..., min_length=2, description="Search query (minimum 2 characters)"
+    )
+
 
 class PlayerGamesParams(BaseModel):
     """Model for player games query parameters."""
+
     player_id: int = Field(..., description="NBA.com person ID")
     last_n_games: Optional[int] = Field(
-        10, 
-        ge=1, 
-        le=82, 
-        description="Number of recent games to return (1-82)"
-    )
\ No newline at end of file
+        10, ge=1, le=82, description="Number of recent games to return (1-82)"
+    )
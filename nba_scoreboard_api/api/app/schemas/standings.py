@@ -1,15 +1,20 @@
 # app/schemas/standings.py
-from pydantic import BaseModel, Field
-from typing import List
 from enum import Enum
+from typing import List
+
+from pydantic import BaseModel, Field
+
 
 class Conference(str, Enum):
     """Enumeration of NBA conferences."""
+
     EAST = "East"
     WEST = "West"
 
+
 class Division(str, Enum):
     """Enumeration of NBA divisions."""
+
     ATLANTIC = "Atlantic"
     CENTRAL = "Central"
     SOUTHEAST = "Southeast"
@@ -17,8 +22,10 @@ class Division(str, Enum):
     PACIFIC = "Pacific"
     SOUTHWEST = "Southwest"
 
+
 class StandingsResponse(BaseModel):
     """Model for team standings information."""
+
     team_id: int = Field(..., description="NBA.com team ID")
     team_city: str = Field(..., description="Team city")
     team_name: str = Field(..., description="Team name")
@@ -44,17 +51,33 @@ class StandingsResponse(BaseModel):
     class Config:
         from_attributes = True
 
+
 class ConferenceStandings(BaseModel):
     """Model for conference standings response."""
+
     conference: Conference
     standings: List[StandingsResponse]
 
+
 class DivisionStandings(BaseModel):
     """Model for division standings response."""
+
     division: Division
     standings: List[StandingsResponse]
 
+
 class StandingsUpdate(BaseModel):
     """Model for standings update response."""
+
     message: str = Field(..., description="Update status message")
-    updated_teams: int = Field(..., description="Number of teams updated")
\ No newline at end of file
+    updated_teams: int = Field(..., description="Number of teams updated")
+    removed_teams: int = Field(default=0, description="Number of teams removed")
+    record_changed_team_ids: List[int] = Field(
+        default_factory=list, description="Teams whose win-loss record moved"
+    )
+    content_hash: str = Field(
+        ..., description="Hash of the standings after this refresh"
+    )
+    changed: bool = Field(
+        ..., description="Whether the standings differ from the previous refresh"
+    )
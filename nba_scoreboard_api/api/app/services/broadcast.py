@@ -0,0 +1,155 @@
+# app/services/broadcast.py
+import asyncio
+import json
+import logging
+from datetime import datetime
+from typing import Any, Awaitable, Callable, Optional, Set
+
+from fastapi import WebSocket
+
+try:
+    import orjson
+except ImportError:  # orjson is an optional speedup
+    orjson = None
+
+logger = logging.getLogger(__name__)
+
+# Close code sent to clients evicted for not keeping up (RFC 6455 "Try Again Later")
+SLOW_CONSUMER_CLOSE_CODE = 1013
+
+# Close handshakes still in flight (referenced so they aren't garbage collected)
+_closing: Set[asyncio.Task] = set()
+
+
+def _serialize_datetime(obj):
+    """Helper to serialize datetime objects to ISO format."""
+    if isinstance(obj, datetime):
+        return obj.isoformat()
+    raise TypeError(f"Type {type(obj)} not serializable")
+
+
+def encode_frame(payload: Any) -> str:
+    """
+    Serialize a payload into a JSON text frame.
+
+    Broadcasts call this exactly once per update and hand the same string to
+    every client. Uses orjson when it is installed.
+
+    Args:
+        payload: JSON-serializable data (datetimes are converted to ISO format)
+
+    Returns:
+        The encoded JSON text
+    """
+    if orjson is not None:
+        return orjson.dumps(payload, default=_serialize_datetime).decode()
+    return json.dumps(payload, default=_serialize_datetime, separators=(",", ":"))
+
+
+class ClientConnection:
+    """
+    A WebSocket client with its own bounded send queue.
+
+    Each client gets a dedicated sender task, so one slow socket never delays
+    delivery to the others. A client whose queue fills up, or whose send takes
+    longer than ``send_timeout``, is evicted.
+    """
+
+    def __init__(
+        self,
+        websocket: WebSocket,
+        max_queue: int,
+        send_timeout: float,
+        on_evict: Optional[Callable[["ClientConnection"], Awaitable[None]]] = None,
+        protocol_version: int = 1,
+    ):
+        self.websocket = websocket
+        self.protocol_version = protocol_version
+        self.send_timeout = send_timeout
+        self._queue: asyncio.Queue = asyncio.Queue(maxsize=max_queue)
+        self._on_evict = on_evict
+        self._sender: Optional[asyncio.Task] = None
+        self._send_timed_out = False
+        self.closed = False
+        # Set once the initial data has been queued; broadcasts skip the client
+        # until then
+        self.ready = False
+
+    def start(self) -> None:
+        """Start the background sender task."""
+        if self._sender is None:
+            self._sender = asyncio.create_task(self._send_loop())
+
+    def enqueue(self, frame: str) -> bool:
+        """
+        Queue a pre-encoded frame for delivery without waiting.
+
+        Returns:
+            False if the client is closed or its queue is full
+        """
+        if self.closed:
+            return False
+        try:
+            self._queue.put_nowait(frame)
+            return True
+        except asyncio.QueueFull:
+            return False
+
+    def _on_send_timeout(self) -> None:
+        self._send_timed_out = True
+        if self._sender is not None:
+            self._sender.cancel()
+
+    async def _send_loop(self) -> None:
+        loop = asyncio.get_running_loop()
+        try:
+            while True:
+                frame = await self._queue.get()
+                # A timer handle per send is much cheaper than asyncio.wait_for,
+                # which wraps every send in a new task
+                watchdog = loop.call_later(self.send_timeout, self._on_send_timeout)
+                try:
+                    await self.websocket.send_text(frame)
+                finally:
+                    watchdog.cancel()
+        except asyncio.CancelledError:
+            if not self._send_timed_out:
+                raise
+            logger.warning("Evicting WebSocket client after send timeout")
+            await self.evict()
+        except Exception as e:
+            logger.warning(f"Evicting WebSocket client after failed send: {e!r}")
+            await self.evict()
+
+    async def evict(self) -> None:
+        """Close a client that cannot keep up and notify the owner."""
+        if self.closed:
+            return
+        await self.close(code=SLOW_CONSUMER_CLOSE_CODE)
+        if self._on_evict is not None:
+            await self._on_evict(self)
+
+    async def close(self, code: int = 1000) -> None:
+        """
+        Stop the sender task and close the socket.
+
+        The close handshake runs in the background, bounded by
+        ``send_timeout``: a stuck client must not hold up the caller, which
+        is often evicting a batch of them after a broadcast.
+        """
+        if self.closed:
+            return
+        self.closed = True
+        if self._sender is not None and self._sender is not asyncio.current_task():
+            self._sender.cancel()
+        self._sender = None
+        task = asyncio.create_task(self._close_socket(code))
+        _closing.add(task)
+        task.add_done_callback(_closing.discard)
+
+    async def _close_socket(self, code: int) -> None:
+        try:
+            await asyncio.wait_for(self.websocket.close(code=code), self.send_timeout)
+        except Exception:
+            # The socket is usually already gone at this point
+            pass
@@ -0,0 +1,174 @@
+# app/services/cache.py
+import asyncio
+import logging
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class _CacheEntry:
+    __slots__ = ("value", "expires_at", "size")
+
+    def __init__(self, value: Any, expires_at: Optional[float], size: int):
+        self.value = value
+        self.expires_at = expires_at
+        self.size = size
+
+
+class _Inflight:
+    """A fetch shared by concurrent misses for one key."""
+
+    __slots__ = ("task", "waiters")
+
+    def __init__(self, task: asyncio.Task):
+        self.task = task
+        self.waiters = 0
+
+
+class TTLCache:
+    """
+    In-process async cache with per-entry TTLs, request coalescing and an
+    LRU memory budget.
+
+    Concurrent misses for the same key share a single fetch. Entries are
+    evicted least-recently-used first once their total estimated size goes
+    over ``max_bytes``.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        max_bytes: int,
+        ttl_for: Callable[[Any], Optional[float]],
+        size_of: Callable[[Any], int],
+    ):
+        """
+        Args:
+            name: Cache name, used in logs and stats
+            max_bytes: Memory budget for all entries
+            ttl_for: Returns the TTL in seconds for a value (None = no expiry)
+            size_of: Returns the estimated size in bytes of a value
+        """
+        self.name = name
+        self.max_bytes = max_bytes
+        self.ttl_for = ttl_for
+        self.size_of = size_of
+        self._entries: "OrderedDict[Hashable, _CacheEntry]" = OrderedDict()
+        self._inflight: Dict[Hashable, _Inflight] = {}
+        self.size_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.coalesced = 0
+        self.evictions = 0
+
+    async def get_or_fetch(
+        self, key: Hashable, fetch: Callable[[], Awaitable[Any]]
+    ) -> Any:
+        """
+        Return the cached value for ``key``, fetching it on a miss.
+
+        The fetch runs as its own task that every waiting caller awaits
+        through a shield, so a caller being cancelled doesn't cancel it for
+        the others; it is only cancelled once no caller is left waiting.
+
+        Args:
+            key: Cache key
+            fetch: Coroutine function producing the value; its exceptions are
+                passed to every waiting caller and nothing is cached
+
+        Returns:
+            The cached or freshly fetched value
+        """
+        entry = self._entries.get(key)
+        if entry is not None:
+            if entry.expires_at is None or entry.expires_at > time.monotonic():
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry.value
+            self._remove(key)
+
+        inflight = self._inflight.get(key)
+        if inflight is not None:
+            self.coalesced += 1
+        else:
+            self.misses += 1
+            inflight = self._inflight[key] = _Inflight(
+                asyncio.create_task(self._fetch(key, fetch))
+            )
+
+        inflight.waiters += 1
+        try:
+            return await asyncio.shield(inflight.task)
+        finally:
+            inflight.waiters -= 1
+            if inflight.waiters == 0 and not inflight.task.done():
+                # Every caller went away: nobody is left to use the result
+                inflight.task.cancel()
+                if self._inflight.get(key) is inflight:
+                    del self._inflight[key]
+
+    async def _fetch(self, key: Hashable, fetch: Callable[[], Awaitable[Any]]) -> Any:
+        try:
+            value = await fetch()
+        finally:
+            inflight = self._inflight.get(key)
+            if inflight is not None and inflight.task is asyncio.current_task():
+                del self._inflight[key]
+        self._store(key, value)
+        return value
+
+    def _store(self, key: Hashable, value: Any) -> None:
+        size = self.size_of(value)
+        if size > self.max_bytes:
+            logger.warning(
+                f"[{self.name}] Not caching {key}: {size} bytes exceeds budget"
+            )
+            return
+        ttl = self.ttl_for(value)
+        expires_at = None if ttl is None else time.monotonic() + ttl
+        if key in self._entries:
+            self._remove(key)
+        self._entries[key] = _CacheEntry(value, expires_at, size)
+        self.size_bytes += size
+        while self.size_bytes > self.max_bytes:
+            oldest = next(iter(self._entries))
+            self._remove(oldest)
+            self.evictions += 1
+
+    def _remove(self, key: Hashable) -> None:
+        entry = self._entries.pop(key)
+        self.size_bytes -= entry.size
+
+    def peek(self, key: Hashable) -> Optional[Any]:
+        """The value stored for ``key`` even if expired, without counting a lookup."""
+        entry = self._entries.get(key)
+        return None if entry is None else entry.value
+
+    def invalidate(self, key: Hashable) -> None:
+        """Drop a single entry if present."""
+        if key in self._entries:
+            self._remove(key)
+
+    def clear(self) -> None:
+        """Drop every entry (counters are kept)."""
+        self._entries.clear()
+        self.size_bytes = 0
+
+    def stats(self) -> Dict[str, Any]:
+        """Hit/miss counters and memory usage, for monitoring."""
+        lookups = self.hits + self.misses + self.coalesced
+        return {
+            "name": self.name,
+            "entries": len(self._entries),
+            "size_bytes": self.size_bytes,
+            "max_bytes": self.max_bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "coalesced": self.coalesced,
+            "evictions": self.evictions,
+            "hit_ratio": (
+                round((self.hits + self.coalesced) / lookups, 4) if lookups else 0.0
+            ),
+        }
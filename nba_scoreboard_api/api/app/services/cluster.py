@@ -0,0 +1,352 @@
+# app/services/cluster.py
+import asyncio
+import functools
+import json
+import logging
+import os
+import socket
+import time
+import uuid
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+from app.core.config import get_settings
+from app.core.metrics import metrics
+from app.services.freshness import FreshnessRegistry, freshness
+from app.services.jobs import scheduler
+from app.services.pubsub import Backbone, Subscription, make_backbone
+from app.services.scheduler import JobScheduler
+from app.services.scoreboard import (
+    PlayByPlayManager,
+    ScoreboardManager,
+    playbyplay_manager,
+    scoreboard_manager,
+)
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+OUTBOX_SIZE = 1000  # Messages waiting for the backbone before new ones are dropped
+RESUBSCRIBE_MIN_DELAY = (
+    0.5  # Seconds before re-subscribing after the backbone failed...
+)
+RESUBSCRIBE_MAX_DELAY = 30.0  # ...doubling up to this while it keeps failing
+
+cluster_dropped = metrics.counter(
+    "nba_cluster_dropped_messages_total",
+    "Messages not published because the backbone fell behind",
+)
+
+
+class Cluster:
+    """
+    Shares one NBA.com poller between workers.
+
+    Workers (uvicorn workers, or processes on other nodes) join a pub/sub
+    backbone and elect a leader through a lease on it. Only the leader runs
+    the job scheduler (scoreboard poll and data refreshes) and the
+    play-by-play pollers, and publishes every encoded scoreboard update and
+    play-by-play delta; the other workers forward those frames to their own
+    WebSocket clients. The leader also announces each data refresh, so the
+    others drop their in-process views of changed data (standings store,
+    search index, stats engine, cached responses) and report the refresh
+    in /health. Followers announce the games their play-by-play
+    clients watch, and ask the leader for the scoreboard when they have none.
+
+    Messages are a JSON header line followed by the frames as sent to
+    clients, one per line. If the leader goes away, another worker takes the
+    lease within ``lease_ttl`` and carries on from the state it was following.
+    """
+
+    def __init__(
+        self,
+        backbone: Backbone,
+        scheduler: JobScheduler,
+        scoreboard: ScoreboardManager,
+        playbyplay: PlayByPlayManager,
+        datasets: FreshnessRegistry,
+        prefix: str = "nba",
+        lease_ttl: float = 10.0,
+        renew_interval: float = 3.0,
+        watch_interval: float = 15.0,
+    ) -> None:
+        self.backbone = backbone
+        self.scheduler = scheduler
+        self.scoreboard = scoreboard
+        self.playbyplay = playbyplay
+        self.datasets = datasets
+        self.lease = f"{prefix}:leader"
+        self.channels = {
+            name: f"{prefix}:{name}"
+            for name in ("scoreboard", "playbyplay", "data", "control")
+        }
+        self._channel_names = {channel: name for name, channel in self.channels.items()}
+        self.lease_ttl = lease_ttl
+        self.renew_interval = renew_interval
+        self.watch_interval = watch_interval
+        self.worker_id = f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+        self.is_leader = False
+        self.leader_since: Optional[float] = None
+        self._renewed = 0.0
+        self._warm_up: Optional[Callable[[], Awaitable[Any]]] = None
+        self._outbox: asyncio.Queue = asyncio.Queue(maxsize=OUTBOX_SIZE)
+        self._subscription: Optional[Subscription] = None
+        self._tasks: List[asyncio.Task] = []
+
+    @classmethod
+    def from_settings(
+        cls,
+        scheduler: JobScheduler,
+        scoreboard: ScoreboardManager,
+        playbyplay: PlayByPlayManager,
+        datasets: FreshnessRegistry,
+    ) -> "Cluster":
+        """Build a cluster member from the application settings."""
+        settings = get_settings()
+        return cls(
+            make_backbone(settings),
+            scheduler,
+            scoreboard,
+            playbyplay,
+            datasets,
+            prefix=settings.PUBSUB_PREFIX,
+            lease_ttl=settings.LEADER_LEASE_TTL,
+            renew_interval=settings.LEADER_RENEW_INTERVAL,
+            watch_interval=settings.PBP_WATCH_INTERVAL,
+        )
+
+    async def start(
+        self, warm_up: Optional[Callable[[], Awaitable[Any]]] = None
+    ) -> None:
+        """
+        Join the backbone and take part in leader election.
+
+        The first election is decided before this returns, so a lone worker
+        leads from its first request.
+
+        Args:
+            warm_up: Awaited the first time this worker becomes the leader,
+                before its scheduler starts
+        """
+        self._warm_up = warm_up
+        self._subscription = await self.backbone.subscribe(list(self.channels.values()))
+        # The election loop renews the lease while a long warm-up runs
+        self._tasks = [
+            asyncio.create_task(self._listen()),
+            asyncio.create_task(self._send_loop()),
+            asyncio.create_task(self._election_loop()),
+            asyncio.create_task(self._watch_loop()),
+        ]
+        await self._elect()
+        if not self.is_leader:
+            await self._follow()
+
+    async def stop(self) -> None:
+        """Leave the backbone, handing the lease over right away if we hold it."""
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks.clear()
+        if self.is_leader:
+            await self.scheduler.stop()
+            await self.playbyplay.stop_polling()
+            self.is_leader = False
+            try:
+                await self.backbone.release_lease(self.lease, self.worker_id)
+            except Exception as e:
+                logger.error(f"Error releasing the leader lease: {e}")
+        if self._subscription is not None:
+            await self._subscription.close()
+        await self.backbone.close()
+
+    def status(self) -> Dict[str, Any]:
+        return {
+            "worker": self.worker_id,
+            "leader": self.is_leader,
+            "leader_seconds": (
+                None
+                if self.leader_since is None
+                else round(time.monotonic() - self.leader_since, 1)
+            ),
+        }
+
+    # Leader election
+
+    async def _elect(self) -> None:
+        try:
+            leader = await self.backbone.acquire_lease(
+                self.lease, self.worker_id, self.lease_ttl
+            )
+            if leader:
+                self._renewed = time.monotonic()
+        except Exception as e:
+            logger.error(f"Leader election failed: {e}")
+            # Keep leading until the lease we hold would have expired
+            leader = (
+                self.is_leader and time.monotonic() - self._renewed < self.lease_ttl
+            )
+        if leader and not self.is_leader:
+            await self._lead()
+        elif not leader and self.is_leader:
+            await self._follow()
+
+    async def _election_loop(self) -> None:
+        while True:
+            await asyncio.sleep(self.renew_interval)
+            await self._elect()
+
+    async def _lead(self) -> None:
+        logger.info(f"Worker {self.worker_id} is the leader: polling NBA.com")
+        self.is_leader = True
+        self.leader_since = time.monotonic()
+        self.scoreboard.replicate = functools.partial(self._send, "scoreboard")
+        self.scoreboard.request_snapshot = None
+        self.playbyplay.replicate = functools.partial(self._send, "playbyplay")
+        self.playbyplay.watch = None
+        self.datasets.replicate = functools.partial(self._send, "data")
+        if self._warm_up is not None:
+            warm_up, self._warm_up = self._warm_up, None
+            await warm_up()
+            if not self.is_leader:
+                return
+        self.playbyplay.start_polling()
+        self.scheduler.start()
+
+    async def _follow(self) -> None:
+        if self.is_leader:
+            logger.warning(f"Worker {self.worker_id} lost the leader lease; following")
+            await self.scheduler.stop()
+        else:
+            logger.info(f"Worker {self.worker_id} is following the leader")
+        self.is_leader = False
+        self.leader_since = None
+        self.scoreboard.replicate = None
+        self.scoreboard.request_snapshot = functools.partial(
+            self._send, "control", {"kind": "hello"}
+        )
+        self.playbyplay.replicate = None
+        self.playbyplay.watch = self._watch
+        self.datasets.replicate = None
+        await self.playbyplay.stop_polling()
+        for game_id in self.playbyplay.subscribed_games():
+            self._watch(game_id, True)
+
+    # Messages
+
+    def _send(self, channel: str, header: Dict[str, Any], *frames: str) -> None:
+        """Queue a message for publishing, in order, without awaiting the backbone."""
+        message = "\n".join([json.dumps({**header, "origin": self.worker_id}), *frames])
+        try:
+            self._outbox.put_nowait((self.channels[channel], message))
+        except asyncio.QueueFull:
+            cluster_dropped.inc()
+            logger.warning(f"Backbone outbox full; dropping a {channel} message")
+
+    async def _send_loop(self) -> None:
+        while True:
+            channel, message = await self._outbox.get()
+            try:
+                await self.backbone.publish(channel, message)
+            except Exception as e:
+                logger.error(f"Error publishing to {channel}: {e}")
+
+    def _watch(self, game_id: str, watching: bool, resync: bool = False) -> None:
+        header: Dict[str, Any] = {
+            "kind": "watch" if watching else "unwatch",
+            "game_id": game_id,
+        }
+        if resync:
+            header["resync"] = True
+        self._send("control", header)
+
+    async def _watch_loop(self) -> None:
+        # The leader forgets watchers that stop re-announcing (workers that died)
+        while True:
+            await asyncio.sleep(self.watch_interval)
+            if not self.is_leader:
+                for game_id in self.playbyplay.subscribed_games():
+                    self._watch(game_id, True)
+
+    async def _listen(self) -> None:
+        """Receive messages while we're a member; re-subscribe if the backbone fails."""
+        delay = RESUBSCRIBE_MIN_DELAY
+        while True:
+            try:
+                if self._subscription is None:
+                    raise ConnectionError("not subscribed")
+                async for channel, message in self._subscription:
+                    delay = RESUBSCRIBE_MIN_DELAY
+                    await self._receive(channel, message)
+                raise ConnectionError("subscription ended")
+            except Exception as e:
+                logger.error(
+                    f"Backbone subscription failed: {e}; re-subscribing in {delay:.1f}s"
+                )
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, RESUBSCRIBE_MAX_DELAY)
+            await self._resubscribe()
+
+    async def _resubscribe(self) -> None:
+        try:
+            if self._subscription is not None:
+                await self._subscription.close()
+        except Exception as e:
+            logger.warning(f"Error closing the failed subscription: {e}")
+        try:
+            self._subscription = await self.backbone.subscribe(
+                list(self.channels.values())
+            )
+        except Exception as e:
+            logger.error(f"Re-subscribing to the backbone failed: {e}")
+            return
+        logger.info("Re-subscribed to the backbone")
+        if not self.is_leader and self.scoreboard.request_snapshot is not None:
+            # Frames published meanwhile are lost: ask for the current state
+            self.scoreboard.request_snapshot()
+            for game_id in self.playbyplay.subscribed_games():
+                self._watch(game_id, True, resync=True)
+
+    async def _receive(self, channel: str, message: str) -> None:
+        try:
+            header_line, *frames = message.split("\n")
+            header = json.loads(header_line)
+            if header.get("origin") == self.worker_id:
+                return
+            await self._handle(self._channel_names.get(channel), header, frames)
+        except Exception as e:
+            logger.error(f"Error handling a {channel} message: {e}")
+
+    async def _handle(
+        self, channel: Optional[str], header: Dict[str, Any], frames: List[str]
+    ) -> None:
+        if channel == "scoreboard" and not self.is_leader:
+            await self.scoreboard.apply_replicated(header, frames)
+        elif channel == "playbyplay" and not self.is_leader:
+            await self.playbyplay.apply_replicated(header, frames[0])
+        elif channel == "data" and not self.is_leader:
+            self.datasets.apply_replicated(header)
+        elif channel == "control" and self.is_leader:
+            kind = header["kind"]
+            if kind == "hello":
+                self.scoreboard.publish_state()
+            elif kind == "watch":
+                await self.playbyplay.add_watcher(
+                    header["game_id"],
+                    header["origin"],
+                    resync=header.get("resync", False),
+                )
+            elif kind == "unwatch":
+                await self.playbyplay.remove_watcher(
+                    header["game_id"], header["origin"]
+                )
+
+
+# Global cluster membership of this worker
+cluster = Cluster.from_settings(
+    scheduler, scoreboard_manager, playbyplay_manager, freshness
+)
+
+metrics.gauge(
+    "nba_cluster_leader",
+    "1 if this worker is the leader polling NBA.com",
+    lambda: float(cluster.is_leader),
+)
@@ -0,0 +1,197 @@
+# app/services/freshness.py
+import logging
+import time
+from datetime import datetime, timezone
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple, Union
+
+from app.services.scheduler import SKIPPED
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+
+def _isoformat(timestamp: Optional[float]) -> Optional[str]:
+    if timestamp is None:
+        return None
+    return datetime.fromtimestamp(timestamp, tz=timezone.utc).isoformat()
+
+
+class DatasetFreshness:
+    """Refresh bookkeeping for one dataset served from SQLite."""
+
+    __slots__ = (
+        "name",
+        "stale_after",
+        "version",
+        "reload",
+        "last_success",
+        "last_attempt",
+        "last_error",
+        "refreshing",
+        "replicated_version",
+    )
+
+    def __init__(
+        self,
+        name: str,
+        stale_after: float,
+        version: Optional[Callable[[], Any]] = None,
+        reload: Optional[Callable[[], None]] = None,
+    ):
+        self.name = name
+        self.stale_after = stale_after
+        self.version = version
+        self.reload = reload
+        self.last_success: Optional[float] = None
+        self.last_attempt: Optional[float] = None
+        self.last_error: Optional[str] = None
+        self.refreshing = False
+        self.replicated_version: Optional[Tuple[str, Any]] = None
+
+    def age(self, now: float) -> Optional[float]:
+        """Seconds since the last successful refresh (None if never refreshed)."""
+        return None if self.last_success is None else now - self.last_success
+
+    def is_stale(self, now: float) -> bool:
+        """Not refreshed yet, or not within ``stale_after``."""
+        age = self.age(now)
+        return age is None or age > self.stale_after
+
+    def as_dict(self, now: float) -> Dict[str, Any]:
+        age = self.age(now)
+        return {
+            "last_refreshed": _isoformat(self.last_success),
+            "last_attempt": _isoformat(self.last_attempt),
+            "age_seconds": None if age is None else round(age, 1),
+            "stale_after_seconds": self.stale_after,
+            "stale": self.is_stale(now),
+            "refreshing": self.refreshing,
+            "last_error": self.last_error,
+        }
+
+
+class FreshnessRegistry:
+    """
+    Tracks when each dataset was last refreshed from NBA.com.
+
+    Endpoints keep serving whatever is in SQLite while refreshes run in the
+    background; the registry records how old that data is so /health can
+    report it.
+
+    Only the cluster leader runs refreshes. While ``replicate`` is set (on the
+    leader) each successful refresh is announced with the dataset's version;
+    the other workers record it with ``apply_replicated``, which also drops
+    their in-process views of the data when the version has changed.
+    """
+
+    def __init__(self):
+        self._datasets: Dict[str, DatasetFreshness] = {}
+        self.replicate: Optional[Callable[[Dict[str, Any]], None]] = None
+
+    def register(
+        self,
+        name: str,
+        stale_after: float,
+        version: Optional[Callable[[], Any]] = None,
+        reload: Optional[Callable[[], None]] = None,
+    ) -> DatasetFreshness:
+        """
+        Register a dataset (idempotent).
+
+        Args:
+            name: Dataset name, e.g. "players"
+            stale_after: Seconds after a successful refresh the data counts as stale
+            version: Returns a JSON-serializable value that changes whenever a
+                refresh changes the data
+            reload: Drops this worker's in-process views of the data after
+                another worker changed it
+
+        Returns:
+            The dataset's freshness record
+        """
+        dataset = self._datasets.get(name)
+        if dataset is None:
+            dataset = self._datasets[name] = DatasetFreshness(
+                name, stale_after, version, reload
+            )
+        return dataset
+
+    async def refresh(
+        self, name: str, fetch: Callable[[], Awaitable[Any]]
+    ) -> Union[bool, str]:
+        """
+        Run a refresh and record its outcome.
+
+        Errors are logged and recorded rather than raised, so a slow or failing
+        NBA.com never takes the API down; the previous data keeps being served.
+        A refresh already in progress for the dataset is not started twice.
+
+        Args:
+            name: Registered dataset name
+            fetch: Coroutine function performing the refresh
+
+        Returns:
+            True if the refresh succeeded, False if it failed, or SKIPPED if
+            one was already in progress
+        """
+        dataset = self._datasets[name]
+        if dataset.refreshing:
+            logger.info(f"Refresh of {name} already in progress; skipping")
+            return SKIPPED
+
+        dataset.refreshing = True
+        dataset.last_attempt = time.time()
+        try:
+            await fetch()
+        except Exception as e:
+            dataset.last_error = f"{type(e).__name__}: {e}"
+            logger.error(f"Error refreshing {name}: {e}")
+            return False
+        finally:
+            dataset.refreshing = False
+        dataset.last_success = time.time()
+        dataset.last_error = None
+        if self.replicate is not None:
+            self.replicate(
+                {
+                    "kind": "refreshed",
+                    "dataset": name,
+                    "time": dataset.last_success,
+                    "version": None if dataset.version is None else dataset.version(),
+                }
+            )
+        return True
+
+    def apply_replicated(self, header: Dict[str, Any]) -> None:
+        """
+        Record a refresh run by the cluster leader.
+
+        Args:
+            header: The leader's "refreshed" message header
+        """
+        dataset = self._datasets.get(header["dataset"])
+        if dataset is None:
+            return
+        dataset.last_success = header["time"]
+        dataset.last_error = None
+        # Versions are per process, so a new leader's count starts over
+        version = (header["origin"], header["version"])
+        if version != dataset.replicated_version:
+            dataset.replicated_version = version
+            if dataset.reload is not None:
+                dataset.reload()
+
+    def snapshot(self) -> Dict[str, Dict[str, Any]]:
+        """Freshness of every registered dataset."""
+        now = time.time()
+        return {name: dataset.as_dict(now) for name, dataset in self._datasets.items()}
+
+    def stale(self) -> List[str]:
+        """Names of datasets that are currently stale."""
+        now = time.time()
+        return [
+            name for name, dataset in self._datasets.items() if dataset.is_stale(now)
+        ]
+
+
+freshness = FreshnessRegistry()
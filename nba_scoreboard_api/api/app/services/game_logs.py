@@ -0,0 +1,272 @@
+# app/services/game_logs.py
+import asyncio
+import logging
+from datetime import date, timedelta
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+import pandas as pd
+from nba_api.stats.endpoints import playergamelogs
+from sqlalchemy import func, select
+from sqlalchemy.dialects.sqlite import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from app.core.config import get_settings
+from app.models.players import PlayerGameLog
+from app.schemas.players import GameStats
+from app.services.upstream import upstream_client
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+REGULAR_SEASON = "Regular Season"
+
+# Stat columns: PlayerGameLogs uses the upper-case names
+INT_STAT_COLUMNS = [
+    "pts",
+    "fgm",
+    "fga",
+    "fg3m",
+    "fg3a",
+    "ftm",
+    "fta",
+    "oreb",
+    "dreb",
+    "reb",
+    "ast",
+    "stl",
+    "blk",
+    "tov",
+    "pf",
+    "plus_minus",
+]
+FLOAT_STAT_COLUMNS = ["min", "fg_pct", "fg3_pct", "ft_pct"]
+
+# Columns returned to clients, in GameStats field order
+GAME_STATS_COLUMNS = [getattr(PlayerGameLog, name) for name in GameStats.model_fields]
+
+# (season, season_type) pairs known to be loaded into the store
+_loaded: Set[Tuple[str, str]] = set()
+
+# Bumped on every write so derived views (the stats engine) know to reload
+store_version = 0
+
+
+async def load_game_logs(
+    db: AsyncSession,
+    season: str,
+    season_type: str = REGULAR_SEASON,
+    date_from: Optional[date] = None,
+) -> int:
+    """
+    Load every player's game logs for a season with one upstream call.
+
+    The DataFrame conversion runs in a worker thread and the upsert through
+    the async session, so a season load doesn't block the event loop.
+
+    Args:
+        db: Database session
+        season: Season in "YYYY-YY" format
+        season_type: "Regular Season", "Playoffs", ...
+        date_from: Only fetch games on or after this date (incremental refresh)
+
+    Returns:
+        Number of game log rows written
+
+    Raises:
+        Exception: If there's an error fetching or storing the logs
+    """
+    params = {"season_nullable": season, "season_type_nullable": season_type}
+    if date_from is not None:
+        params["date_from_nullable"] = date_from.strftime("%m/%d/%Y")
+    try:
+        logs = await upstream_client.call(
+            "stats", playergamelogs.PlayerGameLogs, **params
+        )
+        df_logs = logs.get_data_frames()[0]
+    except Exception as e:
+        logger.error(f"Error fetching game logs for {season} {season_type}: {e}")
+        raise
+
+    rows = await asyncio.to_thread(game_log_rows, df_logs, season, season_type)
+    count = await db.run_sync(store_game_logs, rows)
+    _loaded.add((season, season_type))
+    logger.info(f"Stored {count} game logs for {season} {season_type}")
+    return count
+
+
+async def refresh_game_logs(
+    db: AsyncSession,
+    season: Optional[str] = None,
+    season_type: str = REGULAR_SEASON,
+) -> int:
+    """
+    Incrementally refresh the store after a game night.
+
+    Fetches games from the day before the latest stored game onwards (late
+    finishes and stat corrections land the next day), or the whole season if
+    nothing is stored yet.
+
+    Args:
+        db: Database session
+        season: Season in "YYYY-YY" format (default: NBA_SEASON)
+        season_type: "Regular Season", "Playoffs", ...
+
+    Returns:
+        Number of game log rows written
+    """
+    season = season or get_settings().NBA_SEASON
+    latest = await db.scalar(
+        select(func.max(PlayerGameLog.game_date)).where(
+            PlayerGameLog.season == season,
+            PlayerGameLog.season_type == season_type,
+        )
+    )
+    date_from = date.fromisoformat(latest[:10]) - timedelta(days=1) if latest else None
+    return await load_game_logs(db, season, season_type, date_from)
+
+
+def game_log_rows(
+    df_logs: pd.DataFrame, season: str, season_type: str
+) -> List[Dict[str, Any]]:
+    """
+    Convert a PlayerGameLogs DataFrame to PlayerGameLog column dicts.
+
+    Args:
+        df_logs: PlayerGameLogs DataFrame
+        season: Season the logs belong to
+        season_type: Season type the logs belong to
+
+    Returns:
+        One dict per player-game
+    """
+    frame = pd.DataFrame(
+        {
+            "person_id": df_logs["PLAYER_ID"].astype(int),
+            "game_id": df_logs["GAME_ID"].astype(str),
+            "game_date": df_logs["GAME_DATE"].astype(str),
+            "team_abbreviation": df_logs["TEAM_ABBREVIATION"].fillna(""),
+            "matchup": df_logs["MATCHUP"].fillna(""),
+            "wl": df_logs["WL"].fillna(""),
+        }
+    )
+    for column in INT_STAT_COLUMNS:
+        frame[column] = (
+            pd.to_numeric(df_logs[column.upper()], errors="coerce")
+            .fillna(0)
+            .astype(int)
+        )
+    for column in FLOAT_STAT_COLUMNS:
+        frame[column] = (
+            pd.to_numeric(df_logs[column.upper()], errors="coerce")
+            .fillna(0.0)
+            .astype(float)
+        )
+    frame["season"] = season
+    frame["season_type"] = season_type
+    return frame.to_dict("records")
+
+
+def store_game_logs(db: Session, rows: List[Dict[str, Any]]) -> int:
+    """
+    Upsert game log rows keyed on (person_id, game_id).
+
+    Args:
+        db: Database session
+        rows: PlayerGameLog column dicts
+
+    Returns:
+        Number of rows written
+
+    Raises:
+        Exception: If there's an error updating the database
+    """
+    global store_version
+
+    if not rows:
+        return 0
+    stmt = insert(PlayerGameLog)
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[PlayerGameLog.person_id, PlayerGameLog.game_id],
+        set_={
+            column: stmt.excluded[column]
+            for column in rows[0]
+            if column not in ("person_id", "game_id")
+        },
+    )
+    try:
+        db.execute(stmt, rows)
+        db.commit()
+    except Exception as e:
+        db.rollback()
+        logger.error(f"Error storing game logs: {e}")
+        raise
+    store_version += 1
+    return len(rows)
+
+
+def reload_store() -> None:
+    """Make derived views (the stats engine) reload after another worker's write."""
+    global store_version
+
+    store_version += 1
+
+
+def has_game_logs(db: Session, season: str, season_type: str = REGULAR_SEASON) -> bool:
+    """
+    Whether the store holds logs for a season.
+
+    Args:
+        db: Database session
+        season: Season in "YYYY-YY" format
+        season_type: "Regular Season", "Playoffs", ...
+
+    Returns:
+        True once the season has been loaded
+    """
+    key = (season, season_type)
+    if key not in _loaded:
+        exists = db.scalar(
+            select(PlayerGameLog.id)
+            .where(
+                PlayerGameLog.season == season,
+                PlayerGameLog.season_type == season_type,
+            )
+            .limit(1)
+        )
+        if exists is not None:
+            _loaded.add(key)
+    return key in _loaded
+
+
+def get_recent_game_logs(
+    db: Session,
+    person_id: int,
+    last_n_games: int,
+    season: str,
+    season_type: str = REGULAR_SEASON,
+) -> List[GameStats]:
+    """
+    Get a player's most recent games from the store.
+
+    Args:
+        db: Database session
+        person_id: NBA.com person ID
+        last_n_games: Number of recent games to return
+        season: Season in "YYYY-YY" format
+        season_type: "Regular Season", "Playoffs", ...
+
+    Returns:
+        GameStats, most recent first
+    """
+    rows = db.execute(
+        select(*GAME_STATS_COLUMNS)
+        .where(
+            PlayerGameLog.person_id == person_id,
+            PlayerGameLog.season == season,
+            PlayerGameLog.season_type == season_type,
+        )
+        .order_by(PlayerGameLog.game_date.desc())
+        .limit(last_n_games)
+    )
+    return [GameStats(**row._mapping) for row in rows]
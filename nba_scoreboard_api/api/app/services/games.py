@@ -0,0 +1,159 @@
+# app/services/games.py
+import logging
+from datetime import date, datetime, timedelta
+from typing import List, Set
+
+import pytz
+from sqlalchemy.dialects.sqlite import insert
+from sqlalchemy.orm import Session
+
+from app.core.config import get_settings
+from app.models.scoreboard import Game
+from app.schemas.scoreboard import GameBrief, TeamGameInfo
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+EASTERN = pytz.timezone("US/Eastern")
+
+# Past dates known to have no games (All-Star break, offseason). Kept in
+# memory only: the games table has no row to record them.
+_empty_dates: Set[date] = set()
+
+
+def is_archivable(game_date: date) -> bool:
+    """
+    Whether every game on ``game_date`` (US/Eastern) is certainly final.
+
+    Late games run past midnight, so a date is only archived once
+    GAMES_ARCHIVE_DELAY_HOURS have passed since the end of that day.
+
+    Args:
+        game_date: Game date
+
+    Returns:
+        True if results for the date can no longer change
+    """
+    settings = get_settings()
+    day_end = EASTERN.localize(
+        datetime.combine(game_date + timedelta(days=1), datetime.min.time())
+    )
+    return datetime.now(EASTERN) >= day_end + timedelta(
+        hours=settings.GAMES_ARCHIVE_DELAY_HOURS
+    )
+
+
+def get_archived_games(db: Session, game_date: date) -> List[GameBrief]:
+    """
+    Get the archived final games for a date.
+
+    Args:
+        db: Database session
+        game_date: Game date
+
+    Returns:
+        List of games, empty if the date has not been archived
+    """
+    start = datetime.combine(game_date, datetime.min.time())
+    rows = (
+        db.query(Game)
+        .filter(
+            Game.game_date >= start,
+            Game.game_date < start + timedelta(days=1),
+            Game.status == 3,
+        )
+        .order_by(Game.game_id)
+        .all()
+    )
+    return [game_to_brief(row) for row in rows]
+
+
+def is_empty_date(game_date: date) -> bool:
+    """Whether ``game_date`` was fetched before and had no games."""
+    return game_date in _empty_dates
+
+
+def mark_empty_date(game_date: date) -> None:
+    """Remember that an archivable date had no games."""
+    _empty_dates.add(game_date)
+
+
+def archive_games(db: Session, games: List[GameBrief]) -> int:
+    """
+    Insert or update games in the archive, keyed on game_id.
+
+    Args:
+        db: Database session
+        games: Games to store
+
+    Returns:
+        Number of games written
+
+    Raises:
+        Exception: If there's an error writing to the database
+    """
+    if not games:
+        return 0
+
+    now = datetime.utcnow()
+    rows = [
+        {
+            "game_id": game.game_id,
+            "game_date": game.game_time.replace(tzinfo=None),
+            "status": game.game_status,
+            "period": game.period,
+            "clock": game.clock,
+            "home_team_id": game.home_team.team_id,
+            "home_team_name": game.home_team.team_name,
+            "home_team_city": game.home_team.team_city,
+            "home_team_tricode": game.home_team.team_tricode,
+            "home_team_score": game.home_team.score,
+            "away_team_id": game.away_team.team_id,
+            "away_team_name": game.away_team.team_name,
+            "away_team_city": game.away_team.team_city,
+            "away_team_tricode": game.away_team.team_tricode,
+            "away_team_score": game.away_team.score,
+            "updated_at": now,
+        }
+        for game in games
+    ]
+    stmt = insert(Game)
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[Game.game_id],
+        set_={
+            column: stmt.excluded[column] for column in rows[0] if column != "game_id"
+        },
+    )
+    try:
+        db.execute(stmt, rows)
+        db.commit()
+    except Exception as e:
+        db.rollback()
+        logger.error(f"Error archiving games: {e}")
+        raise
+    return len(rows)
+
+
+def game_to_brief(game: Game) -> GameBrief:
+    """Convert an archived Game row to the scoreboard GameBrief schema."""
+    return GameBrief(
+        game_id=game.game_id,
+        game_status=game.status,
+        period=game.period,
+        clock=game.clock,
+        game_time=game.game_date,
+        home_team=TeamGameInfo(
+            team_id=game.home_team_id,
+            team_name=game.home_team_name,
+            team_city=game.home_team_city,
+            team_tricode=game.home_team_tricode,
+            score=game.home_team_score,
+        ),
+        away_team=TeamGameInfo(
+            team_id=game.away_team_id,
+            team_name=game.away_team_name,
+            team_city=game.away_team_city,
+            team_tricode=game.away_team_tricode,
+            score=game.away_team_score,
+        ),
+    )
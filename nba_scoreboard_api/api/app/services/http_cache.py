@@ -0,0 +1,228 @@
+# app/services/http_cache.py
+import hashlib
+import time
+from email.utils import formatdate, parsedate_to_datetime
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional
+
+from fastapi import Request, Response
+from fastapi.encoders import jsonable_encoder
+
+from app.core.config import get_settings
+from app.core.metrics import metrics
+from app.services.broadcast import encode_frame
+from app.services.cache import TTLCache
+
+http_cache_responses = metrics.counter(
+    "nba_http_cache_responses_total",
+    "GET responses by how they were served: "
+    "not_modified (304), cached, rendered or uncached",
+    labelnames=("result",),
+)
+
+# Returned by a ResponseCache max_age function for results that must not be
+# cached anywhere (e.g. a placeholder served because NBA.com failed)
+NO_STORE = -1.0
+
+
+def etag_for(body: bytes) -> str:
+    """Strong ETag of a response body (truncated SHA-256)."""
+    return f'"{hashlib.sha256(body).hexdigest()[:32]}"'
+
+
+def cache_control(max_age: Optional[float]) -> str:
+    """
+    Cache-Control value for a response.
+
+    Args:
+        max_age: Seconds the response stays fresh (None = it never changes)
+    """
+    if max_age is None:
+        return f"public, max-age={get_settings().HTTP_MAX_AGE_IMMUTABLE}, immutable"
+    return f"public, max-age={max(0, round(max_age))}"
+
+
+def _etag_matches(if_none_match: str, etag: str) -> bool:
+    if if_none_match.strip() == "*":
+        return True
+    # Weak comparison (RFC 9110 13.1.2): W/ prefixes are ignored
+    return any(
+        tag.strip().removeprefix("W/") == etag for tag in if_none_match.split(",")
+    )
+
+
+def is_not_modified(request: Request, etag: str, last_modified: float) -> bool:
+    """
+    Whether the client's copy is current, from If-None-Match or, without
+    it, If-Modified-Since.
+    """
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None:
+        return _etag_matches(if_none_match, etag)
+    if_modified_since = request.headers.get("if-modified-since")
+    if if_modified_since is not None:
+        try:
+            return (
+                int(last_modified)
+                <= parsedate_to_datetime(if_modified_since).timestamp()
+            )
+        except (TypeError, ValueError):
+            return False
+    return False
+
+
+def conditional_response(
+    request: Request,
+    body: bytes,
+    etag: str,
+    last_modified: float,
+    max_age: Optional[float],
+) -> Response:
+    """
+    Serve a serialized JSON body with its validators, or 304 if the client's
+    copy is current.
+
+    Args:
+        request: Incoming request (for If-None-Match / If-Modified-Since)
+        body: Serialized JSON response body
+        etag: ETag of the body
+        last_modified: Unix time the body last changed
+        max_age: Seconds the response stays fresh (None = it never changes)
+
+    Returns:
+        A 200 response with the body, or an empty 304
+    """
+    headers = {
+        "ETag": etag,
+        "Last-Modified": formatdate(last_modified, usegmt=True),
+        "Cache-Control": cache_control(max_age),
+    }
+    if is_not_modified(request, etag, last_modified):
+        return Response(status_code=304, headers=headers)
+    return Response(content=body, media_type="application/json", headers=headers)
+
+
+class CachedResponse:
+    """A serialized GET response body with its validators."""
+
+    __slots__ = ("body", "etag", "last_modified", "max_age", "created")
+
+    def __init__(
+        self, body: bytes, etag: str, last_modified: float, max_age: Optional[float]
+    ):
+        self.body = body
+        self.etag = etag
+        self.last_modified = last_modified
+        self.max_age = max_age
+        self.created = time.monotonic()
+
+    def remaining(self) -> Optional[float]:
+        """Seconds left before the response goes stale (None = never)."""
+        if self.max_age is None:
+            return None
+        return self.max_age - (time.monotonic() - self.created)
+
+
+class _Uncacheable(Exception):
+    """Carries a NO_STORE body out of the cache's fetch so it isn't stored."""
+
+    def __init__(self, body: bytes):
+        super().__init__("uncacheable response")
+        self.body = body
+
+
+class ResponseCache:
+    """
+    Rendered GET responses, keyed by URL, with ETag/Last-Modified validators
+    and a Cache-Control max-age matching how often the data changes.
+
+    While a response is fresh, requests are answered from memory (304 if the
+    client's If-None-Match matches) without calling the service again; once
+    it goes stale the next request re-renders it, keeping Last-Modified if
+    the body came out the same. Concurrent misses for a URL share one render.
+    """
+
+    def __init__(self, max_bytes: int):
+        """
+        Args:
+            max_bytes: Memory budget for the cached bodies
+        """
+        self._cache = TTLCache(
+            "responses",
+            max_bytes=max_bytes,
+            ttl_for=lambda response: response.max_age,
+            size_of=lambda response: len(response.body) + 200,
+        )
+
+    async def respond(
+        self,
+        request: Request,
+        fetch: Callable[[], Awaitable[Any]],
+        max_age: Callable[[Any], Optional[float]],
+        version: Hashable = None,
+    ) -> Response:
+        """
+        Serve a GET route's response from the cache, rendering it on a miss.
+
+        Args:
+            request: Incoming request; its path and query are the cache key
+            fetch: Coroutine function calling the service; its exceptions
+                (e.g. HTTPException) propagate and nothing is cached. Concurrent
+                misses share one call, which may outlive the request that made
+                it, so it must open its own database session
+            max_age: Returns the seconds a result stays fresh (None = it
+                never changes, e.g. a final box score; NO_STORE = serve it
+                with ``Cache-Control: no-store`` and don't keep it)
+            version: Version of the local data the result is derived from;
+                responses rendered from an older version are not served
+
+        Returns:
+            The JSON response with ETag, Last-Modified and Cache-Control, or 304
+        """
+        key = (request.url.path, request.url.query, version)
+        previous: Optional[CachedResponse] = self._cache.peek(key)
+        rendered = False
+
+        async def render() -> CachedResponse:
+            nonlocal rendered
+            rendered = True
+            value = await fetch()
+            body = encode_frame(jsonable_encoder(value)).encode()
+            value_max_age = max_age(value)
+            if value_max_age == NO_STORE:
+                raise _Uncacheable(body)
+            etag = etag_for(body)
+            if previous is not None and previous.etag == etag:
+                last_modified = previous.last_modified
+            else:
+                last_modified = time.time()
+            return CachedResponse(body, etag, last_modified, value_max_age)
+
+        try:
+            cached = await self._cache.get_or_fetch(key, render)
+        except _Uncacheable as e:
+            http_cache_responses.inc("uncached")
+            return Response(
+                content=e.body,
+                media_type="application/json",
+                headers={"Cache-Control": "no-store"},
+            )
+        response = conditional_response(
+            request, cached.body, cached.etag, cached.last_modified, cached.remaining()
+        )
+        if response.status_code == 304:
+            http_cache_responses.inc("not_modified")
+        else:
+            http_cache_responses.inc("rendered" if rendered else "cached")
+        return response
+
+    def clear(self) -> None:
+        """Drop every cached response."""
+        self._cache.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        """Hit/miss counters and memory usage, for monitoring."""
+        return self._cache.stats()
+
+
+# Global response cache for the REST routes
+response_cache = ResponseCache(get_settings().RESPONSE_CACHE_MAX_BYTES)
@@ -0,0 +1,182 @@
+# app/services/jobs.py
+import logging
+import time
+from typing import Dict, Optional, Union
+
+from app.core.config import get_settings
+from app.core.database import AsyncSessionLocal
+from app.services import game_logs as game_log_store
+from app.services import players as player_service
+from app.services.freshness import freshness
+from app.services.game_logs import refresh_game_logs
+from app.services.players import update_player_database
+from app.services.polling import ScoreboardPollPolicy
+from app.services.scheduler import JobScheduler
+from app.services.scoreboard import get_live_games, scoreboard_manager
+from app.services.standings import standings_store, update_standings_database
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+
+class ScoreboardPoller:
+    """
+    Polls the live scoreboard and broadcasts changes.
+
+    The interval follows the games' state (ScoreboardPollPolicy): near idle
+    when nothing is scheduled soon, ramping up before tip-off, fastest in
+    close games late, slower during stoppages and breaks. After an error the
+    poller backs off to SCOREBOARD_ERROR_INTERVAL.
+    """
+
+    def __init__(self, policy: Optional[ScoreboardPollPolicy] = None):
+        self.policy = policy or ScoreboardPollPolicy()
+        self.error_interval = get_settings().SCOREBOARD_ERROR_INTERVAL
+        self._after_error = False
+
+    async def poll(self) -> None:
+        """Fetch the scoreboard once and let the manager broadcast any changes."""
+        try:
+            games = await get_live_games()
+            was_broadcast = await scoreboard_manager.broadcast(games)
+        except Exception:
+            self._after_error = True
+            raise
+        self._after_error = False
+        self.policy.observe(games, time.time())
+
+        if was_broadcast:
+            logger.debug(f"Broadcast scoreboard update with {len(games)} games")
+
+    def next_interval(self) -> float:
+        """Seconds until the next poll."""
+        if self._after_error:
+            return self.error_interval
+        return self.policy.interval(time.time())
+
+
+class GameNight:
+    """
+    Whether standings and box-score-derived data are currently changing.
+
+    It is a game night while any game on the live scoreboard is in progress,
+    and for ``grace`` seconds after a game is first seen final (NBA.com's
+    stats endpoints lag the final buzzer).
+    """
+
+    def __init__(self, grace: float):
+        self.grace = grace
+        self._final_seen: Dict[str, float] = {}
+
+    def active(self) -> bool:
+        now = time.time()
+        live = False
+        for game in scoreboard_manager.current_games:
+            status = game.get("game_status")
+            if status == 2:
+                live = True
+            elif status == 3:
+                self._final_seen.setdefault(game["game_id"], now)
+        self._final_seen = {
+            game_id: seen
+            for game_id, seen in self._final_seen.items()
+            if now - seen < self.grace
+        }
+        return live or bool(self._final_seen)
+
+
+async def refresh_players() -> Union[bool, str]:
+    async with AsyncSessionLocal() as db:
+        return await freshness.refresh("players", lambda: update_player_database(db))
+
+
+async def refresh_standings() -> Union[bool, str]:
+    async with AsyncSessionLocal() as db:
+        return await freshness.refresh(
+            "standings", lambda: update_standings_database(db)
+        )
+
+
+async def refresh_game_log_store() -> Union[bool, str]:
+    async with AsyncSessionLocal() as db:
+        return await freshness.refresh("game_logs", lambda: refresh_game_logs(db))
+
+
+scheduler = JobScheduler(get_settings().SCHEDULER_POOL_LIMITS)
+scoreboard_poller = ScoreboardPoller()
+
+
+def register_jobs(scheduler: JobScheduler, refresh: bool = True) -> None:
+    """
+    Register the app's periodic jobs.
+
+    - scoreboard: live scoreboard poll, interval from the games' state
+    - standings: every STANDINGS_REFRESH_INTERVAL on game nights, otherwise
+      only once stale
+    - players: once the roster is stale (daily by default)
+    - game_logs: every GAME_LOGS_CHECK_INTERVAL on game nights (ingesting
+      new finals), otherwise only once stale
+
+    The datasets' versions let other workers in the cluster drop their
+    in-process views when the leader's refresh changed the data.
+
+    Refresh jobs share the "refresh" pool, so NBA.com stats calls and SQLite
+    writes don't pile up; the poll runs in its own "live" pool.
+
+    Args:
+        scheduler: Scheduler to register with
+        refresh: Also register the NBA.com data refresh jobs (off in testing)
+    """
+    settings = get_settings()
+    players = freshness.register(
+        "players",
+        settings.PLAYERS_STALE_AFTER,
+        version=lambda: player_service.roster_version,
+        reload=player_service.reload_roster,
+    )
+    standings = freshness.register(
+        "standings",
+        settings.STANDINGS_STALE_AFTER,
+        version=lambda: standings_store.content_hash,
+        reload=standings_store.invalidate,
+    )
+    game_logs = freshness.register(
+        "game_logs",
+        settings.GAME_LOGS_REFRESH_INTERVAL,
+        version=lambda: game_log_store.store_version,
+        reload=game_log_store.reload_store,
+    )
+    game_night = GameNight(settings.GAME_NIGHT_GRACE)
+
+    scheduler.add_job(
+        "scoreboard",
+        scoreboard_poller.poll,
+        interval=scoreboard_poller.next_interval,
+        pool="live",
+    )
+    if not refresh:
+        return
+    scheduler.add_job(
+        "standings",
+        refresh_standings,
+        interval=settings.STANDINGS_REFRESH_INTERVAL,
+        jitter=settings.SCHEDULER_JITTER,
+        pool="refresh",
+        when=lambda: standings.is_stale(time.time()) or game_night.active(),
+    )
+    scheduler.add_job(
+        "players",
+        refresh_players,
+        interval=settings.PLAYERS_CHECK_INTERVAL,
+        jitter=settings.SCHEDULER_JITTER,
+        pool="refresh",
+        when=lambda: players.is_stale(time.time()),
+    )
+    scheduler.add_job(
+        "game_logs",
+        refresh_game_log_store,
+        interval=settings.GAME_LOGS_CHECK_INTERVAL,
+        jitter=settings.SCHEDULER_JITTER,
+        pool="refresh",
+        when=lambda: game_logs.is_stale(time.time()) or game_night.active(),
+    )
@@ -0,0 +1,211 @@
+# app/services/player_search.py
+import heapq
+import logging
+import math
+import re
+import unicodedata
+from bisect import bisect_left
+from collections import Counter
+from itertools import chain
+from typing import Dict, Iterable, Iterator, List, Sequence, Set, Tuple
+
+from sqlalchemy.orm import Session
+
+from app.models.players import Player
+from app.schemas.players import PlayerBase
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+_DROPPED = re.compile(r"[.'’]")  # "P.J.", "D'Angelo" fold to "pj", "dangelo"
+_SEPARATORS = re.compile(r"[^0-9a-z]+")
+
+# Share of the query's trigrams a fuzzy match must contain
+TRIGRAM_MIN_OVERLAP = 0.5
+
+
+def fold_tokens(text: str) -> List[str]:
+    """
+    Accent- and case-fold a name into search tokens.
+
+    Args:
+        text: Player name or search query
+
+    Returns:
+        Lowercase ASCII tokens, e.g. "Nikola Jokić" -> ["nikola", "jokic"]
+    """
+    decomposed = unicodedata.normalize("NFKD", text)
+    stripped = "".join(c for c in decomposed if not unicodedata.combining(c))
+    return _SEPARATORS.sub(" ", _DROPPED.sub("", stripped.casefold())).split()
+
+
+def _trigrams(tokens: Iterable[str]) -> Set[str]:
+    grams = set()
+    for token in tokens:
+        padded = f"  {token} "
+        grams.update(padded[i : i + 3] for i in range(len(padded) - 2))
+    return grams
+
+
+class PlayerSearchIndex:
+    """
+    In-memory player name index.
+
+    Documents are numbered in static rank order (shorter names first), so a
+    lower id is a better match within a tier. Prefix lookups are bisect range
+    scans over sorted arrays (a flattened trie); typo-tolerant matches come
+    from a trigram index. Results are ranked:
+
+      1. the full name starts with the query ("lebron ja")
+      2. every query word starts a word of the name ("james", "jok niko")
+      3. most shared word trigrams, only if 1 and 2 found fewer than ``limit``
+    """
+
+    def __init__(self):
+        self.loaded = False
+        self._players: List[PlayerBase] = []
+        self._doc_tokens: List[Tuple[str, ...]] = []
+        self._full_names: List[str] = []
+        self._full_ids: List[int] = []
+        self._tokens: List[str] = []
+        self._postings: Dict[str, List[int]] = {}
+        self._trigram_postings: Dict[str, List[int]] = {}
+
+    def __len__(self) -> int:
+        return len(self._players)
+
+    def build(self, players: Iterable[PlayerBase]) -> None:
+        """
+        Replace the index contents.
+
+        Args:
+            players: Players to index
+        """
+        folded = []
+        for player in players:
+            tokens = tuple(fold_tokens(player.display_name))
+            if tokens:
+                folded.append((" ".join(tokens), tokens, player))
+        folded.sort(key=lambda item: (len(item[0]), item[0]))
+
+        postings: Dict[str, List[int]] = {}
+        trigram_postings: Dict[str, List[int]] = {}
+        for doc, (_, tokens, _) in enumerate(folded):
+            for token in set(tokens):
+                postings.setdefault(token, []).append(doc)
+            for gram in _trigrams(tokens):
+                trigram_postings.setdefault(gram, []).append(doc)
+
+        by_name = sorted(range(len(folded)), key=lambda doc: folded[doc][0])
+
+        # Swap everything in at once so searches never see a partial index
+        self._players = [player for _, _, player in folded]
+        self._doc_tokens = [tokens for _, tokens, _ in folded]
+        self._full_names = [folded[doc][0] for doc in by_name]
+        self._full_ids = by_name
+        self._tokens = sorted(postings)
+        self._postings = postings
+        self._trigram_postings = trigram_postings
+        self.loaded = True
+        logger.info(
+            f"Built player search index: {len(folded)} players, {len(postings)} tokens"
+        )
+
+    def load(self, db: Session) -> None:
+        """
+        Rebuild the index from the players table.
+
+        Args:
+            db: Database session
+        """
+        self.build(
+            PlayerBase.model_validate(player) for player in db.query(Player).all()
+        )
+
+    def ensure_loaded(self, db: Session) -> None:
+        """Load the index on first use (e.g. when startup refreshes are skipped)."""
+        if not self.loaded:
+            self.load(db)
+
+    def search(self, query: str, limit: int = 25) -> List[PlayerBase]:
+        """
+        Find players matching a name query.
+
+        Args:
+            query: Search string (any case, accents optional)
+            limit: Maximum number of results
+
+        Returns:
+            Up to ``limit`` players, best matches first
+        """
+        tokens = fold_tokens(query)
+        if not tokens or limit <= 0:
+            return []
+        folded = " ".join(tokens)
+
+        results: List[int] = []
+        seen: Set[int] = set()
+
+        def take(docs: Iterable[int]) -> bool:
+            for doc in docs:
+                if doc not in seen:
+                    seen.add(doc)
+                    results.append(doc)
+                    if len(results) >= limit:
+                        return True
+            return False
+
+        lo, hi = self._range(self._full_names, folded)
+        if not take(heapq.nsmallest(limit, self._full_ids[lo:hi])):
+            if not take(self._word_prefix_matches(tokens)):
+                take(self._trigram_matches(tokens, limit - len(results), seen))
+        return [self._players[doc] for doc in results]
+
+    @staticmethod
+    def _range(keys: Sequence[str], prefix: str) -> Tuple[int, int]:
+        return bisect_left(keys, prefix), bisect_left(keys, prefix + "\uffff")
+
+    def _word_prefix_matches(self, tokens: List[str]) -> Iterator[int]:
+        """Docs where every query token prefixes some name token, best first."""
+        ranges = [self._range(self._tokens, token) for token in tokens]
+        # Drive the scan from the most selective query token
+        pivot = min(range(len(tokens)), key=lambda i: ranges[i][1] - ranges[i][0])
+        lo, hi = ranges[pivot]
+        if lo == hi:
+            return
+        others = [token for i, token in enumerate(tokens) if i != pivot]
+        docs = sorted(
+            set(
+                chain.from_iterable(
+                    self._postings[token] for token in self._tokens[lo:hi]
+                )
+            )
+        )
+        for doc in docs:
+            doc_tokens = self._doc_tokens[doc]
+            if all(
+                any(word.startswith(token) for word in doc_tokens) for token in others
+            ):
+                yield doc
+
+    def _trigram_matches(
+        self, tokens: List[str], limit: int, exclude: Set[int]
+    ) -> List[int]:
+        """Docs containing the most of the query's trigrams (typo tolerance)."""
+        grams = _trigrams(tokens)
+        needed = max(1, math.ceil(len(grams) * TRIGRAM_MIN_OVERLAP))
+        counts: Counter = Counter()
+        for gram in grams:
+            postings = self._trigram_postings.get(gram)
+            if postings:
+                counts.update(postings)
+
+        scored = [
+            (-shared, doc)
+            for doc, shared in counts.items()
+            if shared >= needed and doc not in exclude
+        ]
+        return [doc for _, doc in heapq.nsmallest(limit, scored)]
+
+
+player_search_index = PlayerSearchIndex()
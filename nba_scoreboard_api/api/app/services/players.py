@@ -1,146 +1,353 @@
 # app/services/players.py
 import logging
-from sqlalchemy.orm import Session
+from typing import Any, Dict, List, Optional, Tuple
+
+import pandas as pd
 from nba_api.stats.endpoints import commonallplayers, playergamelogs
-from typing import Optional, Tuple, Any
+from sqlalchemy import delete, select
+from sqlalchemy.dialects.sqlite import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
 
+from app.core.config import get_settings
 from app.models.players import Player
-from app.schemas.players import PlayerStats, PlayerBase, GameStats
+from app.schemas.players import (
+    GameStats,
+    Leaderboard,
+    LeaderEntry,
+    PlayerAverages,
+    PlayerBase,
+    PlayerStats,
+    RollingPoint,
+)
+from app.services import game_logs
+from app.services.player_search import player_search_index
+from app.services.stats_engine import stats_engine
+from app.services.upstream import upstream_client
 
 # Configure logging
 logger = logging.getLogger(__name__)
 
-async def update_player_database(db: Session) -> None:
+# SQLite limits bound parameters per statement; chunk large IN (...) lists
+_DELETE_CHUNK_SIZE = 500
+
+# Bumped whenever the players table changes so cached responses are re-rendered
+roster_version = 0
+
+
+async def update_player_database(db: AsyncSession) -> Dict[str, int]:
     """
     Update the SQLite database with current NBA players.
-    
+
     Args:
-        db: Database session
-    
+        db: Async database session
+
+    Returns:
+        Counts of inserted, updated, removed and unchanged players
+
     Raises:
         Exception: If there's an error updating the database
     """
     try:
         # Get all current NBA players
-        all_players = commonallplayers.CommonAllPlayers(
+        all_players = await upstream_client.call(
+            "stats",
+            commonallplayers.CommonAllPlayers,
             is_only_current_season=1,
-            league_id='00',
-            season='2024-25'
+            league_id="00",
+            season=get_settings().NBA_SEASON,
         )
         df_players = all_players.common_all_players.get_data_frame()
-        
-        try:
-            # Clear existing players
-            db.query(Player).delete()
-            
-            # Add new players
-            for _, row in df_players.iterrows():
-                db_player = Player(
-                    person_id=row['PERSON_ID'],
-                    display_name=row['DISPLAY_FIRST_LAST'],
-                    team_name=row['TEAM_NAME'],
-                    team_abbreviation=row['TEAM_ABBREVIATION']
-                )
-                db.add(db_player)
-            
-            db.commit()
-            logger.info("Successfully updated player database")
-            
-        except Exception as e:
-            db.rollback()
-            logger.error(f"Error updating database: {e}")
-            raise
-            
     except Exception as e:
         logger.error(f"Error fetching player data: {e}")
         raise
 
+    counts = await db.run_sync(sync_players, df_players)
+    logger.info(
+        "Successfully updated player database: "
+        + ", ".join(f"{name}={count}" for name, count in counts.items())
+    )
+    return counts
+
+
+def sync_players(db: Session, df_players: pd.DataFrame) -> Dict[str, int]:
+    """
+    Make the players table match a CommonAllPlayers DataFrame.
+
+    Rows are diffed against the table in memory; only new and changed players
+    are written, with one ``INSERT ... ON CONFLICT(person_id) DO UPDATE``
+    executemany, and players no longer listed are deleted. Readers never see
+    a partially emptied table.
+
+    Args:
+        db: Database session
+        df_players: DataFrame with PERSON_ID, DISPLAY_FIRST_LAST, TEAM_NAME
+            and TEAM_ABBREVIATION columns
+
+    Returns:
+        Counts of inserted, updated, removed and unchanged players
+
+    Raises:
+        Exception: If there's an error updating the database
+    """
+    global roster_version
+
+    incoming = {
+        person_id: (display_name, team_name, team_abbreviation)
+        for person_id, display_name, team_name, team_abbreviation in zip(
+            df_players["PERSON_ID"].astype(int).tolist(),
+            df_players["DISPLAY_FIRST_LAST"].tolist(),
+            df_players["TEAM_NAME"].tolist(),
+            df_players["TEAM_ABBREVIATION"].tolist(),
+        )
+    }
+    existing = {
+        row[0]: tuple(row[1:])
+        for row in db.execute(
+            select(
+                Player.person_id,
+                Player.display_name,
+                Player.team_name,
+                Player.team_abbreviation,
+            )
+        )
+    }
+
+    inserted = [pid for pid in incoming if pid not in existing]
+    updated = [
+        pid for pid in incoming if pid in existing and existing[pid] != incoming[pid]
+    ]
+    removed = [pid for pid in existing if pid not in incoming]
+
+    try:
+        changed = inserted + updated
+        if changed:
+            stmt = insert(Player)
+            stmt = stmt.on_conflict_do_update(
+                index_elements=[Player.person_id],
+                set_={
+                    "display_name": stmt.excluded.display_name,
+                    "team_name": stmt.excluded.team_name,
+                    "team_abbreviation": stmt.excluded.team_abbreviation,
+                },
+            )
+            db.execute(
+                stmt,
+                [
+                    {
+                        "person_id": pid,
+                        "display_name": incoming[pid][0],
+                        "team_name": incoming[pid][1],
+                        "team_abbreviation": incoming[pid][2],
+                    }
+                    for pid in changed
+                ],
+            )
+        for i in range(0, len(removed), _DELETE_CHUNK_SIZE):
+            chunk = removed[i : i + _DELETE_CHUNK_SIZE]
+            db.execute(delete(Player).where(Player.person_id.in_(chunk)))
+        db.commit()
+    except Exception as e:
+        db.rollback()
+        logger.error(f"Error updating database: {e}")
+        raise
+
+    if changed or removed:
+        roster_version += 1
+    if changed or removed or not player_search_index.loaded:
+        player_search_index.load(db)
+
+    return {
+        "inserted": len(inserted),
+        "updated": len(updated),
+        "removed": len(removed),
+        "unchanged": len(incoming) - len(changed),
+    }
+
+
+def data_version() -> Tuple[int, int]:
+    """Versions of the players table and the game log store, for response caching."""
+    return roster_version, game_logs.store_version
+
+
+def reload_roster() -> None:
+    """Drop cached views of the players table after another worker changed it."""
+    global roster_version
+
+    roster_version += 1
+    player_search_index.loaded = False
+
+
 async def get_player_recent_games(
-    db: Session,
-    player_id: int,
-    last_n_games: int = 10
+    db: AsyncSession, player_id: int, last_n_games: int = 10
 ) -> Optional[PlayerStats]:
     """
     Get recent games for a specific player.
-    
+
+    Served from the local game log store when the current season is loaded,
+    otherwise fetched from NBA.com.
+
     Args:
-        db: Database session
+        db: Async database session
         player_id: NBA.com person ID
         last_n_games: Number of recent games to return (default: 10)
-    
+
     Returns:
         PlayerStats object containing player info and game statistics,
         or None if player not found
     """
     # Get player from database
-    player = db.query(Player).filter(Player.person_id == player_id).first()
+    player = await db.scalar(select(Player).where(Player.person_id == player_id))
     if not player:
         return None
-    
+
+    # Convert player to PlayerBase model
+    player_info = PlayerBase(
+        person_id=player.person_id,
+        display_name=player.display_name,
+        team_name=player.team_name,
+        team_abbreviation=player.team_abbreviation,
+    )
+
+    # Serve from the local game log store once the season is loaded
+    season = get_settings().NBA_SEASON
+    if await db.run_sync(game_logs.has_game_logs, season):
+        games = await db.run_sync(
+            game_logs.get_recent_game_logs, player_id, last_n_games, season
+        )
+        return PlayerStats(player_info=player_info, games=games)
+
     try:
         # Fetch game logs from NBA API
-        logs = playergamelogs.PlayerGameLogs(
+        logs = await upstream_client.call(
+            "stats",
+            playergamelogs.PlayerGameLogs,
             player_id_nullable=player_id,
-            season_nullable="2024-25",
-            season_type_nullable="Regular Season",
-            last_n_games_nullable=last_n_games
+            season_nullable=season,
+            season_type_nullable=game_logs.REGULAR_SEASON,
+            last_n_games_nullable=last_n_games,
         )
         df_games = logs.get_data_frames()[0]
-        
-        # Convert player to PlayerBase model
-        player_info = PlayerBase(
-            person_id=player.person_id,
-            display_name=player.display_name,
-            team_name=player.team_name,
-            team_abbreviation=player.team_abbreviation
-        )
-        
+
         # Convert game logs to GameStats models
-        games = []
-        for _, game in df_games.iterrows():
-            game_stats = GameStats(
-                game_date=game["GAME_DATE"],
-                matchup=game["MATCHUP"],
-                wl=game["WL"],
-                min=float(game["MIN"]) if game["MIN"] else 0.0,
-                pts=game["PTS"],
-                fgm=game["FGM"],
-                fga=game["FGA"],
-                fg_pct=game["FG_PCT"],
-                fg3m=game["FG3M"],
-                fg3a=game["FG3A"],
-                fg3_pct=game["FG3_PCT"],
-                ftm=game["FTM"],
-                fta=game["FTA"],
-                ft_pct=game["FT_PCT"],
-                oreb=game["OREB"],
-                dreb=game["DREB"],
-                reb=game["REB"],
-                ast=game["AST"],
-                stl=game["STL"],
-                blk=game["BLK"],
-                tov=game["TOV"],
-                pf=game["PF"],
-                plus_minus=game["PLUS_MINUS"]
+        games = [
+            GameStats(**{field: row[field] for field in GameStats.model_fields})
+            for row in game_logs.game_log_rows(
+                df_games, season, game_logs.REGULAR_SEASON
             )
-            games.append(game_stats)
-        
+        ]
+
         return PlayerStats(player_info=player_info, games=games)
-        
+
     except Exception as e:
         logger.error(f"Error fetching game logs for player {player_id}: {e}")
         raise
 
-async def search_players(db: Session, query: str) -> list[Player]:
+
+async def get_player_averages(
+    db: AsyncSession, player_id: int, window: int = 10, rolling_stat: str = "pts"
+) -> Optional[PlayerAverages]:
+    """
+    Get a player's season averages, per-36 rates and rolling averages.
+
+    Args:
+        db: Async database session
+        player_id: NBA.com person ID
+        window: Games in the last-N averages and each rolling window
+        rolling_stat: Stat for the rolling series (see stats_engine.STATS)
+
+    Returns:
+        PlayerAverages, or None if the player is not found or has no games
+        in the local game log store
+    """
+    player = await db.scalar(select(Player).where(Player.person_id == player_id))
+    if not player:
+        return None
+
+    season = get_settings().NBA_SEASON
+    await db.run_sync(stats_engine.ensure_loaded, season)
+    averages = stats_engine.player_averages(player_id, window)
+    if averages is None:
+        return None
+    rolling = stats_engine.rolling(player_id, rolling_stat, window)
+    return PlayerAverages(
+        player_info=PlayerBase.model_validate(player),
+        season=season,
+        window=window,
+        rolling_stat=rolling_stat,
+        rolling=[RollingPoint(game_date=d, value=round(v, 3)) for d, v in rolling],
+        **averages,
+    )
+
+
+async def get_league_leaders(
+    db: AsyncSession,
+    stat: str,
+    mode: str = "per_game",
+    limit: int = 10,
+    min_games: int = 1,
+    min_attempts: Optional[int] = None,
+) -> Leaderboard:
+    """
+    Get the top players for a stat this season.
+
+    Args:
+        db: Async database session
+        stat: Stat to rank by (see stats_engine.STATS)
+        mode: "per_game", "per_36" or "total"
+        limit: Number of players to return
+        min_games: Minimum games played to qualify
+        min_attempts: For percentages, minimum total attempts to qualify
+            (default: LEADERS_MIN_ATTEMPTS)
+
+    Returns:
+        Leaderboard, best first
+    """
+    settings = get_settings()
+    season = settings.NBA_SEASON
+    if min_attempts is None:
+        min_attempts = settings.LEADERS_MIN_ATTEMPTS.get(stat, 0)
+    await db.run_sync(stats_engine.ensure_loaded, season)
+    top = stats_engine.leaders(stat, mode, limit, min_games, min_attempts)
+    players = {
+        p.person_id: p
+        for p in await db.scalars(
+            select(Player).where(Player.person_id.in_([pid for pid, _, _ in top]))
+        )
+    }
+    return Leaderboard(
+        season=season,
+        stat=stat,
+        mode=mode,
+        leaders=[
+            LeaderEntry(
+                rank=rank,
+                person_id=pid,
+                display_name=players[pid].display_name if pid in players else None,
+                team_abbreviation=(
+                    players[pid].team_abbreviation if pid in players else None
+                ),
+                games_played=games,
+                value=round(value, 3),
+            )
+            for rank, (pid, games, value) in enumerate(top, start=1)
+        ],
+    )
+
+
+async def search_players(
+    db: AsyncSession, query: str, limit: int = 25
+) -> List[PlayerBase]:
     """
     Search for players by name.
-    
+
     Args:
-        db: Database session
-        query: Search string
-    
+        db: Async database session
+        query: Search string (case- and accent-insensitive)
+        limit: Maximum number of results (default: 25)
+
     Returns:
-        List of matching Player objects
+        Matching players, best matches first
     """
-    search_query = f"%{query}%"
-    return db.query(Player).filter(Player.display_name.ilike(search_query)).all()
\ No newline at end of file
+    await db.run_sync(player_search_index.ensure_loaded)
+    return player_search_index.search(query, limit)
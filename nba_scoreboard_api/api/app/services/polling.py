@@ -0,0 +1,173 @@
+# app/services/polling.py
+from datetime import datetime
+from typing import Dict, List, Optional, Tuple
+
+from app.core.config import get_settings
+from app.services.scoreboard import parse_game_clock
+
+# Game states returned by ScoreboardPollPolicy.game_state
+STATES = (
+    "final",
+    "scheduled",
+    "pregame",
+    "tipoff",
+    "delayed",
+    "clutch",
+    "live",
+    "stoppage",
+    "break",
+    "halftime",
+)
+
+
+class ScoreboardPollPolicy:
+    """
+    Chooses the live scoreboard poll interval from the state of the games.
+
+    Each game gets an interval from its own state, and the scoreboard is polled
+    at the shortest of them:
+
+    - final: idle interval
+    - scheduled: idle until SCOREBOARD_PREGAME_WINDOW before tip-off (waking
+      up exactly then), the pregame interval inside the window, and the
+      tip-off interval once the scheduled time has passed
+    - delayed: still not started SCOREBOARD_TIPOFF_WINDOW after the scheduled
+      tip-off (postponed, or no tip-off time): idle interval
+    - live, clock running: the live interval, or the clutch interval in the
+      4th quarter/OT with little time left and a close score
+    - live, clock stopped for SCOREBOARD_STOPPAGE_AFTER: the stoppage interval
+      (timeouts, reviews, free throws); the live interval until then
+    - live, period over: the break interval, or the halftime interval
+
+    A scoreboard without games (e.g. early morning, before NBA.com rolls over
+    to the next day) is polled at the idle interval. Stoppages are detected
+    from the clock not moving between polls, so the policy must see every
+    poll's games (``observe``).
+    """
+
+    def __init__(self):
+        settings = get_settings()
+        self.idle_interval = settings.SCOREBOARD_IDLE_INTERVAL
+        self.pregame_window = settings.SCOREBOARD_PREGAME_WINDOW
+        self.pregame_interval = settings.SCOREBOARD_PREGAME_INTERVAL
+        self.tipoff_interval = settings.SCOREBOARD_TIPOFF_INTERVAL
+        self.tipoff_window = settings.SCOREBOARD_TIPOFF_WINDOW
+        self.live_interval = settings.SCOREBOARD_LIVE_INTERVAL
+        self.clutch_interval = settings.SCOREBOARD_CLUTCH_INTERVAL
+        self.clutch_seconds = settings.SCOREBOARD_CLUTCH_SECONDS
+        self.clutch_margin = settings.SCOREBOARD_CLUTCH_MARGIN
+        self.stoppage_after = settings.SCOREBOARD_STOPPAGE_AFTER
+        self.stoppage_interval = settings.SCOREBOARD_STOPPAGE_INTERVAL
+        self.break_interval = settings.SCOREBOARD_BREAK_INTERVAL
+        self.halftime_interval = settings.SCOREBOARD_HALFTIME_INTERVAL
+
+        self.games: Optional[List[Dict]] = None
+        # game_id -> (period, clock, time the clock was first seen at that value)
+        self._clocks: Dict[str, Tuple[int, Optional[str], float]] = {}
+
+    def observe(self, games: List[Dict], now: float) -> None:
+        """
+        Record the games returned by a poll.
+
+        Args:
+            games: Games as dumped from the live scoreboard response
+            now: Time of the poll (epoch seconds)
+        """
+        clocks = {}
+        for game in games:
+            key = (game.get("period"), game.get("clock"))
+            previous = self._clocks.get(game["game_id"])
+            since = previous[2] if previous is not None and previous[:2] == key else now
+            clocks[game["game_id"]] = (*key, since)
+        self._clocks = clocks
+        self.games = games
+
+    def game_state(self, game: Dict, now: float) -> str:
+        """
+        Classify a game for polling purposes.
+
+        Args:
+            game: Game as dumped from the live scoreboard response
+            now: Current time (epoch seconds)
+
+        Returns:
+            One of STATES
+        """
+        status = game.get("game_status")
+        if status == 1:
+            tipoff = _timestamp(game.get("game_time"))
+            if tipoff is None or now - tipoff > self.tipoff_window:
+                return "delayed"
+            if now >= tipoff:
+                return "tipoff"
+            return "pregame" if tipoff - now <= self.pregame_window else "scheduled"
+        if status != 2:
+            return "final"
+
+        period = game.get("period") or 0
+        seconds = parse_game_clock(game.get("clock"))
+        if period and seconds == 0:
+            return "halftime" if period == 2 else "break"
+
+        clock = self._clocks.get(game["game_id"])
+        if clock is not None and now - clock[2] >= self.stoppage_after:
+            return "stoppage"
+        if (
+            period >= 4
+            and seconds is not None
+            and seconds <= self.clutch_seconds
+            and abs(game["home_team"]["score"] - game["away_team"]["score"])
+            <= self.clutch_margin
+        ):
+            return "clutch"
+        return "live"
+
+    def _game_interval(self, game: Dict, now: float) -> float:
+        state = self.game_state(game, now)
+        if state == "scheduled":
+            # Sleep until the pregame window opens, but never past the idle interval
+            tipoff = _timestamp(game.get("game_time"))
+            return max(
+                self.pregame_interval,
+                min(self.idle_interval, tipoff - self.pregame_window - now),
+            )
+        return {
+            "final": self.idle_interval,
+            "pregame": self.pregame_interval,
+            "tipoff": self.tipoff_interval,
+            "delayed": self.idle_interval,
+            "clutch": self.clutch_interval,
+            "live": self.live_interval,
+            "stoppage": self.stoppage_interval,
+            "break": self.break_interval,
+            "halftime": self.halftime_interval,
+        }[state]
+
+    def interval(self, now: float) -> float:
+        """
+        Seconds until the next poll, given the last observed games.
+
+        Args:
+            now: Current time (epoch seconds)
+
+        Returns:
+            The shortest interval any game calls for; the live interval if no
+            poll has been observed yet
+        """
+        if self.games is None:
+            return self.live_interval
+        return min(
+            (self._game_interval(game, now) for game in self.games),
+            default=self.idle_interval,
+        )
+
+
+def _timestamp(value) -> Optional[float]:
+    if isinstance(value, datetime):
+        return value.timestamp()
+    if isinstance(value, str):
+        try:
+            return datetime.fromisoformat(value.replace("Z", "+00:00")).timestamp()
+        except ValueError:
+            return None
+    return None
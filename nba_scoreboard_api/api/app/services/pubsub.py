@@ -0,0 +1,212 @@
+# app/services/pubsub.py
+import abc
+import asyncio
+import logging
+import time
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+from app.core.config import Settings, get_settings
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+BACKBONES = ("local", "redis")
+
+Message = Tuple[str, str]  # (channel, message)
+
+
+class Subscription(abc.ABC):
+    """Messages on a set of channels, as an async iterator of (channel, message)."""
+
+    def __aiter__(self) -> "Subscription":
+        return self
+
+    @abc.abstractmethod
+    async def __anext__(self) -> Message:
+        """Wait for the next (channel, message) published on the subscribed channels."""
+
+    async def close(self) -> None:
+        pass
+
+
+class Backbone(abc.ABC):
+    """
+    Pub/sub channels and leases shared by every worker.
+
+    Messages are text and delivered at most once to the subscribers present
+    when they are published. A lease belongs to one owner at a time and
+    expires unless its owner renews it.
+    """
+
+    @abc.abstractmethod
+    async def publish(self, channel: str, message: str) -> None:
+        """Deliver a message to the channel's current subscribers."""
+
+    @abc.abstractmethod
+    async def subscribe(self, channels: List[str]) -> Subscription:
+        """Subscribe to channels; messages published once this returns are received."""
+
+    @abc.abstractmethod
+    async def acquire_lease(self, name: str, owner: str, ttl: float) -> bool:
+        """
+        Take the lease, or renew it if ``owner`` holds it.
+
+        Args:
+            name: Lease name
+            owner: Unique ID of the caller
+            ttl: Seconds until the lease expires unless renewed
+
+        Returns:
+            True if ``owner`` holds the lease
+        """
+
+    @abc.abstractmethod
+    async def release_lease(self, name: str, owner: str) -> None:
+        """Give up the lease if ``owner`` holds it."""
+
+    async def close(self) -> None:
+        pass
+
+
+class _LocalSubscription(Subscription):
+    def __init__(self, backbone: "LocalBackbone", channels: List[str]) -> None:
+        self.backbone = backbone
+        self.channels = channels
+        self.queue: asyncio.Queue = asyncio.Queue()
+
+    async def __anext__(self) -> Message:
+        return await self.queue.get()
+
+    async def close(self) -> None:
+        for channel in self.channels:
+            self.backbone._subscribers.get(channel, set()).discard(self.queue)
+
+
+class LocalBackbone(Backbone):
+    """
+    In-process backbone: one process, any number of workers sharing the object.
+
+    With a single worker it leads and publishes to nobody. Tests and
+    benchmarks share one instance between several simulated workers.
+    """
+
+    def __init__(self) -> None:
+        self._subscribers: Dict[str, Set[asyncio.Queue]] = {}
+        self._leases: Dict[str, Tuple[str, float]] = {}  # name -> (owner, expires)
+
+    async def publish(self, channel: str, message: str) -> None:
+        for queue in self._subscribers.get(channel, ()):
+            queue.put_nowait((channel, message))
+
+    async def subscribe(self, channels: List[str]) -> Subscription:
+        subscription = _LocalSubscription(self, channels)
+        for channel in channels:
+            self._subscribers.setdefault(channel, set()).add(subscription.queue)
+        return subscription
+
+    async def acquire_lease(self, name: str, owner: str, ttl: float) -> bool:
+        now = time.monotonic()
+        holder = self._leases.get(name)
+        if holder is None or holder[0] == owner or holder[1] <= now:
+            self._leases[name] = (owner, now + ttl)
+            return True
+        return False
+
+    async def release_lease(self, name: str, owner: str) -> None:
+        holder = self._leases.get(name)
+        if holder is not None and holder[0] == owner:
+            del self._leases[name]
+
+
+# Take the lease if it is free, or renew it if the caller holds it
+_ACQUIRE_LEASE = """
+local owner = redis.call("GET", KEYS[1])
+if owner == ARGV[1] then
+    redis.call("PEXPIRE", KEYS[1], ARGV[2])
+    return 1
+end
+if not owner then
+    redis.call("SET", KEYS[1], ARGV[1], "PX", ARGV[2])
+    return 1
+end
+return 0
+"""
+
+_RELEASE_LEASE = """
+if redis.call("GET", KEYS[1]) == ARGV[1] then
+    return redis.call("DEL", KEYS[1])
+end
+return 0
+"""
+
+
+class _RedisSubscription(Subscription):
+    def __init__(self, pubsub: Any) -> None:
+        self.pubsub = pubsub
+
+    async def __anext__(self) -> Message:
+        while True:
+            message = await self.pubsub.get_message(
+                ignore_subscribe_messages=True, timeout=None
+            )
+            if message is not None and message["type"] == "message":
+                return message["channel"], message["data"]
+
+    async def close(self) -> None:
+        await self.pubsub.aclose()
+
+
+class RedisBackbone(Backbone):
+    """
+    Backbone on a Redis-compatible server (Redis, Valkey, KeyDB), for workers
+    in several processes or on several nodes.
+
+    Channels are Redis pub/sub channels; a lease is a key set with NX and a
+    millisecond expiry, renewed and released only by its owner (Lua scripts,
+    so the check and the update are atomic).
+
+    Needs the ``redis`` package (the ``redis`` extra); the local backbone
+    does not.
+    """
+
+    def __init__(self, url: str) -> None:
+        import redis.asyncio as redis
+
+        self.url = url
+        self._redis = redis.from_url(url, decode_responses=True)
+        self._acquire = self._redis.register_script(_ACQUIRE_LEASE)
+        self._release = self._redis.register_script(_RELEASE_LEASE)
+
+    async def publish(self, channel: str, message: str) -> None:
+        await self._redis.publish(channel, message)
+
+    async def subscribe(self, channels: List[str]) -> Subscription:
+        pubsub = self._redis.pubsub()
+        await pubsub.subscribe(*channels)
+        return _RedisSubscription(pubsub)
+
+    async def acquire_lease(self, name: str, owner: str, ttl: float) -> bool:
+        return bool(await self._acquire(keys=[name], args=[owner, int(ttl * 1000)]))
+
+    async def release_lease(self, name: str, owner: str) -> None:
+        await self._release(keys=[name], args=[owner])
+
+    async def close(self) -> None:
+        await self._redis.aclose()
+
+
+def make_backbone(settings: Optional[Settings] = None) -> Backbone:
+    """
+    Build the backbone selected by PUBSUB_BACKEND.
+
+    Raises:
+        ValueError: If PUBSUB_BACKEND is not one of BACKBONES
+    """
+    settings = settings or get_settings()
+    if settings.PUBSUB_BACKEND == "local":
+        return LocalBackbone()
+    if settings.PUBSUB_BACKEND == "redis":
+        return RedisBackbone(settings.PUBSUB_REDIS_URL)
+    raise ValueError(
+        f"PUBSUB_BACKEND must be one of {BACKBONES}, got {settings.PUBSUB_BACKEND!r}"
+    )
@@ -0,0 +1,264 @@
+# app/services/scheduler.py
+import asyncio
+import logging
+import random
+import time
+from datetime import datetime, timezone
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Union
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+Interval = Union[float, Callable[[], float]]
+
+# Returned by a job run that had nothing to do because the same work was
+# already in progress (e.g. a refresh started elsewhere); counted as skipped,
+# not as a failure
+SKIPPED = "skipped"
+
+
+def _isoformat(timestamp: Optional[float]) -> Optional[str]:
+    if timestamp is None:
+        return None
+    return datetime.fromtimestamp(timestamp, tz=timezone.utc).isoformat()
+
+
+class Job:
+    """A periodic coroutine with its schedule and run metrics."""
+
+    def __init__(
+        self,
+        name: str,
+        fn: Callable[[], Awaitable[Any]],
+        interval: Interval,
+        jitter: float = 0.0,
+        pool: str = "default",
+        when: Optional[Callable[[], bool]] = None,
+    ):
+        self.name = name
+        self.fn = fn
+        self.interval = interval
+        self.jitter = jitter
+        self.pool = pool
+        self.when = when
+
+        self.running = False
+        self.runs = 0
+        self.completed = 0
+        self.failures = 0
+        self.skipped = 0  # Ticks dropped because the work was already in progress
+        self.idle = 0  # Ticks where ``when`` said there was nothing to do
+        self.total_duration = 0.0
+        self.max_duration = 0.0
+        self.last_duration: Optional[float] = None
+        self.last_started: Optional[float] = None
+        self.last_finished: Optional[float] = None
+        self.last_success: Optional[float] = None
+        self.last_error: Optional[str] = None
+        self.next_run: Optional[float] = None
+
+    def next_delay(self) -> float:
+        """Seconds until the next tick: the (possibly dynamic) interval plus jitter."""
+        interval = self.interval() if callable(self.interval) else self.interval
+        return interval + (random.uniform(0, self.jitter) if self.jitter else 0.0)
+
+    def status(self) -> Dict[str, Any]:
+        return {
+            "name": self.name,
+            "pool": self.pool,
+            "running": self.running,
+            "runs": self.runs,
+            "failures": self.failures,
+            "skipped": self.skipped,
+            "idle": self.idle,
+            "last_started": _isoformat(self.last_started),
+            "last_finished": _isoformat(self.last_finished),
+            "last_success": _isoformat(self.last_success),
+            "last_error": self.last_error,
+            "last_duration_ms": (
+                None
+                if self.last_duration is None
+                else round(self.last_duration * 1000, 1)
+            ),
+            "avg_duration_ms": (
+                round(self.total_duration / self.completed * 1000, 1)
+                if self.completed
+                else None
+            ),
+            "max_duration_ms": round(self.max_duration * 1000, 1),
+            "next_run": _isoformat(self.next_run),
+        }
+
+
+class JobScheduler:
+    """
+    In-process scheduler owning the app's periodic work.
+
+    Each job ticks at its interval (plus random jitter, so jobs sharing an
+    interval don't hit NBA.com together). A tick is skipped if the job's
+    previous run is still going, and skipped as idle if the job's ``when``
+    condition says there is nothing to do. Runs are spawned as tasks, so a
+    slow run never delays a fixed-interval job's schedule, and jobs in the
+    same pool share a concurrency cap. A job with a dynamic interval waits for
+    each run to finish, since the run decides the next interval.
+
+    A run fails if it raises or returns False, and counts as skipped if it
+    returns SKIPPED.
+    """
+
+    def __init__(self, pool_limits: Optional[Dict[str, int]] = None):
+        self.jobs: Dict[str, Job] = {}
+        self._pool_limits = dict(pool_limits or {})
+        self._pools: Dict[str, asyncio.Semaphore] = {}
+        self._loops: List[asyncio.Task] = []
+        self._runs: set = set()
+
+    def add_job(
+        self,
+        name: str,
+        fn: Callable[[], Awaitable[Any]],
+        interval: Interval,
+        jitter: float = 0.0,
+        pool: str = "default",
+        when: Optional[Callable[[], bool]] = None,
+    ) -> Job:
+        """
+        Register a job (replacing any job with the same name).
+
+        Args:
+            name: Job name, shown in the status listing
+            fn: Coroutine function performing one run
+            interval: Seconds between ticks, or a callable returning them
+                (evaluated once each tick's run has finished)
+            jitter: Up to this many random seconds added to each interval
+            pool: Concurrency pool; runs beyond the pool's limit wait
+            when: Optional condition checked at each tick; False skips the tick
+
+        Returns:
+            The registered Job
+        """
+        job = Job(name, fn, interval, jitter, pool, when)
+        self.jobs[name] = job
+        return job
+
+    def _pool(self, name: str) -> asyncio.Semaphore:
+        if name not in self._pools:
+            self._pools[name] = asyncio.Semaphore(self._pool_limits.get(name, 1))
+        return self._pools[name]
+
+    async def run(self, name: str) -> bool:
+        """
+        Run a job now and wait for it, unless it is already running.
+
+        Args:
+            name: Job name
+
+        Returns:
+            True if the run succeeded; False if it failed or was skipped
+
+        Raises:
+            KeyError: If there is no such job
+        """
+        job = self.jobs[name]
+        if job.running:
+            job.skipped += 1
+            return False
+
+        job.running = True
+        job.runs += 1
+        try:
+            async with self._pool(job.pool):
+                job.last_started = time.time()
+                start = time.perf_counter()
+                skipped = False
+                try:
+                    result = await job.fn()
+                    skipped = result is SKIPPED
+                    ok = result is not False and not skipped
+                    if not skipped:
+                        job.last_error = None if ok else "returned False"
+                except asyncio.CancelledError:
+                    raise
+                except Exception as e:
+                    ok = False
+                    job.last_error = f"{type(e).__name__}: {e}"
+                    logger.error(f"Job {name} failed: {e}")
+                duration = time.perf_counter() - start
+        finally:
+            job.running = False
+
+        job.last_finished = time.time()
+        job.completed += 1
+        job.last_duration = duration
+        job.total_duration += duration
+        job.max_duration = max(job.max_duration, duration)
+        if ok:
+            job.last_success = job.last_finished
+        elif skipped:
+            job.skipped += 1
+        else:
+            job.failures += 1
+        return ok
+
+    def trigger(self, name: str) -> bool:
+        """
+        Start a job run in the background.
+
+        Args:
+            name: Job name
+
+        Returns:
+            False if the job is already running
+
+        Raises:
+            KeyError: If there is no such job
+        """
+        return self._spawn(name) is not None
+
+    def _spawn(self, name: str) -> Optional[asyncio.Task]:
+        if self.jobs[name].running:
+            self.jobs[name].skipped += 1
+            return None
+        task = asyncio.create_task(self.run(name))
+        self._runs.add(task)
+        task.add_done_callback(self._runs.discard)
+        return task
+
+    async def _tick_loop(self, job: Job) -> None:
+        while True:
+            if job.when is not None and not job.running:
+                try:
+                    due = job.when()
+                except Exception as e:
+                    logger.error(f"Job {job.name} condition failed: {e}")
+                    due = True
+            else:
+                due = True
+            run = self._spawn(job.name) if due else None
+            if not due:
+                job.idle += 1
+            elif run is not None and callable(job.interval):
+                # A dynamic interval depends on what the run found
+                await asyncio.wait({run})
+            delay = job.next_delay()
+            job.next_run = time.time() + delay
+            await asyncio.sleep(delay)
+
+    def start(self) -> None:
+        """Start ticking every job; the first tick of each is immediate."""
+        for job in self.jobs.values():
+            self._loops.append(asyncio.create_task(self._tick_loop(job)))
+        logger.info(f"Scheduler started: {', '.join(self.jobs)}")
+
+    async def stop(self) -> None:
+        """Cancel the tick loops and any runs in progress."""
+        tasks = self._loops + list(self._runs)
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        self._loops.clear()
+        self._runs.clear()
+
+    def status(self) -> List[Dict[str, Any]]:
+        """Status and timing metrics of every job."""
+        return [job.status() for job in self.jobs.values()]
@@ -1,33 +1,96 @@
 # File: app/services/scoreboard.py
-import logging
 import asyncio
+import functools
+import json
+import logging
 import re
 import time
+from collections import deque
 from datetime import datetime, timedelta
-from typing import List, Optional, Dict, Any, Set
-from fastapi import WebSocket
-from nba_api.live.nba.endpoints import scoreboard, boxscore, playbyplay
+from typing import Any, Callable, Deque, Dict, List, Optional, Set, Tuple
+
 import pytz
 from dateutil import parser
-import json
-import copy
-
+from fastapi import WebSocket
+from nba_api.live.nba.endpoints import boxscore, playbyplay, scoreboard
+from nba_api.stats.endpoints import leaguegamefinder
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from app.core.config import get_settings
+from app.core.database import AsyncSessionLocal
+from app.core.metrics import FAST_BUCKETS, metrics
 from app.models.scoreboard import Game
 from app.schemas.scoreboard import (
+    GameBoxScore,
     GameBrief,
     GameDetail,
-    ScoreboardResponse,
-    GameBoxScore,
     PlayByPlayEvent,
     PlayByPlayResponse,
-    TeamGameInfo,
-    TeamBoxScore,
     PlayerBoxScore,
     PlayerStatistics,
+    ScoreboardResponse,
+    TeamBoxScore,
+    TeamGameInfo,
 )
+from app.services import games as games_archive
+from app.services.broadcast import ClientConnection, encode_frame
+from app.services.cache import TTLCache
+from app.services.transform import scoreboard_games
+from app.services.upstream import upstream_client
 
 logger = logging.getLogger(__name__)
 
+_ISO_CLOCK = re.compile(r"PT(\d+)M(\d+(?:\.\d+)?)S")
+_COLON_CLOCK = re.compile(r"\d+:\d+\s*")
+
+# Recent states kept per game to validate scoreboard updates against
+GAME_STATE_HISTORY = 5
+
+
+def box_score_ttl(box_score: GameBoxScore) -> Optional[float]:
+    """Cache TTL for a box score: short while live, no expiry once final."""
+    settings = get_settings()
+    if box_score.status == 3:
+        return settings.BOXSCORE_FINAL_TTL
+    if box_score.status == 2:
+        return settings.BOXSCORE_LIVE_TTL
+    return settings.BOXSCORE_SCHEDULED_TTL
+
+
+def _box_score_size(box_score: GameBoxScore) -> int:
+    """Estimated memory footprint of a cached box score (its JSON size)."""
+    return len(box_score.model_dump_json())
+
+
+box_score_cache = TTLCache(
+    "boxscore",
+    max_bytes=get_settings().BOXSCORE_CACHE_MAX_BYTES,
+    ttl_for=box_score_ttl,
+    size_of=_box_score_size,
+)
+
+scoreboard_fetch_duration = metrics.histogram(
+    "nba_scoreboard_fetch_duration_seconds",
+    "get_live_games time: NBA.com call plus transform",
+)
+broadcast_duration = metrics.histogram(
+    "nba_scoreboard_broadcast_duration_seconds",
+    "ScoreboardManager.broadcast time, by whether an update was sent",
+    ("result",),
+    buckets=FAST_BUCKETS,
+)
+playbyplay_publish_duration = metrics.histogram(
+    "nba_playbyplay_publish_duration_seconds",
+    "Play-by-play poll result publishing time",
+    buckets=FAST_BUCKETS,
+)
+websocket_evictions = metrics.counter(
+    "nba_websocket_evictions_total",
+    "WebSocket clients evicted for falling behind, by stream",
+    ("stream",),
+)
+
 
 async def get_box_score_fixed(game_id: str):
     """
@@ -37,79 +100,14 @@ async def get_box_score_fixed(game_id: str):
     - game_id instead of gameId
     - team_id instead of teamId
     - etc.
+
+    Box scores are served from ``box_score_cache``; concurrent requests for
+    the same game share one upstream fetch. Failed fetches are not cached.
     """
     try:
-        logger.info(f"Fetching box score for game ID: {game_id}")
-
-        # Create BoxScore object from NBA API
-        b = boxscore.BoxScore(game_id)
-
-        # Process home team players
-        home_players = []
-        for player in b.home_team_player_stats.get_dict() or []:
-            if isinstance(player, dict):
-                # Extract statistics safely
-                stats_dict = player.get("statistics", {}) or {}
-
-                home_players.append(
-                    PlayerBoxScore(
-                        player_id=str(player.get("personId", "")),
-                        name=player.get("name", ""),
-                        position=player.get("position", ""),
-                        starter=player.get("starter", False),
-                        statistics=PlayerStatistics(**stats_dict),
-                    )
-                )
-
-        # Process away team players
-        away_players = []
-        for player in b.away_team_player_stats.get_dict() or []:
-            if isinstance(player, dict):
-                # Extract statistics safely
-                stats_dict = player.get("statistics", {}) or {}
-
-                away_players.append(
-                    PlayerBoxScore(
-                        player_id=str(player.get("personId", "")),
-                        name=player.get("name", ""),
-                        position=player.get("position", ""),
-                        starter=player.get("starter", False),
-                        statistics=PlayerStatistics(**stats_dict),
-                    )
-                )
-
-        # Get team stats
-        home_team_stats = b.home_team_stats.get_dict() or {}
-        away_team_stats = b.away_team_stats.get_dict() or {}
-
-        # Get game metadata
-        game_data = b.get_dict() or {}
-        game_status = game_data.get("gameStatus", 1)
-        game_period = game_data.get("period", 0)
-        game_clock = game_data.get("gameClock")
-
-        # Construct the final response using field names matching the schema
-        return GameBoxScore(
-            game_id=game_id,
-            status=game_status,
-            period=game_period,
-            clock=game_clock,
-            home_team=TeamBoxScore(
-                team_id=str(home_team_stats.get("teamId", "")),
-                team_name=home_team_stats.get("teamName", ""),
-                team_city=home_team_stats.get("teamCity", ""),
-                team_tricode=home_team_stats.get("teamTricode", ""),
-                players=home_players,
-            ),
-            away_team=TeamBoxScore(
-                team_id=str(away_team_stats.get("teamId", "")),
-                team_name=away_team_stats.get("teamName", ""),
-                team_city=away_team_stats.get("teamCity", ""),
-                team_tricode=away_team_stats.get("teamTricode", ""),
-                players=away_players,
-            ),
+        return await box_score_cache.get_or_fetch(
+            game_id, functools.partial(_fetch_box_score, game_id)
         )
-
     except Exception as e:
         logger.error(f"Error in get_box_score_fixed for game {game_id}: {e}")
         # Return empty response with correct field names
@@ -135,10 +133,93 @@ async def get_box_score_fixed(game_id: str):
         )
 
 
+def is_placeholder_box_score(box_score: GameBoxScore) -> bool:
+    """Whether get_box_score_fixed returned its empty stand-in after a failed fetch."""
+    return box_score.home_team.team_id == "" and box_score.away_team.team_id == ""
+
+
+async def _fetch_box_score(game_id: str) -> GameBoxScore:
+    """Fetch and parse a box score from NBA.com; raises on failure."""
+    logger.info(f"Fetching box score for game ID: {game_id}")
+
+    # Create BoxScore object from NBA API (off the event loop)
+    b = await upstream_client.call("boxscore", boxscore.BoxScore, game_id)
+
+    # Process home team players
+    home_players = []
+    for player in b.home_team_player_stats.get_dict() or []:
+        if isinstance(player, dict):
+            # Extract statistics safely
+            stats_dict = player.get("statistics", {}) or {}
+
+            home_players.append(
+                PlayerBoxScore(
+                    player_id=str(player.get("personId", "")),
+                    name=player.get("name", ""),
+                    position=player.get("position", ""),
+                    starter=player.get("starter", False),
+                    statistics=PlayerStatistics(**stats_dict),
+                )
+            )
+
+    # Process away team players
+    away_players = []
+    for player in b.away_team_player_stats.get_dict() or []:
+        if isinstance(player, dict):
+            # Extract statistics safely
+            stats_dict = player.get("statistics", {}) or {}
+
+            away_players.append(
+                PlayerBoxScore(
+                    player_id=str(player.get("personId", "")),
+                    name=player.get("name", ""),
+                    position=player.get("position", ""),
+                    starter=player.get("starter", False),
+                    statistics=PlayerStatistics(**stats_dict),
+                )
+            )
+
+    # Get team stats
+    home_team_stats = b.home_team_stats.get_dict() or {}
+    away_team_stats = b.away_team_stats.get_dict() or {}
+
+    # Get game metadata
+    game_data = b.get_dict() or {}
+    game_status = game_data.get("gameStatus", 1)
+    game_period = game_data.get("period", 0)
+    game_clock = game_data.get("gameClock")
+
+    # Construct the final response using field names matching the schema
+    return GameBoxScore(
+        game_id=game_id,
+        status=game_status,
+        period=game_period,
+        clock=game_clock,
+        home_team=TeamBoxScore(
+            team_id=str(home_team_stats.get("teamId", "")),
+            team_name=home_team_stats.get("teamName", ""),
+            team_city=home_team_stats.get("teamCity", ""),
+            team_tricode=home_team_stats.get("teamTricode", ""),
+            players=home_players,
+        ),
+        away_team=TeamBoxScore(
+            team_id=str(away_team_stats.get("teamId", "")),
+            team_name=away_team_stats.get("teamName", ""),
+            team_city=away_team_stats.get("teamCity", ""),
+            team_tricode=away_team_stats.get("teamTricode", ""),
+            players=away_players,
+        ),
+    )
+
+
 def standardize_game_clocks(games_data: List[Dict]) -> List[Dict]:
     """
     Standardize game clocks to a consistent format and filter out invalid formats.
 
+    Games whose clock is already an ISO 8601 duration (the usual case) are
+    returned as they are; the others are shallow-copied with the clock
+    replaced, so the input is never modified.
+
     Args:
         games_data: List of game data dictionaries
 
@@ -148,34 +229,32 @@ def standardize_game_clocks(games_data: List[Dict]) -> List[Dict]:
     standardized_games = []
 
     for game in games_data:
-        # Create a copy to avoid modifying the original
-        game_copy = copy.deepcopy(game)
-
-        # Process the clock field
-        clock = game_copy.get("clock", "")
+        clock = game.get("clock", "")
 
         # Handle various clock formats
         if clock is None or clock.strip() in ("", " "):
             # Set empty/blank clocks to None
-            game_copy["clock"] = None
+            standardized = None
         elif clock.startswith("PT") and "M" in clock and "S" in clock:
             # ISO 8601 Duration format - keep as is
-            pass
-        elif re.match(r"\d+:\d+\s*", clock):
+            standardized = clock
+        elif _COLON_CLOCK.match(clock):
             # Convert "5:06 " format to ISO 8601 duration format
             try:
                 parts = clock.strip().split(":")
                 minutes = int(parts[0])
                 seconds = int(parts[1])
-                game_copy["clock"] = f"PT{minutes:02d}M{seconds:02d}.00S"
+                standardized = f"PT{minutes:02d}M{seconds:02d}.00S"
             except (ValueError, IndexError):
                 # If conversion fails, set to None
-                game_copy["clock"] = None
+                standardized = None
         else:
             # Unknown format, set to None
-            game_copy["clock"] = None
+            standardized = None
 
-        standardized_games.append(game_copy)
+        if standardized != clock or "clock" not in game:
+            game = {**game, "clock": standardized}
+        standardized_games.append(game)
 
     return standardized_games
 
@@ -195,7 +274,7 @@ def parse_game_clock(clock_str: Optional[str]) -> Optional[float]:
 
     try:
         # Parse the PT12M00.00S format
-        match = re.match(r"PT(\d+)M(\d+(?:\.\d+)?)S", clock_str)
+        match = _ISO_CLOCK.match(clock_str)
         if match:
             minutes = int(match.group(1))
             seconds = float(match.group(2))
@@ -206,6 +285,44 @@ def parse_game_clock(clock_str: Optional[str]) -> Optional[float]:
     return None
 
 
+class GameState:
+    """
+    The fields of a game that progression validation compares, with the clock
+    parsed once. Kept per game in ScoreboardManager.game_state_history.
+    """
+
+    __slots__ = ("status", "period", "clock", "seconds", "home", "away")
+
+    def __init__(
+        self,
+        status: int,
+        period: int,
+        clock: Optional[str],
+        seconds: Optional[float],
+        home: int,
+        away: int,
+    ):
+        self.status = status
+        self.period = period
+        self.clock = clock
+        self.seconds = seconds  # Clock in seconds, None if it can't be parsed
+        self.home = home
+        self.away = away
+
+    @classmethod
+    def from_game(cls, game: Dict) -> "GameState":
+        """Build the state of a (standardized) scoreboard game dict."""
+        clock = game["clock"]
+        return cls(
+            game["game_status"],
+            game["period"],
+            clock,
+            parse_game_clock(clock),
+            game["home_team"]["score"],
+            game["away_team"]["score"],
+        )
+
+
 def scoreboard_changed(old_data: List[Dict], new_data: List[Dict]) -> bool:
     """
     Determine if there's a meaningful difference between old and new scoreboard data.
@@ -249,6 +366,32 @@ def scoreboard_changed(old_data: List[Dict], new_data: List[Dict]) -> bool:
     return False
 
 
+def diff_game_state(old_game: Dict, new_game: Dict) -> Dict:
+    """
+    Build a patch holding only the fields of a game that changed.
+
+    Nested team dicts are diffed one level deep, so a score change produces
+    ``{"home_team": {"score": 82}}`` rather than the whole team.
+
+    Args:
+        old_game: Previously broadcast game state
+        new_game: New game state
+
+    Returns:
+        Dict of changed fields (empty if nothing changed)
+    """
+    patch = {}
+    for key, value in new_game.items():
+        old_value = old_game.get(key)
+        if value == old_value:
+            continue
+        if isinstance(value, dict) and isinstance(old_value, dict):
+            patch[key] = {k: v for k, v in value.items() if old_value.get(k) != v}
+        else:
+            patch[key] = value
+    return patch
+
+
 ## Modified ScoreboardManager class for app/services/scoreboard.py
 
 
@@ -256,62 +399,94 @@ class ScoreboardManager:
     """Manages live scoreboard data and WebSocket connections with enhanced state validation."""
 
     def __init__(self):
-        self.active_connections: Set[WebSocket] = set()
+        settings = get_settings()
+        self.active_connections: Dict[WebSocket, ClientConnection] = {}
+        self.send_queue_size = settings.WS_SEND_QUEUE_SIZE
+        self.send_timeout = settings.WS_SEND_TIMEOUT
+        # Delta protocol (version 2): sequence number of the last update and
+        # the most recent encoded patch frames, for resyncing clients
+        self.sequence = 0
+        self.patch_history: deque = deque(maxlen=settings.WS_PATCH_HISTORY)
+        # Snapshot served to new connections: the pre-encoded current games and
+        # when they were last confirmed upstream
+        self._games_json: Optional[str] = None
+        self.snapshot_time: Optional[float] = None
+        self._initial_fetch: Optional[asyncio.Task] = None
         self.current_games: List[Dict] = []  # Store current game state
         self._lock = asyncio.Lock()  # Add lock for thread safety
         self.last_update_timestamp: Dict[str, float] = (
             {}
         )  # Track last update time per game
-        self.game_state_history: Dict[str, List[Dict]] = (
+        self.game_state_history: Dict[str, Deque[GameState]] = (
             {}
         )  # Track game state history for validation
+        # Multi-worker fan-out (see app.services.cluster): the leader publishes
+        # every update through ``replicate``; followers apply them with
+        # apply_replicated and ask the leader for a snapshot through
+        # ``request_snapshot`` instead of fetching upstream
+        self.replicate: Optional[Callable[..., None]] = None
+        self.request_snapshot: Optional[Callable[[], None]] = None
+        self.snapshot_wait = settings.LEADER_LEASE_TTL
+        self._replicated = asyncio.Event()
+
+    async def connect(self, websocket: WebSocket, protocol_version: int = 1):
+        """
+        Add a new WebSocket connection with its own bounded send queue.
 
-    async def connect(self, websocket: WebSocket):
-        """Add a new WebSocket connection."""
+        Version 1 clients receive the full list of games on every update.
+        Version 2 clients receive a snapshot followed by per-game patches.
+        """
         await websocket.accept()
-        self.active_connections.add(websocket)
+        client = ClientConnection(
+            websocket,
+            max_queue=self.send_queue_size,
+            send_timeout=self.send_timeout,
+            on_evict=self._on_client_evicted,
+            protocol_version=protocol_version,
+        )
+        client.start()
+        self.active_connections[websocket] = client
 
     async def disconnect(self, websocket: WebSocket):
         """Remove a WebSocket connection."""
-        self.active_connections.discard(websocket)
+        client = self.active_connections.pop(websocket, None)
+        if client is not None:
+            await client.close()
 
-    def is_valid_game_progression(self, game_id: str, new_data: Dict) -> bool:
+    async def _on_client_evicted(self, client: ClientConnection):
+        """Drop a slow consumer that was evicted by its send queue."""
+        self.active_connections.pop(client.websocket, None)
+
+    def is_valid_game_progression(self, game_id: str, new_state: GameState) -> bool:
         """
-        Check if the new game data represents a valid progression from previous states.
+        Check if the new game state represents a valid progression from previous states.
 
         This function filters out obviously invalid updates while being more flexible
         about potential legitimate changes that might appear invalid.
 
         Args:
             game_id: The unique identifier for the game
-            new_data: The new game data to check
+            new_state: The new state of the game to check
 
         Returns:
             True if data represents valid game progression, False otherwise
         """
-        # If we haven't seen this game before, accept the data
-        if game_id not in self.game_state_history:
-            self.game_state_history[game_id] = []
-            return True
+        history = self.game_state_history.get(game_id)
 
-        # If history is empty, accept the data
-        if not self.game_state_history[game_id]:
+        # If we haven't seen this game before (or history is empty), accept the data
+        if not history:
             return True
 
         # Get the last known state
-        last_state = self.game_state_history[game_id][-1]
+        last_state = history[-1]
 
         # If we have at least 3 states in the history, detect if the new state
         # matches a state we've seen before in the alternating pattern
-        if len(self.game_state_history[game_id]) >= 3:
-            # Get the older states
-            older_state = self.game_state_history[game_id][-2]
-            oldest_state = self.game_state_history[game_id][-3]
-
+        if len(history) >= 3:
             # Check if we've seen a pattern like A -> B -> A
             if self._states_are_equivalent(
-                new_data, oldest_state
-            ) and not self._states_are_equivalent(new_data, last_state):
+                new_state, history[-3]
+            ) and not self._states_are_equivalent(new_state, last_state):
                 # We're seeing the same state alternate twice, which indicates flapping
                 logger.warning(
                     f"Detected alternating game states for game {game_id} - stabilizing"
@@ -323,41 +498,35 @@ class ScoreboardManager:
 
         # More flexible rule for period regression
         # Only reject if we have multiple confirmations of the higher period
-        if new_data["period"] < last_state["period"]:
+        if new_state.period < last_state.period:
             # Check if we've seen the higher period consistently
-            consistent_higher_period = False
-            for i in range(min(3, len(self.game_state_history[game_id]))):
-                if (
-                    self.game_state_history[game_id][-(i + 1)]["period"]
-                    == last_state["period"]
-                ):
-                    consistent_higher_period = True
-                else:
-                    consistent_higher_period = False
-                    break
+            consistent_higher_period = all(
+                history[-(i + 1)].period == last_state.period
+                for i in range(min(3, len(history)))
+            )
 
             if consistent_higher_period:
                 logger.warning(
                     f"Rejected invalid period regression for game {game_id}: "
-                    f"period {last_state['period']} -> {new_data['period']}"
+                    f"period {last_state.period} -> {new_state.period}"
                 )
                 return False
             else:
                 # If we haven't consistently seen the higher period, accept this as a correction
                 logger.info(
                     f"Allowing period correction for game {game_id}: "
-                    f"period {last_state['period']} -> {new_data['period']}"
+                    f"period {last_state.period} -> {new_state.period}"
                 )
 
         # More flexible rule for clock regression
         if (
-            new_data["period"] == last_state["period"]
-            and new_data["game_status"] == 2
-            and last_state["game_status"] == 2
+            new_state.period == last_state.period
+            and new_state.status == 2
+            and last_state.status == 2
         ):
 
-            old_seconds = parse_game_clock(last_state["clock"])
-            new_seconds = parse_game_clock(new_data["clock"])
+            old_seconds = last_state.seconds
+            new_seconds = new_state.seconds
 
             # Only validate if both clocks can be parsed
             if old_seconds is not None and new_seconds is not None:
@@ -368,13 +537,8 @@ class ScoreboardManager:
                     clock_regression_pattern = False
 
                     # Check if this regression has happened multiple times
-                    if len(self.game_state_history[game_id]) >= 4:
-                        prev_clocks = [
-                            parse_game_clock(
-                                self.game_state_history[game_id][-(i + 1)]["clock"]
-                            )
-                            for i in range(3)
-                        ]
+                    if len(history) >= 4:
+                        prev_clocks = [history[-(i + 1)].seconds for i in range(3)]
 
                         # If clocks have been consistently decreasing except for this one
                         if all(
@@ -388,48 +552,32 @@ class ScoreboardManager:
                     if clock_regression_pattern:
                         logger.warning(
                             f"Rejected invalid clock regression for game {game_id}: "
-                            f"{last_state['clock']} -> {new_data['clock']}"
+                            f"{last_state.clock} -> {new_state.clock}"
                         )
                         return False
                     else:
                         # Accept the clock update as a legitimate correction
                         logger.info(
                             f"Allowing clock correction for game {game_id}: "
-                            f"{last_state['clock']} -> {new_data['clock']}"
+                            f"{last_state.clock} -> {new_state.clock}"
                         )
 
         # More flexible rule for score decreases
         # Only reject score decreases if they're significant (more than 2 points)
         # and if the previous score was consistent for multiple updates
-        if (
-            new_data["home_team"]["score"] < last_state["home_team"]["score"]
-            or new_data["away_team"]["score"] < last_state["away_team"]["score"]
-        ):
-
-            home_score_diff = (
-                last_state["home_team"]["score"] - new_data["home_team"]["score"]
-            )
-            away_score_diff = (
-                last_state["away_team"]["score"] - new_data["away_team"]["score"]
+        if new_state.home < last_state.home or new_state.away < last_state.away:
+            max_score_diff = max(
+                last_state.home - new_state.home, last_state.away - new_state.away
             )
-            max_score_diff = max(home_score_diff, away_score_diff)
 
             # Only worry about significant score decreases
             if max_score_diff > 2:
                 # Check if previous scores were consistent
-                consistent_previous_score = False
-                if len(self.game_state_history[game_id]) >= 3:
-                    consistent_previous_score = True
-                    for i in range(min(2, len(self.game_state_history[game_id]) - 1)):
-                        prev_state = self.game_state_history[game_id][-(i + 1)]
-                        if (
-                            prev_state["home_team"]["score"]
-                            != last_state["home_team"]["score"]
-                            or prev_state["away_team"]["score"]
-                            != last_state["away_team"]["score"]
-                        ):
-                            consistent_previous_score = False
-                            break
+                consistent_previous_score = len(history) >= 3 and all(
+                    history[-(i + 1)].home == last_state.home
+                    and history[-(i + 1)].away == last_state.away
+                    for i in range(min(2, len(history) - 1))
+                )
 
                 if consistent_previous_score:
                     logger.warning(
@@ -442,19 +590,16 @@ class ScoreboardManager:
 
         # Game status regression check (less restrictive)
         # Only validate when transitioning from finished (3) back to in progress (2)
-        if (
-            new_data["game_status"] < last_state["game_status"]
-            and last_state["game_status"] == 3
-        ):
+        if new_state.status < last_state.status and last_state.status == 3:
             logger.warning(
                 f"Rejected invalid status regression for game {game_id}: "
-                f"status {last_state['game_status']} -> {new_data['game_status']}"
+                f"status {last_state.status} -> {new_state.status}"
             )
             return False
 
         return True
 
-    def _states_are_equivalent(self, state1: Dict, state2: Dict) -> bool:
+    def _states_are_equivalent(self, state1: GameState, state2: GameState) -> bool:
         """
         Check if two game states are effectively equivalent.
 
@@ -466,51 +611,39 @@ class ScoreboardManager:
             True if states are equivalent, False otherwise
         """
         # Check core game state
-        if (
-            state1["game_status"] != state2["game_status"]
-            or state1["period"] != state2["period"]
-        ):
+        if state1.status != state2.status or state1.period != state2.period:
             return False
 
         # Check scores (allow small differences)
-        home_score_diff = abs(
-            state1["home_team"]["score"] - state2["home_team"]["score"]
-        )
-        away_score_diff = abs(
-            state1["away_team"]["score"] - state2["away_team"]["score"]
-        )
-        if home_score_diff > 1 or away_score_diff > 1:
+        if abs(state1.home - state2.home) > 1 or abs(state1.away - state2.away) > 1:
             return False
 
         # Check clock (approximately)
-        clock1 = parse_game_clock(state1["clock"])
-        clock2 = parse_game_clock(state2["clock"])
-        if clock1 is not None and clock2 is not None:
+        if state1.seconds is not None and state2.seconds is not None:
             # If clocks are more than 10 seconds different, they're not equivalent
-            if abs(clock1 - clock2) > 10:
+            if abs(state1.seconds - state2.seconds) > 10:
                 return False
 
         return True
 
-    def update_game_history(self, game_id: str, game_data: Dict):
+    def update_game_history(self, game_id: str, state: GameState):
         """
         Update the history of game states.
 
-        Maintains a limited history of recent game states for validation purposes.
+        Keeps the last GAME_STATE_HISTORY states of each game in a ring
+        buffer for validation purposes; states are immutable, so they are
+        stored without copying.
 
         Args:
             game_id: The unique identifier for the game
-            game_data: The game data to add to history
+            state: The state to add to history
         """
-        if game_id not in self.game_state_history:
-            self.game_state_history[game_id] = []
-
-        # Add new state to history
-        self.game_state_history[game_id].append(copy.deepcopy(game_data))
-
-        # Keep only the last 5 states to limit memory usage
-        if len(self.game_state_history[game_id]) > 5:
-            self.game_state_history[game_id].pop(0)
+        history = self.game_state_history.get(game_id)
+        if history is None:
+            history = self.game_state_history[game_id] = deque(
+                maxlen=GAME_STATE_HISTORY
+            )
+        history.append(state)
 
     async def broadcast(self, data: List[Dict]) -> bool:
         """
@@ -523,6 +656,22 @@ class ScoreboardManager:
         Returns:
             True if data was broadcast, False otherwise
         """
+        started = time.perf_counter()
+        sent = False
+        try:
+            sent = await self._broadcast(data)
+            if not sent and self.replicate is not None:
+                self.replicate({"kind": "confirm", "time": self.snapshot_time})
+            return sent
+        finally:
+            broadcast_duration.observe(
+                time.perf_counter() - started, "sent" if sent else "unchanged"
+            )
+
+    async def _broadcast(self, data: List[Dict]) -> bool:
+        # Every successful poll confirms the snapshot, even when nothing changed
+        self.snapshot_time = time.time()
+
         if not data:
             return False
 
@@ -541,13 +690,14 @@ class ScoreboardManager:
 
             # Get the current state of this game if we have it
             current_game = current_games_map.get(game_id)
+            new_state = GameState.from_game(new_game)
 
             # Check if this update is valid progression
-            if self.is_valid_game_progression(game_id, new_game):
+            if self.is_valid_game_progression(game_id, new_state):
                 # Update timestamp and history
                 current_time = time.time()
                 self.last_update_timestamp[game_id] = current_time
-                self.update_game_history(game_id, new_game)
+                self.update_game_history(game_id, new_state)
 
                 # Add to processed games
                 processed_games.append(new_game)
@@ -574,14 +724,15 @@ class ScoreboardManager:
                 else:
                     # If we don't have current state, use this one as baseline
                     # but mark that we've seen it so we can validate future updates
-                    self.update_game_history(game_id, new_game)
+                    self.update_game_history(game_id, new_state)
                     processed_games.append(new_game)
                     has_changes = True
 
         # Check for games that are in our current list but not in the new data
         # (shouldn't happen, but handle it just in case)
+        new_game_ids = {g["game_id"] for g in standardized_data}
         for game_id, game in current_games_map.items():
-            if game_id not in [g["game_id"] for g in standardized_data]:
+            if game_id not in new_game_ids:
                 # Keep this game in our list
                 processed_games.append(game)
 
@@ -589,214 +740,739 @@ class ScoreboardManager:
         if not has_changes and len(processed_games) == len(self.current_games):
             return False
 
-        # Update our current games list
+        # Per-game patches against what clients last received
+        patches = []
+        for game in processed_games:
+            previous = current_games_map.get(game["game_id"])
+            if previous is None:
+                patches.append(game)
+                continue
+            patch = diff_game_state(previous, game)
+            if patch:
+                patches.append({"game_id": game["game_id"], **patch})
+
+        # Update our current games list and fan out while holding the lock, so a
+        # connection's initial snapshot can never interleave with an update
         async with self._lock:
             self.current_games = processed_games
+            self._games_json = None
+            self.sequence += 1
+            patch_frame = encode_frame(
+                {"type": "patch", "seq": self.sequence, "games": patches}
+            )
+            evicted = self._fan_out(patch_frame)
+            if self.replicate is not None:
+                self.replicate(
+                    {
+                        "kind": "update",
+                        "seq": self.sequence,
+                        "time": self.snapshot_time,
+                    },
+                    patch_frame,
+                    self._current_games_json(),
+                )
+
+        await self._evict(evicted)
+        return True
+
+    def _fan_out(self, patch_frame: str) -> List[ClientConnection]:
+        """
+        Queue an update to every ready client (the caller holds the lock).
+
+        Returns:
+            Clients whose send queue was full
+        """
+        self.patch_history.append((self.sequence, patch_frame))
+        evicted = []
+
+        # Encode each frame once and hand the same text to every client's queue
+        for client in list(self.active_connections.values()):
+            if not client.ready:
+                # Still waiting for its initial snapshot, which will include this
+                continue
+            if client.protocol_version >= 2:
+                frame = patch_frame
+            else:
+                frame = self._current_games_json()
+            if not client.enqueue(frame):
+                evicted.append(client)
+        return evicted
+
+    async def _evict(self, evicted: List[ClientConnection]):
+        for client in evicted:
+            logger.warning("Evicting slow WebSocket client (send queue full)")
+            websocket_evictions.inc("scoreboard")
+            await client.evict()
+
+    async def apply_replicated(self, header: Dict[str, Any], frames: List[str]):
+        """
+        Apply a scoreboard message published by the leader worker.
+
+        Args:
+            header: ``kind`` ("update", "confirm" or "state"), ``seq`` and
+                ``time`` (when the leader last confirmed the snapshot)
+            frames: For "update", the patch frame and the encoded games; for
+                "state" (answering a follower that just joined), the encoded games
+        """
+        started = time.perf_counter()
+        self.snapshot_time = header["time"]
+        if header["kind"] == "confirm":
+            return
+        if (
+            header["kind"] == "state"
+            and header["seq"] == self.sequence
+            and self._replicated.is_set()
+        ):
+            return
 
-        # Convert any datetime objects to strings
-        json_data = json.loads(
-            json.dumps(processed_games, default=self._serialize_datetime)
+        games_json = frames[-1]
+        games = json.loads(games_json)
+        async with self._lock:
+            self.current_games = games
+            self._games_json = games_json
+            self.sequence = header["seq"]
+            if header["kind"] == "update":
+                evicted = self._fan_out(frames[0])
+            else:
+                # Out of step with the leader: start over from its snapshot
+                self.patch_history.clear()
+                evicted = []
+                for client in list(self.active_connections.values()):
+                    if client.ready:
+                        frame = (
+                            self.snapshot_frame()
+                            if client.protocol_version >= 2
+                            else games_json
+                        )
+                        if not client.enqueue(frame):
+                            evicted.append(client)
+        self._replicated.set()
+        await self._evict(evicted)
+        broadcast_duration.observe(time.perf_counter() - started, "replicated")
+
+    def publish_state(self):
+        """Publish the current games for followers that just joined."""
+        if self.replicate is not None and self.snapshot_time is not None:
+            self.replicate(
+                {"kind": "state", "seq": self.sequence, "time": self.snapshot_time},
+                self._current_games_json(),
+            )
+
+    def get_game(self, game_id: str) -> Optional[Dict]:
+        """Return the current state of a game, or None if it isn't on the scoreboard."""
+        for game in self.current_games:
+            if game["game_id"] == game_id:
+                return game
+        return None
+
+    def _current_games_json(self) -> str:
+        """Return the current games encoded once, reused until the next update."""
+        if self._games_json is None:
+            self._games_json = encode_frame(self.current_games)
+        return self._games_json
+
+    def snapshot_age(self) -> Optional[float]:
+        """Seconds since the snapshot was last confirmed upstream (None if none)."""
+        if self.snapshot_time is None:
+            return None
+        return max(0.0, time.time() - self.snapshot_time)
+
+    def snapshot_frame(self) -> str:
+        """
+        Build a version 2 snapshot of the current games.
+
+        Only the envelope is formatted per call; the games themselves are the
+        pre-encoded text shared with full-frame broadcasts.
+        """
+        age = self.snapshot_age() or 0.0
+        return (
+            f'{{"type":"snapshot","seq":{self.sequence},"age":{age:.1f},'
+            f'"games":{self._current_games_json()}}}'
         )
 
-        # Broadcast to all connections
-        for connection in self.active_connections.copy():
-            try:
-                await connection.send_json(json_data)
-            except Exception as e:
-                logger.error(f"Error broadcasting to client: {e}")
-                await self.disconnect(connection)
+    async def handle_client_message(self, websocket: WebSocket, message: str):
+        """
+        Handle a message from a version 2 client.
 
-        return True
+        The only supported message is ``{"type": "resync", "seq": N}``, sent by a
+        client that missed updates after sequence ``N``. It is answered with the
+        missed patches if they are still in the history, otherwise with a fresh
+        snapshot.
+        """
+        client = self.active_connections.get(websocket)
+        if client is None or client.protocol_version < 2:
+            return
 
-    # Other methods remain the same...
-    async def send_current_games(self, websocket: WebSocket):
-        """Send initial scoreboard data to a new connection."""
         try:
-            current_games = await get_live_scoreboard()
+            request = json.loads(message)
+            if request.get("type") != "resync":
+                return
+            last_seen = int(request.get("seq", -1))
+        except (ValueError, TypeError, AttributeError):
+            logger.debug(f"Ignoring malformed scoreboard client message: {message!r}")
+            return
 
-            # Convert the Pydantic model to a dict
-            games_data = current_games.model_dump()
+        async with self._lock:
+            oldest = self.patch_history[0][0] if self.patch_history else None
+            if oldest is not None and oldest - 1 <= last_seen <= self.sequence:
+                frames = [f for seq, f in self.patch_history if seq > last_seen]
+            else:
+                frames = [self.snapshot_frame()]
 
-            # Standardize game clocks
-            standardized_data = standardize_game_clocks(games_data["games"])
+        for frame in frames:
+            if not client.enqueue(frame):
+                await client.evict()
+                return
 
-            # Ensure all datetime objects are converted to strings
-            json_data = json.loads(
-                json.dumps(standardized_data, default=self._serialize_datetime)
-            )
+    async def send_current_games(self, websocket: WebSocket):
+        """
+        Send initial scoreboard data to a new connection.
+
+        New connections are served from the in-memory snapshot kept up to date
+        by the poller. Only when no snapshot exists yet (e.g. right after
+        startup) is the scoreboard fetched upstream, and concurrent connections
+        share that single fetch.
+        """
+        client = self.active_connections.get(websocket)
+        if client is None:
+            raise RuntimeError("Client disconnected before initial games data")
+
+        try:
+            if self.snapshot_time is None:
+                await self._load_initial_snapshot()
 
-            # Send standardized games data
-            await websocket.send_json(json_data)
+            async with self._lock:
+                if client.protocol_version >= 2:
+                    frame = self.snapshot_frame()
+                else:
+                    frame = self._current_games_json()
+                queued = client.enqueue(frame)
+                client.ready = True
+            if not queued:
+                raise RuntimeError("Client send queue full before initial games data")
         except Exception as e:
             logger.error(f"Error sending initial games data: {e}")
             raise
 
-    def _serialize_datetime(self, obj):
-        """Helper method to serialize datetime objects to ISO format."""
-        if isinstance(obj, datetime):
-            return obj.isoformat()
-        raise TypeError(f"Type {type(obj)} not serializable")
+    async def _load_initial_snapshot(self):
+        """Fetch the scoreboard once for all connections waiting on a snapshot."""
+        if self._initial_fetch is None or self._initial_fetch.done():
+            self._initial_fetch = asyncio.create_task(self._fetch_initial_snapshot())
+        # Shield the shared fetch so one client going away doesn't cancel it for all
+        await asyncio.shield(self._initial_fetch)
+
+    async def _fetch_initial_snapshot(self):
+        if self.request_snapshot is not None:
+            # Followers get the snapshot from the leader, unless there is none
+            self.request_snapshot()
+            try:
+                await asyncio.wait_for(self._replicated.wait(), self.snapshot_wait)
+                return
+            except asyncio.TimeoutError:
+                logger.warning("No scoreboard snapshot from the leader worker")
+        logger.info("No scoreboard snapshot yet; fetching upstream for new connections")
+        await self.broadcast(await get_live_games())
 
 
 class PlayByPlayManager:
-    """Manages play-by-play WebSocket connections for individual games."""
+    """
+    Manages play-by-play WebSocket connections for individual games.
 
-    def __init__(self):
-        self.active_connections: Dict[str, Set[WebSocket]] = {}
-        self.last_data: Dict[str, Any] = {}
+    A single poller runs per game with subscribers. It remembers the actions
+    already sent (keyed by ``actionNumber``) and broadcasts only new, edited or
+    removed actions. The poll interval follows the game's state on the live
+    scoreboard, and polling stops once the game is final.
+
+    With several workers (app.services.cluster) only the leader polls: it
+    also polls games other workers' clients ``watch`` and publishes every
+    delta through ``replicate``, and followers apply them to their own
+    subscribers with apply_replicated.
+    """
+
+    def __init__(self, scoreboard: Optional[ScoreboardManager] = None):
+        settings = get_settings()
+        self.scoreboard = scoreboard
+        self.active_connections: Dict[str, Dict[WebSocket, ClientConnection]] = {}
+        self.actions: Dict[str, Dict[int, Dict]] = (
+            {}
+        )  # game_id -> actionNumber -> action
+        self.last_action_number: Dict[str, int] = {}
         self.tasks: Dict[str, asyncio.Task] = {}
+        self._snapshot_frames: Dict[str, str] = {}
         self._lock = asyncio.Lock()  # Added lock for concurrency safety
+        self.send_queue_size = settings.WS_SEND_QUEUE_SIZE
+        self.send_timeout = settings.WS_SEND_TIMEOUT
+        self.live_interval = settings.PBP_LIVE_INTERVAL
+        self.break_interval = settings.PBP_BREAK_INTERVAL
+        self.pregame_interval = settings.PBP_PREGAME_INTERVAL
+        self.unknown_interval = settings.PBP_UNKNOWN_INTERVAL
+        # Multi-worker fan-out
+        self.polling = (
+            True  # False on followers, which watch the leader's polls instead
+        )
+        self.replicate: Optional[Callable[..., None]] = None
+        self.watch: Optional[Callable[[str, bool], None]] = None
+        self.watchers: Dict[str, Dict[str, float]] = (
+            {}
+        )  # game_id -> worker -> last announced
+        self.watcher_ttl = 3 * settings.PBP_WATCH_INTERVAL
 
     async def connect(self, websocket: WebSocket, game_id: str):
         """Add a new WebSocket connection for a specific game and start background polling if needed."""
         await websocket.accept()
+        client = ClientConnection(
+            websocket,
+            max_queue=self.send_queue_size,
+            send_timeout=self.send_timeout,
+            on_evict=functools.partial(self._on_client_evicted, game_id),
+        )
+        client.start()
         async with self._lock:
-            if game_id not in self.active_connections:
-                self.active_connections[game_id] = set()
-            self.active_connections[game_id].add(websocket)
-            if game_id not in self.tasks:
-                self.tasks[game_id] = asyncio.create_task(
-                    self._poll_playbyplay(game_id)
-                )
+            first = game_id not in self.active_connections
+            self.active_connections.setdefault(game_id, {})[websocket] = client
+            if game_id in self.actions:
+                # Already polling this game: send what we have right away
+                client.enqueue(self._snapshot_frame(game_id))
+                client.ready = True
+            if self.polling:
+                self._start_polling(game_id)
+            elif first and self.watch is not None:
+                self.watch(game_id, True)
+
+    def _start_polling(self, game_id: str):
+        if game_id not in self.tasks:
+            self.tasks[game_id] = asyncio.create_task(self._poll_playbyplay(game_id))
+
+    def _wanted(self, game_id: str) -> bool:
+        """Whether any worker still has subscribers for the game."""
+        if game_id in self.active_connections:
+            return True
+        watchers = self.watchers.get(game_id)
+        if watchers:
+            now = time.monotonic()
+            for worker, announced in list(watchers.items()):
+                if now - announced > self.watcher_ttl:
+                    del watchers[worker]
+        return bool(watchers)
+
+    def _drop(self, game_id: str):
+        """Stop polling a game and forget its state."""
+        task = self.tasks.pop(game_id, None)
+        if task is not None and task is not asyncio.current_task():
+            task.cancel()
+        self.watchers.pop(game_id, None)
+        self.actions.pop(game_id, None)
+        self.last_action_number.pop(game_id, None)
+        self._snapshot_frames.pop(game_id, None)
 
     async def disconnect(self, websocket: WebSocket, game_id: str):
         """Remove a WebSocket connection for a specific game."""
+        client = None
         async with self._lock:
-            if game_id in self.active_connections:
-                self.active_connections[game_id].discard(websocket)
-                if not self.active_connections[game_id]:
-                    if game_id in self.tasks:
-                        self.tasks[game_id].cancel()
-                        del self.tasks[game_id]
+            clients = self.active_connections.get(game_id)
+            if clients is not None:
+                client = clients.pop(websocket, None)
+                if not clients:
+                    # Last subscriber gone: stop polling and drop the game state,
+                    # unless other workers still watch it
                     del self.active_connections[game_id]
-                    if game_id in self.last_data:
-                        del self.last_data[game_id]
+                    if not self._wanted(game_id):
+                        self._drop(game_id)
+                    if not self.polling and self.watch is not None:
+                        self.watch(game_id, False)
+        if client is not None:
+            await client.close()
+
+    async def _on_client_evicted(self, game_id: str, client: ClientConnection):
+        """Drop a slow consumer that was evicted by its send queue."""
+        await self.disconnect(client.websocket, game_id)
+
+    def apply_actions(
+        self, game_id: str, actions: List[Dict]
+    ) -> Tuple[List[Dict], List[int]]:
+        """
+        Merge the full upstream action list into the known state of a game.
+
+        Actions numbered above the last one seen are new and are taken without
+        comparison; older ones are only compared to detect upstream edits.
+
+        Args:
+            game_id: NBA game ID
+            actions: The ``game.actions`` list from the play-by-play feed
 
-    async def broadcast_to_game(self, game_id: str, data: Any):
-        """Broadcast data to all connections for a specific game."""
+        Returns:
+            Tuple of (new or edited actions, removed action numbers)
+        """
+        known = self.actions.setdefault(game_id, {})
+        last_seen = self.last_action_number.get(game_id, 0)
+        changed = []
+        seen = set()
+
+        for action in actions:
+            number = action.get("actionNumber")
+            if number is None:
+                continue
+            seen.add(number)
+            if number > last_seen or known.get(number) != action:
+                known[number] = action
+                changed.append(action)
+
+        # Every seen action is now known, so equal sizes mean nothing was removed
+        removed = []
+        if len(known) != len(seen):
+            removed = [number for number in known if number not in seen]
+            for number in removed:
+                del known[number]
+
+        if seen:
+            self.last_action_number[game_id] = max(last_seen, max(seen))
+        if changed or removed:
+            self._snapshot_frames.pop(game_id, None)
+        return changed, removed
+
+    def _snapshot_frame(self, game_id: str) -> str:
+        """Encode all known actions of a game, cached until they change."""
+        frame = self._snapshot_frames.get(game_id)
+        if frame is None:
+            known = self.actions.get(game_id, {})
+            frame = encode_frame(
+                {
+                    "type": "snapshot",
+                    "game": {
+                        "gameId": game_id,
+                        "actions": [known[number] for number in sorted(known)],
+                    },
+                }
+            )
+            self._snapshot_frames[game_id] = frame
+        return frame
+
+    async def _publish(self, game_id: str, actions: List[Dict]):
+        """Apply a poll result and send snapshots or deltas to subscribers."""
+        started = time.perf_counter()
         async with self._lock:
-            if game_id not in self.active_connections:
-                return
-            connections = self.active_connections[game_id].copy()
-        for connection in connections:
-            try:
-                await connection.send_json(data)
-            except Exception as e:
-                logger.error(f"Error broadcasting to game {game_id} client: {e}")
-                await self.disconnect(connection, game_id)
+            changed, removed = self.apply_actions(game_id, actions)
+            delta_frame = None
+            if (changed or removed) and self.replicate is not None:
+                delta_frame = self._delta_frame(game_id, changed, removed)
+                self.replicate({"kind": "delta", "game_id": game_id}, delta_frame)
+            evicted = self._fan_out(game_id, changed, removed, delta_frame)
+
+        playbyplay_publish_duration.observe(time.perf_counter() - started)
+        await self._evict(game_id, evicted)
+
+    def _delta_frame(
+        self, game_id: str, changed: List[Dict], removed: List[int]
+    ) -> str:
+        return encode_frame(
+            {
+                "type": "actions",
+                "game": {"gameId": game_id, "actions": changed},
+                "removed": removed,
+            }
+        )
 
-    async def _poll_playbyplay(self, game_id: str):
-        from nba_api.live.nba.endpoints import playbyplay  # typically imported here
+    def _fan_out(
+        self,
+        game_id: str,
+        changed: List[Dict],
+        removed: List[int],
+        delta_frame: Optional[str] = None,
+    ) -> List[ClientConnection]:
+        """
+        Queue a snapshot to new subscribers and the delta to the others (the
+        caller holds the lock).
+
+        Returns:
+            Clients whose send queue was full
+        """
+        evicted = []
+        for client in list(self.active_connections.get(game_id, {}).values()):
+            if not client.ready:
+                frame = self._snapshot_frame(game_id)
+                client.ready = True
+            elif changed or removed:
+                if delta_frame is None:
+                    delta_frame = self._delta_frame(game_id, changed, removed)
+                frame = delta_frame
+            else:
+                continue
+            if not client.enqueue(frame):
+                evicted.append(client)
+        return evicted
+
+    async def _evict(self, game_id: str, evicted: List[ClientConnection]):
+        for client in evicted:
+            logger.warning(f"Evicting slow PlayByPlay client for game {game_id}")
+            websocket_evictions.inc("playbyplay")
+            await client.evict()
+
+    async def apply_replicated(self, header: Dict[str, Any], frame: str):
+        """
+        Apply a play-by-play message published by the leader worker.
+
+        Args:
+            header: ``game_id`` and ``kind``: "delta" (an actions frame, as
+                sent to clients) or "snapshot" (every action of the game, sent
+                when this worker started watching it)
+            frame: The encoded frame
+        """
+        game_id = header["game_id"]
+        if game_id not in self.active_connections:
+            return
+        started = time.perf_counter()
+        message = json.loads(frame)
+        async with self._lock:
+            if header["kind"] == "snapshot":
+                changed, removed = self.apply_actions(
+                    game_id, message["game"]["actions"]
+                )
+                delta_frame = None
+            else:
+                changed, removed = message["game"]["actions"], message["removed"]
+                self._apply_delta(game_id, changed, removed)
+                delta_frame = frame
+            evicted = self._fan_out(game_id, changed, removed, delta_frame)
+
+        playbyplay_publish_duration.observe(time.perf_counter() - started)
+        await self._evict(game_id, evicted)
+
+    def _apply_delta(self, game_id: str, changed: List[Dict], removed: List[int]):
+        known = self.actions.setdefault(game_id, {})
+        for action in changed:
+            known[action["actionNumber"]] = action
+        for number in removed:
+            known.pop(number, None)
+        if known:
+            self.last_action_number[game_id] = max(
+                self.last_action_number.get(game_id, 0), max(known)
+            )
+        self._snapshot_frames.pop(game_id, None)
+
+    async def add_watcher(self, game_id: str, worker: str, resync: bool = False):
+        """
+        Poll a game for another worker's subscribers (leader only).
+
+        A worker that starts watching a game already polled here gets its
+        snapshot published; otherwise the first poll's delta carries it.
+
+        Args:
+            game_id: Game to poll
+            worker: ID of the watching worker
+            resync: Publish the snapshot even if the worker already watched
+                the game (it may have missed deltas)
+        """
+        async with self._lock:
+            watchers = self.watchers.setdefault(game_id, {})
+            new = worker not in watchers
+            watchers[worker] = time.monotonic()
+            if game_id not in self.tasks:
+                self._start_polling(game_id)
+            elif (
+                (new or resync)
+                and game_id in self.actions
+                and self.replicate is not None
+            ):
+                self.replicate(
+                    {"kind": "snapshot", "game_id": game_id},
+                    self._snapshot_frame(game_id),
+                )
+
+    async def remove_watcher(self, game_id: str, worker: str):
+        """Stop polling a game for another worker, unless someone else watches it."""
+        async with self._lock:
+            self.watchers.get(game_id, {}).pop(worker, None)
+            if not self._wanted(game_id):
+                self._drop(game_id)
+
+    def subscribed_games(self) -> List[str]:
+        """Games this worker has play-by-play subscribers for."""
+        return list(self.active_connections)
+
+    def start_polling(self):
+        """Poll every game with subscribers here (on becoming the leader)."""
+        self.polling = True
+        for game_id in self.active_connections:
+            self._start_polling(game_id)
+
+    async def stop_polling(self):
+        """Stop every poller and keep the state, to follow the new leader's deltas."""
+        self.polling = False
+        tasks = list(self.tasks.values())
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        self.tasks.clear()
+        self.watchers.clear()
+
+    def _poll_interval(self, game_id: str) -> float:
+        """Choose the next poll delay from the game's state on the live scoreboard."""
+        game = self.scoreboard.get_game(game_id) if self.scoreboard else None
+        if game is None:
+            return self.unknown_interval
+        if game["game_status"] == 1:
+            return self.pregame_interval
+        if game["game_status"] == 2 and parse_game_clock(game.get("clock")) != 0:
+            return self.live_interval
+        # End of a period, halftime, or a final game waiting for its last actions
+        return self.break_interval
+
+    def _game_is_over(self, game_id: str, actions: List[Dict]) -> bool:
+        """Whether a game is final, per the scoreboard or its closing action."""
+        game = self.scoreboard.get_game(game_id) if self.scoreboard else None
+        if game is not None and game["game_status"] == 3:
+            return True
+        if actions:
+            last = actions[-1]
+            return last.get("actionType") == "game" and last.get("subType") == "end"
+        return False
 
+    async def _poll_playbyplay(self, game_id: str):
         logger.info(f"Starting PlayByPlay polling for {game_id}")
         while True:
             try:
-                p = playbyplay.PlayByPlay(game_id)
-                if not p:
-                    await asyncio.sleep(0.2)
-                    continue
-
-                current_data = p.get_dict()
-                # Fallback: if current_data is empty or missing a nonempty "plays" key and p has a "games" attribute, try that
-                if (not current_data or not current_data.get("plays")) and hasattr(
-                    p, "games"
-                ):
-                    logger.debug(
-                        "No plays found using p.get_dict(); trying p.games.get_dict()"
-                    )
-                    current_data = p.games.get_dict()
-
-                last = self.last_data.get(game_id)
-                if not last or (last != current_data):
-                    self.last_data[game_id] = current_data
-                    await self.broadcast_to_game(
-                        game_id, current_data
-                    )  # Updated method call
-                await asyncio.sleep(0.2)
+                if game_id not in self.active_connections:
+                    async with self._lock:
+                        if not self._wanted(game_id):
+                            # Every worker watching this game went away silently
+                            self._drop(game_id)
+                            break
+                p = await upstream_client.call(
+                    "playbyplay", playbyplay.PlayByPlay, game_id
+                )
+                data = p.get_dict() or {}
+                actions = (data.get("game") or {}).get("actions") or []
+                await self._publish(game_id, actions)
+
+                if self._game_is_over(game_id, actions):
+                    # Final games never change again; subscribers keep the snapshot
+                    logger.info(f"Game {game_id} is final; stopping PlayByPlay polling")
+                    break
+                await asyncio.sleep(self._poll_interval(game_id))
             except asyncio.CancelledError:
                 logger.info(f"Canceling PlayByPlay polling for {game_id}")
                 break
             except Exception as e:
                 logger.error(f"[PlayByPlay] Error in background loop ({game_id}): {e}")
-                await asyncio.sleep(1)
+                await asyncio.sleep(self.break_interval)
 
 
 # Helper functions for data processing
 
 
-async def get_live_scoreboard() -> ScoreboardResponse:
+async def get_live_games() -> List[Dict]:
     """
-    Fetch current scoreboard data from NBA API.
+    Fetch the current games from NBA API in the wire representation.
+
+    This is what the scoreboard poller broadcasts: the upstream payload goes
+    through scoreboard_games in one pass, without building models.
+
     Returns:
-        ScoreboardResponse containing current games
+        List of game dictionaries, shaped like GameBrief
     """
+    started = time.perf_counter()
     try:
-        board = scoreboard.ScoreBoard()
-        games_data = board.games.get_dict()
-        games = []
-
-        for game in games_data:
-            # Create TeamGameInfo objects with string IDs
-            home_team = TeamGameInfo(
-                team_id=str(game["homeTeam"]["teamId"]),  # Convert to string
-                team_name=game["homeTeam"]["teamName"],
-                team_city=game["homeTeam"]["teamCity"],
-                team_tricode=game["homeTeam"]["teamTricode"],
-                score=game["homeTeam"].get("score", 0),
-            )
-
-            away_team = TeamGameInfo(
-                team_id=str(game["awayTeam"]["teamId"]),  # Convert to string
-                team_name=game["awayTeam"]["teamName"],
-                team_city=game["awayTeam"]["teamCity"],
-                team_tricode=game["awayTeam"]["teamTricode"],
-                score=game["awayTeam"].get("score", 0),
-            )
-
-            # Create GameBrief object
-            game_brief = GameBrief(
-                game_id=str(game["gameId"]),  # Convert to string
-                game_status=game["gameStatus"],
-                period=game.get("period", 0),
-                clock=game.get("gameClock"),
-                game_time=parser.parse(game["gameTimeUTC"]),
-                home_team=home_team,
-                away_team=away_team,
-            )
-
-            games.append(game_brief)
-
-        return ScoreboardResponse(games=games, total_games=len(games))
+        board = await upstream_client.call("scoreboard", scoreboard.ScoreBoard)
+        games = scoreboard_games(board.games.get_dict())
+        scoreboard_fetch_duration.observe(time.perf_counter() - started)
+        return games
 
     except Exception as e:
         logger.error(f"Error fetching live scoreboard: {e}")
         raise
 
 
-async def get_past_scoreboard(date_str: str) -> List[GameBrief]:
+async def get_live_scoreboard() -> ScoreboardResponse:
+    """
+    Fetch current scoreboard data from NBA API.
+    Returns:
+        ScoreboardResponse containing current games
+    """
+    games = await get_live_games()
+    return ScoreboardResponse(games=games, total_games=len(games))
+
+
+async def get_past_scoreboard(
+    date_str: str,
+    db: Optional[AsyncSession] = None,
+    write_sessions: Callable[[], AsyncSession] = AsyncSessionLocal,
+) -> List[GameBrief]:
     """
     Get scoreboard data for a past date.
+
+    With a database session, dates whose games are all final are served from
+    the ``games`` archive and written to it on first fetch. The write session
+    is only opened for that first fetch.
+
     Args:
         date_str: Date in YYYY-MM-DD format
+        db: Optional async database session for reading the game archive
+        write_sessions: Session factory for archiving a fetched date
     Returns:
         List of games for the specified date
     """
     try:
-        from nba_api.stats.endpoints import leaguegamefinder
-
         date_obj = datetime.strptime(date_str, "%Y-%m-%d")
+        archivable = db is not None and games_archive.is_archivable(date_obj.date())
+        if archivable:
+            if games_archive.is_empty_date(date_obj.date()):
+                return []
+            archived = await db.run_sync(
+                games_archive.get_archived_games, date_obj.date()
+            )
+            if archived:
+                return archived
+
         date_formatted = date_obj.strftime("%m/%d/%Y")
-        games_df = leaguegamefinder.LeagueGameFinder(
+        finder = await upstream_client.call(
+            "stats",
+            leaguegamefinder.LeagueGameFinder,
             date_from_nullable=date_formatted,
             date_to_nullable=date_formatted,
             league_id_nullable="00",
-        ).get_data_frames()[0]
-        return process_past_games(games_df)
+        )
+        games_df = finder.get_data_frames()[0]
+        games = process_past_games(games_df)
+
+        if archivable:
+            if games:
+                async with write_sessions() as write_db:
+                    await write_db.run_sync(games_archive.archive_games, games)
+            else:
+                games_archive.mark_empty_date(date_obj.date())
+        return games
     except Exception as e:
         logger.error(f"Error fetching past scoreboard: {e}")
         raise
 
 
+async def backfill_past_games(db: Session, season: str) -> int:
+    """
+    Archive every finished game of a season with a single upstream call.
+
+    Args:
+        db: Database session
+        season: Season in "YYYY-YY" format
+
+    Returns:
+        Number of games written to the archive
+    """
+    finder = await upstream_client.call(
+        "stats",
+        leaguegamefinder.LeagueGameFinder,
+        season_nullable=season,
+        league_id_nullable="00",
+    )
+    games = [
+        game
+        for game in process_past_games(finder.get_data_frames()[0])
+        if games_archive.is_archivable(game.game_time.date())
+    ]
+    count = games_archive.archive_games(db, games)
+    logger.info(f"Archived {count} games for season {season}")
+    return count
+
+
 # Updated get_box_score function in app/services/scoreboard.py
 
 
@@ -811,7 +1487,7 @@ async def get_box_score(game_id: str) -> GameBoxScore:
         Exception if box score cannot be retrieved
     """
     try:
-        box = boxscore.BoxScore(game_id)
+        box = await upstream_client.call("boxscore", boxscore.BoxScore, game_id)
 
         # Debug logging to see the raw data structure
         raw_data = box.get_dict()
@@ -844,7 +1520,7 @@ async def get_play_by_play(game_id: str) -> PlayByPlayResponse:
         PlayByPlayResponse with play-by-play events
     """
     try:
-        pbp = playbyplay.PlayByPlay(game_id)
+        pbp = await upstream_client.call("playbyplay", playbyplay.PlayByPlay, game_id)
         return process_play_by_play(pbp.get_dict())
     except Exception as e:
         logger.error(f"Error fetching play-by-play for game {game_id}: {e}")
@@ -992,4 +1668,21 @@ def process_play_by_play(pbp_data: Dict) -> PlayByPlayResponse:
 
 # Global instances of managers
 scoreboard_manager = ScoreboardManager()
-playbyplay_manager = PlayByPlayManager()
+playbyplay_manager = PlayByPlayManager(scoreboard_manager)
+
+metrics.gauge(
+    "nba_websocket_connections",
+    "Open WebSocket connections, by stream",
+    lambda: {
+        ("scoreboard",): len(scoreboard_manager.active_connections),
+        ("playbyplay",): sum(
+            len(clients) for clients in playbyplay_manager.active_connections.values()
+        ),
+    },
+    ("stream",),
+)
+metrics.gauge(
+    "nba_playbyplay_poll_tasks",
+    "Games with a running play-by-play poller",
+    lambda: sum(not task.done() for task in playbyplay_manager.tasks.values()),
+)
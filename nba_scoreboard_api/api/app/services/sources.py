@@ -0,0 +1,310 @@
+# app/services/sources.py
+import abc
+import bisect
+import gzip
+import json
+import logging
+import os
+import threading
+import time
+from pathlib import Path
+from typing import IO, Any, Callable, Dict, List, Optional, Tuple, Union, cast
+
+from nba_api.library.http import NBAResponse
+from nba_api.stats.library.http import NBAStatsResponse
+
+from app.core.config import Settings, get_settings
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+SOURCES = ("live", "record", "replay")
+
+# Request arguments that don't change the response
+_TRANSPORT_ARGS = ("timeout", "proxy", "headers")
+
+
+def open_recording(path: Union[str, Path], mode: str) -> IO[str]:
+    """Open a recording for text I/O; gzip-compressed if the name ends in ``.gz``."""
+    if str(path).endswith(".gz"):
+        return cast(IO[str], gzip.open(path, mode + "t", encoding="utf-8"))
+    return open(path, mode, encoding="utf-8")
+
+
+class UpstreamReplayMissError(LookupError):
+    """Raised when a replayed recording has no response for a request (yet)."""
+
+
+def request_key(fn: Callable[..., Any], args: Tuple, kwargs: Dict[str, Any]) -> str:
+    """
+    Identify an nba_api request by endpoint class and parameters.
+
+    Args:
+        fn: nba_api endpoint class
+        args: Positional arguments
+        kwargs: Keyword arguments (transport options like ``timeout`` are ignored)
+
+    Returns:
+        A key like ``BoxScore('0022400801')``
+    """
+    params = [repr(arg) for arg in args] + [
+        f"{name}={value!r}"
+        for name, value in sorted(kwargs.items())
+        if name not in _TRANSPORT_ARGS
+    ]
+    return f"{fn.__name__}({', '.join(params)})"
+
+
+class UpstreamSource(abc.ABC):
+    """
+    Where nba_api endpoint objects come from.
+
+    ``fetch`` is blocking; UpstreamClient runs it on its worker pool with the
+    endpoint's concurrency limit and timeout.
+    """
+
+    @abc.abstractmethod
+    def fetch(
+        self,
+        endpoint: str,
+        fn: Callable[..., Any],
+        args: Tuple,
+        kwargs: Dict[str, Any],
+    ) -> Any:
+        """Return the endpoint object ``fn(*args, **kwargs)`` would build."""
+
+    def close(self) -> None:
+        """Release files or connections the source holds."""
+
+
+class LiveSource(UpstreamSource):
+    """Calls NBA.com."""
+
+    def fetch(
+        self,
+        endpoint: str,
+        fn: Callable[..., Any],
+        args: Tuple,
+        kwargs: Dict[str, Any],
+    ) -> Any:
+        return fn(*args, **kwargs)
+
+
+class RecordingSource(UpstreamSource):
+    """
+    Calls NBA.com and appends the raw responses to a JSON Lines file.
+
+    Each line holds the request key, the seconds since the recording started,
+    the call's duration, and the response text. A response identical to the
+    previous one for the same request is not written again, so a recording
+    is a timeline of changes. The live scoreboard still changes every second
+    of a game night, so use a ``.gz`` path (compressed as it is written).
+    Failed calls are not recorded.
+    """
+
+    def __init__(
+        self, path: Union[str, Path], inner: Optional[UpstreamSource] = None
+    ) -> None:
+        self.path = Path(path)
+        self.inner = inner or LiveSource()
+        self.started = time.time()
+        self.records = 0
+        self._last: Dict[str, str] = {}
+        self._lock = threading.Lock()
+        os.makedirs(self.path.parent, exist_ok=True)
+        self._file = open_recording(self.path, "a")
+        self._file.write(json.dumps({"recording": 1, "started": self.started}) + "\n")
+        self._file.flush()
+
+    def fetch(
+        self,
+        endpoint: str,
+        fn: Callable[..., Any],
+        args: Tuple,
+        kwargs: Dict[str, Any],
+    ) -> Any:
+        start = time.time()
+        result = self.inner.fetch(endpoint, fn, args, kwargs)
+        response = result.nba_response
+        key = request_key(fn, args, kwargs)
+        text = response.get_response()
+        with self._lock:
+            # Calls still running when the client shuts down aren't recorded
+            if not self._file.closed and self._last.get(key) != text:
+                self._last[key] = text
+                self._file.write(
+                    json.dumps(
+                        {
+                            "t": round(start - self.started, 3),
+                            "endpoint": endpoint,
+                            "key": key,
+                            "elapsed": round(time.time() - start, 3),
+                            "url": response.get_url(),
+                            "response": text,
+                        }
+                    )
+                    + "\n"
+                )
+                self._file.flush()
+                self.records += 1
+        return result
+
+    def close(self) -> None:
+        """Close the recording file (idempotent)."""
+        with self._lock:
+            self._file.close()
+
+
+class ReplaySource(UpstreamSource):
+    """
+    Serves a recording made by RecordingSource, without network access.
+
+    The replay clock starts at ``start`` seconds into the recording on the
+    first request and advances ``speed`` recording seconds per second (or
+    follows ``clock``, a callable returning the position, for virtual-time
+    simulations). Each request gets the latest response recorded for it at
+    or before the current position (its first response, if it is asked for
+    before that was recorded); requests never recorded raise
+    UpstreamReplayMissError like an NBA.com failure would.
+
+    Endpoint objects are rebuilt from the recorded text with the nba_api
+    class itself (``get_request=False`` and ``load_response``), so services
+    see exactly what they would have seen live.
+    """
+
+    def __init__(
+        self,
+        path: Union[str, Path],
+        speed: float = 1.0,
+        start: float = 0.0,
+        latency: bool = False,
+        clock: Optional[Callable[[], float]] = None,
+    ) -> None:
+        self.path = Path(path)
+        self.speed = speed
+        self.start = start
+        self.latency = latency
+        self.clock = clock
+        self._replay_started: Optional[float] = None
+        self.started: Optional[float] = None  # Epoch time the recording began
+        # key -> (times, records), in recording order
+        self._timelines: Dict[str, Tuple[List[float], List[Dict[str, Any]]]] = {}
+        self.duration = self._load()
+
+    def _load(self) -> float:
+        offset = 0.0
+        end = 0.0
+        with open_recording(self.path, "r") as file:
+            for line in file:
+                record = json.loads(line)
+                if "recording" in record:
+                    # Appended sessions continue where the previous one ended
+                    offset = end
+                    if self.started is None:
+                        self.started = record["started"]
+                    continue
+                t = offset + record["t"]
+                end = max(end, t)
+                times, records = self._timelines.setdefault(record["key"], ([], []))
+                times.append(t)
+                records.append(record)
+        logger.info(
+            f"Loaded upstream recording {self.path}: "
+            f"{len(self._timelines)} requests, {end:.0f}s"
+        )
+        return end
+
+    def keys(self) -> List[str]:
+        """Every recorded request key."""
+        return list(self._timelines)
+
+    def times(self, key: str) -> List[float]:
+        """Recording positions at which the response to ``key`` changed."""
+        return list(self._timelines.get(key, ([], []))[0])
+
+    def position(self) -> float:
+        """Current position in the recording, in seconds."""
+        if self.clock is not None:
+            return self.clock()
+        if self._replay_started is None:
+            self._replay_started = time.monotonic()
+        return self.start + (time.monotonic() - self._replay_started) * self.speed
+
+    def record_at(self, key: str, position: float) -> Dict[str, Any]:
+        """
+        The recorded response to a request at a position of the recording.
+
+        Raises:
+            UpstreamReplayMissError: If the request was never recorded
+        """
+        times, records = self._timelines.get(key, ([], []))
+        if not records:
+            raise UpstreamReplayMissError(f"No recorded response for {key}")
+        return records[max(0, bisect.bisect_right(times, position) - 1)]
+
+    def fetch(
+        self,
+        endpoint: str,
+        fn: Callable[..., Any],
+        args: Tuple,
+        kwargs: Dict[str, Any],
+    ) -> Any:
+        record = self.record_at(request_key(fn, args, kwargs), self.position())
+        if self.latency and self.clock is None:
+            time.sleep(record.get("elapsed", 0.0) / self.speed)
+        return build_endpoint(fn, args, kwargs, record["response"], record.get("url"))
+
+
+def build_endpoint(
+    fn: Callable[..., Any],
+    args: Tuple,
+    kwargs: Dict[str, Any],
+    text: str,
+    url: Optional[str] = None,
+) -> Any:
+    """
+    Build an nba_api endpoint object from a response body, without a request.
+
+    Args:
+        fn: nba_api endpoint class
+        args: Positional arguments it was called with
+        kwargs: Keyword arguments it was called with
+        text: Raw response text
+        url: Request URL, if known
+
+    Returns:
+        The endpoint object, as if it had fetched ``text`` itself
+    """
+    if fn.__module__.startswith("nba_api.stats"):
+        response_class = NBAStatsResponse
+    else:
+        response_class = NBAResponse
+    endpoint = fn(*args, **{**kwargs, "get_request": False})
+    endpoint.nba_response = response_class(response=text, status_code=200, url=url)
+    endpoint.load_response()
+    return endpoint
+
+
+def make_source(settings: Optional[Settings] = None) -> UpstreamSource:
+    """
+    Build the upstream source selected by UPSTREAM_SOURCE.
+
+    Raises:
+        ValueError: If UPSTREAM_SOURCE is not one of SOURCES
+    """
+    settings = settings or get_settings()
+    if settings.UPSTREAM_SOURCE == "live":
+        return LiveSource()
+    if settings.UPSTREAM_SOURCE == "record":
+        return RecordingSource(settings.UPSTREAM_RECORDING_PATH)
+    if settings.UPSTREAM_SOURCE == "replay":
+        return ReplaySource(
+            settings.UPSTREAM_RECORDING_PATH,
+            speed=settings.UPSTREAM_REPLAY_SPEED,
+            start=settings.UPSTREAM_REPLAY_START,
+            latency=settings.UPSTREAM_REPLAY_LATENCY,
+        )
+    raise ValueError(
+        f"UPSTREAM_SOURCE must be one of {SOURCES}, "
+        f"got {settings.UPSTREAM_SOURCE!r}"
+    )
@@ -1,146 +1,358 @@
 # app/services/standings.py
+import hashlib
+import json
 import logging
-from sqlalchemy.orm import Session
-from sqlalchemy import func
+import time
+from typing import Any, Dict, List, Optional
+
+import pandas as pd
 from nba_api.stats.endpoints import leaguestandings
-from typing import List
+from sqlalchemy import delete, select
+from sqlalchemy.dialects.sqlite import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
 
+from app.core.config import get_settings
 from app.models.standings import TeamStanding
-from app.schemas.standings import StandingsResponse
+from app.schemas.standings import StandingsResponse, StandingsUpdate
+from app.services.broadcast import encode_frame
+from app.services.http_cache import etag_for
+from app.services.upstream import upstream_client
 
 # Configure logging
 logger = logging.getLogger(__name__)
 
-async def update_standings_database(db: Session) -> None:
+# TeamStanding column -> LeagueStandings DataFrame column
+STANDINGS_COLUMNS: Dict[str, str] = {
+    "team_id": "TeamID",
+    "team_city": "TeamCity",
+    "team_name": "TeamName",
+    "conference": "Conference",
+    "division": "Division",
+    "wins": "WINS",
+    "losses": "LOSSES",
+    "win_pct": "WinPCT",
+    "games_back": "ConferenceGamesBack",
+    "conference_rank": "PlayoffRank",
+    "division_rank": "DivisionRank",
+    "home_record": "HOME",
+    "road_record": "ROAD",
+    "last_ten": "L10",
+    "streak": "CurrentStreak",
+    "points_pg": "PointsPG",
+    "opp_points_pg": "OppPointsPG",
+    "division_record": "DivisionRecord",
+    "conference_record": "ConferenceRecord",
+    "vs_east": "vsEast",
+    "vs_west": "vsWest",
+}
+
+
+async def update_standings_database(db: AsyncSession) -> StandingsUpdate:
     """
     Update the standings in the database with current NBA standings.
-    
+
     Args:
-        db: Database session
-    
+        db: Async database session
+
+    Returns:
+        StandingsUpdate with the changed teams and the new content hash
+
     Raises:
         Exception: If there's an error updating the database
     """
     try:
         # Get current standings
-        standings = leaguestandings.LeagueStandings(season='2024-25')
+        standings = await upstream_client.call(
+            "stats", leaguestandings.LeagueStandings, season=get_settings().NBA_SEASON
+        )
         df = standings.standings.get_data_frame()
-        
-        try:
-            # Clear existing standings
-            db.query(TeamStanding).delete()
-            
-            # Add new standings
-            for _, row in df.iterrows():
-                db_standing = TeamStanding(
-                    team_id=row['TeamID'],
-                    team_city=row['TeamCity'],
-                    team_name=row['TeamName'],
-                    conference=row['Conference'],
-                    division=row['Division'],
-                    wins=row['WINS'],
-                    losses=row['LOSSES'],
-                    win_pct=row['WinPCT'],
-                    games_back=row['ConferenceGamesBack'],
-                    conference_rank=row['PlayoffRank'],
-                    division_rank=row['DivisionRank'],
-                    home_record=row['HOME'],
-                    road_record=row['ROAD'],
-                    last_ten=row['L10'],
-                    streak=row['CurrentStreak'],
-                    points_pg=row['PointsPG'],
-                    opp_points_pg=row['OppPointsPG'],
-                    division_record=row['DivisionRecord'],
-                    conference_record=row['ConferenceRecord'],
-                    vs_east=f"{row['vsEast']}",
-                    vs_west=f"{row['vsWest']}"
-                )
-                db.add(db_standing)
-            
-            db.commit()
-            logger.info("Successfully updated standings database")
-            
-        except Exception as e:
-            db.rollback()
-            logger.error(f"Error updating standings database: {e}")
-            raise
-            
     except Exception as e:
         logger.error(f"Error fetching standings data: {e}")
         raise
 
+    result = await db.run_sync(sync_standings, standings_rows(df))
+    logger.info(
+        "Successfully updated standings database: "
+        f"{result.updated_teams} teams changed, "
+        f"hash {result.content_hash[:12]}"
+    )
+    return result
+
+
+def standings_rows(df: pd.DataFrame) -> List[Dict[str, Any]]:
+    """
+    Convert a LeagueStandings DataFrame to TeamStanding column dicts.
+
+    Values are cast to their column's Python type (e.g. the integer
+    CurrentStreak to the string stored in ``streak``), so the rows compare
+    equal to what sync_standings reads back from the table.
+
+    Args:
+        df: LeagueStandings standings DataFrame
+
+    Returns:
+        One dict per team, keyed by TeamStanding column names
+    """
+    frame = df[list(STANDINGS_COLUMNS.values())].rename(
+        columns={v: k for k, v in STANDINGS_COLUMNS.items()}
+    )
+    frame = frame.astype(
+        {
+            name: getattr(TeamStanding, name).type.python_type
+            for name in STANDINGS_COLUMNS
+        }
+    )
+    return frame.to_dict("records")
+
+
+def standings_content_hash(rows: List[Dict[str, Any]]) -> str:
+    """
+    Stable hash of a full set of standings rows.
+
+    Args:
+        rows: TeamStanding column dicts
+
+    Returns:
+        Hex digest that changes only when some team's standing changes
+    """
+    ordered = sorted(rows, key=lambda row: row["team_id"])
+    payload = json.dumps(ordered, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+def sync_standings(db: Session, rows: List[Dict[str, Any]]) -> StandingsUpdate:
+    """
+    Make the team_standings table match ``rows``.
+
+    Only rows that differ from the table are written, with one
+    ``INSERT ... ON CONFLICT(team_id) DO UPDATE`` executemany; teams missing
+    from ``rows`` are deleted.
+
+    Args:
+        db: Database session
+        rows: TeamStanding column dicts, one per team
+
+    Returns:
+        StandingsUpdate with the changed teams and the new content hash
+
+    Raises:
+        Exception: If there's an error updating the database
+    """
+    columns = [getattr(TeamStanding, name) for name in STANDINGS_COLUMNS]
+    existing = {
+        row["team_id"]: row
+        for row in (dict(r._mapping) for r in db.execute(select(*columns)))
+    }
+    incoming = {row["team_id"]: row for row in rows}
+
+    changed = [row for team_id, row in incoming.items() if existing.get(team_id) != row]
+    removed = [team_id for team_id in existing if team_id not in incoming]
+    record_changed = sorted(
+        team_id
+        for team_id, row in incoming.items()
+        if team_id not in existing
+        or (existing[team_id]["wins"], existing[team_id]["losses"])
+        != (row["wins"], row["losses"])
+    )
+
+    try:
+        if changed:
+            stmt = insert(TeamStanding)
+            stmt = stmt.on_conflict_do_update(
+                index_elements=[TeamStanding.team_id],
+                set_={
+                    name: stmt.excluded[name]
+                    for name in STANDINGS_COLUMNS
+                    if name != "team_id"
+                },
+            )
+            db.execute(stmt, changed)
+        if removed:
+            db.execute(delete(TeamStanding).where(TeamStanding.team_id.in_(removed)))
+        db.commit()
+    except Exception as e:
+        db.rollback()
+        logger.error(f"Error updating standings database: {e}")
+        raise
+
+    if changed or removed or not standings_store.loaded:
+        standings_store.load(db)
+    return StandingsUpdate(
+        message="Standings database updated successfully",
+        updated_teams=len(changed),
+        removed_teams=len(removed),
+        record_changed_team_ids=record_changed,
+        content_hash=standings_store.content_hash,
+        changed=bool(changed or removed),
+    )
+
+
+class StandingsView:
+    """One pre-grouped standings list with its serialized response body."""
+
+    __slots__ = ("standings", "body", "etag", "last_modified")
+
+    def __init__(
+        self,
+        standings: List[StandingsResponse],
+        previous: Optional["StandingsView"] = None,
+    ):
+        """
+        Args:
+            standings: Teams in display order
+            previous: The view this one replaces; its Last-Modified time is
+                kept if the body is unchanged
+        """
+        self.standings = standings
+        self.body: bytes = encode_frame([s.model_dump() for s in standings]).encode()
+        self.etag = etag_for(self.body)
+        if previous is not None and previous.etag == self.etag:
+            self.last_modified = previous.last_modified
+        else:
+            self.last_modified = time.time()
+
+
+class StandingsStore:
+    """
+    In-memory standings grouped by conference and division.
+
+    Rebuilt from the database whenever a refresh changes the standings, so
+    the standings endpoints are dictionary lookups returning pre-serialized
+    JSON with an ETag.
+    """
+
+    def __init__(self):
+        self.content_hash: Optional[str] = None
+        self._conferences: Dict[str, StandingsView] = {}
+        self._divisions: Dict[str, StandingsView] = {}
+
+    @property
+    def loaded(self) -> bool:
+        return self.content_hash is not None
+
+    def load(self, db: Session) -> None:
+        """
+        Rebuild the store from the team_standings table.
+
+        Args:
+            db: Database session
+        """
+        teams = db.query(TeamStanding).all()
+        standings = [StandingsResponse.model_validate(team) for team in teams]
+        conferences: Dict[str, List[StandingsResponse]] = {}
+        divisions: Dict[str, List[StandingsResponse]] = {}
+        for standing in standings:
+            conferences.setdefault(standing.conference.lower(), []).append(standing)
+            divisions.setdefault(standing.division.lower(), []).append(standing)
+
+        self._conferences = {
+            name: StandingsView(
+                sorted(teams, key=lambda s: s.conference_rank),
+                self._conferences.get(name),
+            )
+            for name, teams in conferences.items()
+        }
+        self._divisions = {
+            name: StandingsView(
+                sorted(teams, key=lambda s: s.division_rank), self._divisions.get(name)
+            )
+            for name, teams in divisions.items()
+        }
+        self.content_hash = standings_content_hash(
+            [
+                {name: getattr(team, name) for name in STANDINGS_COLUMNS}
+                for team in teams
+            ]
+        )
+        logger.info(f"Loaded standings store: {len(standings)} teams")
+
+    def ensure_loaded(self, db: Session) -> None:
+        """Load the store on first use (e.g. when startup refreshes are skipped)."""
+        if not self.loaded:
+            self.load(db)
+
+    def invalidate(self) -> None:
+        """Reload on next use, e.g. after another worker refreshed the standings."""
+        self.content_hash = None
+
+    def conference(self, conference: str) -> Optional[StandingsView]:
+        """Standings for a conference, ordered by conference rank."""
+        return self._conferences.get(conference.lower())
+
+    def division(self, division: str) -> Optional[StandingsView]:
+        """Standings for a division, ordered by division rank."""
+        return self._divisions.get(division.lower())
+
+
+standings_store = StandingsStore()
+
+
 async def get_conference_standings(
-    db: Session,
-    conference: str
+    db: AsyncSession, conference: str
 ) -> List[StandingsResponse]:
     """
     Get standings for a specific conference.
-    
+
     Args:
-        db: Database session
+        db: Async database session
         conference: Conference name ('East' or 'West')
-    
+
     Returns:
         List of team standings for the specified conference
     """
-    standings = (
-        db.query(TeamStanding)
-        .filter(func.lower(TeamStanding.conference) == func.lower(conference))
-        .order_by(TeamStanding.conference_rank)
-        .all()
-    )
-    return standings
+    await db.run_sync(standings_store.ensure_loaded)
+    view = standings_store.conference(conference)
+    return view.standings if view else []
+
 
 async def get_division_standings(
-    db: Session,
-    division: str
+    db: AsyncSession, division: str
 ) -> List[StandingsResponse]:
     """
     Get standings for a specific division.
-    
+
     Args:
-        db: Database session
+        db: Async database session
         division: Division name
-    
+
     Returns:
         List of team standings for the specified division
     """
-    standings = (
-        db.query(TeamStanding)
-        .filter(func.lower(TeamStanding.division) == func.lower(division))
-        .order_by(TeamStanding.division_rank)
-        .all()
-    )
-    return standings
+    await db.run_sync(standings_store.ensure_loaded)
+    view = standings_store.division(division)
+    return view.standings if view else []
+
 
 def validate_conference(conference: str) -> bool:
     """
     Validate conference name.
-    
+
     Args:
         conference: Conference name to validate
-    
+
     Returns:
         True if valid, False otherwise
     """
-    return conference.lower() in ['east', 'west']
+    return conference.lower() in ["east", "west"]
+
 
 def validate_division(division: str) -> bool:
     """
     Validate division name.
-    
+
     Args:
         division: Division name to validate
-    
+
     Returns:
         True if valid, False otherwise
     """
     valid_divisions = [
-        'atlantic',
-        'central',
-        'southeast',
-        'northwest',
-        'pacific',
-        'southwest'
+        "atlantic",
+        "central",
+        "southeast",
+        "northwest",
+        "pacific",
+        "southwest",
     ]
-    return division.lower() in valid_divisions
\ No newline at end of file
+    return division.lower() in valid_divisions
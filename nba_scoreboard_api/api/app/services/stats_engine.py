@@ -0,0 +1,291 @@
+# app/services/stats_engine.py
+import logging
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from app.models.players import PlayerGameLog
+from app.services import game_logs
+from app.services.game_logs import REGULAR_SEASON
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+# Summable per-game stats, one column each in the value matrix
+COUNTING_STATS = [
+    "min",
+    "pts",
+    "fgm",
+    "fga",
+    "fg3m",
+    "fg3a",
+    "ftm",
+    "fta",
+    "oreb",
+    "dreb",
+    "reb",
+    "ast",
+    "stl",
+    "blk",
+    "tov",
+    "pf",
+    "plus_minus",
+]
+# Shooting percentages, derived from made/attempted totals rather than averaged
+PERCENTAGE_STATS: Dict[str, Tuple[str, str]] = {
+    "fg_pct": ("fgm", "fga"),
+    "fg3_pct": ("fg3m", "fg3a"),
+    "ft_pct": ("ftm", "fta"),
+}
+STATS = COUNTING_STATS + list(PERCENTAGE_STATS)
+LEADER_MODES = ("per_game", "per_36", "total")
+
+_COLUMN = {stat: i for i, stat in enumerate(COUNTING_STATS)}
+
+
+def _safe_divide(numerator: np.ndarray, denominator: np.ndarray) -> np.ndarray:
+    return np.divide(
+        numerator,
+        denominator,
+        out=np.zeros(np.broadcast(numerator, denominator).shape),
+        where=denominator > 0,
+    )
+
+
+def _with_percentages(totals: np.ndarray, scaled: np.ndarray) -> np.ndarray:
+    """
+    Append percentage columns (from ``totals``) to ``scaled`` counting stats.
+
+    Both arrays are (..., len(COUNTING_STATS)); the result is (..., len(STATS)).
+    """
+    percentages = [
+        _safe_divide(totals[..., _COLUMN[made]], totals[..., _COLUMN[attempted]])
+        for made, attempted in PERCENTAGE_STATS.values()
+    ]
+    return np.concatenate([scaled, np.stack(percentages, axis=-1)], axis=-1)
+
+
+class SeasonStatsEngine:
+    """
+    Columnar season stats over the player game log store.
+
+    Game logs are held as one float64 matrix (a column per counting stat),
+    sorted by player and date so each player's games are a contiguous slice.
+    Season totals for every player come from a single ``np.add.reduceat``;
+    averages, per-36 rates, rolling windows and leaderboards are vectorized
+    over those arrays.
+    """
+
+    def __init__(self):
+        self.season: Optional[str] = None
+        self.season_type: Optional[str] = None
+        self.loaded = False
+        self._store_version = -1
+        self.person_ids = np.empty(0, dtype=np.int64)
+        self.game_dates = np.empty(0, dtype=object)
+        self.values = np.empty((0, len(COUNTING_STATS)))
+        self.starts = np.empty(0, dtype=np.int64)
+        self.games_played = np.empty(0, dtype=np.int64)
+        self.totals = np.empty((0, len(COUNTING_STATS)))
+        self._index: Dict[int, int] = {}
+
+    def load_frame(self, frame: pd.DataFrame, season: str, season_type: str) -> None:
+        """
+        Build the arrays from a DataFrame of player_game_logs rows.
+
+        Args:
+            frame: DataFrame with person_id, game_date and COUNTING_STATS columns
+            season: Season the rows belong to
+            season_type: Season type the rows belong to
+        """
+        frame = frame.sort_values(["person_id", "game_date"], kind="stable")
+        person_ids = frame["person_id"].to_numpy(dtype=np.int64)
+        values = frame[COUNTING_STATS].to_numpy(dtype=np.float64)
+        players, starts, counts = np.unique(
+            person_ids, return_index=True, return_counts=True
+        )
+
+        self.values = values
+        self.game_dates = frame["game_date"].to_numpy(dtype=object)
+        self.person_ids = players
+        self.starts = starts
+        self.games_played = counts
+        self.totals = (
+            np.add.reduceat(values, starts, axis=0)
+            if len(values)
+            else np.empty((0, len(COUNTING_STATS)))
+        )
+        self._index = {int(person_id): i for i, person_id in enumerate(players)}
+        self.season = season
+        self.season_type = season_type
+        self.loaded = True
+        logger.info(
+            f"Loaded stats engine: {len(values)} player-games, {len(players)} players"
+        )
+
+    def load(self, db: Session, season: str, season_type: str = REGULAR_SEASON) -> None:
+        """
+        Build the arrays from the player_game_logs table.
+
+        Args:
+            db: Database session
+            season: Season in "YYYY-YY" format
+            season_type: "Regular Season", "Playoffs", ...
+        """
+        columns = [PlayerGameLog.person_id, PlayerGameLog.game_date] + [
+            getattr(PlayerGameLog, stat) for stat in COUNTING_STATS
+        ]
+        query = select(*columns).where(
+            PlayerGameLog.season == season,
+            PlayerGameLog.season_type == season_type,
+        )
+        version = game_logs.store_version
+        frame = pd.read_sql_query(query, db.connection())
+        self.load_frame(frame, season, season_type)
+        self._store_version = version
+
+    def ensure_loaded(
+        self, db: Session, season: str, season_type: str = REGULAR_SEASON
+    ) -> None:
+        """Load the arrays for a season on first use and after the store changes."""
+        if (
+            not self.loaded
+            or (self.season, self.season_type) != (season, season_type)
+            or self._store_version != game_logs.store_version
+        ):
+            self.load(db, season, season_type)
+
+    def _player_slice(self, person_id: int) -> Optional[slice]:
+        i = self._index.get(person_id)
+        if i is None:
+            return None
+        start = self.starts[i]
+        return slice(start, start + self.games_played[i])
+
+    def player_averages(
+        self, person_id: int, window: int
+    ) -> Optional[Dict[str, object]]:
+        """
+        Season averages, per-36 rates and last-``window`` averages for a player.
+
+        Args:
+            person_id: NBA.com person ID
+            window: Number of most recent games for ``last_n``
+
+        Returns:
+            Dict with games_played and ``averages``/``per_36``/``last_n``
+            stat dicts, or None if the player has no games
+        """
+        rows = self._player_slice(person_id)
+        if rows is None:
+            return None
+        games = self.values[rows]
+        totals = self.totals[self._index[person_id]]
+        recent = games[-window:]
+        recent_totals = recent.sum(axis=0)
+        return {
+            "games_played": len(games),
+            "averages": self._stat_line(_with_percentages(totals, totals / len(games))),
+            "per_36": self._stat_line(_with_percentages(totals, self._per_36(totals))),
+            "last_n": self._stat_line(
+                _with_percentages(recent_totals, recent_totals / len(recent))
+            ),
+        }
+
+    def rolling(
+        self, person_id: int, stat: str, window: int
+    ) -> Optional[List[Tuple[str, float]]]:
+        """
+        Rolling ``window``-game averages of one stat, oldest first.
+
+        Args:
+            person_id: NBA.com person ID
+            stat: One of STATS
+            window: Games per window
+
+        Returns:
+            (game_date, value) for every game completing a full window, or
+            None if the player has no games
+        """
+        rows = self._player_slice(person_id)
+        if rows is None:
+            return None
+        games = self.values[rows]
+        dates = self.game_dates[rows]
+        if len(games) < window:
+            return []
+        cumulative = np.concatenate(
+            [np.zeros((1, games.shape[1])), np.cumsum(games, axis=0)]
+        )
+        window_totals = cumulative[window:] - cumulative[:-window]
+        if stat in PERCENTAGE_STATS:
+            series = _with_percentages(window_totals, window_totals)[
+                :, STATS.index(stat)
+            ]
+        else:
+            series = window_totals[:, _COLUMN[stat]] / window
+        return list(zip(dates[window - 1 :].tolist(), series.tolist()))
+
+    def leaders(
+        self,
+        stat: str,
+        mode: str = "per_game",
+        limit: int = 10,
+        min_games: int = 1,
+        min_attempts: int = 0,
+    ) -> List[Tuple[int, int, float]]:
+        """
+        Top-``limit`` players for a stat.
+
+        Args:
+            stat: One of STATS
+            mode: "per_game", "per_36" or "total" (percentages ignore mode)
+            limit: Number of players to return
+            min_games: Minimum games played to qualify
+            min_attempts: For percentages, minimum total attempts (FGA, FG3A
+                or FTA) to qualify, so a 1-for-1 shooter doesn't lead
+
+        Returns:
+            (person_id, games_played, value), best first
+        """
+        if not len(self.person_ids):
+            return []
+        if mode == "per_game":
+            scaled = self.totals / self.games_played[:, None]
+        elif mode == "per_36":
+            scaled = self._per_36(self.totals)
+        else:
+            scaled = self.totals
+        values = _with_percentages(self.totals, scaled)[:, STATS.index(stat)]
+        qualified = self.games_played >= min_games
+        if stat in PERCENTAGE_STATS and min_attempts > 0:
+            attempted = PERCENTAGE_STATS[stat][1]
+            qualified &= self.totals[:, _COLUMN[attempted]] >= min_attempts
+        values = np.where(qualified, values, -np.inf)
+
+        k = min(limit, int(np.isfinite(values).sum()))
+        if k <= 0:
+            return []
+        top = np.argpartition(-values, k - 1)[:k]
+        top = top[np.lexsort((self.person_ids[top], -values[top]))]
+        return [
+            (int(self.person_ids[i]), int(self.games_played[i]), float(values[i]))
+            for i in top
+        ]
+
+    @staticmethod
+    def _per_36(totals: np.ndarray) -> np.ndarray:
+        minutes = totals[..., _COLUMN["min"]]
+        per_36 = _safe_divide(totals * 36.0, minutes[..., None])
+        per_36[..., _COLUMN["min"]] = np.where(minutes > 0, 36.0, 0.0)
+        return per_36
+
+    @staticmethod
+    def _stat_line(values: np.ndarray) -> Dict[str, float]:
+        return {stat: round(float(value), 3) for stat, value in zip(STATS, values)}
+
+
+stats_engine = SeasonStatsEngine()
@@ -0,0 +1,80 @@
+# app/services/transform.py
+import re
+from typing import Any, Dict, List
+
+from dateutil import parser
+
+# NBA.com's gameTimeUTC, e.g. "2025-02-28T00:30:00Z"
+_UTC_TIME = re.compile(r"\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}Z")
+
+
+def wire_time(value: str) -> str:
+    """
+    Convert an upstream UTC timestamp to the ISO 8601 form sent to clients.
+
+    NBA.com's usual "...Z" form is rewritten without parsing; anything else
+    goes through dateutil.
+
+    Args:
+        value: Timestamp from the upstream payload
+
+    Returns:
+        The timestamp as ``YYYY-MM-DDTHH:MM:SS+00:00`` (as datetime.isoformat())
+
+    Raises:
+        ValueError: If the timestamp can't be parsed
+    """
+    if _UTC_TIME.fullmatch(value):
+        return value[:-1] + "+00:00"
+    return parser.parse(value).isoformat()
+
+
+def _team(team: Dict[str, Any]) -> Dict[str, Any]:
+    return {
+        "team_id": str(team["teamId"]),
+        "team_name": team["teamName"],
+        "team_city": team["teamCity"],
+        "team_tricode": team["teamTricode"],
+        "score": int(team.get("score", 0)),
+    }
+
+
+def scoreboard_games(games_data: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """
+    Map the games of NBA.com's live scoreboard to the wire representation.
+
+    One pass, no models: each game becomes the dict clients receive, shaped
+    like GameBrief (which documents it) with game_time already an ISO 8601
+    string, so the result can be broadcast and encoded as is.
+
+    Args:
+        games_data: The ``games`` list of the upstream scoreboard payload
+
+    Returns:
+        List of game dictionaries
+
+    Raises:
+        ValueError: If a game lacks a field or has one of the wrong type
+    """
+    games = []
+    for game in games_data:
+        try:
+            clock = game.get("gameClock")
+            if clock is not None and not isinstance(clock, str):
+                raise TypeError(f"gameClock is {type(clock).__name__}")
+            games.append(
+                {
+                    "game_id": str(game["gameId"]),
+                    "game_status": int(game["gameStatus"]),
+                    "away_team": _team(game["awayTeam"]),
+                    "home_team": _team(game["homeTeam"]),
+                    "period": int(game.get("period", 0)),
+                    "clock": clock,
+                    "game_time": wire_time(game["gameTimeUTC"]),
+                }
+            )
+        except (KeyError, TypeError, ValueError, OverflowError) as e:
+            raise ValueError(
+                f"Invalid scoreboard game {game.get('gameId')!r}: {e!r}"
+            ) from e
+    return games
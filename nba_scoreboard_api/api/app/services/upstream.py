@@ -0,0 +1,158 @@
+# app/services/upstream.py
+import asyncio
+import functools
+import logging
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Optional
+
+from app.core.config import get_settings
+from app.core.metrics import metrics
+from app.services.sources import LiveSource, UpstreamSource, make_source
+
+logger = logging.getLogger(__name__)
+
+upstream_duration = metrics.histogram(
+    "nba_upstream_request_duration_seconds",
+    "NBA.com call time (worker pool and request), by endpoint and outcome",
+    ("endpoint", "outcome"),
+)
+upstream_wait = metrics.histogram(
+    "nba_upstream_queue_wait_seconds",
+    "Time NBA.com calls waited for their endpoint's concurrency limit",
+    ("endpoint",),
+)
+
+
+class UpstreamTimeoutError(Exception):
+    """Raised when an NBA.com call does not complete within its endpoint timeout."""
+
+
+class UpstreamClient:
+    """
+    Runs the blocking nba_api calls off the event loop.
+
+    Every call goes through a shared, bounded thread pool. Each logical endpoint
+    ("scoreboard", "boxscore", "playbyplay", "stats") additionally has its own
+    concurrency limit and timeout, so a slow stats call can never starve the
+    live scoreboard poller of worker threads.
+
+    The calls themselves are made by an UpstreamSource: NBA.com, NBA.com
+    with the responses recorded to disk, or a replayed recording
+    (UPSTREAM_SOURCE).
+    """
+
+    def __init__(
+        self,
+        max_workers: int,
+        timeouts: Dict[str, float],
+        concurrency: Dict[str, int],
+        default_timeout: float,
+        default_concurrency: int,
+        source: Optional[UpstreamSource] = None,
+    ):
+        self.max_workers = max_workers
+        self.timeouts = dict(timeouts)
+        self.concurrency = dict(concurrency)
+        self.default_timeout = default_timeout
+        self.default_concurrency = default_concurrency
+        self.source = source or LiveSource()
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._semaphores: Dict[str, asyncio.Semaphore] = {}
+
+    @classmethod
+    def from_settings(cls) -> "UpstreamClient":
+        """Build a client from the application settings."""
+        settings = get_settings()
+        return cls(
+            max_workers=settings.UPSTREAM_MAX_WORKERS,
+            timeouts=settings.UPSTREAM_TIMEOUTS,
+            concurrency=settings.UPSTREAM_CONCURRENCY,
+            default_timeout=settings.UPSTREAM_DEFAULT_TIMEOUT,
+            default_concurrency=settings.UPSTREAM_DEFAULT_CONCURRENCY,
+            source=make_source(settings),
+        )
+
+    def timeout_for(self, endpoint: str) -> float:
+        """Return the timeout in seconds for an endpoint."""
+        return self.timeouts.get(endpoint, self.default_timeout)
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self.max_workers, thread_name_prefix="nba-upstream"
+            )
+        return self._executor
+
+    def _get_semaphore(self, endpoint: str) -> asyncio.Semaphore:
+        if endpoint not in self._semaphores:
+            self._semaphores[endpoint] = asyncio.Semaphore(
+                self.concurrency.get(endpoint, self.default_concurrency)
+            )
+        return self._semaphores[endpoint]
+
+    async def call(self, endpoint: str, fn: Callable[..., Any], *args, **kwargs) -> Any:
+        """
+        Run a blocking nba_api call in the worker pool, through the source.
+
+        The endpoint timeout is also passed to ``fn`` as its ``timeout`` keyword
+        (every nba_api endpoint class accepts one) so the worker thread gives up
+        on the HTTP request at the same time we stop waiting for it.
+
+        Args:
+            endpoint: Logical endpoint name used for limits and timeouts
+            fn: Blocking callable, typically an nba_api endpoint class
+            *args: Positional arguments for ``fn``
+            **kwargs: Keyword arguments for ``fn``
+
+        Returns:
+            Whatever ``fn`` returns
+
+        Raises:
+            UpstreamTimeoutError: If the call exceeds the endpoint timeout
+        """
+        timeout = self.timeout_for(endpoint)
+        kwargs.setdefault("timeout", timeout)
+        loop = asyncio.get_running_loop()
+        queued = time.perf_counter()
+
+        async with self._get_semaphore(endpoint):
+            started = time.perf_counter()
+            upstream_wait.observe(started - queued, endpoint)
+            future = loop.run_in_executor(
+                self._get_executor(),
+                functools.partial(self.source.fetch, endpoint, fn, args, kwargs),
+            )
+            outcome = "error"
+            try:
+                result = await asyncio.wait_for(future, timeout)
+                outcome = "ok"
+                return result
+            except asyncio.TimeoutError:
+                outcome = "timeout"
+                raise UpstreamTimeoutError(
+                    f"Upstream {endpoint} call timed out after {timeout}s"
+                )
+            except asyncio.CancelledError:
+                outcome = "cancelled"
+                raise
+            finally:
+                upstream_duration.observe(
+                    time.perf_counter() - started, endpoint, outcome
+                )
+
+    def shutdown(self) -> None:
+        """
+        Release the worker pool without waiting for in-flight calls.
+
+        Also closes the source (e.g. a RecordingSource's file).
+        """
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+        self._semaphores.clear()
+        self.source.close()
+
+
+# Global upstream client shared by all services
+upstream_client = UpstreamClient.from_settings()
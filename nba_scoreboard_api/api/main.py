@@ -1,53 +1,58 @@
 # main.py
-import asyncio
+import copy
+import logging
+import time
 from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.openapi.docs import get_swagger_ui_html, get_redoc_html
-import logging
-import time
-import copy
-from app.core.config import get_settings
-from app.core.database import init_db, get_db, SessionLocal
-from app.api.v1.endpoints import router as api_router
-from app.services.players import update_player_database
-from app.services.standings import update_standings_database
+from fastapi.openapi.docs import get_redoc_html, get_swagger_ui_html
+from fastapi.responses import PlainTextResponse
 
-# Import these from your scoreboard service (restores old approach)
-from app.services.scoreboard import scoreboard_manager, get_live_scoreboard
+from app.api.v1.endpoints import router as api_router
+from app.core.config import get_settings
+from app.core.database import async_engine, async_read_engine, init_db
+from app.core.metrics import CONTENT_TYPE, metrics
+from app.services.cluster import cluster
+from app.services.freshness import freshness
+from app.services.jobs import register_jobs, scheduler
+from app.services.scoreboard import scoreboard_manager
+from app.services.upstream import upstream_client
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+STARTED_AT = time.monotonic()
+
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Lifespan events for database initialization and data updates."""
     settings = get_settings()
 
-    # 1) Initialize DB
+    # 1) Initialize DB (migrates only when the schema revision differs)
     init_db()
 
-    # 2) Update player data + standings if not in testing mode
-    if not settings.TESTING:
-        db = SessionLocal()
-        try:
-            await update_player_database(db)
-            await update_standings_database(db)
-        finally:
-            db.close()
+    # 2) Join the cluster. The leader worker runs the job scheduler (live
+    #    scoreboard poll plus player, standings and game log refreshes) and
+    #    publishes updates to the others. Stale data is refreshed on the first
+    #    tick while requests are served from SQLite; /health reports how fresh it is.
+    register_jobs(scheduler, refresh=not settings.TESTING)
+
+    async def warm_up():
+        await scheduler.run("players")
+        await scheduler.run("standings")
 
-    # 3) Start background scoreboard task
-    scoreboard_task = asyncio.create_task(fetch_scoreboard_updates())
+    blocking = not settings.TESTING and settings.STARTUP_MODE == "blocking"
+    await cluster.start(warm_up=warm_up if blocking else None)
 
     yield  # Application is running
 
-    # 4) Cleanup
-    scoreboard_task.cancel()
-    try:
-        await scoreboard_task
-    except asyncio.CancelledError:
-        pass
+    # 3) Cleanup
+    await cluster.stop()
+    upstream_client.shutdown()
+    await async_engine.dispose()
+    await async_read_engine.dispose()
 
 
 def create_app() -> FastAPI:
@@ -88,92 +93,74 @@ def create_app() -> FastAPI:
             title=app.title + " - ReDoc",
         )
 
+    @app.get("/health", include_in_schema=False)
+    async def health():
+        stale = freshness.stale()
+        snapshot_age = scoreboard_manager.snapshot_age()
+        return {
+            "status": "stale" if stale else "ok",
+            "uptime_seconds": round(time.monotonic() - STARTED_AT, 1),
+            "scoreboard_age_seconds": (
+                None if snapshot_age is None else round(snapshot_age, 1)
+            ),
+            "cluster": cluster.status(),
+            "stale": stale,
+            "data": freshness.snapshot(),
+        }
+
+    if settings.METRICS_ENABLED:
+
+        @app.get("/metrics", include_in_schema=False)
+        async def metrics_endpoint():
+            return PlainTextResponse(metrics.render(), media_type=CONTENT_TYPE)
+
     # Include API routers
     app.include_router(api_router, prefix="/api/v1")
 
     return app
 
 
-async def fetch_scoreboard_updates():
-    """
-    Background task to periodically fetch the live scoreboard and broadcast updates.
-    Enhanced with additional safeguards against fluctuating data.
-    """
-    logger.info("Starting scoreboard update background task")
-    settings = get_settings()
-    
-    # Simple adaptive polling
-    base_interval = 1.0
-    current_interval = base_interval
-    max_interval = 3.0
-    min_interval = 0.5
-    
-    while True:
-        try:
-            # Fetch live scoreboard from services/scoreboard.py
-            games_response = await get_live_scoreboard()
-            
-            # Convert to dict for easier manipulation
-            games_data = games_response.model_dump()
-            
-            # Let the scoreboard manager handle validation and broadcasting
-            # The manager will now process each game individually and maintain
-            # a consistent view of all games
-            was_broadcast = await scoreboard_manager.broadcast(games_data["games"])
-            
-            if was_broadcast:
-                logger.debug(f"Broadcast scoreboard update with {len(games_data['games'])} games")
-                # Decrease interval slightly on successful broadcast for more responsive updates
-                current_interval = max(min_interval, current_interval * 0.9)
-            else:
-                # Increase interval slightly when no changes to reduce polling
-                current_interval = min(max_interval, current_interval * 1.1)
-                
-            # Sleep before the next update (use dynamic interval)
-            await asyncio.sleep(current_interval)
-        except Exception as e:
-            logger.error(f"Error in scoreboard update task: {e}")
-            # Sleep longer on error
-            await asyncio.sleep(5)
-
 def are_responses_equal(resp1, resp2):
     """
     Compare two scoreboard responses to check if they represent the same game state.
     Only compares the essential fields that would affect the display.
-    
+
     Args:
         resp1: First response dict
         resp2: Second response dict
-        
+
     Returns:
         True if the responses represent the same game state, False otherwise
     """
     if "games" not in resp1 or "games" not in resp2:
         return False
-        
+
     if len(resp1["games"]) != len(resp2["games"]):
         return False
-        
+
     # Create maps for faster comparison
     games1 = {g["game_id"]: g for g in resp1["games"]}
     games2 = {g["game_id"]: g for g in resp2["games"]}
-    
+
     if set(games1.keys()) != set(games2.keys()):
         return False
-        
+
     # Compare each game
     for game_id, game1 in games1.items():
         game2 = games2[game_id]
-        
+
         # Compare essential fields
-        if (game1["game_status"] != game2["game_status"] or
-                game1["period"] != game2["period"] or
-                game1["home_team"]["score"] != game2["home_team"]["score"] or
-                game1["away_team"]["score"] != game2["away_team"]["score"]):
+        if (
+            game1["game_status"] != game2["game_status"]
+            or game1["period"] != game2["period"]
+            or game1["home_team"]["score"] != game2["home_team"]["score"]
+            or game1["away_team"]["score"] != game2["away_team"]["score"]
+        ):
             return False
-            
+
     return True
 
+
 app = create_app()
 
 if __name__ == "__main__":
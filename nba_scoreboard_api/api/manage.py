@@ -0,0 +1,174 @@
+# manage.py
+"""
+Management commands for the NBA Scoreboard API.
+
+Usage (from nba_scoreboard_api/api/):
+    python manage.py backfill-games --season 2024-25
+    python manage.py load-game-logs --season 2024-25 [--full]
+    python manage.py record-night --output recordings/2025-02-27.jsonl.gz
+"""
+
+import argparse
+import asyncio
+import logging
+import time
+
+from nba_api.live.nba.endpoints import boxscore, playbyplay
+
+from app.core.config import get_settings
+from app.core.database import AsyncSessionLocal, SessionLocal
+from app.services.game_logs import REGULAR_SEASON, load_game_logs, refresh_game_logs
+from app.services.polling import ScoreboardPollPolicy
+from app.services.scoreboard import backfill_past_games, get_live_games
+from app.services.sources import RecordingSource
+from app.services.upstream import upstream_client
+
+logger = logging.getLogger(__name__)
+
+
+async def backfill_games(args: argparse.Namespace) -> None:
+    """Archive every finished game of the given seasons."""
+    db = SessionLocal()
+    try:
+        for season in args.season:
+            count = await backfill_past_games(db, season)
+            print(f"{season}: archived {count} games")
+    finally:
+        db.close()
+        upstream_client.shutdown()
+
+
+async def load_game_logs_command(args: argparse.Namespace) -> None:
+    """Load (or incrementally refresh) the player game log store."""
+    try:
+        async with AsyncSessionLocal() as db:
+            for season in args.season:
+                if args.full:
+                    count = await load_game_logs(db, season, args.season_type)
+                else:
+                    count = await refresh_game_logs(db, season, args.season_type)
+                print(f"{season} {args.season_type}: stored {count} game logs")
+    finally:
+        upstream_client.shutdown()
+
+
+async def record_night(args: argparse.Namespace) -> None:
+    """
+    Record a game night's live feeds for offline replay.
+
+    Polls the live scoreboard at the app's own intervals, and the box score
+    and play-by-play of every live game (plus once more when it goes final),
+    until every game seen live has gone final (with all of the scoreboard's
+    games final) or ``--hours`` have passed.
+    """
+    source = RecordingSource(args.output, inner=upstream_client.source)
+    upstream_client.source = source
+    policy = ScoreboardPollPolicy()
+    deadline = time.time() + args.hours * 60 * 60
+    details_polled = {}
+    finished = set()
+    seen_live = False
+    try:
+        while time.time() < deadline:
+            try:
+                games = await get_live_games()
+            except Exception:
+                await asyncio.sleep(get_settings().SCOREBOARD_ERROR_INTERVAL)
+                continue
+            now = time.time()
+            policy.observe(games, now)
+
+            due = [
+                game["game_id"]
+                for game in games
+                if (
+                    game["game_status"] == 2
+                    or (game["game_status"] == 3 and game["game_id"] not in finished)
+                )
+                and now - details_polled.get(game["game_id"], 0) >= args.detail_interval
+            ]
+            for game_id in due:
+                details_polled[game_id] = now
+            results = await asyncio.gather(
+                *(
+                    upstream_client.call(endpoint, fn, game_id)
+                    for game_id in due
+                    for endpoint, fn in (
+                        ("boxscore", boxscore.BoxScore),
+                        ("playbyplay", playbyplay.PlayByPlay),
+                    )
+                ),
+                return_exceptions=True,
+            )
+            for error in (
+                result for result in results if isinstance(result, Exception)
+            ):
+                logger.warning(f"Recording a game's details failed: {error}")
+            finished.update(
+                game["game_id"] for game in games if game["game_status"] == 3
+            )
+            seen_live = seen_live or any(game["game_status"] == 2 for game in games)
+
+            if seen_live and len(finished) == len(games):
+                print(f"All {len(games)} games final")
+                break
+            await asyncio.sleep(policy.interval(time.time()))
+    finally:
+        upstream_client.shutdown()
+        print(f"Recorded {source.records} responses to {args.output}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="NBA Scoreboard API management commands"
+    )
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    backfill = subparsers.add_parser(
+        "backfill-games",
+        help="Archive a whole season of past games into the games table",
+    )
+    backfill.add_argument(
+        "--season",
+        action="append",
+        help='Season in "YYYY-YY" format; repeat for several (default: NBA_SEASON)',
+    )
+    backfill.set_defaults(handler=backfill_games)
+
+    logs = subparsers.add_parser(
+        "load-game-logs",
+        help="Load player game logs into the local store (incremental by default)",
+    )
+    logs.add_argument(
+        "--season",
+        action="append",
+        help='Season in "YYYY-YY" format; repeat for several (default: NBA_SEASON)',
+    )
+    logs.add_argument("--season-type", default=REGULAR_SEASON)
+    logs.add_argument("--full", action="store_true", help="Reload the whole season")
+    logs.set_defaults(handler=load_game_logs_command)
+
+    record = subparsers.add_parser(
+        "record-night",
+        help="Record the live scoreboard, box scores and play-by-play for replay",
+    )
+    record.add_argument("--output", default=str(get_settings().UPSTREAM_RECORDING_PATH))
+    record.add_argument(
+        "--hours", type=float, default=18.0, help="Stop after this long"
+    )
+    record.add_argument(
+        "--detail-interval",
+        type=float,
+        default=3.0,
+        help="Seconds between box score/play-by-play fetches of a live game",
+    )
+    record.set_defaults(handler=record_night, season=None)
+
+    args = parser.parse_args()
+    if not args.season:
+        args.season = [get_settings().NBA_SEASON]
+    asyncio.run(args.handler(args))
+
+
+if __name__ == "__main__":
+    main()
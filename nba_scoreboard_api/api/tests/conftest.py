@@ -0,0 +1,40 @@
+# tests/conftest.py
+import os
+import tempfile
+
+# Point the app's own engines at a throwaway database before anything imports
+# app.core.database; the tests below build their own engines per test
+os.environ.setdefault("TESTING", "True")
+os.environ.setdefault(
+    "SQLALCHEMY_DATABASE_URL",
+    f"sqlite:///{os.path.join(tempfile.mkdtemp(prefix='nba-tests-'), 'app.db')}",
+)
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+import app.models.players  # noqa: F401  (registers the tables)
+import app.models.scoreboard  # noqa: F401
+import app.models.standings  # noqa: F401
+from app.core.database import Base
+
+
+@pytest.fixture
+def db_url(tmp_path):
+    """URL of an empty SQLite database with every table created."""
+    url = f"sqlite:///{tmp_path / 'test.db'}"
+    engine = create_engine(url)
+    Base.metadata.create_all(engine)
+    engine.dispose()
+    return url
+
+
+@pytest.fixture
+def db(db_url):
+    """Sync session on the test database."""
+    engine = create_engine(db_url)
+    session = sessionmaker(bind=engine)()
+    yield session
+    session.close()
+    engine.dispose()
@@ -0,0 +1,212 @@
+# tests/test_cluster.py
+import asyncio
+import time
+
+from app.services.cluster import Cluster
+from app.services.freshness import FreshnessRegistry
+from app.services.pubsub import LocalBackbone
+from app.services.scheduler import JobScheduler
+from app.services.scoreboard import PlayByPlayManager, ScoreboardManager
+
+LEASE_TTL = 0.3
+RENEW_INTERVAL = 0.05
+
+
+class Worker:
+    """A simulated uvicorn worker: own managers and scheduler, shared backbone."""
+
+    def __init__(self, backbone):
+        self.scoreboard = ScoreboardManager()
+        self.playbyplay = PlayByPlayManager(self.scoreboard)
+        self.scheduler = JobScheduler()
+        self.datasets = FreshnessRegistry()
+        self.standings_version = 1
+        self.reloads = 0
+        self.datasets.register(
+            "standings",
+            3600,
+            version=lambda: self.standings_version,
+            reload=self.reload_standings,
+        )
+        self.cluster = Cluster(
+            backbone,
+            self.scheduler,
+            self.scoreboard,
+            self.playbyplay,
+            self.datasets,
+            prefix="test",
+            lease_ttl=LEASE_TTL,
+            renew_interval=RENEW_INTERVAL,
+        )
+
+    def reload_standings(self):
+        self.reloads += 1
+
+    async def refresh_standings(self):
+        async def fetch():
+            pass
+
+        return await self.datasets.refresh("standings", fetch)
+
+    async def crash(self):
+        """Stop without releasing the lease, which has to expire."""
+        for task in self.cluster._tasks:
+            task.cancel()
+        await asyncio.gather(*self.cluster._tasks, return_exceptions=True)
+        await self.scheduler.stop()
+        await self.cluster._subscription.close()
+
+
+def game(home_score):
+    def team(team_id, tricode, score):
+        return {
+            "team_id": team_id,
+            "team_name": tricode.title(),
+            "team_city": "City",
+            "team_tricode": tricode,
+            "score": score,
+        }
+
+    return {
+        "game_id": "0022400001",
+        "game_status": 2,
+        "away_team": team("1610612738", "BOS", 0),
+        "home_team": team("1610612747", "LAL", home_score),
+        "period": 1,
+        "clock": "PT10M00.00S",
+        "game_time": "2025-02-28T00:30:00+00:00",
+    }
+
+
+async def wait_until(condition, timeout=1.0):
+    deadline = time.monotonic() + timeout
+    while not condition() and time.monotonic() < deadline:
+        await asyncio.sleep(0.01)
+
+
+async def wait_for_leader(workers, timeout):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        leaders = [worker for worker in workers if worker.cluster.is_leader]
+        if leaders:
+            return leaders
+        await asyncio.sleep(RENEW_INTERVAL / 5)
+    return []
+
+
+async def start_workers(n):
+    backbone = LocalBackbone()
+    workers = [Worker(backbone) for _ in range(n)]
+    for worker in workers:
+        await worker.cluster.start()
+    return workers
+
+
+async def stop_workers(workers):
+    for worker in workers:
+        await worker.cluster.stop()
+
+
+def test_exactly_one_worker_leads():
+    async def scenario():
+        workers = await start_workers(3)
+        await asyncio.sleep(RENEW_INTERVAL * 4)
+        leaders = [worker.cluster.is_leader for worker in workers]
+        await stop_workers(workers)
+        return leaders
+
+    assert asyncio.run(scenario()) == [True, False, False]
+
+
+def test_followers_receive_the_leaders_updates():
+    async def scenario():
+        leader, follower = await start_workers(2)
+        await leader.scoreboard.broadcast([game(7)])
+        await wait_until(lambda: follower.scoreboard.current_games)
+        games = follower.scoreboard.current_games
+        sequences = (leader.scoreboard.sequence, follower.scoreboard.sequence)
+        await stop_workers([leader, follower])
+        return games, sequences
+
+    games, (leader_seq, follower_seq) = asyncio.run(scenario())
+
+    assert games[0]["home_team"]["score"] == 7
+    assert follower_seq == leader_seq
+
+
+def test_followers_pick_up_the_leaders_data_refreshes():
+    async def scenario():
+        leader, follower = await start_workers(2)
+        stale_before = follower.datasets.stale()
+
+        await leader.refresh_standings()
+        await wait_until(lambda: follower.reloads == 1)
+        first = (follower.reloads, follower.datasets.stale())
+
+        # Same version: the refresh time is recorded, nothing is reloaded
+        await leader.refresh_standings()
+        await asyncio.sleep(RENEW_INTERVAL)
+        unchanged = follower.reloads
+
+        leader.standings_version = 2
+        await leader.refresh_standings()
+        await wait_until(lambda: follower.reloads == 2)
+        changed = follower.reloads
+
+        await stop_workers([leader, follower])
+        return stale_before, first, unchanged, changed, leader.reloads
+
+    stale_before, first, unchanged, changed, leader_reloads = asyncio.run(scenario())
+
+    assert stale_before == ["standings"]
+    assert first == (1, [])
+    assert unchanged == 1
+    assert changed == 2
+    assert leader_reloads == 0
+
+
+def test_leader_stopping_hands_over_right_away():
+    async def scenario():
+        leader, *followers = await start_workers(3)
+        await leader.cluster.stop()
+        started = time.monotonic()
+        leaders = await wait_for_leader(followers, LEASE_TTL)
+        elapsed = time.monotonic() - started
+        await stop_workers(followers)
+        return leaders, elapsed
+
+    leaders, elapsed = asyncio.run(scenario())
+
+    assert len(leaders) == 1
+    # Released, not expired: the next renewal round takes it
+    assert elapsed < LEASE_TTL
+
+
+def test_leader_crashing_fails_over_once_the_lease_expires():
+    async def scenario():
+        leader, *followers = await start_workers(3)
+        await leader.scoreboard.broadcast([game(2)])
+        await wait_until(
+            lambda: all(worker.scoreboard.current_games for worker in followers)
+        )
+        await leader.crash()
+        started = time.monotonic()
+        leaders = await wait_for_leader(followers, LEASE_TTL * 5)
+        elapsed = time.monotonic() - started
+
+        # The new leader carries on from the state it was following
+        new_leader = leaders[0]
+        await new_leader.scoreboard.broadcast([game(5)])
+        follower = next(worker for worker in followers if worker is not new_leader)
+        await wait_until(
+            lambda: follower.scoreboard.current_games[0]["home_team"]["score"] == 5
+        )
+        score = follower.scoreboard.current_games[0]["home_team"]["score"]
+        await stop_workers(followers)
+        return leaders, elapsed, score
+
+    leaders, elapsed, score = asyncio.run(scenario())
+
+    assert len(leaders) == 1
+    assert LEASE_TTL / 2 < elapsed < LEASE_TTL * 5
+    assert score == 5
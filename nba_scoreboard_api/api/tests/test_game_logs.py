@@ -0,0 +1,119 @@
+# tests/test_game_logs.py
+import asyncio
+
+import pandas as pd
+import pytest
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+
+from app.models.players import PlayerGameLog
+from app.services import game_logs
+
+SEASON = "2024-25"
+
+
+def log_row(person_id, game_id, game_date, pts):
+    """A PlayerGameLogs row, with the upper-case column names NBA.com uses."""
+    row = {
+        column.upper(): 0
+        for column in game_logs.INT_STAT_COLUMNS + game_logs.FLOAT_STAT_COLUMNS
+    }
+    row.update(
+        {
+            "PLAYER_ID": person_id,
+            "GAME_ID": game_id,
+            "GAME_DATE": f"{game_date}T00:00:00",
+            "TEAM_ABBREVIATION": "LAL",
+            "MATCHUP": "LAL vs. BOS",
+            "WL": "W",
+            "PTS": pts,
+            "MIN": 30.0,
+        }
+    )
+    return row
+
+
+COLUMNS = list(log_row(0, "", "2025-01-01", 0))
+
+
+class FakePlayerGameLogs:
+    """Stand-in for nba_api's PlayerGameLogs: serves ``rows``, records each call."""
+
+    rows = []
+    calls = []
+
+    def __init__(self, **kwargs):
+        FakePlayerGameLogs.calls.append(kwargs)
+        self._df = pd.DataFrame(FakePlayerGameLogs.rows, columns=COLUMNS)
+
+    def get_data_frames(self):
+        return [self._df]
+
+
+@pytest.fixture
+def fake_upstream(monkeypatch):
+    FakePlayerGameLogs.rows = []
+    FakePlayerGameLogs.calls = []
+    monkeypatch.setattr(game_logs.playergamelogs, "PlayerGameLogs", FakePlayerGameLogs)
+    return FakePlayerGameLogs
+
+
+async def refresh(db_url):
+    engine = create_async_engine(db_url.replace("sqlite://", "sqlite+aiosqlite://", 1))
+    try:
+        async with AsyncSession(engine) as db:
+            return await game_logs.refresh_game_logs(db, SEASON)
+    finally:
+        await engine.dispose()
+
+
+def test_refresh_of_an_empty_store_loads_the_whole_season(db, db_url, fake_upstream):
+    fake_upstream.rows = [
+        log_row(1, "0022400001", "2025-01-09", 20),
+        log_row(2, "0022400001", "2025-01-09", 15),
+    ]
+
+    count = asyncio.run(refresh(db_url))
+
+    assert count == 2
+    assert len(fake_upstream.calls) == 1
+    assert "date_from_nullable" not in fake_upstream.calls[0]
+    assert fake_upstream.calls[0]["season_nullable"] == SEASON
+    assert game_logs.has_game_logs(db, SEASON)
+
+
+def test_refresh_fetches_from_the_day_before_the_latest_game(db, db_url, fake_upstream):
+    fake_upstream.rows = [
+        log_row(1, "0022400001", "2025-01-09", 20),
+        log_row(1, "0022400002", "2025-01-10", 25),
+    ]
+    asyncio.run(refresh(db_url))
+    version = game_logs.store_version
+
+    # The next night: a stat correction for the 10th and a new game
+    fake_upstream.rows = [
+        log_row(1, "0022400002", "2025-01-10", 27),
+        log_row(1, "0022400003", "2025-01-11", 31),
+    ]
+    count = asyncio.run(refresh(db_url))
+
+    assert count == 2
+    assert fake_upstream.calls[-1]["date_from_nullable"] == "01/09/2025"
+    assert game_logs.store_version > version
+    points = {
+        game_id: pts
+        for game_id, pts in db.execute(select(PlayerGameLog.game_id, PlayerGameLog.pts))
+    }
+    assert points == {"0022400001": 20, "0022400002": 27, "0022400003": 31}
+
+
+def test_refresh_without_new_games_writes_nothing(db_url, fake_upstream):
+    fake_upstream.rows = [log_row(1, "0022400001", "2025-01-09", 20)]
+    asyncio.run(refresh(db_url))
+    version = game_logs.store_version
+
+    fake_upstream.rows = []
+    count = asyncio.run(refresh(db_url))
+
+    assert count == 0
+    assert game_logs.store_version == version
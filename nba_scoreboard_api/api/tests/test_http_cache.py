@@ -0,0 +1,151 @@
+# tests/test_http_cache.py
+import pytest
+from fastapi import FastAPI, HTTPException, Request
+from fastapi.testclient import TestClient
+
+from app.api.v1.endpoints import scoreboard as scoreboard_routes
+from app.schemas.scoreboard import GameBoxScore, TeamBoxScore
+from app.services import scoreboard as scoreboard_service
+from app.services.http_cache import response_cache
+
+
+def box_score(status=2):
+    def team(team_id, tricode):
+        return TeamBoxScore(
+            team_id=team_id,
+            team_name=tricode.title(),
+            team_city="City",
+            team_tricode=tricode,
+            players=[],
+        )
+
+    return GameBoxScore(
+        game_id="0022400001",
+        status=status,
+        period=2,
+        clock="PT05M00.00S",
+        home_team=team("1610612747", "LAL"),
+        away_team=team("1610612738", "BOS"),
+    )
+
+
+class FakeFetch:
+    """Counts calls; raises while ``error`` is set, otherwise returns ``value``."""
+
+    def __init__(self, value=None):
+        self.value = value
+        self.error = None
+        self.calls = 0
+
+    async def __call__(self, *args):
+        self.calls += 1
+        if self.error is not None:
+            raise self.error
+        return self.value
+
+
+@pytest.fixture(autouse=True)
+def empty_caches():
+    response_cache.clear()
+    scoreboard_service.box_score_cache.clear()
+    yield
+    response_cache.clear()
+    scoreboard_service.box_score_cache.clear()
+
+
+@pytest.fixture
+def fetch():
+    return FakeFetch({"value": 1})
+
+
+@pytest.fixture
+def client(fetch):
+    app = FastAPI()
+
+    @app.get("/data")
+    async def data(request: Request):
+        return await response_cache.respond(request, fetch, lambda _: 60)
+
+    return TestClient(app)
+
+
+@pytest.fixture
+def box_score_client(monkeypatch):
+    upstream = FakeFetch(box_score())
+    monkeypatch.setattr(scoreboard_service, "_fetch_box_score", upstream)
+    app = FastAPI()
+    app.include_router(scoreboard_routes.router, prefix="/scoreboard")
+    return TestClient(app), upstream
+
+
+def test_response_carries_validators(client):
+    response = client.get("/data")
+
+    assert response.status_code == 200
+    assert response.json() == {"value": 1}
+    assert response.headers["etag"].startswith('"')
+    assert "last-modified" in response.headers
+    assert response.headers["cache-control"] == "public, max-age=60"
+
+
+def test_matching_if_none_match_gets_304_without_calling_the_service(client, fetch):
+    etag = client.get("/data").headers["etag"]
+
+    response = client.get("/data", headers={"If-None-Match": etag})
+
+    assert response.status_code == 304
+    assert response.content == b""
+    assert response.headers["etag"] == etag
+    assert fetch.calls == 1
+
+
+def test_stale_if_none_match_gets_the_body(client):
+    response = client.get("/data", headers={"If-None-Match": '"something-else"'})
+
+    assert response.status_code == 200
+    assert response.json() == {"value": 1}
+
+
+def test_failed_fetch_is_not_cached(client, fetch):
+    fetch.error = HTTPException(status_code=503, detail="NBA.com is down")
+    assert client.get("/data").status_code == 503
+
+    fetch.error = None
+    response = client.get("/data")
+
+    assert response.status_code == 200
+    assert fetch.calls == 2
+
+
+def test_box_score_placeholder_after_a_failed_fetch_is_not_cached(box_score_client):
+    client, upstream = box_score_client
+    upstream.error = RuntimeError("NBA.com is down")
+
+    failed = client.get("/scoreboard/boxscore/0022400001")
+
+    assert failed.status_code == 200
+    assert failed.json()["home_team"]["team_id"] == ""
+    assert failed.headers["cache-control"] == "no-store"
+    assert "etag" not in failed.headers
+
+    upstream.error = None
+    recovered = client.get("/scoreboard/boxscore/0022400001")
+
+    assert recovered.json()["home_team"]["team_id"] == "1610612747"
+    assert "etag" in recovered.headers
+    assert upstream.calls == 2
+
+
+def test_final_box_score_is_immutable_and_revalidates(box_score_client):
+    client, upstream = box_score_client
+    upstream.value = box_score(status=3)
+
+    first = client.get("/scoreboard/boxscore/0022400001")
+    second = client.get(
+        "/scoreboard/boxscore/0022400001",
+        headers={"If-None-Match": first.headers["etag"]},
+    )
+
+    assert "immutable" in first.headers["cache-control"]
+    assert second.status_code == 304
+    assert upstream.calls == 1
@@ -0,0 +1,75 @@
+# tests/test_players.py
+import pandas as pd
+from sqlalchemy import select
+
+from app.models.players import Player
+from app.services import players
+
+
+def roster(*players_):
+    """A CommonAllPlayers DataFrame from (person_id, name, team, tricode) tuples."""
+    return pd.DataFrame(
+        players_,
+        columns=["PERSON_ID", "DISPLAY_FIRST_LAST", "TEAM_NAME", "TEAM_ABBREVIATION"],
+    )
+
+
+def stored(db):
+    return {
+        row.person_id: (row.display_name, row.team_name, row.team_abbreviation)
+        for row in db.scalars(select(Player))
+    }
+
+
+def test_sync_players_into_empty_table_inserts_everyone(db):
+    counts = players.sync_players(
+        db,
+        roster(
+            (1, "Player One", "Lakers", "LAL"),
+            (2, "Player Two", "Celtics", "BOS"),
+        ),
+    )
+
+    assert counts == {"inserted": 2, "updated": 0, "removed": 0, "unchanged": 0}
+    assert stored(db) == {
+        1: ("Player One", "Lakers", "LAL"),
+        2: ("Player Two", "Celtics", "BOS"),
+    }
+
+
+def test_sync_players_counts_the_diff(db):
+    players.sync_players(
+        db,
+        roster(
+            (1, "Player One", "Lakers", "LAL"),
+            (2, "Player Two", "Celtics", "BOS"),
+            (3, "Player Three", "Knicks", "NYK"),
+        ),
+    )
+
+    counts = players.sync_players(
+        db,
+        roster(
+            (1, "Player One", "Lakers", "LAL"),  # unchanged
+            (2, "Player Two", "Warriors", "GSW"),  # traded
+            (4, "Player Four", "Heat", "MIA"),  # new; 3 is gone
+        ),
+    )
+
+    assert counts == {"inserted": 1, "updated": 1, "removed": 1, "unchanged": 1}
+    assert stored(db) == {
+        1: ("Player One", "Lakers", "LAL"),
+        2: ("Player Two", "Warriors", "GSW"),
+        4: ("Player Four", "Heat", "MIA"),
+    }
+
+
+def test_sync_players_bumps_the_roster_version_only_on_changes(db):
+    df = roster((1, "Player One", "Lakers", "LAL"))
+    players.sync_players(db, df)
+    version = players.roster_version
+
+    counts = players.sync_players(db, df)
+
+    assert counts == {"inserted": 0, "updated": 0, "removed": 0, "unchanged": 1}
+    assert players.roster_version == version
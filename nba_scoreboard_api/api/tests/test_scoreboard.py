@@ -0,0 +1,150 @@
+# tests/test_scoreboard.py
+import asyncio
+import json
+from collections import deque
+
+from app.services.scoreboard import ScoreboardManager
+
+
+class FakeWebSocket:
+    """Collects the frames a client receives."""
+
+    def __init__(self):
+        self.frames = []
+
+    async def accept(self):
+        pass
+
+    async def send_text(self, frame):
+        self.frames.append(json.loads(frame))
+
+    async def close(self, code=1000):
+        pass
+
+
+def game(home_score, away_score, game_id="0022400001", clock="PT10M00.00S"):
+    """A live game in the wire representation (scoreboard_games output)."""
+
+    def team(team_id, tricode, score):
+        return {
+            "team_id": team_id,
+            "team_name": tricode.title(),
+            "team_city": "City",
+            "team_tricode": tricode,
+            "score": score,
+        }
+
+    return {
+        "game_id": game_id,
+        "game_status": 2,
+        "away_team": team("1610612738", "BOS", away_score),
+        "home_team": team("1610612747", "LAL", home_score),
+        "period": 1,
+        "clock": clock,
+        "game_time": "2025-02-28T00:30:00+00:00",
+    }
+
+
+async def flush():
+    """Let the clients' sender tasks deliver what is queued."""
+    for _ in range(10):
+        await asyncio.sleep(0)
+
+
+async def connected_client(manager):
+    websocket = FakeWebSocket()
+    await manager.connect(websocket, protocol_version=2)
+    await manager.send_current_games(websocket)
+    await flush()
+    return websocket
+
+
+async def play(manager, points):
+    """Broadcast a scoring update per entry of ``points``; return the last score."""
+    home = 0
+    for home in points:
+        assert await manager.broadcast([game(home, 0)])
+    await flush()
+    return home
+
+
+def test_resync_after_a_gap_replays_the_missed_patches():
+    async def scenario():
+        manager = ScoreboardManager()
+        await manager.broadcast([game(0, 0)])
+        websocket = await connected_client(manager)
+        await play(manager, [2, 4, 7])
+
+        # The client saw seq 2 but lost 3 and 4
+        snapshot_seq = websocket.frames[0]["seq"]
+        websocket.frames.clear()
+        await manager.handle_client_message(
+            websocket, json.dumps({"type": "resync", "seq": snapshot_seq + 1})
+        )
+        await flush()
+        return snapshot_seq, websocket.frames
+
+    snapshot_seq, frames = asyncio.run(scenario())
+
+    assert [frame["type"] for frame in frames] == ["patch", "patch"]
+    assert [frame["seq"] for frame in frames] == [snapshot_seq + 2, snapshot_seq + 3]
+    assert frames[-1]["games"][0]["home_team"]["score"] == 7
+
+
+def test_resync_past_the_history_sends_a_snapshot():
+    async def scenario():
+        manager = ScoreboardManager()
+        manager.patch_history = deque(maxlen=2)
+        await manager.broadcast([game(0, 0)])
+        websocket = await connected_client(manager)
+        snapshot_seq = websocket.frames[0]["seq"]
+        await play(manager, [2, 4, 7, 9])
+
+        websocket.frames.clear()
+        await manager.handle_client_message(
+            websocket, json.dumps({"type": "resync", "seq": snapshot_seq})
+        )
+        await flush()
+        return manager.sequence, websocket.frames
+
+    sequence, frames = asyncio.run(scenario())
+
+    assert len(frames) == 1
+    assert frames[0]["type"] == "snapshot"
+    assert frames[0]["seq"] == sequence
+    assert frames[0]["games"][0]["home_team"]["score"] == 9
+
+
+def test_resync_when_up_to_date_sends_nothing():
+    async def scenario():
+        manager = ScoreboardManager()
+        await manager.broadcast([game(0, 0)])
+        websocket = await connected_client(manager)
+        await play(manager, [2])
+
+        websocket.frames.clear()
+        await manager.handle_client_message(
+            websocket, json.dumps({"type": "resync", "seq": manager.sequence})
+        )
+        await flush()
+        return websocket.frames
+
+    assert asyncio.run(scenario()) == []
+
+
+def test_patches_carry_only_the_changed_fields():
+    async def scenario():
+        manager = ScoreboardManager()
+        await manager.broadcast([game(0, 0)])
+        websocket = await connected_client(manager)
+        await play(manager, [3])
+        return websocket.frames
+
+    snapshot, patch = asyncio.run(scenario())
+
+    assert snapshot["type"] == "snapshot"
+    assert patch == {
+        "type": "patch",
+        "seq": snapshot["seq"] + 1,
+        "games": [{"game_id": "0022400001", "home_team": {"score": 3}}],
+    }
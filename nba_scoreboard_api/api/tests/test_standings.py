@@ -0,0 +1,157 @@
+# tests/test_standings.py
+import pandas as pd
+from sqlalchemy import select
+
+from app.models.standings import TeamStanding
+from app.services import standings
+
+
+def team(i, wins=41, losses=41, **changes):
+    """TeamStanding column dicts, as standings_rows returns them."""
+    row = {
+        "team_id": 1610612737 + i,
+        "team_city": f"City {i}",
+        "team_name": f"Team {i}",
+        "conference": "East" if i < 15 else "West",
+        "division": "Atlantic",
+        "wins": wins,
+        "losses": losses,
+        "win_pct": round(wins / max(1, wins + losses), 3),
+        "games_back": 0.0,
+        "conference_rank": i % 15 + 1,
+        "division_rank": i % 5 + 1,
+        "home_record": "20-21",
+        "road_record": "21-20",
+        "last_ten": "5-5",
+        "streak": "W 1",
+        "points_pg": 110.0,
+        "opp_points_pg": 109.0,
+        "division_record": "8-8",
+        "conference_record": "26-26",
+        "vs_east": "25-27",
+        "vs_west": "16-14",
+    }
+    row.update(changes)
+    return row
+
+
+def test_sync_standings_into_empty_table_writes_every_team(db):
+    result = standings.sync_standings(db, [team(0), team(1), team(2)])
+
+    assert result.updated_teams == 3
+    assert result.removed_teams == 0
+    assert result.record_changed_team_ids == [
+        team(0)["team_id"],
+        team(1)["team_id"],
+        team(2)["team_id"],
+    ]
+    assert result.changed
+    assert len(db.scalars(select(TeamStanding)).all()) == 3
+
+
+def test_sync_standings_counts_the_diff(db):
+    standings.sync_standings(db, [team(0), team(1), team(2)])
+
+    result = standings.sync_standings(
+        db,
+        [
+            team(0),  # unchanged
+            team(1, wins=42, losses=41),  # played a game
+            team(
+                2, streak="L 1", last_ten="4-6"
+            ),  # changed without a new record (correction)
+        ],
+    )
+
+    assert result.updated_teams == 2
+    assert result.removed_teams == 0
+    assert result.record_changed_team_ids == [team(1)["team_id"]]
+    assert result.changed
+    assert (
+        db.scalar(
+            select(TeamStanding.wins).where(TeamStanding.team_id == team(1)["team_id"])
+        )
+        == 42
+    )
+
+
+def test_sync_standings_removes_missing_teams(db):
+    standings.sync_standings(db, [team(0), team(1)])
+
+    result = standings.sync_standings(db, [team(0)])
+
+    assert result.updated_teams == 0
+    assert result.removed_teams == 1
+    assert [t.team_id for t in db.scalars(select(TeamStanding))] == [team(0)["team_id"]]
+
+
+def test_sync_standings_without_changes_keeps_the_content_hash(db):
+    rows = [team(0), team(1)]
+    first = standings.sync_standings(db, rows)
+
+    second = standings.sync_standings(db, rows)
+
+    assert second.updated_teams == 0
+    assert second.removed_teams == 0
+    assert not second.changed
+    assert second.content_hash == first.content_hash
+
+
+def league_standings(streak):
+    """A LeagueStandings DataFrame with the dtypes NBA.com returns."""
+    return pd.DataFrame(
+        {
+            "TeamID": [1610612737, 1610612738],
+            "TeamCity": ["Atlanta", "Boston"],
+            "TeamName": ["Hawks", "Celtics"],
+            "Conference": ["East", "East"],
+            "Division": ["Southeast", "Atlantic"],
+            "WINS": [30, 45],
+            "LOSSES": [28, 13],
+            "WinPCT": [0.517, 0.776],
+            "ConferenceGamesBack": [15.0, 0.0],
+            "PlayoffRank": [8, 2],
+            "DivisionRank": [2, 1],
+            "HOME": ["16-13", "22-7"],
+            "ROAD": ["14-15", "23-6"],
+            "L10": ["6-4", "8-2"],
+            "CurrentStreak": streak,
+            "PointsPG": [116.2, 117.0],
+            "OppPointsPG": [117.5, 107.4],
+            "DivisionRecord": ["5-4", "7-2"],
+            "ConferenceRecord": ["20-17", "28-8"],
+            "vsEast": ["20-17", "28-8"],
+            "vsWest": ["10-11", "17-5"],
+        }
+    )
+
+
+def test_unchanged_nba_com_standings_write_nothing(db):
+    first = standings.sync_standings(
+        db, standings.standings_rows(league_standings([3, -2]))
+    )
+
+    second = standings.sync_standings(
+        db, standings.standings_rows(league_standings([3, -2]))
+    )
+
+    assert first.updated_teams == 2
+    assert second.updated_teams == 0
+    assert not second.changed
+    assert (
+        second.content_hash
+        == first.content_hash
+        == standings.standings_store.content_hash
+    )
+    assert db.scalars(select(TeamStanding.streak)).all() == ["3", "-2"]
+
+
+def test_nba_com_streak_change_is_detected(db):
+    standings.sync_standings(db, standings.standings_rows(league_standings([3, -2])))
+
+    result = standings.sync_standings(
+        db, standings.standings_rows(league_standings([4, -2]))
+    )
+
+    assert result.updated_teams == 1
+    assert result.changed
@@ -0,0 +1,232 @@
+"""
+Benchmark: REST throughput and WebSocket broadcast latency, sync vs. async DB sessions.
+
+Runs ``--workers`` concurrent /players/{id}/games requests (served from a
+temporary SQLite player_game_logs store with a synthetic ~26k-row season)
+for ``--duration`` seconds while a broadcaster fans a scoreboard frame out
+to ``--clients`` WebSocket clients every ``--broadcast-interval``:
+
+  sync   - the previous handlers: a synchronous Session inside ``async def``,
+           so every query blocks the event loop
+  async  - get_player_recent_games on an aiosqlite AsyncSession from the
+           pooled async engine
+
+Reports requests/s, request latency, broadcast latency (tick start until
+every client has the frame) and how late broadcast ticks fire.
+
+Usage (from nba_scoreboard_api/):
+    python test/bench_async_db.py --workers 32 --clients 1000 --duration 5
+"""
+
+import argparse
+import asyncio
+import os
+import random
+import statistics
+import sys
+import tempfile
+import time
+
+from sqlalchemy import create_engine, insert
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+
+sys.path.append(os.path.join(os.path.dirname(os.path.dirname(__file__)), "api"))
+sys.path.append(os.path.dirname(__file__))
+os.environ.setdefault("TESTING", "True")
+
+from bench_broadcast import make_games
+from bench_game_logs import make_season
+
+from app.core.config import get_settings
+from app.core.database import Base
+from app.models.players import Player
+from app.schemas.players import PlayerBase, PlayerStats
+from app.services import game_logs
+from app.services import players as players_service
+from app.services.broadcast import ClientConnection, encode_frame
+
+
+class FakeWebSocket:
+    def __init__(self, on_receive):
+        self.on_receive = on_receive
+
+    async def send_text(self, data):
+        self.on_receive()
+
+    async def close(self, code=1000):
+        pass
+
+
+async def legacy_recent_games(db, player_id, last_n_games, season):
+    """The previous store path: synchronous queries inside an async handler."""
+    player = db.query(Player).filter(Player.person_id == player_id).first()
+    player_info = PlayerBase.model_validate(player)
+    game_logs.has_game_logs(db, season)
+    games = game_logs.get_recent_game_logs(db, player_id, last_n_games, season)
+    return PlayerStats(player_info=player_info, games=games)
+
+
+def percentile(values, share):
+    values = sorted(values)
+    return values[min(len(values) - 1, int(len(values) * share))]
+
+
+async def broadcaster(n_clients, interval, stop, latencies, lateness):
+    received = 0
+    done = asyncio.Event()
+
+    def on_receive():
+        nonlocal received
+        received += 1
+        if received == n_clients:
+            done.set()
+
+    settings = get_settings()
+    clients = [
+        ClientConnection(
+            FakeWebSocket(on_receive),
+            settings.WS_SEND_QUEUE_SIZE,
+            settings.WS_SEND_TIMEOUT,
+        )
+        for _ in range(n_clients)
+    ]
+    for client in clients:
+        client.start()
+
+    loop = asyncio.get_running_loop()
+    tick = 0
+    next_tick = loop.time()
+    while not stop.is_set():
+        lateness.append((loop.time() - next_tick) * 1000)
+        start = time.perf_counter()
+        received = 0
+        done.clear()
+        frame = encode_frame({"type": "scoreboard", "games": make_games(tick)})
+        for client in clients:
+            client.enqueue(frame)
+        await done.wait()
+        latencies.append((time.perf_counter() - start) * 1000)
+        tick += 1
+        next_tick += interval
+        await asyncio.sleep(max(0.0, next_tick - loop.time()))
+
+    for client in clients:
+        await client.close()
+
+
+async def run(mode, args, make_session, player_ids, season):
+    stop = asyncio.Event()
+    broadcast_latencies, lateness, request_latencies = [], [], []
+    rng = random.Random(args.seed)
+
+    async def worker():
+        while not stop.is_set():
+            player_id = rng.choice(player_ids)
+            start = time.perf_counter()
+            if mode == "sync":
+                db = make_session()
+                try:
+                    await legacy_recent_games(db, player_id, args.last_n, season)
+                finally:
+                    db.close()
+            else:
+                async with make_session() as db:
+                    await players_service.get_player_recent_games(
+                        db, player_id, args.last_n
+                    )
+            request_latencies.append((time.perf_counter() - start) * 1000)
+            await asyncio.sleep(0)
+
+    tasks = [asyncio.create_task(worker()) for _ in range(args.workers)]
+    tasks.append(
+        asyncio.create_task(
+            broadcaster(
+                args.clients,
+                args.broadcast_interval,
+                stop,
+                broadcast_latencies,
+                lateness,
+            )
+        )
+    )
+    await asyncio.sleep(args.duration)
+    stop.set()
+    await asyncio.gather(*tasks)
+
+    print(
+        f"{mode:<6} {len(request_latencies) / args.duration:8.0f} req/s  "
+        f"request p50={statistics.median(request_latencies):7.2f}ms "
+        f"p99={percentile(request_latencies, 0.99):7.2f}ms  "
+        f"broadcast p50={statistics.median(broadcast_latencies):6.2f}ms "
+        f"p99={percentile(broadcast_latencies, 0.99):6.2f}ms  "
+        f"tick lateness p99={percentile(lateness, 0.99):6.2f}ms"
+    )
+
+
+async def main_async(args):
+    settings = get_settings()
+    season = settings.NBA_SEASON
+    rows = game_logs.game_log_rows(
+        make_season(args.players, args.games, args.seed),
+        season,
+        game_logs.REGULAR_SEASON,
+    )
+    player_ids = sorted({row["person_id"] for row in rows})
+    print(
+        f"{len(rows):,} player-games, {args.workers} request workers, "
+        f"{args.clients} WebSocket clients every {args.broadcast_interval * 1000:.0f}ms"
+    )
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "bench.db")
+        engine = create_engine(f"sqlite:///{path}")
+        Base.metadata.create_all(engine)
+        make_sync_session = sessionmaker(bind=engine)
+        db = make_sync_session()
+        db.execute(
+            insert(Player),
+            [
+                {
+                    "person_id": pid,
+                    "display_name": f"Player {pid}",
+                    "team_name": "Lakers",
+                    "team_abbreviation": "LAL",
+                }
+                for pid in player_ids
+            ],
+        )
+        db.commit()
+        game_logs.store_game_logs(db, rows)
+        db.close()
+
+        async_engine = create_async_engine(
+            f"sqlite+aiosqlite:///{path}",
+            poolclass=AsyncAdaptedQueuePool,
+            pool_size=settings.ASYNC_DB_POOL_SIZE,
+            max_overflow=settings.ASYNC_DB_MAX_OVERFLOW,
+            pool_timeout=settings.ASYNC_DB_POOL_TIMEOUT,
+        )
+        make_async_session = async_sessionmaker(
+            bind=async_engine, expire_on_commit=False
+        )
+
+        await run("sync", args, make_sync_session, player_ids, season)
+        await run("async", args, make_async_session, player_ids, season)
+
+        await async_engine.dispose()
+        engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--players", type=int, default=500)
+    parser.add_argument("--games", type=int, default=52)
+    parser.add_argument("--workers", type=int, default=32)
+    parser.add_argument("--clients", type=int, default=1000)
+    parser.add_argument("--broadcast-interval", type=float, default=0.1)
+    parser.add_argument("--duration", type=float, default=5.0)
+    parser.add_argument("--last-n", type=int, default=20)
+    parser.add_argument("--seed", type=int, default=2025)
+    asyncio.run(main_async(parser.parse_args()))
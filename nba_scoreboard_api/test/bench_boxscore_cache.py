@@ -0,0 +1,152 @@
+"""
+Benchmark: box score upstream calls and latency with and without the cache.
+
+``--viewers`` clients each request the box score of one of ``--games`` games
+every ``--interval`` seconds for ``--duration`` seconds (a popular game page
+refreshing). Reports upstream BoxScore calls and request latency for:
+
+  uncached  - _fetch_box_score on every request (the previous behaviour)
+  cached    - get_box_score_fixed via box_score_cache
+
+NBA.com is replaced by a fake BoxScore that blocks for ``--upstream-latency``.
+
+Usage (from nba_scoreboard_api/):
+    python test/bench_boxscore_cache.py --viewers 200 --games 4 --duration 10
+"""
+
+import argparse
+import asyncio
+import os
+import statistics
+import sys
+import time
+
+sys.path.append(os.path.join(os.path.dirname(os.path.dirname(__file__)), "api"))
+os.environ.setdefault("TESTING", "True")
+
+from app.services import scoreboard as scoreboard_service
+
+UPSTREAM_LATENCY = 0.15
+upstream_calls = 0
+
+
+class _FakeDataSet:
+    def __init__(self, data):
+        self._data = data
+
+    def get_dict(self):
+        return self._data
+
+
+def _players(team_id):
+    return [
+        {
+            "personId": team_id * 100 + i,
+            "name": f"Player {i}",
+            "position": "G",
+            "starter": i < 5,
+            "statistics": {
+                "points": i * 2,
+                "reboundsTotal": i,
+                "assists": i // 2,
+                "minutes": "PT24M00.00S",
+            },
+        }
+        for i in range(13)
+    ]
+
+
+class FakeBoxScore:
+    """Stand-in for nba_api's BoxScore that counts calls and blocks like HTTP."""
+
+    def __init__(self, game_id, timeout=30, **kwargs):
+        global upstream_calls
+        upstream_calls += 1
+        time.sleep(UPSTREAM_LATENCY)
+        self._game = {
+            "gameId": game_id,
+            "gameStatus": 2,
+            "period": 3,
+            "gameClock": "PT04M12.00S",
+        }
+        self.home_team_stats = _FakeDataSet(
+            {
+                "teamId": 1610612747,
+                "teamName": "Lakers",
+                "teamCity": "Los Angeles",
+                "teamTricode": "LAL",
+            }
+        )
+        self.away_team_stats = _FakeDataSet(
+            {
+                "teamId": 1610612744,
+                "teamName": "Warriors",
+                "teamCity": "Golden State",
+                "teamTricode": "GSW",
+            }
+        )
+        self.home_team_player_stats = _FakeDataSet(_players(1))
+        self.away_team_player_stats = _FakeDataSet(_players(2))
+
+    def get_dict(self):
+        return self._game
+
+
+async def run(fetch, args):
+    global upstream_calls
+    upstream_calls = 0
+    latencies = []
+
+    async def viewer(index):
+        game_id = f"00224007{index % args.games:02d}"
+        # Stagger viewers across the refresh interval
+        await asyncio.sleep(args.interval * index / args.viewers)
+        deadline = time.perf_counter() + args.duration
+        while time.perf_counter() < deadline:
+            start = time.perf_counter()
+            await fetch(game_id)
+            latencies.append((time.perf_counter() - start) * 1000)
+            await asyncio.sleep(args.interval)
+
+    await asyncio.gather(*(viewer(i) for i in range(args.viewers)))
+    latencies.sort()
+    return {
+        "requests": len(latencies),
+        "calls": upstream_calls,
+        "p50": statistics.median(latencies),
+        "p99": latencies[min(len(latencies) - 1, int(len(latencies) * 0.99))],
+    }
+
+
+def report(name, result):
+    print(
+        f"{name:<9} requests={result['requests']:<6} "
+        f"upstream calls={result['calls']:<6} "
+        f"p50={result['p50']:8.2f}ms  p99={result['p99']:8.2f}ms"
+    )
+
+
+async def main_async(args):
+    global UPSTREAM_LATENCY
+    UPSTREAM_LATENCY = args.upstream_latency
+    scoreboard_service.boxscore.BoxScore = FakeBoxScore
+    print(
+        f"{args.viewers} viewers, {args.games} live games, "
+        f"refresh every {args.interval}s, "
+        f"simulated upstream latency {args.upstream_latency * 1000:.0f}ms"
+    )
+
+    report("uncached", await run(scoreboard_service._fetch_box_score, args))
+    report("cached", await run(scoreboard_service.get_box_score_fixed, args))
+    print(scoreboard_service.box_score_cache.stats())
+    scoreboard_service.upstream_client.shutdown()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--viewers", type=int, default=200)
+    parser.add_argument("--games", type=int, default=4)
+    parser.add_argument("--interval", type=float, default=1.0)
+    parser.add_argument("--duration", type=float, default=10.0)
+    parser.add_argument("--upstream-latency", type=float, default=0.15)
+    asyncio.run(main_async(parser.parse_args()))
@@ -0,0 +1,149 @@
+"""
+Benchmark: ScoreboardManager.broadcast latency at 1k/10k simulated clients.
+
+Compares the old path (json.loads(json.dumps(...)) then a sequential
+``send_json`` per socket) with the serialize-once fan-out through per-client
+send queues. A small share of clients is slow, to show that they no longer
+delay everyone else.
+
+Latency is the time from the start of the broadcast until every fast client
+has received the frame.
+
+Usage (from nba_scoreboard_api/):
+    python test/bench_broadcast.py --clients 1000 10000 --slow-share 0.01
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import sys
+import time
+
+sys.path.append(os.path.join(os.path.dirname(os.path.dirname(__file__)), "api"))
+os.environ.setdefault("TESTING", "True")
+
+from app.services.scoreboard import ScoreboardManager
+
+
+def make_games(tick: int, n_games: int = 12):
+    return [
+        {
+            "game_id": f"00224000{i:02d}",
+            "game_status": 2,
+            "period": 2,
+            "clock": f"PT0{i % 10}M{(59 - tick) % 60:02d}.00S",
+            "game_time": "2025-02-17T00:30:00+00:00",
+            "home_team": {
+                "team_id": str(1610612700 + i),
+                "team_name": "Home",
+                "team_city": "City",
+                "team_tricode": "HOM",
+                "score": 50 + tick,
+            },
+            "away_team": {
+                "team_id": str(1610612750 + i),
+                "team_name": "Away",
+                "team_city": "City",
+                "team_tricode": "AWY",
+                "score": 48 + tick,
+            },
+        }
+        for i in range(n_games)
+    ]
+
+
+class FakeWebSocket:
+    """Records when frames arrive; slow sockets take ``delay`` per send."""
+
+    def __init__(self, delay: float, on_receive):
+        self.delay = delay
+        self.on_receive = on_receive
+
+    async def accept(self):
+        pass
+
+    async def _deliver(self):
+        await asyncio.sleep(self.delay)
+        if not self.delay:
+            self.on_receive()
+
+    async def send_text(self, data):
+        await self._deliver()
+
+    async def send_json(self, data):
+        json.dumps(data)
+        await self._deliver()
+
+    async def close(self, code=1000):
+        pass
+
+
+async def legacy_broadcast(manager, games):
+    """The previous ScoreboardManager.broadcast delivery loop."""
+    json_data = json.loads(json.dumps(games))
+    for websocket in list(manager.active_connections):
+        await websocket.send_json(json_data)
+
+
+async def run(n_clients: int, slow_share: float, slow_delay: float, legacy: bool):
+    manager = ScoreboardManager()
+    n_slow = int(n_clients * slow_share)
+    n_fast = n_clients - n_slow
+    received = 0
+    done = asyncio.Event()
+
+    def on_receive():
+        nonlocal received
+        received += 1
+        if received == n_fast:
+            done.set()
+
+    sockets = [
+        FakeWebSocket(slow_delay if i < n_slow else 0.0, on_receive)
+        for i in range(n_clients)
+    ]
+    # Prime the manager so new connections get a snapshot and the measured
+    # broadcast is a normal update
+    await manager.broadcast(make_games(0))
+    for ws in sockets:
+        await manager.connect(ws)
+        await manager.send_current_games(ws)
+    await asyncio.sleep(slow_delay * 2)
+    received = 0
+    done.clear()
+
+    games = make_games(1)
+    start = time.perf_counter()
+    if legacy:
+        await legacy_broadcast(manager, games)
+    else:
+        await manager.broadcast(games)
+    await done.wait()
+    elapsed = (time.perf_counter() - start) * 1000
+
+    for ws in sockets:
+        await manager.disconnect(ws)
+    return elapsed
+
+
+async def main_async(args):
+    print(
+        f"slow clients: {args.slow_share:.1%} with {args.slow_delay * 1000:.0f}ms sends"
+    )
+    for n_clients in args.clients:
+        for legacy in (True, False):
+            elapsed = await run(n_clients, args.slow_share, args.slow_delay, legacy)
+            label = "legacy" if legacy else "fan-out"
+            print(
+                f"{n_clients:>6} clients  {label:<8} "
+                f"{elapsed:10.1f}ms to all fast clients"
+            )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--clients", type=int, nargs="+", default=[1000, 10000])
+    parser.add_argument("--slow-share", type=float, default=0.01)
+    parser.add_argument("--slow-delay", type=float, default=0.05)
+    asyncio.run(main_async(parser.parse_args()))
@@ -0,0 +1,162 @@
+"""
+Load test: a reconnect storm of simultaneous scoreboard WebSocket connects.
+
+Opens ``--clients`` connections at once against ScoreboardManager and reports
+upstream scoreboard calls, total time and time-to-first-frame percentiles for:
+
+  cold    - no snapshot yet; all connections share one upstream fetch
+  warm    - served from the poller's in-memory snapshot
+  legacy  - the old behaviour, one upstream fetch per connection
+            (run with fewer clients, it is bounded by upstream latency)
+
+NBA.com is replaced by a fake ScoreBoard that blocks for ``--upstream-latency``.
+
+Usage (from nba_scoreboard_api/):
+    python test/bench_connect_storm.py --clients 5000 --legacy-clients 50
+"""
+
+import argparse
+import asyncio
+import os
+import statistics
+import sys
+import time
+
+sys.path.append(os.path.join(os.path.dirname(os.path.dirname(__file__)), "api"))
+os.environ.setdefault("TESTING", "True")
+
+from app.services import scoreboard as scoreboard_service
+from app.services.broadcast import encode_frame
+from app.services.scoreboard import ScoreboardManager, get_live_scoreboard
+
+UPSTREAM_LATENCY = 0.1
+upstream_calls = 0
+
+
+class _FakeDataSet:
+    def __init__(self, data):
+        self._data = data
+
+    def get_dict(self):
+        return self._data
+
+
+class FakeScoreBoard:
+    """Stand-in for nba_api's ScoreBoard that counts calls and blocks like HTTP."""
+
+    def __init__(self, timeout=30, **kwargs):
+        global upstream_calls
+        upstream_calls += 1
+        time.sleep(UPSTREAM_LATENCY)
+        self.games = _FakeDataSet(
+            [
+                {
+                    "gameId": f"00224000{i:02d}",
+                    "gameStatus": 2,
+                    "period": 2,
+                    "gameClock": "PT05M00.00S",
+                    "gameTimeUTC": "2025-02-17T00:30:00Z",
+                    "homeTeam": {
+                        "teamId": 1610612700 + i,
+                        "teamName": "Home",
+                        "teamCity": "City",
+                        "teamTricode": "HOM",
+                        "score": 50,
+                    },
+                    "awayTeam": {
+                        "teamId": 1610612750 + i,
+                        "teamName": "Away",
+                        "teamCity": "City",
+                        "teamTricode": "AWY",
+                        "score": 48,
+                    },
+                }
+                for i in range(12)
+            ]
+        )
+
+
+class FakeWebSocket:
+    def __init__(self):
+        self.connected_at = time.perf_counter()
+        self.first_frame_at = None
+
+    async def accept(self):
+        pass
+
+    async def send_text(self, data):
+        if self.first_frame_at is None:
+            self.first_frame_at = time.perf_counter()
+
+    async def close(self, code=1000):
+        pass
+
+
+async def legacy_send_current_games(websocket):
+    """The previous send_current_games: an upstream fetch per connection."""
+    response = await get_live_scoreboard()
+    games = scoreboard_service.standardize_game_clocks(response.model_dump()["games"])
+    await websocket.send_text(encode_frame(games))
+
+
+async def storm(manager, n_clients, legacy=False):
+    global upstream_calls
+    upstream_calls = 0
+    sockets = [FakeWebSocket() for _ in range(n_clients)]
+
+    async def one(ws):
+        await manager.connect(ws)
+        if legacy:
+            await legacy_send_current_games(ws)
+        else:
+            await manager.send_current_games(ws)
+
+    start = time.perf_counter()
+    await asyncio.gather(*(one(ws) for ws in sockets))
+    while any(ws.first_frame_at is None for ws in sockets):
+        await asyncio.sleep(0.001)
+    total = time.perf_counter() - start
+
+    waits = sorted((ws.first_frame_at - start) * 1000 for ws in sockets)
+    for ws in sockets:
+        await manager.disconnect(ws)
+    return {
+        "calls": upstream_calls,
+        "total": total,
+        "p50": statistics.median(waits),
+        "p99": waits[min(len(waits) - 1, int(len(waits) * 0.99))],
+    }
+
+
+def report(name, n_clients, result):
+    print(
+        f"{name:<7} {n_clients:>6} clients  upstream calls={result['calls']:<5} "
+        f"total={result['total'] * 1000:9.1f}ms  "
+        f"first frame p50={result['p50']:8.1f}ms "
+        f"p99={result['p99']:8.1f}ms"
+    )
+
+
+async def main_async(args):
+    global UPSTREAM_LATENCY
+    UPSTREAM_LATENCY = args.upstream_latency
+    scoreboard_service.scoreboard.ScoreBoard = FakeScoreBoard
+    print(f"simulated upstream latency {args.upstream_latency * 1000:.0f}ms")
+
+    manager = ScoreboardManager()
+    report("cold", args.clients, await storm(manager, args.clients))
+    report("warm", args.clients, await storm(manager, args.clients))
+    report(
+        "legacy",
+        args.legacy_clients,
+        await storm(ScoreboardManager(), args.legacy_clients, legacy=True),
+    )
+    scoreboard_service.upstream_client.shutdown()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--clients", type=int, default=5000)
+    parser.add_argument("--legacy-clients", type=int, default=50)
+    parser.add_argument("--upstream-latency", type=float, default=0.1)
+    asyncio.run(main_async(parser.parse_args()))
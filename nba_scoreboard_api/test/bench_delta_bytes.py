@@ -0,0 +1,137 @@
+"""
+Benchmark: scoreboard WebSocket egress, full frames vs. delta protocol.
+
+Replays a synthetic busy night through ScoreboardManager.broadcast with one
+version 1 client (full game list on every update) and one version 2 client
+(snapshot + per-game patches) connected, and counts the bytes each receives.
+
+Each poll, every live game's clock runs with probability ``--clock-share`` and
+scores with probability ``--score-share``.
+
+Usage (from nba_scoreboard_api/):
+    python test/bench_delta_bytes.py --games 15 --polls 3000
+"""
+
+import argparse
+import asyncio
+import os
+import random
+import sys
+
+sys.path.append(os.path.join(os.path.dirname(os.path.dirname(__file__)), "api"))
+os.environ.setdefault("TESTING", "True")
+
+from app.services.scoreboard import ScoreboardManager
+
+
+class CountingWebSocket:
+    def __init__(self):
+        self.frames = 0
+        self.bytes = 0
+
+    async def accept(self):
+        pass
+
+    async def send_text(self, data):
+        self.frames += 1
+        self.bytes += len(data.encode())
+
+    async def close(self, code=1000):
+        pass
+
+
+def initial_games(n_games: int):
+    return [
+        {
+            "game_id": f"00224008{i:02d}",
+            "game_status": 2,
+            "period": 1,
+            "clock": "PT12M00.00S",
+            "game_time": "2025-02-17T00:30:00+00:00",
+            "home_team": {
+                "team_id": str(1610612737 + i),
+                "team_name": f"Home{i}",
+                "team_city": "Home City",
+                "team_tricode": "HOM",
+                "score": 0,
+            },
+            "away_team": {
+                "team_id": str(1610612737 + 15 + i),
+                "team_name": f"Away{i}",
+                "team_city": "Away City",
+                "team_tricode": "AWY",
+                "score": 0,
+            },
+            "_seconds": 720,
+        }
+        for i in range(n_games)
+    ]
+
+
+def advance(games, rng, clock_share, score_share):
+    for game in games:
+        if game["game_status"] != 2:
+            continue
+        if rng.random() < clock_share:
+            game["_seconds"] -= 1
+            if game["_seconds"] <= 0:
+                if game["period"] >= 4:
+                    game["game_status"] = 3
+                    game["clock"] = None
+                    continue
+                game["period"] += 1
+                game["_seconds"] = 720
+            minutes, seconds = divmod(game["_seconds"], 60)
+            game["clock"] = f"PT{minutes:02d}M{seconds:02d}.00S"
+        if rng.random() < score_share:
+            team = rng.choice(("home_team", "away_team"))
+            game[team]["score"] += rng.choice((1, 2, 2, 3))
+
+
+def wire(games):
+    return [
+        {
+            k: (dict(v) if isinstance(v, dict) else v)
+            for k, v in g.items()
+            if k != "_seconds"
+        }
+        for g in games
+    ]
+
+
+async def main_async(args):
+    rng = random.Random(args.seed)
+    games = initial_games(args.games)
+    manager = ScoreboardManager()
+    # Tip-off poll, then both clients join and receive their initial frames
+    await manager.broadcast(wire(games))
+    legacy, delta = CountingWebSocket(), CountingWebSocket()
+    await manager.connect(legacy, protocol_version=1)
+    await manager.connect(delta, protocol_version=2)
+    await manager.send_current_games(legacy)
+    await manager.send_current_games(delta)
+
+    broadcasts = 0
+    for _ in range(args.polls):
+        advance(games, rng, args.clock_share, args.score_share)
+        if await manager.broadcast(wire(games)):
+            broadcasts += 1
+        # Let the per-client sender tasks drain
+        await asyncio.sleep(0)
+
+    await asyncio.sleep(0.01)
+    print(f"{args.games} games, {args.polls} polls, {broadcasts} broadcasts")
+    print(f"full frames (v1): {legacy.bytes:>12,} bytes in {legacy.frames} frames")
+    print(f"delta (v2):       {delta.bytes:>12,} bytes in {delta.frames} frames")
+    if delta.bytes:
+        print(f"reduction:        {legacy.bytes / delta.bytes:.1f}x")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--games", type=int, default=15)
+    parser.add_argument("--polls", type=int, default=3000)
+    parser.add_argument("--clock-share", type=float, default=0.5)
+    parser.add_argument("--score-share", type=float, default=0.05)
+    parser.add_argument("--seed", type=int, default=2025)
+    asyncio.run(main_async(parser.parse_args()))
@@ -0,0 +1,319 @@
+"""
+Benchmark: NBA.com calls and frame delivery with several workers,
+independent vs. clustered.
+
+Runs ``--workers`` simulated workers in one process, each with its own
+ScoreboardManager, PlayByPlayManager and job scheduler (scoreboard poll every
+``--interval`` seconds), and ``--clients`` scoreboard clients (protocol
+version 2) plus ``--pbp-clients`` play-by-play clients per worker. Upstream
+is a replayed recording of ``--games`` live games (bench_websocket_load's
+generator), shared by every worker and counted per endpoint.
+
+  independent  - every worker leads itself and polls NBA.com (one backbone each)
+  cluster      - workers share a backbone and elect one leader, whose frames
+                 the others forward; in-process LocalBackbone, or Redis with
+                 ``--redis-url``
+
+Halfway through, the leader worker goes away (``--failover stop``: clean
+shutdown, releasing its lease; ``crash``: it just stops, and the lease has to
+expire). Reported: upstream calls, frames per client, how much later
+followers' clients get a scoreboard update than the leader's, sequence gaps,
+whether every surviving client ends up with the leader's play-by-play, and
+the failover gap.
+
+Usage (from nba_scoreboard_api/):
+    python test/bench_fanout.py --workers 4 --duration 30 --failover crash
+    python test/bench_fanout.py --workers 4 --redis-url redis://localhost:6379/15
+"""
+
+import argparse
+import asyncio
+import collections
+import json
+import os
+import re
+import statistics
+import sys
+import tempfile
+import time
+
+sys.path.append(
+    os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "api")
+)
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+os.environ.setdefault("TESTING", "True")
+
+from bench_websocket_load import write_recording
+
+from app.services.cluster import Cluster
+from app.services.freshness import FreshnessRegistry
+from app.services.pubsub import LocalBackbone, RedisBackbone
+from app.services.scheduler import JobScheduler
+from app.services.scoreboard import PlayByPlayManager, ScoreboardManager, get_live_games
+from app.services.sources import ReplaySource, UpstreamSource
+from app.services.upstream import upstream_client
+
+SEQ = re.compile(r'"seq":(\d+)')
+
+
+class CountingSource(UpstreamSource):
+    def __init__(self, inner):
+        self.inner = inner
+        self.calls = collections.Counter()
+
+    def fetch(self, endpoint, fn, args, kwargs):
+        self.calls[endpoint] += 1
+        return self.inner.fetch(endpoint, fn, args, kwargs)
+
+
+class ScoreboardClient:
+    """Records the sequence number and arrival time of every scoreboard frame."""
+
+    def __init__(self):
+        self.frames = 0
+        self.received = {}  # seq -> time
+
+    async def accept(self):
+        pass
+
+    async def send_text(self, data):
+        self.frames += 1
+        match = SEQ.search(data)
+        if match:
+            self.received[int(match.group(1))] = time.perf_counter()
+
+    async def close(self, code=1000):
+        pass
+
+
+class PlayByPlayClient:
+    """Keeps the actions a play-by-play client would show."""
+
+    def __init__(self):
+        self.frames = 0
+        self.actions = {}
+
+    async def accept(self):
+        pass
+
+    async def send_text(self, data):
+        self.frames += 1
+        message = json.loads(data)
+        if message["type"] == "snapshot":
+            self.actions = {}
+        for action in message["game"]["actions"]:
+            self.actions[action["actionNumber"]] = action
+        for number in message.get("removed", ()):
+            self.actions.pop(number, None)
+
+    async def close(self, code=1000):
+        pass
+
+
+class Worker:
+    def __init__(self, index, backbone, args):
+        self.index = index
+        self.scoreboard = ScoreboardManager()
+        self.playbyplay = PlayByPlayManager(self.scoreboard)
+        self.scheduler = JobScheduler({"live": 1})
+        self.scheduler.add_job(
+            "scoreboard", self.poll, interval=args.interval, pool="live"
+        )
+        self.cluster = Cluster(
+            backbone,
+            self.scheduler,
+            self.scoreboard,
+            self.playbyplay,
+            FreshnessRegistry(),
+            prefix="bench",
+            lease_ttl=args.lease_ttl,
+            renew_interval=args.renew_interval,
+            watch_interval=args.watch_interval,
+        )
+        self.clients = []
+        self.pbp_clients = []  # (game_id, client)
+        self.alive = True
+
+    async def poll(self):
+        games = await get_live_games()
+        await self.scoreboard.broadcast(games)
+
+    async def connect(self, n_clients, n_pbp_clients, game_ids):
+        for _ in range(n_clients):
+            client = ScoreboardClient()
+            await self.scoreboard.connect(client, protocol_version=2)
+            await self.scoreboard.send_current_games(client)
+            self.clients.append(client)
+        for i in range(n_pbp_clients):
+            game_id = game_ids[(self.index + i) % len(game_ids)]
+            client = PlayByPlayClient()
+            await self.playbyplay.connect(client, game_id)
+            self.pbp_clients.append((game_id, client))
+
+    async def crash(self):
+        """Stop without a word to the others: the lease stays until it expires."""
+        self.alive = False
+        cluster = self.cluster
+        for task in cluster._tasks:
+            task.cancel()
+        await asyncio.gather(*cluster._tasks, return_exceptions=True)
+        await self.scheduler.stop()
+        await self.playbyplay.stop_polling()
+        await cluster._subscription.close()
+
+
+async def run(mode, args, path, game_ids):
+    source = CountingSource(ReplaySource(path))
+    upstream_client.source = source
+    if mode == "cluster":
+        shared = RedisBackbone(args.redis_url) if args.redis_url else LocalBackbone()
+        if args.redis_url:
+            await shared._redis.delete("bench:leader")
+        backbones = [shared] * args.workers
+    else:
+        backbones = [LocalBackbone() for _ in range(args.workers)]
+
+    workers = [Worker(i, backbones[i], args) for i in range(args.workers)]
+    for worker in workers:
+        await worker.cluster.start()
+    for worker in workers:
+        await worker.connect(args.clients, args.pbp_clients, game_ids)
+
+    failover = None
+    await asyncio.sleep(args.duration / 2)
+    leaders = [worker for worker in workers if worker.cluster.is_leader]
+    if mode == "cluster" and args.failover != "none" and leaders:
+        old = leaders[0]
+        stopped = time.perf_counter()
+        last_seq = old.scoreboard.sequence
+        if args.failover == "crash":
+            await old.crash()
+        else:
+            old.alive = False
+            await old.cluster.stop()
+        survivors = [worker for worker in workers if worker.alive]
+        while not any(worker.cluster.is_leader for worker in survivors):
+            await asyncio.sleep(0.05)
+        elected = time.perf_counter() - stopped
+        while not any(
+            seq > last_seq
+            for worker in survivors
+            for client in worker.clients[:1]
+            for seq in client.received
+        ):
+            await asyncio.sleep(0.05)
+        failover = (elected, time.perf_counter() - stopped)
+    await asyncio.sleep(args.duration / 2)
+
+    # Let the last frames drain, then stop everything
+    await asyncio.sleep(0.5)
+    survivors = [worker for worker in workers if worker.alive]
+    leader = next(worker for worker in survivors if worker.cluster.is_leader)
+    reference = {
+        game_id: dict(leader.playbyplay.actions.get(game_id, {}))
+        for game_id in game_ids
+    }
+    for worker in sorted(survivors, key=lambda worker: worker is leader):
+        for client in worker.clients:
+            await worker.scoreboard.disconnect(client)
+        for game_id, client in worker.pbp_clients:
+            await worker.playbyplay.disconnect(client, game_id)
+        await worker.cluster.stop()
+
+    # Delivery lag: each update's arrival at a client vs. its first arrival anywhere
+    first = {}
+    for worker in survivors:
+        for client in worker.clients:
+            for seq, t in client.received.items():
+                first[seq] = min(first.get(seq, t), t)
+    lags = (
+        [
+            (t - first[seq]) * 1000
+            for worker in survivors
+            if worker is not leader
+            for client in worker.clients
+            for seq, t in client.received.items()
+        ]
+        if mode == "cluster"
+        else []
+    )
+    gaps = 0
+    for worker in survivors:
+        for client in worker.clients:
+            seqs = sorted(client.received)
+            gaps += sum(b - a - 1 for a, b in zip(seqs, seqs[1:]) if b - a > 1)
+    in_sync = sum(
+        client.actions == reference[game_id]
+        for worker in survivors
+        for game_id, client in worker.pbp_clients
+    )
+    n_pbp = sum(len(worker.pbp_clients) for worker in survivors)
+    frames = [client.frames for worker in survivors for client in worker.clients]
+
+    print(f"{mode}")
+    print(
+        f"  upstream calls      scoreboard {source.calls['scoreboard']:5d}  "
+        f"playbyplay {source.calls['playbyplay']:5d}  ({args.duration:.0f}s)"
+    )
+    print(
+        f"  scoreboard frames   {statistics.mean(frames):.1f} per client, "
+        f"{gaps} missed sequence numbers"
+    )
+    if lags:
+        lags.sort()
+        print(
+            f"  follower lag        p50 {lags[len(lags) // 2]:.2f}ms  "
+            f"p99 {lags[int(len(lags) * 0.99)]:.2f}ms  "
+            f"max {lags[-1]:.2f}ms"
+        )
+    print(f"  play-by-play        {in_sync}/{n_pbp} clients match the leader's actions")
+    if failover:
+        print(
+            f"  failover ({args.failover})    new leader after {failover[0]:.2f}s, "
+            f"first update after {failover[1]:.2f}s"
+        )
+
+
+async def main_async(args):
+    directory = tempfile.TemporaryDirectory()
+    path = os.path.join(directory.name, "fanout.jsonl")
+    game_ids = write_recording(
+        path, args.games, args.duration * 2 + 60, args.action_interval, 50, args.seed
+    )
+    print(
+        f"{args.workers} workers x ({args.clients} scoreboard + "
+        f"{args.pbp_clients} play-by-play clients), "
+        f"{args.games} live games, {args.duration:.0f}s"
+    )
+    for mode in ("independent", "cluster"):
+        await run(mode, args, path, game_ids)
+    upstream_client.shutdown()
+    directory.cleanup()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument(
+        "--clients", type=int, default=200, help="Scoreboard clients per worker"
+    )
+    parser.add_argument(
+        "--pbp-clients", type=int, default=20, help="Play-by-play clients per worker"
+    )
+    parser.add_argument("--games", type=int, default=5)
+    parser.add_argument("--duration", type=float, default=30.0)
+    parser.add_argument(
+        "--interval", type=float, default=1.0, help="Scoreboard poll interval"
+    )
+    parser.add_argument("--action-interval", type=float, default=8.0)
+    parser.add_argument(
+        "--failover", choices=("stop", "crash", "none"), default="crash"
+    )
+    parser.add_argument("--lease-ttl", type=float, default=5.0)
+    parser.add_argument("--renew-interval", type=float, default=1.0)
+    parser.add_argument("--watch-interval", type=float, default=5.0)
+    parser.add_argument(
+        "--redis-url", help="Use a Redis backbone instead of the in-process one"
+    )
+    parser.add_argument("--seed", type=int, default=2025)
+    asyncio.run(main_async(parser.parse_args()))
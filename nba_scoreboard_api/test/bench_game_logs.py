@@ -0,0 +1,218 @@
+"""
+Benchmark: /players/{id}/games latency and upstream calls, live vs. local store.
+
+Runs ``--requests`` get_player_recent_games calls for random players against a
+temporary SQLite database:
+
+  live   - store empty: one PlayerGameLogs call per request (the old path)
+  store  - after one season-wide load_game_logs call: served from
+           player_game_logs via ix_player_game_logs_person_date
+
+Also times the season load and an incremental refresh_game_logs. NBA.com is
+replaced by a fake PlayerGameLogs (``--players`` x ``--games`` rows) that
+blocks for ``--upstream-latency``.
+
+Usage (from nba_scoreboard_api/):
+    python test/bench_game_logs.py --players 500 --games 52 --requests 30
+"""
+
+import argparse
+import asyncio
+import os
+import random
+import statistics
+import sys
+import tempfile
+import time
+from datetime import date, timedelta
+
+import pandas as pd
+from sqlalchemy import create_engine, insert
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.orm import sessionmaker
+
+sys.path.append(os.path.join(os.path.dirname(os.path.dirname(__file__)), "api"))
+os.environ.setdefault("TESTING", "True")
+
+from app.core.config import get_settings
+from app.core.database import Base
+from app.models.players import Player
+from app.services import game_logs
+from app.services import players as players_service
+
+UPSTREAM_LATENCY = 0.3
+SEASON_START = date(2024, 10, 22)
+upstream_calls = 0
+
+
+def make_season(n_players: int, n_games: int, seed: int) -> pd.DataFrame:
+    rng = random.Random(seed)
+    rows = []
+    for player in range(n_players):
+        for game in range(n_games):
+            day = SEASON_START + timedelta(days=game * 3 + player % 3)
+            fga, fg3a, fta = rng.randint(3, 25), rng.randint(0, 10), rng.randint(0, 10)
+            fgm, fg3m, ftm = (
+                rng.randint(0, fga),
+                rng.randint(0, fg3a),
+                rng.randint(0, fta),
+            )
+            rows.append(
+                {
+                    "PLAYER_ID": 1_000 + player,
+                    "GAME_ID": f"00224{game * 15 + player // 2:05d}",
+                    "GAME_DATE": f"{day.isoformat()}T00:00:00",
+                    "TEAM_ABBREVIATION": "LAL",
+                    "MATCHUP": "LAL vs. BOS",
+                    "WL": rng.choice("WL"),
+                    "MIN": rng.uniform(10, 40),
+                    "PTS": 2 * fgm + fg3m + ftm,
+                    "FGM": fgm,
+                    "FGA": fga,
+                    "FG_PCT": fgm / fga,
+                    "FG3M": fg3m,
+                    "FG3A": fg3a,
+                    "FG3_PCT": fg3m / fg3a if fg3a else 0.0,
+                    "FTM": ftm,
+                    "FTA": fta,
+                    "FT_PCT": ftm / fta if fta else 0.0,
+                    "OREB": rng.randint(0, 4),
+                    "DREB": rng.randint(0, 10),
+                    "REB": rng.randint(0, 14),
+                    "AST": rng.randint(0, 12),
+                    "STL": rng.randint(0, 3),
+                    "BLK": rng.randint(0, 3),
+                    "TOV": rng.randint(0, 5),
+                    "PF": rng.randint(0, 6),
+                    "PLUS_MINUS": rng.randint(-20, 20),
+                }
+            )
+    return pd.DataFrame(rows)
+
+
+class FakePlayerGameLogs:
+    """Stand-in for nba_api's PlayerGameLogs over a synthetic season."""
+
+    season: pd.DataFrame = None
+
+    def __init__(
+        self,
+        player_id_nullable="",
+        last_n_games_nullable="",
+        date_from_nullable="",
+        timeout=30,
+        **kwargs,
+    ):
+        global upstream_calls
+        upstream_calls += 1
+        time.sleep(UPSTREAM_LATENCY)
+        df = self.season
+        if player_id_nullable:
+            df = df[df["PLAYER_ID"] == player_id_nullable]
+        if date_from_nullable:
+            since = pd.to_datetime(date_from_nullable).strftime("%Y-%m-%d")
+            df = df[df["GAME_DATE"] >= since]
+        df = df.sort_values("GAME_DATE", ascending=False)
+        if last_n_games_nullable:
+            df = df.head(last_n_games_nullable)
+        self._df = df
+
+    def get_data_frames(self):
+        return [self._df]
+
+
+async def timed_requests(async_engine, player_ids, last_n):
+    global upstream_calls
+    upstream_calls = 0
+    latencies = []
+    for player_id in player_ids:
+        start = time.perf_counter()
+        async with AsyncSession(async_engine) as db:
+            result = await players_service.get_player_recent_games(
+                db, player_id, last_n
+            )
+        latencies.append((time.perf_counter() - start) * 1000)
+        assert len(result.games) == last_n
+    latencies.sort()
+    return latencies, upstream_calls
+
+
+def report(name, latencies, calls):
+    print(
+        f"{name:<6} requests={len(latencies):<4} upstream calls={calls:<4} "
+        f"p50={statistics.median(latencies):9.2f}ms  "
+        f"p99={latencies[min(len(latencies) - 1, int(len(latencies) * 0.99))]:9.2f}ms"
+    )
+
+
+async def main_async(args):
+    global UPSTREAM_LATENCY, upstream_calls
+    UPSTREAM_LATENCY = args.upstream_latency
+    FakePlayerGameLogs.season = make_season(args.players, args.games, args.seed)
+    game_logs.playergamelogs.PlayerGameLogs = FakePlayerGameLogs
+    players_service.playergamelogs.PlayerGameLogs = FakePlayerGameLogs
+    season = get_settings().NBA_SEASON
+    print(
+        f"{len(FakePlayerGameLogs.season):,} player-games, "
+        f"simulated upstream latency {args.upstream_latency * 1000:.0f}ms"
+    )
+
+    rng = random.Random(args.seed)
+    player_ids = [1_000 + rng.randrange(args.players) for _ in range(args.requests)]
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "logs.db")
+        engine = create_engine(f"sqlite:///{path}")
+        async_engine = create_async_engine(f"sqlite+aiosqlite:///{path}")
+        Base.metadata.create_all(engine)
+        db = sessionmaker(bind=engine)()
+        db.execute(
+            insert(Player),
+            [
+                {
+                    "person_id": 1_000 + i,
+                    "display_name": f"Player {i}",
+                    "team_name": "Lakers",
+                    "team_abbreviation": "LAL",
+                }
+                for i in range(args.players)
+            ],
+        )
+        db.commit()
+
+        report("live", *await timed_requests(async_engine, player_ids, args.last_n))
+
+        upstream_calls = 0
+        start = time.perf_counter()
+        async with AsyncSession(async_engine) as async_db:
+            count = await game_logs.load_game_logs(async_db, season)
+        print(
+            f"season load: {count:,} rows "
+            f"in {(time.perf_counter() - start) * 1000:.0f}ms, "
+            f"{upstream_calls} upstream call"
+        )
+        upstream_calls = 0
+        start = time.perf_counter()
+        async with AsyncSession(async_engine) as async_db:
+            count = await game_logs.refresh_game_logs(async_db, season)
+        print(
+            f"incremental refresh: {count:,} rows "
+            f"in {(time.perf_counter() - start) * 1000:.0f}ms, "
+            f"{upstream_calls} upstream call"
+        )
+
+        report("store", *await timed_requests(async_engine, player_ids, args.last_n))
+        db.close()
+        await async_engine.dispose()
+        engine.dispose()
+    game_logs.upstream_client.shutdown()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--players", type=int, default=500)
+    parser.add_argument("--games", type=int, default=52)
+    parser.add_argument("--requests", type=int, default=30)
+    parser.add_argument("--last-n", type=int, default=10)
+    parser.add_argument("--upstream-latency", type=float, default=0.3)
+    parser.add_argument("--seed", type=int, default=2025)
+    asyncio.run(main_async(parser.parse_args()))
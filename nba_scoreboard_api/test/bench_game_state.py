@@ -0,0 +1,148 @@
+"""
+Benchmark: per-poll CPU and allocations of ScoreboardManager.broadcast on a
+15-game night.
+
+Feeds ``--polls`` consecutive one-second polls of ``--games`` games (two
+scheduled, two final, the rest live with the clock running, stopped for
+free throws and timeouts, or between periods) to a ScoreboardManager
+without clients, so the time is the clock standardization, progression
+validation, state history and patch building of each poll. Each poll's
+games are fresh dicts, as ScoreboardResponse.model_dump() returns them.
+
+Reported: CPU time per poll (median of ``--rounds``), and with tracemalloc
+the peak memory allocated during a poll and the memory held by the game
+state history.
+
+Usage (from nba_scoreboard_api/):
+    python test/bench_game_state.py --games 15 --polls 2000 --rounds 5
+"""
+
+import argparse
+import asyncio
+import gc
+import os
+import random
+import statistics
+import sys
+import time
+import tracemalloc
+from datetime import datetime, timezone
+
+sys.path.append(os.path.join(os.path.dirname(os.path.dirname(__file__)), "api"))
+os.environ.setdefault("TESTING", "True")
+
+from app.services.scoreboard import ScoreboardManager
+
+
+def simulate_polls(n_games, n_polls, seed):
+    """Scoreboard game dicts for each of ``n_polls`` one-second polls."""
+    rng = random.Random(seed)
+    games = []
+    for i in range(n_games):
+        status = 1 if i < 2 else 3 if i < 4 else 2
+        games.append(
+            {
+                "status": status,
+                "period": 0 if status == 1 else 4 if status == 3 else rng.randint(1, 4),
+                "clock": 0 if status == 3 else rng.randint(0, 720),
+                "home": 0 if status == 1 else rng.randint(20, 100),
+                "away": 0 if status == 1 else rng.randint(20, 100),
+                "break": 0,
+            }
+        )
+
+    polls = []
+    for _ in range(n_polls):
+        for game in games:
+            if game["status"] != 2:
+                continue
+            if game["break"]:
+                game["break"] -= 1
+                if not game["break"]:
+                    game["period"] += 1
+                    game["clock"] = 720 if game["period"] <= 4 else 300
+            elif game["clock"] == 0:
+                game["break"] = 130
+            elif rng.random() < 0.7:  # Clock running
+                game["clock"] -= 1
+                if rng.random() < 0.035:
+                    game["home" if rng.random() < 0.5 else "away"] += rng.choice(
+                        (1, 2, 2, 3)
+                    )
+        polls.append(
+            [
+                {
+                    "game_id": f"00224008{i:02d}",
+                    "game_status": game["status"],
+                    "period": game["period"],
+                    "clock": (
+                        ""
+                        if game["status"] == 1
+                        else f"PT{game['clock'] // 60:02d}M{game['clock'] % 60:02d}.00S"
+                    ),
+                    "game_time": datetime(2025, 2, 28, 0, 30, tzinfo=timezone.utc),
+                    "home_team": {
+                        "team_id": str(1610612737 + 2 * i),
+                        "team_name": f"Home {i}",
+                        "team_city": "City",
+                        "team_tricode": f"H{i:02d}",
+                        "score": game["home"],
+                    },
+                    "away_team": {
+                        "team_id": str(1610612738 + 2 * i),
+                        "team_name": f"Away {i}",
+                        "team_city": "City",
+                        "team_tricode": f"A{i:02d}",
+                        "score": game["away"],
+                    },
+                }
+                for i, game in enumerate(games)
+            ]
+        )
+    return polls
+
+
+async def cpu_per_poll(polls):
+    manager = ScoreboardManager()
+    gc.collect()
+    start = time.process_time()
+    for games in polls:
+        await manager.broadcast(games)
+    return (time.process_time() - start) / len(polls)
+
+
+async def memory_per_poll(polls):
+    manager = ScoreboardManager()
+    tracemalloc.start()
+    peaks = []
+    for games in polls:
+        tracemalloc.reset_peak()
+        before = tracemalloc.get_traced_memory()[0]
+        await manager.broadcast(games)
+        peaks.append(tracemalloc.get_traced_memory()[1] - before)
+    gc.collect()
+    before = tracemalloc.get_traced_memory()[0]
+    manager.game_state_history.clear()
+    gc.collect()
+    history = before - tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return statistics.mean(peaks), history
+
+
+async def main_async(args):
+    polls = simulate_polls(args.games, args.polls, args.seed)
+    timings = [await cpu_per_poll(polls) for _ in range(args.rounds)]
+    peak, history = await memory_per_poll(polls)
+    print(f"{args.games} games, {args.polls} polls, median of {args.rounds} rounds")
+    print(f"  CPU per poll         {statistics.median(timings) * 1e6:8.1f}us")
+    print(f"  allocated per poll   {peak / 1024:8.1f} KiB (peak)")
+    print(f"  state history        {history / 1024:8.1f} KiB")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--games", type=int, default=15)
+    parser.add_argument("--polls", type=int, default=2000)
+    parser.add_argument("--rounds", type=int, default=5)
+    parser.add_argument("--seed", type=int, default=2025)
+    asyncio.run(main_async(parser.parse_args()))
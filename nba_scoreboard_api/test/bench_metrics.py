@@ -0,0 +1,181 @@
+"""
+Benchmark: overhead of the metrics registry on the instrumented hot paths.
+
+Runs each path with metrics on and off (``metrics.enabled``), alternating
+rounds so drift affects both equally, and reports the median time per
+operation:
+
+  broadcast  - ScoreboardManager.broadcast of a changed scoreboard to
+               ``--clients`` connected clients (queueing, not delivery)
+  upstream   - UpstreamClient.call of a no-op endpoint (worker pool hop)
+  db sync    - a one-row SELECT on the sync engine
+  db async   - the same SELECT through an aiosqlite engine
+
+plus the cost of rendering /metrics once every series has data.
+
+Usage (from nba_scoreboard_api/):
+    python test/bench_metrics.py --clients 1000 --ops 2000 --rounds 5
+"""
+
+import argparse
+import asyncio
+import os
+import statistics
+import sys
+import tempfile
+import time
+
+sys.path.append(os.path.join(os.path.dirname(os.path.dirname(__file__)), "api"))
+sys.path.append(os.path.dirname(__file__))
+os.environ.setdefault("TESTING", "True")
+
+from bench_broadcast import FakeWebSocket, make_games
+from sqlalchemy import create_engine, text
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from app.core.database import instrument_engine
+from app.core.metrics import metrics
+from app.services.scoreboard import ScoreboardManager
+from app.services.upstream import UpstreamClient
+
+
+def noop(timeout=None):
+    return None
+
+
+async def bench_broadcast(n_clients, n_ops):
+    manager = ScoreboardManager()
+    for _ in range(n_clients):
+        await manager.connect(FakeWebSocket(0, lambda: None), protocol_version=2)
+    for client in manager.active_connections.values():
+        client.ready = True
+    boards = [make_games(tick) for tick in range(60)]
+
+    async def run(n):
+        elapsed = 0.0
+        for i in range(n):
+            start = time.perf_counter()
+            await manager.broadcast(boards[i % len(boards)])
+            elapsed += time.perf_counter() - start
+            await asyncio.sleep(0)  # Let the send queues drain, untimed
+            await asyncio.sleep(0)
+        return elapsed / n
+
+    async def close():
+        for websocket in list(manager.active_connections):
+            await manager.disconnect(websocket)
+
+    return run, close
+
+
+async def bench_upstream(n_ops):
+    client = UpstreamClient(
+        max_workers=2,
+        timeouts={},
+        concurrency={},
+        default_timeout=5.0,
+        default_concurrency=1,
+    )
+
+    async def run(n):
+        start = time.perf_counter()
+        for _ in range(n):
+            await client.call("bench", noop)
+        return (time.perf_counter() - start) / n
+
+    async def close():
+        client.shutdown()
+
+    return run, close
+
+
+async def bench_db_sync(path):
+    engine = create_engine(f"sqlite:///{path}")
+    instrument_engine(engine, "bench_sync")
+    connection = engine.connect()
+
+    async def run(n):
+        start = time.perf_counter()
+        for i in range(n):
+            connection.execute(text("SELECT :i"), {"i": i}).scalar()
+        return (time.perf_counter() - start) / n
+
+    async def close():
+        connection.close()
+        engine.dispose()
+
+    return run, close
+
+
+async def bench_db_async(path):
+    engine = create_async_engine(f"sqlite+aiosqlite:///{path}")
+    instrument_engine(engine.sync_engine, "bench_async")
+    connection = await engine.connect()
+
+    async def run(n):
+        start = time.perf_counter()
+        for i in range(n):
+            (await connection.execute(text("SELECT :i"), {"i": i})).scalar()
+        return (time.perf_counter() - start) / n
+
+    async def close():
+        await connection.close()
+        await engine.dispose()
+
+    return run, close
+
+
+async def compare(name, run, n_ops, rounds):
+    await run(max(1, n_ops // 10))  # Warm up
+    timings = {True: [], False: []}
+    for _ in range(rounds):
+        for enabled in (False, True):
+            metrics.enabled = enabled
+            timings[enabled].append(await run(n_ops))
+    off = statistics.median(timings[False])
+    on = statistics.median(timings[True])
+    print(
+        f"{name:<11} off {off * 1e6:9.2f}us  on {on * 1e6:9.2f}us  "
+        f"overhead {(on - off) * 1e6:+7.2f}us ({(on - off) / off:+6.1%})"
+    )
+
+
+async def main_async(args):
+    directory = tempfile.TemporaryDirectory()
+    path = os.path.join(directory.name, "bench.db")
+    benches = [
+        (
+            "broadcast",
+            await bench_broadcast(args.clients, args.ops),
+            max(1, args.ops // 20),
+        ),
+        ("upstream", await bench_upstream(args.ops), args.ops),
+        ("db sync", await bench_db_sync(path), args.ops),
+        ("db async", await bench_db_async(path), args.ops),
+    ]
+    print(f"broadcast to {args.clients} clients; median of {args.rounds} rounds")
+    for name, (run, close), n_ops in benches:
+        await compare(name, run, n_ops, args.rounds)
+        await close()
+
+    metrics.enabled = True
+    start = time.perf_counter()
+    body = metrics.render()
+    print(
+        f"render      {(time.perf_counter() - start) * 1e3:.2f}ms for "
+        f"{len(body.splitlines())} lines ({len(body) / 1024:.1f} KiB)"
+    )
+    directory.cleanup()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--clients", type=int, default=1000)
+    parser.add_argument(
+        "--ops",
+        type=int,
+        default=2000,
+        help="Operations per round (broadcasts: ops / 20)",
+    )
+    parser.add_argument("--rounds", type=int, default=5)
+    asyncio.run(main_async(parser.parse_args()))
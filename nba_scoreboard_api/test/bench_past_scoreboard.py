@@ -0,0 +1,164 @@
+"""
+Benchmark: /scoreboard/past response times, cold (NBA.com) vs. warm (SQLite).
+
+Requests ``--dates`` past dates twice through get_past_scoreboard against a
+temporary SQLite database with the ``games`` table:
+
+  cold  - first request per date: LeagueGameFinder + archive write
+  warm  - later requests: served from ``games`` via ix_games_date_status
+
+Then times a one-call season backfill (``--season-games`` games) into a fresh
+database. NBA.com is replaced by a fake LeagueGameFinder that blocks for
+``--upstream-latency``.
+
+Usage (from nba_scoreboard_api/):
+    python test/bench_past_scoreboard.py --dates 30 --upstream-latency 0.8
+"""
+
+import argparse
+import asyncio
+import os
+import statistics
+import sys
+import tempfile
+import time
+from datetime import date, timedelta
+
+import pandas as pd
+from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.orm import sessionmaker
+
+sys.path.append(os.path.join(os.path.dirname(os.path.dirname(__file__)), "api"))
+os.environ.setdefault("TESTING", "True")
+
+from app.core.database import Base
+from app.models.scoreboard import Game  # noqa: F401  (registers the table)
+from app.services import scoreboard as scoreboard_service
+
+UPSTREAM_LATENCY = 0.8
+SEASON_START = date(2024, 10, 22)
+GAMES_PER_DATE = 10
+upstream_calls = 0
+
+
+def make_rows(day: date, n_games: int, first_id: int):
+    rows = []
+    for i in range(n_games):
+        game_id = f"00224{first_id + i:05d}"
+        home, away = 1610612737 + (2 * i) % 30, 1610612738 + (2 * i) % 30
+        for team_id, abbr, matchup, pts in (
+            (home, "HOM", "HOM vs. AWY", 112),
+            (away, "AWY", "AWY @ HOM", 104),
+        ):
+            rows.append(
+                {
+                    "GAME_ID": game_id,
+                    "GAME_DATE": day.isoformat(),
+                    "TEAM_ID": team_id,
+                    "TEAM_NAME": f"Team {team_id % 100}",
+                    "TEAM_ABBREVIATION": abbr,
+                    "MATCHUP": matchup,
+                    "PTS": pts,
+                }
+            )
+    return rows
+
+
+class FakeLeagueGameFinder:
+    """Stand-in for nba_api's LeagueGameFinder (per-date or whole season)."""
+
+    season_games = 1230
+
+    def __init__(self, date_from_nullable="", season_nullable="", timeout=30, **kwargs):
+        global upstream_calls
+        upstream_calls += 1
+        time.sleep(UPSTREAM_LATENCY)
+        if date_from_nullable:
+            day = pd.to_datetime(date_from_nullable).date()
+            offset = (day - SEASON_START).days
+            self._df = pd.DataFrame(
+                make_rows(day, GAMES_PER_DATE, offset * GAMES_PER_DATE)
+            )
+        else:
+            rows = []
+            for n in range(0, self.season_games, GAMES_PER_DATE):
+                day = SEASON_START + timedelta(days=n // GAMES_PER_DATE)
+                rows.extend(
+                    make_rows(day, min(GAMES_PER_DATE, self.season_games - n), n)
+                )
+            self._df = pd.DataFrame(rows)
+
+    def get_data_frames(self):
+        return [self._df]
+
+
+def temp_session(directory: str, name: str):
+    engine = create_engine(f"sqlite:///{os.path.join(directory, name)}")
+    Base.metadata.create_all(engine)
+    return sessionmaker(bind=engine)()
+
+
+async def timed_requests(db, write_sessions, dates):
+    latencies = []
+    for day in dates:
+        start = time.perf_counter()
+        games = await scoreboard_service.get_past_scoreboard(
+            day.isoformat(), db, write_sessions
+        )
+        latencies.append((time.perf_counter() - start) * 1000)
+        assert len(games) == GAMES_PER_DATE
+    return latencies
+
+
+def report(name, latencies, calls):
+    print(
+        f"{name:<5} requests={len(latencies):<4} upstream calls={calls:<4} "
+        f"p50={statistics.median(latencies):9.2f}ms  max={max(latencies):9.2f}ms"
+    )
+
+
+async def main_async(args):
+    global UPSTREAM_LATENCY, upstream_calls
+    UPSTREAM_LATENCY = args.upstream_latency
+    FakeLeagueGameFinder.season_games = args.season_games
+    scoreboard_service.leaguegamefinder.LeagueGameFinder = FakeLeagueGameFinder
+    print(f"simulated upstream latency {args.upstream_latency * 1000:.0f}ms")
+
+    dates = [SEASON_START + timedelta(days=i) for i in range(args.dates)]
+    with tempfile.TemporaryDirectory() as directory:
+        temp_session(directory, "past.db").close()
+        async_engine = create_async_engine(
+            f"sqlite+aiosqlite:///{os.path.join(directory, 'past.db')}"
+        )
+        write_sessions = async_sessionmaker(async_engine)
+        async with AsyncSession(async_engine) as db:
+            upstream_calls = 0
+            report(
+                "cold", await timed_requests(db, write_sessions, dates), upstream_calls
+            )
+            upstream_calls = 0
+            report(
+                "warm", await timed_requests(db, write_sessions, dates), upstream_calls
+            )
+        await async_engine.dispose()
+
+        db = temp_session(directory, "backfill.db")
+        upstream_calls = 0
+        start = time.perf_counter()
+        count = await scoreboard_service.backfill_past_games(db, "2024-25")
+        elapsed = time.perf_counter() - start
+        print(
+            f"backfill: {count} games in {elapsed * 1000:.0f}ms "
+            f"with {upstream_calls} upstream call(s)"
+        )
+        db.close()
+    scoreboard_service.upstream_client.shutdown()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--dates", type=int, default=30)
+    parser.add_argument("--season-games", type=int, default=1230)
+    parser.add_argument("--upstream-latency", type=float, default=0.8)
+    asyncio.run(main_async(parser.parse_args()))
@@ -0,0 +1,179 @@
+"""
+Benchmark: play-by-play bytes and CPU per game-minute, full rebroadcast vs.
+incremental action streaming.
+
+Simulates a game's live play-by-play feed (actions arriving over time, with a
+share of them edited later, as NBA.com does when it corrects a play). The feed
+is polled on a simulated clock, so no real time passes:
+
+  legacy       - poll every 0.2s, compare the whole payload with ``!=`` and
+                 rebroadcast the whole payload on any change
+  incremental  - PlayByPlayManager._publish, polling at PBP_LIVE_INTERVAL
+
+Only server-side processing is timed (the upstream fetch is excluded).
+
+Usage (from nba_scoreboard_api/):
+    python test/bench_playbyplay.py --actions 480 --wall-ratio 2.0
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import random
+import sys
+import time
+
+sys.path.append(os.path.join(os.path.dirname(os.path.dirname(__file__)), "api"))
+os.environ.setdefault("TESTING", "True")
+
+from app.core.config import get_settings
+from app.services.scoreboard import PlayByPlayManager
+
+GAME_ID = "0022400789"
+GAME_MINUTES = 48
+
+
+class CountingWebSocket:
+    def __init__(self):
+        self.frames = 0
+        self.bytes = 0
+
+    async def accept(self):
+        pass
+
+    async def send_text(self, data):
+        self.frames += 1
+        self.bytes += len(data.encode())
+
+    async def close(self, code=1000):
+        pass
+
+
+def make_action(number: int, rng: random.Random):
+    return {
+        "actionNumber": number,
+        "clock": f"PT{rng.randint(0, 11):02d}M{rng.randint(0, 59):02d}.00S",
+        "timeActual": "2025-02-17T01:12:33.4Z",
+        "period": min(4, 1 + number * 4 // 500),
+        "periodType": "REGULAR",
+        "teamId": 1610612747,
+        "teamTricode": "LAL",
+        "actionType": rng.choice(["2pt", "3pt", "rebound", "foul", "turnover"]),
+        "subType": "Jump Shot",
+        "descriptor": "pullup",
+        "qualifiers": ["pointsinthepaint"],
+        "personId": 2544,
+        "x": rng.random() * 100,
+        "y": rng.random() * 100,
+        "possession": 1610612747,
+        "scoreHome": str(number // 4),
+        "scoreAway": str(number // 5),
+        "edited": "2025-02-17T01:12:40Z",
+        "orderNumber": number * 10000,
+        "isFieldGoal": 1,
+        "side": "left",
+        "description": f"L. James 18' Pullup Jump Shot ({number // 20} PTS)",
+        "personIdsFilter": [2544],
+    }
+
+
+def build_feed(n_actions: int, edit_share: float, wall_seconds: float, seed: int):
+    """Return a list of (time, kind, payload) feed events on the wall clock."""
+    rng = random.Random(seed)
+    events = []
+    for number in range(1, n_actions + 1):
+        at = wall_seconds * number / (n_actions + 1)
+        events.append((at, "add", make_action(number, rng)))
+        if rng.random() < edit_share:
+            events.append((at + rng.uniform(5, 60), "edit", number))
+    events.sort(key=lambda e: e[0])
+    return events
+
+
+def feed_states(events, poll_interval: float, wall_seconds: float):
+    """Yield the upstream payload as seen at each poll (fresh objects every time)."""
+    actions = {}
+    index = 0
+    t = 0.0
+    while t <= wall_seconds + 60:
+        while index < len(events) and events[index][0] <= t:
+            _, kind, payload = events[index]
+            if kind == "add":
+                actions[payload["actionNumber"]] = payload
+            elif payload in actions:
+                actions[payload]["description"] += " (edited)"
+            index += 1
+        yield {
+            "meta": {"version": 1, "code": 200},
+            # New dicts every poll, like a freshly parsed response
+            "game": {"gameId": GAME_ID, "actions": [dict(a) for a in actions.values()]},
+        }
+        t += poll_interval
+
+
+def run_legacy(events, wall_seconds):
+    sent_bytes = 0
+    cpu = 0.0
+    polls = 0
+    last = None
+    for payload in feed_states(events, 0.2, wall_seconds):
+        polls += 1
+        start = time.process_time()
+        if not last or last != payload:
+            last = payload
+            # Starlette's send_json encodes the whole payload
+            sent_bytes += len(json.dumps(payload, separators=(",", ":")).encode())
+        cpu += time.process_time() - start
+    return polls, sent_bytes, cpu
+
+
+async def run_incremental(events, wall_seconds, interval):
+    manager = PlayByPlayManager()
+    ws = CountingWebSocket()
+    # Register the subscriber without starting a real poller task
+    manager.tasks[GAME_ID] = asyncio.get_running_loop().create_future()
+    await manager.connect(ws, GAME_ID)
+
+    cpu = 0.0
+    polls = 0
+    for payload in feed_states(events, interval, wall_seconds):
+        polls += 1
+        start = time.process_time()
+        actions = (payload.get("game") or {}).get("actions") or []
+        await manager._publish(GAME_ID, actions)
+        await asyncio.sleep(0)
+        cpu += time.process_time() - start
+    await asyncio.sleep(0.01)
+    return polls, ws.bytes, cpu
+
+
+async def main_async(args):
+    wall_seconds = GAME_MINUTES * 60 * args.wall_ratio
+    events = build_feed(args.actions, args.edit_share, wall_seconds, args.seed)
+    interval = get_settings().PBP_LIVE_INTERVAL
+
+    results = {
+        "legacy": run_legacy(events, wall_seconds),
+        "incremental": await run_incremental(events, wall_seconds, interval),
+    }
+    print(
+        f"{args.actions} actions over {GAME_MINUTES} game minutes "
+        f"({args.wall_ratio:.1f} wall minutes per game minute), "
+        f"{args.edit_share:.0%} edited"
+    )
+    for name, (polls, sent, cpu) in results.items():
+        print(
+            f"{name:<12} polls/game-min={polls / GAME_MINUTES:7.1f}  "
+            f"bytes/game-min={sent / GAME_MINUTES:12,.0f}  "
+            f"cpu ms/game-min={cpu * 1000 / GAME_MINUTES:8.2f}"
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--actions", type=int, default=480)
+    parser.add_argument("--edit-share", type=float, default=0.05)
+    parser.add_argument("--wall-ratio", type=float, default=2.0)
+    parser.add_argument("--seed", type=int, default=2025)
+    asyncio.run(main_async(parser.parse_args()))
@@ -0,0 +1,132 @@
+"""
+Benchmark: player roster refresh, delete + iterrows vs. diffed bulk upsert.
+
+For each table size, loads the roster into a temporary SQLite database and
+then refreshes it with a copy where ``--change-share`` of the players moved
+team, a few retired and a few were added:
+
+  legacy  - the previous update_player_database body: delete every row, then
+            one db.add(Player(...)) per DataFrame row
+  upsert  - sync_players: in-memory diff, ON CONFLICT(person_id) DO UPDATE for
+            new/changed rows only, chunked delete for removed rows
+
+Usage (from nba_scoreboard_api/):
+    python test/bench_player_refresh.py --sizes 600 100000
+"""
+
+import argparse
+import os
+import random
+import sys
+import tempfile
+import time
+
+import pandas as pd
+from sqlalchemy import create_engine, func, select
+from sqlalchemy.orm import sessionmaker
+
+sys.path.append(os.path.join(os.path.dirname(os.path.dirname(__file__)), "api"))
+os.environ.setdefault("TESTING", "True")
+
+from app.core.database import Base
+from app.models.players import Player
+from app.services.players import sync_players
+
+TEAMS = [(f"Team {i}", f"T{i:02d}") for i in range(30)]
+
+
+def make_roster(n: int, rng: random.Random) -> pd.DataFrame:
+    teams = [rng.choice(TEAMS) for _ in range(n)]
+    return pd.DataFrame(
+        {
+            "PERSON_ID": range(1_000_000, 1_000_000 + n),
+            "DISPLAY_FIRST_LAST": [f"Player Number{i}" for i in range(n)],
+            "TEAM_NAME": [t[0] for t in teams],
+            "TEAM_ABBREVIATION": [t[1] for t in teams],
+        }
+    )
+
+
+def refreshed(
+    df: pd.DataFrame, change_share: float, rng: random.Random
+) -> pd.DataFrame:
+    df = df.copy()
+    n = len(df)
+    moved = rng.sample(range(n), max(1, int(n * change_share)))
+    for i in moved:
+        name, abbr = rng.choice(TEAMS)
+        df.at[i, "TEAM_NAME"] = name
+        df.at[i, "TEAM_ABBREVIATION"] = abbr
+    churn = max(1, n // 200)
+    df = df.drop(index=rng.sample(range(n), churn))
+    added = make_roster(churn, rng)
+    added["PERSON_ID"] += n
+    return pd.concat([df, added], ignore_index=True)
+
+
+def legacy_update(db, df_players):
+    """The previous update_player_database body."""
+    try:
+        db.query(Player).delete()
+        for _, row in df_players.iterrows():
+            db.add(
+                Player(
+                    person_id=row["PERSON_ID"],
+                    display_name=row["DISPLAY_FIRST_LAST"],
+                    team_name=row["TEAM_NAME"],
+                    team_abbreviation=row["TEAM_ABBREVIATION"],
+                )
+            )
+        db.commit()
+    except Exception:
+        db.rollback()
+        raise
+
+
+def timed(fn, *args):
+    start = time.perf_counter()
+    result = fn(*args)
+    return (time.perf_counter() - start) * 1000, result
+
+
+def run(size, change_share, seed, directory):
+    rng = random.Random(seed)
+    initial = make_roster(size, rng)
+    update = refreshed(initial, change_share, rng)
+
+    results = {}
+    for name, fn in (("legacy", legacy_update), ("upsert", sync_players)):
+        engine = create_engine(
+            f"sqlite:///{os.path.join(directory, f'{name}-{size}.db')}"
+        )
+        Base.metadata.create_all(engine)
+        db = sessionmaker(bind=engine)()
+        load_ms, _ = timed(fn, db, initial)
+        refresh_ms, counts = timed(fn, db, update)
+        rows = db.scalar(select(func.count()).select_from(Player))
+        db.close()
+        engine.dispose()
+        results[name] = (load_ms, refresh_ms, rows, counts)
+    return results
+
+
+def main(args):
+    with tempfile.TemporaryDirectory() as directory:
+        for size in args.sizes:
+            print(f"{size:,} players, {args.change_share:.0%} changed on refresh")
+            for name, (load_ms, refresh_ms, rows, counts) in run(
+                size, args.change_share, args.seed, directory
+            ).items():
+                print(
+                    f"  {name:<7} initial load={load_ms:10.1f}ms  "
+                    f"refresh={refresh_ms:10.1f}ms  "
+                    f"rows={rows:,}" + (f"  {counts}" if counts else "")
+                )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[600, 100_000])
+    parser.add_argument("--change-share", type=float, default=0.02)
+    parser.add_argument("--seed", type=int, default=2025)
+    main(parser.parse_args())
@@ -0,0 +1,222 @@
+"""
+Microbenchmark: player search lookups, ILIKE scan vs. in-memory index.
+
+Builds a synthetic ``--players`` name corpus (current plus historical players,
+with accented names) and times keystroke-style queries:
+
+  ilike  - the previous search_players: display_name ILIKE '%query%' on SQLite
+  index  - PlayerSearchIndex.search (prefix, word-prefix and trigram tiers)
+
+Usage (from nba_scoreboard_api/):
+    python test/bench_player_search.py --players 50000
+"""
+
+import argparse
+import os
+import random
+import statistics
+import sys
+import tempfile
+import time
+
+from sqlalchemy import create_engine, insert
+from sqlalchemy.orm import sessionmaker
+
+sys.path.append(os.path.join(os.path.dirname(os.path.dirname(__file__)), "api"))
+os.environ.setdefault("TESTING", "True")
+
+from app.core.database import Base
+from app.models.players import Player
+from app.schemas.players import PlayerBase
+from app.services.player_search import PlayerSearchIndex
+
+FIRST = [
+    "LeBron",
+    "Stephen",
+    "Kevin",
+    "Nikola",
+    "Luka",
+    "Giannis",
+    "Jayson",
+    "Joel",
+    "Anthony",
+    "James",
+    "Chris",
+    "Michael",
+    "Kareem",
+    "Wilt",
+    "Bill",
+    "Larry",
+    "Magic",
+    "Dražen",
+    "Šarūnas",
+    "Toni",
+    "Dāvis",
+    "Jonas",
+    "Bogdan",
+    "José",
+    "D'Angelo",
+    "P.J.",
+    "De'Aaron",
+    "Shai",
+    "Tyrese",
+    "Zion",
+    "Ja",
+    "Jalen",
+    "Jrue",
+    "Karl-Anthony",
+    "Domantas",
+    "Alperen",
+    "Victor",
+    "Kristaps",
+    "Goran",
+]
+LAST = [
+    "James",
+    "Curry",
+    "Durant",
+    "Jokić",
+    "Dončić",
+    "Antetokounmpo",
+    "Tatum",
+    "Embiid",
+    "Davis",
+    "Harden",
+    "Paul",
+    "Jordan",
+    "Abdul-Jabbar",
+    "Chamberlain",
+    "Russell",
+    "Bird",
+    "Johnson",
+    "Petrović",
+    "Marčiulionis",
+    "Kukoč",
+    "Bertāns",
+    "Valančiūnas",
+    "Bogdanović",
+    "Calderón",
+    "Russell",
+    "Tucker",
+    "Fox",
+    "Gilgeous-Alexander",
+    "Haliburton",
+    "Williamson",
+    "Morant",
+    "Brunson",
+    "Holiday",
+    "Towns",
+    "Sabonis",
+    "Şengün",
+    "Wembanyama",
+    "Porziņģis",
+    "Dragić",
+]
+QUERIES = [
+    "le",
+    "leb",
+    "lebron",
+    "lebron ja",
+    "james",
+    "jokic",
+    "joki",
+    "doncic",
+    "luka don",
+    "gilgeous",
+    "sengun",
+    "wemby",
+    "porzingis",
+    "shai gil",
+    "lebrn jmes",
+    "antetokunmpo",
+    "zz",
+]
+
+
+def make_players(n: int, rng: random.Random):
+    players = []
+    for i in range(n):
+        first, last = rng.choice(FIRST), rng.choice(LAST)
+        # Most of the corpus is historical; suffix to keep names distinct
+        name = (
+            f"{first} {last}"
+            if i < 600
+            else f"{first} {last} {rng.choice(LAST)[:rng.randint(3, 8)]}{i}"
+        )
+        players.append(
+            PlayerBase(
+                person_id=i + 1,
+                display_name=name,
+                team_name="Lakers" if i < 600 else "",
+                team_abbreviation="LAL" if i < 600 else "",
+            )
+        )
+    return players
+
+
+def timed(fn, query, repeat):
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = fn(query)
+        samples.append((time.perf_counter() - start) * 1000)
+    return statistics.median(samples), len(result)
+
+
+def main(args):
+    rng = random.Random(args.seed)
+    players = make_players(args.players, rng)
+
+    index = PlayerSearchIndex()
+    start = time.perf_counter()
+    index.build(players)
+    print(
+        f"{args.players:,} players, index built "
+        f"in {(time.perf_counter() - start) * 1000:.0f}ms"
+    )
+
+    with tempfile.TemporaryDirectory() as directory:
+        engine = create_engine(f"sqlite:///{os.path.join(directory, 'players.db')}")
+        Base.metadata.create_all(engine)
+        db = sessionmaker(bind=engine)()
+        db.execute(insert(Player), [p.model_dump() for p in players])
+        db.commit()
+
+        def ilike(query):
+            return (
+                db.query(Player).filter(Player.display_name.ilike(f"%{query}%")).all()
+            )
+
+        def search(query):
+            return index.search(query, args.limit)
+
+        print(
+            f"{'query':<16} {'ilike ms':>10} {'rows':>6} "
+            f"{'index ms':>10} {'rows':>5}  top hit"
+        )
+        index_times = []
+        for query in QUERIES:
+            ilike_ms, ilike_rows = timed(ilike, query, max(1, args.repeat // 20))
+            index_ms, index_rows = timed(search, query, args.repeat)
+            index_times.append(index_ms)
+            top = search(query)
+            print(
+                f"{query:<16} {ilike_ms:>10.3f} {ilike_rows:>6} "
+                f"{index_ms:>10.3f} {index_rows:>5}  "
+                f"{top[0].display_name if top else '-'}"
+            )
+        db.close()
+        engine.dispose()
+    print(
+        f"index median {statistics.median(index_times):.3f}ms, "
+        f"max {max(index_times):.3f}ms"
+    )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--players", type=int, default=50_000)
+    parser.add_argument("--limit", type=int, default=25)
+    parser.add_argument("--repeat", type=int, default=200)
+    parser.add_argument("--seed", type=int, default=2025)
+    main(parser.parse_args())
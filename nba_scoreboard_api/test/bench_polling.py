@@ -0,0 +1,349 @@
+"""
+Benchmark: upstream scoreboard calls over a game night, fixed vs. state-driven polling.
+
+Replays a recorded game night of the live scoreboard (``--recording``, made
+with ``manage.py record-night``) in virtual time through the app's
+ReplaySource and get_live_games. Without a recording, a simulated
+night is generated first (and kept with ``--save``): 24 hours from 06:00
+ET, ``--games`` games tipping off between 19:00 and 22:30 ET, each played
+out second by second with running clock, dead balls, timeouts, quarter
+breaks, halftime and overtime when tied. Two polling loops run against it:
+
+  legacy  - the previous loop: 1s to start, x0.9 after a poll that changed
+            the scoreboard, x1.1 otherwise, clamped to 0.5-3s
+  policy  - ScoreboardPollPolicy (idle when nothing is live or scheduled
+            soon, pregame ramp-up, clutch, stoppages, breaks, halftime)
+
+Reports upstream calls per phase of the day and how long score changes take
+to show up (all of them, and those in clutch time).
+
+Usage (from nba_scoreboard_api/):
+    python test/bench_polling.py --games 11 --seed 2025 [--save night.jsonl.gz]
+    python test/bench_polling.py --recording api/recordings/upstream.jsonl.gz
+"""
+
+import argparse
+import asyncio
+import bisect
+import json
+import math
+import os
+import random
+import statistics
+import sys
+import tempfile
+from datetime import datetime, timedelta, timezone
+
+sys.path.append(os.path.join(os.path.dirname(os.path.dirname(__file__)), "api"))
+os.environ.setdefault("TESTING", "True")
+
+from nba_api.live.nba.endpoints import scoreboard
+
+from app.services.polling import ScoreboardPollPolicy
+from app.services.scoreboard import get_live_games, parse_game_clock
+from app.services.sources import ReplaySource, open_recording, request_key
+from app.services.upstream import upstream_client
+
+ET = timezone(timedelta(hours=-5))
+DAY_START = datetime(2025, 2, 27, 6, 0, tzinfo=ET).timestamp()
+DAY_LENGTH = 24 * 60 * 60
+TIPOFFS_ET = [
+    "19:00",
+    "19:00",
+    "19:00",
+    "19:30",
+    "19:30",
+    "19:30",
+    "20:00",
+    "20:00",
+    "21:00",
+    "22:00",
+    "22:30",
+]
+FEED_PHASE = 0.37  # Seconds past the second at which the simulated feed is republished
+SCOREBOARD_KEY = request_key(scoreboard.ScoreBoard, (), {})
+
+
+class SimulatedGame:
+    """One game's scoreboard states as a timeline of change points."""
+
+    def __init__(self, index, tipoff, rng):
+        self.index = index
+        self.game_time = datetime.fromtimestamp(tipoff, tz=timezone.utc)
+        self.times = []
+        self.states = []  # (status, period, clock seconds, home, away)
+
+        t = tipoff + rng.uniform(0, 8 * 60)  # Tip-offs run late
+        self._emit(DAY_START, (1, 0, None, 0, 0))
+        home = away = 0
+        period = 0
+        while period < 4 or home == away:
+            period += 1
+            clock = 720 if period <= 4 else 300
+            while clock > 0:
+                # A stretch of running clock, then a dead ball or timeout
+                run = min(clock, int(rng.uniform(15, 60)))
+                for _ in range(run):
+                    clock -= 1
+                    t += 1
+                    if rng.random() < 0.035:
+                        points = rng.choices((1, 2, 3), (0.1, 0.65, 0.25))[0]
+                        # The trailing team scores slightly more often
+                        if rng.random() < (
+                            0.56 if home < away else 0.44 if home > away else 0.5
+                        ):
+                            home += points
+                        else:
+                            away += points
+                    self._emit(t, (2, period, clock, home, away))
+                if clock > 0:
+                    t += (
+                        rng.uniform(75, 150)
+                        if rng.random() < 0.12
+                        else rng.uniform(5, 30)
+                    )
+            if period >= 4 and home != away:
+                break
+            t += 15 * 60 if period == 2 else 130
+            self._emit(t, (2, period + 1, 720 if period < 4 else 300, home, away))
+        self._emit(t + 20, (3, period, 0, home, away))
+
+    def _emit(self, t, state):
+        self.times.append(t)
+        self.states.append(state)
+
+    def live_json(self, t):
+        """The game as it appears in NBA.com's live scoreboard at ``t``."""
+        status, period, clock, home, away = self.states[
+            bisect.bisect_right(self.times, t) - 1
+        ]
+        return {
+            "gameId": f"00224008{self.index:02d}",
+            "gameStatus": status,
+            "gameStatusText": "",
+            "period": period,
+            "gameClock": (
+                "" if clock is None else f"PT{clock // 60:02d}M{clock % 60:02d}.00S"
+            ),
+            "gameTimeUTC": self.game_time.strftime("%Y-%m-%dT%H:%M:%SZ"),
+            "homeTeam": {
+                "teamId": 1610612737 + 2 * self.index,
+                "teamName": f"Home {self.index}",
+                "teamCity": "City",
+                "teamTricode": f"H{self.index:02d}",
+                "score": home,
+            },
+            "awayTeam": {
+                "teamId": 1610612738 + 2 * self.index,
+                "teamName": f"Away {self.index}",
+                "teamCity": "City",
+                "teamTricode": f"A{self.index:02d}",
+                "score": away,
+            },
+        }
+
+
+def simulate_night(path, n_games, seed):
+    """Write a simulated game night as a scoreboard recording."""
+    rng = random.Random(seed)
+    games = []
+    for i in range(n_games):
+        hour, minute = map(int, TIPOFFS_ET[i % len(TIPOFFS_ET)].split(":"))
+        tipoff = datetime(2025, 2, 27, hour, minute, tzinfo=ET).timestamp()
+        games.append(SimulatedGame(i, tipoff, rng))
+
+    # NBA.com republishes the live feed once a second; a change shows up at the
+    # next publish
+    changes = sorted(
+        {
+            math.ceil(t - FEED_PHASE) + FEED_PHASE
+            for game in games
+            for t in game.times
+            if t < DAY_START + DAY_LENGTH - 1
+        }
+    )
+    with open_recording(path, "w") as file:
+        file.write(json.dumps({"recording": 1, "started": DAY_START}) + "\n")
+        for t in changes:
+            board = {
+                "scoreboard": {
+                    "gameDate": "2025-02-27",
+                    "games": [game.live_json(t) for game in games],
+                }
+            }
+            file.write(
+                json.dumps(
+                    {
+                        "t": t - DAY_START,
+                        "endpoint": "scoreboard",
+                        "key": SCOREBOARD_KEY,
+                        "elapsed": 0.05,
+                        "url": None,
+                        "response": json.dumps(board),
+                    }
+                )
+                + "\n"
+            )
+        # Keep the night going until 06:00 the next day
+        file.write(
+            json.dumps(
+                {
+                    "t": DAY_LENGTH,
+                    "endpoint": "scoreboard",
+                    "key": SCOREBOARD_KEY,
+                    "elapsed": 0.05,
+                    "url": None,
+                    "response": json.dumps(board),
+                }
+            )
+            + "\n"
+        )
+
+
+def night_events(source):
+    """A recording's score changes (flagged if in clutch time), tip-offs and phases."""
+    scores, clutch_scores, tipoffs = [], [], []
+    previous = {}
+    first_tip = last_final = None
+    for position in source.times(SCOREBOARD_KEY):
+        board = json.loads(source.record_at(SCOREBOARD_KEY, position)["response"])
+        games = board["scoreboard"]["games"]
+        for game in games:
+            home, away = game["homeTeam"]["score"], game["awayTeam"]["score"]
+            before = previous.get(game["gameId"])
+            if before is not None and before[1:] != (home, away):
+                scores.append(position)
+                seconds = parse_game_clock(game["gameClock"])
+                if (
+                    game["period"] >= 4
+                    and seconds is not None
+                    and seconds <= 300
+                    and abs(home - away) <= 5
+                ):
+                    clutch_scores.append(position)
+            if before is not None and before[0] == 1 and game["gameStatus"] == 2:
+                tipoffs.append(position)
+            previous[game["gameId"]] = (game["gameStatus"], home, away)
+            tip = (
+                datetime.fromisoformat(
+                    game["gameTimeUTC"].replace("Z", "+00:00")
+                ).timestamp()
+                - source.started
+            )
+            first_tip = tip if first_tip is None else min(first_tip, tip)
+        if (
+            games
+            and last_final is None
+            and all(game["gameStatus"] == 3 for game in games)
+        ):
+            last_final = position
+    phases = [
+        ("before games", 0, first_tip - 30 * 60),
+        ("pregame", first_tip - 30 * 60, first_tip),
+        ("games", first_tip, last_final or source.duration),
+        ("after finals", last_final or source.duration, source.duration),
+    ]
+    return scores, clutch_scores, tipoffs, phases
+
+
+async def legacy_loop(source, clock):
+    """The previous fetch_scoreboard_updates interval logic, in virtual time."""
+    interval, previous, polls = 1.0, None, []
+    while clock[0] < source.duration:
+        polls.append(clock[0])
+        games = await get_live_games()
+        key = [
+            (
+                g["game_status"],
+                g["period"],
+                g["clock"],
+                g["home_team"]["score"],
+                g["away_team"]["score"],
+            )
+            for g in games
+        ]
+        if key != previous:
+            interval = max(0.5, interval * 0.9)
+        else:
+            interval = min(3.0, interval * 1.1)
+        previous = key
+        clock[0] += interval
+    return polls
+
+
+async def policy_loop(source, clock):
+    policy, polls = ScoreboardPollPolicy(), []
+    while clock[0] < source.duration:
+        polls.append(clock[0])
+        games = await get_live_games()
+        policy.observe(games, source.started + clock[0])
+        clock[0] += policy.interval(source.started + clock[0])
+    return polls
+
+
+def lags(polls, events):
+    result = []
+    for t in events:
+        i = bisect.bisect_left(polls, t)
+        if i < len(polls):
+            result.append(polls[i] - t)
+    return result
+
+
+def describe(values):
+    if not values:
+        return "n/a"
+    values = sorted(values)
+    return (
+        f"mean {statistics.mean(values):5.2f}s  "
+        f"p95 {values[int(len(values) * 0.95)]:5.2f}s  "
+        f"max {values[-1]:6.2f}s"
+    )
+
+
+async def main_async(args):
+    directory = None
+    path = args.recording
+    if path is None:
+        directory = tempfile.TemporaryDirectory()
+        path = args.save or os.path.join(directory.name, "night.jsonl")
+        simulate_night(path, args.games, args.seed)
+
+    clock = [0.0]
+    source = ReplaySource(path, clock=lambda: clock[0])
+    upstream_client.source = source
+    scores, clutch_scores, tipoffs, phases = night_events(source)
+    print(
+        f"{path if args.recording else f'simulated night, {args.games} games'}: "
+        f"{source.duration / 3600:.1f}h, {len(scores)} score changes "
+        f"({len(clutch_scores)} in clutch time)"
+    )
+
+    for name, loop in (("legacy", legacy_loop), ("policy", policy_loop)):
+        clock[0] = 0.0
+        polls = await loop(source, clock)
+        counts = "  ".join(
+            f"{phase} {sum(start <= t < end for t in polls):6d}"
+            for phase, start, end in phases
+        )
+        print(f"{name:<7} calls {len(polls):6d}  ({counts})")
+        print(f"        score change lag:  {describe(lags(polls, scores))}")
+        print(f"        clutch score lag:  {describe(lags(polls, clutch_scores))}")
+        print(f"        tip-off lag:       {describe(lags(polls, tipoffs))}")
+
+    upstream_client.shutdown()
+    if directory is not None:
+        directory.cleanup()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument(
+        "--recording", help="Replay this recording instead of a simulated night"
+    )
+    parser.add_argument(
+        "--save", help="Keep the simulated night's recording at this path"
+    )
+    parser.add_argument("--games", type=int, default=11)
+    parser.add_argument("--seed", type=int, default=2025)
+    asyncio.run(main_async(parser.parse_args()))
@@ -0,0 +1,179 @@
+"""
+Benchmark: read latency during a concurrent roster refresh, per SQLite storage profile.
+
+Loads ``--players`` players into a temporary SQLite database, then runs
+``--refreshes`` roster refreshes from a separate process (like the
+manage.py jobs; a thread would mostly measure GIL contention) while
+``--readers`` async tasks on the read-only pool keep looking up players and
+counting team rosters. Reads failing with "database is locked" (waited
+longer than SQLITE_BUSY_TIMEOUT_MS) are counted as errors:
+
+  default - SQLite's stock settings: rollback journal, synchronous=FULL.
+            Readers wait whenever the writer holds the exclusive lock
+            (commit, or earlier once its page cache spills).
+  tuned   - WAL, synchronous=NORMAL, mmap and a larger page cache; readers
+            see the last committed snapshot while the writer works.
+
+Each profile is run with both writers from bench_player_refresh: ``upsert``
+(sync_players) and ``legacy`` (delete every row, then re-insert).
+
+Usage (from nba_scoreboard_api/):
+    python test/bench_sqlite_profile.py --players 20000 --readers 8 --refreshes 3
+"""
+
+import argparse
+import asyncio
+import multiprocessing
+import os
+import random
+import statistics
+import sys
+import tempfile
+import time
+
+from sqlalchemy import create_engine, func, select
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+
+sys.path.append(os.path.join(os.path.dirname(os.path.dirname(__file__)), "api"))
+sys.path.append(os.path.dirname(__file__))
+os.environ.setdefault("TESTING", "True")
+
+from bench_player_refresh import TEAMS, legacy_update, make_roster, refreshed
+
+from app.core.config import get_settings
+from app.core.database import Base, configure_sqlite
+from app.models.players import Player
+from app.services.players import sync_players
+
+WRITERS = {"upsert": sync_players, "legacy": legacy_update}
+
+
+def percentile(values, share):
+    values = sorted(values)
+    return values[min(len(values) - 1, int(len(values) * share))]
+
+
+def refresh_process(path, profile, writer_name, rosters, durations, done):
+    engine = create_engine(f"sqlite:///{path}")
+    configure_sqlite(engine, profile)
+    make_session = sessionmaker(bind=engine)
+    try:
+        for roster in rosters:
+            db = make_session()
+            start = time.perf_counter()
+            try:
+                WRITERS[writer_name](db, roster)
+            finally:
+                db.close()
+            durations.put((time.perf_counter() - start) * 1000)
+    finally:
+        engine.dispose()
+        done.set()
+
+
+async def reader(make_session, person_ids, done, latencies, errors, rng):
+    while not done.is_set():
+        start = time.perf_counter()
+        try:
+            async with make_session() as db:
+                await db.scalar(
+                    select(Player).where(Player.person_id == rng.choice(person_ids))
+                )
+                await db.scalar(
+                    select(func.count())
+                    .select_from(Player)
+                    .where(Player.team_abbreviation == rng.choice(TEAMS)[1])
+                )
+        except OperationalError:
+            errors.append(start)
+            continue
+        latencies.append((time.perf_counter() - start) * 1000)
+
+
+async def run(profile, writer_name, args):
+    rng = random.Random(args.seed)
+    roster = make_roster(args.players, rng)
+    rosters = [refreshed(roster, args.change_share, rng) for _ in range(args.refreshes)]
+    person_ids = roster["PERSON_ID"].tolist()
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "players.db")
+        engine = create_engine(f"sqlite:///{path}")
+        configure_sqlite(engine, profile)
+        Base.metadata.create_all(engine)
+        db = sessionmaker(bind=engine)()
+        sync_players(db, roster)
+        db.close()
+        engine.dispose()
+
+        settings = get_settings()
+        read_engine = create_async_engine(
+            f"sqlite+aiosqlite:///{path}",
+            poolclass=AsyncAdaptedQueuePool,
+            pool_size=settings.ASYNC_DB_READ_POOL_SIZE,
+            max_overflow=settings.ASYNC_DB_MAX_OVERFLOW,
+            pool_timeout=settings.ASYNC_DB_POOL_TIMEOUT,
+        )
+        configure_sqlite(read_engine.sync_engine, profile, read_only=True)
+        make_read_session = async_sessionmaker(bind=read_engine)
+
+        context = multiprocessing.get_context("spawn")
+        done, durations = context.Event(), context.Queue()
+        latencies, errors = [], []
+        process = context.Process(
+            target=refresh_process,
+            args=(path, profile, writer_name, rosters, durations, done),
+        )
+        process.start()
+        start = time.perf_counter()
+        await asyncio.gather(
+            *(
+                reader(
+                    make_read_session,
+                    person_ids,
+                    done,
+                    latencies,
+                    errors,
+                    random.Random(i),
+                )
+                for i in range(args.readers)
+            )
+        )
+        elapsed = time.perf_counter() - start
+        process.join()
+        await read_engine.dispose()
+        refreshes = [durations.get() for _ in range(durations.qsize())]
+
+    print(
+        f"{profile:<8} {writer_name:<7} "
+        f"refresh p50={statistics.median(refreshes) if refreshes else 0:7.0f}ms  "
+        f"reads={len(latencies) / elapsed:6.0f}/s  "
+        f"p50={statistics.median(latencies):7.2f}ms  "
+        f"p99={percentile(latencies, 0.99):8.2f}ms  max={max(latencies):8.2f}ms  "
+        f"locked errors={len(errors)}"
+    )
+
+
+async def main_async(args):
+    print(
+        f"{args.players:,} players, {args.readers} readers, {args.refreshes} refreshes"
+    )
+    for writer_name in args.writers:
+        for profile in ("default", "tuned"):
+            await run(profile, writer_name, args)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--players", type=int, default=20_000)
+    parser.add_argument("--readers", type=int, default=8)
+    parser.add_argument("--refreshes", type=int, default=3)
+    parser.add_argument("--change-share", type=float, default=0.2)
+    parser.add_argument(
+        "--writers", nargs="+", choices=list(WRITERS), default=list(WRITERS)
+    )
+    parser.add_argument("--seed", type=int, default=2025)
+    asyncio.run(main_async(parser.parse_args()))
@@ -0,0 +1,202 @@
+"""
+Benchmark: time until the app accepts traffic, blocking vs. background startup.
+
+Enters the app's lifespan against a temporary SQLite database with NBA.com
+replaced by fake CommonAllPlayers / LeagueStandings endpoints that block for
+``--upstream-latency`` (or fail after it with ``--upstream-down``):
+
+  legacy      - the previous lifespan: ``alembic upgrade head`` subprocess,
+                then await the player and standings refreshes
+  background  - init_db (in-process migration only if the revision differs),
+                refreshes run as scheduler jobs
+
+Each is run on a cold start (empty database) and a warm restart (schema at
+head, data present). "ready" is when the lifespan yields; "fresh" is when
+the background refreshes have finished.
+
+Usage (from nba_scoreboard_api/):
+    python test/bench_startup.py --upstream-latency 2.0 [--upstream-down]
+"""
+
+import argparse
+import asyncio
+import glob
+import os
+import random
+import subprocess
+import sys
+import tempfile
+import time
+
+import pandas as pd
+
+directory = tempfile.mkdtemp()
+DB_PATH = os.path.join(directory, "startup.db")
+os.environ["SQLALCHEMY_DATABASE_URL"] = f"sqlite:///{DB_PATH}"
+sys.path.append(os.path.join(os.path.dirname(os.path.dirname(__file__)), "api"))
+sys.path.append(os.path.dirname(__file__))
+os.environ.setdefault("TESTING", "True")
+
+from bench_player_refresh import make_roster
+
+import main
+from app.core import database
+from app.core.config import get_settings
+from app.services import jobs
+from app.services import players as players_service
+from app.services import standings as standings_service
+from app.services.freshness import freshness
+from app.services.standings import STANDINGS_COLUMNS
+
+UPSTREAM_LATENCY = 2.0
+UPSTREAM_DOWN = False
+
+
+def upstream_call():
+    time.sleep(UPSTREAM_LATENCY)
+    if UPSTREAM_DOWN:
+        raise ConnectionError("NBA.com timed out")
+
+
+class FakeFrame:
+    def __init__(self, df):
+        self._df = df
+
+    def get_data_frame(self):
+        return self._df
+
+
+class FakeCommonAllPlayers:
+    def __init__(self, **kwargs):
+        upstream_call()
+        self.common_all_players = FakeFrame(make_roster(600, random.Random(1)))
+
+
+class FakeLeagueStandings:
+    def __init__(self, **kwargs):
+        upstream_call()
+        rows = []
+        for i in range(30):
+            row = {column: f"{i}-{30 - i}" for column in STANDINGS_COLUMNS.values()}
+            row.update(
+                {
+                    "TeamID": 1610612737 + i,
+                    "TeamCity": f"City {i}",
+                    "TeamName": f"Team {i}",
+                    "Conference": "East" if i < 15 else "West",
+                    "Division": [
+                        "Atlantic",
+                        "Central",
+                        "Southeast",
+                        "Northwest",
+                        "Pacific",
+                        "Southwest",
+                    ][i // 5],
+                    "WINS": 30 + i,
+                    "LOSSES": 52 - i,
+                    "WinPCT": (30 + i) / 82,
+                    "ConferenceGamesBack": float(i),
+                    "PlayoffRank": i % 15 + 1,
+                    "DivisionRank": i % 5 + 1,
+                    "PointsPG": 110.0,
+                    "OppPointsPG": 108.0,
+                }
+            )
+            rows.append(row)
+        self.standings = FakeFrame(pd.DataFrame(rows))
+
+
+async def idle():
+    return True
+
+
+async def legacy_startup():
+    """The previous lifespan startup."""
+    subprocess.run(
+        ["alembic", "upgrade", "head"],
+        check=True,
+        capture_output=True,
+        cwd=get_settings().PROJECT_ROOT,
+    )
+    async with database.AsyncSessionLocal() as db:
+        await players_service.update_player_database(db)
+        await standings_service.update_standings_database(db)
+
+
+def reset_database():
+    database.engine.dispose()
+    for path in glob.glob(DB_PATH + "*"):
+        os.remove(path)
+
+
+async def run(mode, cold):
+    if cold:
+        reset_database()
+    datasets = [freshness.register(name, 0) for name in ("players", "standings")]
+    previous = [dataset.last_attempt for dataset in datasets]
+
+    start = time.perf_counter()
+    if mode == "legacy":
+        try:
+            await legacy_startup()
+            ready = time.perf_counter() - start
+            result = f"ready {ready * 1000:8.0f}ms"
+        except Exception as e:
+            result = (
+                f"startup FAILED after {(time.perf_counter() - start) * 1000:.0f}ms "
+                f"({type(e).__name__})"
+            )
+        await database.async_engine.dispose()
+        main.upstream_client.shutdown()
+    else:
+        async with main.lifespan(main.app):
+            ready = time.perf_counter() - start
+            while any(
+                dataset.last_attempt == before or dataset.refreshing
+                for dataset, before in zip(datasets, previous)
+            ):
+                await asyncio.sleep(0.01)
+            fresh = time.perf_counter() - start
+            errors = [dataset.last_error for dataset in datasets if dataset.last_error]
+        result = f"ready {ready * 1000:8.0f}ms  " + (
+            f"refresh failed after {fresh * 1000:.0f}ms (serving SQLite data)"
+            if errors
+            else f"fresh {fresh * 1000:8.0f}ms"
+        )
+    print(f"{mode:<11} {'cold' if cold else 'warm':<5} {result}")
+
+
+async def main_async(args):
+    global UPSTREAM_LATENCY, UPSTREAM_DOWN
+    UPSTREAM_LATENCY = args.upstream_latency
+    UPSTREAM_DOWN = args.upstream_down
+    players_service.commonallplayers.CommonAllPlayers = FakeCommonAllPlayers
+    standings_service.leaguestandings.LeagueStandings = FakeLeagueStandings
+    jobs.scoreboard_poller.poll = idle
+    jobs.refresh_game_log_store = idle
+    get_settings().TESTING = False
+    print(
+        f"simulated NBA.com: {args.upstream_latency * 1000:.0f}ms per call"
+        + (", then failing" if args.upstream_down else "")
+    )
+
+    for mode in ("legacy", "background"):
+        # A warm restart needs a migrated, populated database
+        UPSTREAM_DOWN = False
+        reset_database()
+        database.init_db()
+        async with database.AsyncSessionLocal() as db:
+            await players_service.update_player_database(db)
+            await standings_service.update_standings_database(db)
+        UPSTREAM_DOWN = args.upstream_down
+        await run(mode, cold=False)
+        await run(mode, cold=True)
+    reset_database()
+    os.rmdir(directory)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--upstream-latency", type=float, default=2.0)
+    parser.add_argument("--upstream-down", action="store_true")
+    asyncio.run(main_async(parser.parse_args()))
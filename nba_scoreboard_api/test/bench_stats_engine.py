@@ -0,0 +1,148 @@
+"""
+Benchmark: season aggregates and leaderboards, per-player queries vs. the stats engine.
+
+Fills a temporary SQLite player_game_logs store with a synthetic season
+(``--players`` x ``--games`` rows, ~26k by default) and times:
+
+  naive   - a points-per-game leaderboard built by querying each player's
+            games (get_recent_game_logs) and averaging them in Python
+  groupby - the same leaderboard via read_sql + pandas groupby per request
+  engine  - SeasonStatsEngine: one load, then leaders (per game / per 36),
+            player averages and rolling windows from the in-memory arrays
+
+Usage (from nba_scoreboard_api/):
+    python test/bench_stats_engine.py --players 500 --games 52 --requests 200
+"""
+
+import argparse
+import os
+import random
+import statistics
+import sys
+import tempfile
+import time
+
+import pandas as pd
+from sqlalchemy import create_engine, select
+from sqlalchemy.orm import sessionmaker
+
+sys.path.append(os.path.join(os.path.dirname(os.path.dirname(__file__)), "api"))
+sys.path.append(os.path.dirname(__file__))
+os.environ.setdefault("TESTING", "True")
+
+from bench_game_logs import make_season
+
+from app.core.config import get_settings
+from app.core.database import Base
+from app.models.players import PlayerGameLog
+from app.services import game_logs
+from app.services.stats_engine import SeasonStatsEngine
+
+
+def timed(fn, repeat):
+    latencies = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = fn()
+        latencies.append((time.perf_counter() - start) * 1000)
+    latencies.sort()
+    return result, latencies
+
+
+def report(name, latencies):
+    print(
+        f"{name:<24} runs={len(latencies):<5} "
+        f"p50={statistics.median(latencies):9.3f}ms  "
+        f"max={latencies[-1]:9.3f}ms"
+    )
+
+
+def naive_leaders(db, player_ids, season, limit):
+    averages = []
+    for person_id in player_ids:
+        games = game_logs.get_recent_game_logs(db, person_id, 82, season)
+        averages.append((sum(g.pts for g in games) / len(games), person_id))
+    averages.sort(key=lambda item: (-item[0], item[1]))
+    return [person_id for _, person_id in averages[:limit]]
+
+
+def groupby_leaders(db, season, limit):
+    frame = pd.read_sql_query(
+        select(PlayerGameLog.person_id, PlayerGameLog.pts).where(
+            PlayerGameLog.season == season
+        ),
+        db.connection(),
+    )
+    means = frame.groupby("person_id")["pts"].mean().reset_index()
+    means = means.sort_values(["pts", "person_id"], ascending=[False, True])
+    return means["person_id"].head(limit).tolist()
+
+
+def main(args):
+    season = get_settings().NBA_SEASON
+    rows = game_logs.game_log_rows(
+        make_season(args.players, args.games, args.seed),
+        season,
+        game_logs.REGULAR_SEASON,
+    )
+    print(f"{len(rows):,} player-games, {args.players} players")
+
+    rng = random.Random(args.seed)
+    player_ids = sorted({row["person_id"] for row in rows})
+    sample = [rng.choice(player_ids) for _ in range(args.requests)]
+    with tempfile.TemporaryDirectory() as directory:
+        engine = create_engine(f"sqlite:///{os.path.join(directory, 'logs.db')}")
+        Base.metadata.create_all(engine)
+        db = sessionmaker(bind=engine)()
+        game_logs.store_game_logs(db, rows)
+
+        naive, latencies = timed(
+            lambda: naive_leaders(db, player_ids, season, args.limit), 3
+        )
+        report("naive leaders", latencies)
+        grouped, latencies = timed(lambda: groupby_leaders(db, season, args.limit), 10)
+        report("groupby leaders", latencies)
+
+        stats = SeasonStatsEngine()
+        _, latencies = timed(lambda: stats.load(db, season), 5)
+        report("engine load", latencies)
+        leaders, latencies = timed(
+            lambda: stats.leaders("pts", "per_game", args.limit), args.requests
+        )
+        report("engine leaders", latencies)
+        assert [person_id for person_id, _, _ in leaders] == naive == grouped
+        _, latencies = timed(
+            lambda: stats.leaders(
+                "reb", "per_36", args.limit, min_games=args.games // 2
+            ),
+            args.requests,
+        )
+        report("engine per-36 leaders", latencies)
+        _, latencies = timed(
+            lambda: stats.leaders("fg_pct", "per_game", args.limit), args.requests
+        )
+        report("engine fg% leaders", latencies)
+
+        samples = iter(sample * 2)
+        _, latencies = timed(
+            lambda: stats.player_averages(next(samples), args.window), args.requests
+        )
+        report("engine player averages", latencies)
+        _, latencies = timed(
+            lambda: stats.rolling(next(samples), "pts", args.window), args.requests
+        )
+        report("engine rolling", latencies)
+
+        db.close()
+        engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--players", type=int, default=500)
+    parser.add_argument("--games", type=int, default=52)
+    parser.add_argument("--requests", type=int, default=200)
+    parser.add_argument("--limit", type=int, default=10)
+    parser.add_argument("--window", type=int, default=10)
+    parser.add_argument("--seed", type=int, default=2025)
+    main(parser.parse_args())
@@ -0,0 +1,143 @@
+"""
+Benchmark: per-poll cost of turning the upstream scoreboard into the frame
+sent to clients.
+
+Builds ``--polls`` snapshots of NBA.com's live scoreboard for a ``--games``
+game night (bench_polling's simulated games, sampled every few seconds from
+before tip-off to the last final) and maps each to the wire representation:
+
+  models     - the previous path: TeamGameInfo/GameBrief/ScoreboardResponse
+               with dateutil-parsed game times, then model_dump()
+  transform  - app.services.transform.scoreboard_games, one pass to dicts
+
+Reported per poll: CPU time of the mapping alone and together with
+encode_frame (median of ``--rounds``), and the peak memory allocated
+(tracemalloc). Checks that both paths produce identical frames.
+
+Usage (from nba_scoreboard_api/):
+    python test/bench_transform.py --games 15 --polls 2000 --rounds 5
+"""
+
+import argparse
+import os
+import random
+import statistics
+import sys
+import time
+import tracemalloc
+from datetime import datetime
+
+sys.path.append(
+    os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "api")
+)
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+os.environ.setdefault("TESTING", "True")
+
+from bench_polling import ET, TIPOFFS_ET, SimulatedGame
+from dateutil import parser as date_parser
+
+from app.schemas.scoreboard import GameBrief, ScoreboardResponse, TeamGameInfo
+from app.services.broadcast import encode_frame
+from app.services.transform import scoreboard_games
+
+
+def make_polls(n_games, n_polls, seed):
+    """Upstream ``games`` lists, evenly spread over the night."""
+    rng = random.Random(seed)
+    games = []
+    for i in range(n_games):
+        hour, minute = map(int, TIPOFFS_ET[i % len(TIPOFFS_ET)].split(":"))
+        tipoff = datetime(2025, 2, 27, hour, minute, tzinfo=ET).timestamp()
+        games.append(SimulatedGame(i, tipoff, rng))
+    start = min(game.times[1] for game in games) - 30 * 60
+    end = max(game.times[-1] for game in games) + 60
+    step = (end - start) / n_polls
+    return [
+        [game.live_json(start + i * step) for game in games] for i in range(n_polls)
+    ]
+
+
+def models(games_data):
+    """The previous get_live_scoreboard followed by model_dump()["games"]."""
+    games = []
+    for game in games_data:
+        home_team = TeamGameInfo(
+            team_id=str(game["homeTeam"]["teamId"]),
+            team_name=game["homeTeam"]["teamName"],
+            team_city=game["homeTeam"]["teamCity"],
+            team_tricode=game["homeTeam"]["teamTricode"],
+            score=game["homeTeam"].get("score", 0),
+        )
+        away_team = TeamGameInfo(
+            team_id=str(game["awayTeam"]["teamId"]),
+            team_name=game["awayTeam"]["teamName"],
+            team_city=game["awayTeam"]["teamCity"],
+            team_tricode=game["awayTeam"]["teamTricode"],
+            score=game["awayTeam"].get("score", 0),
+        )
+        games.append(
+            GameBrief(
+                game_id=str(game["gameId"]),
+                game_status=game["gameStatus"],
+                period=game.get("period", 0),
+                clock=game.get("gameClock"),
+                game_time=date_parser.parse(game["gameTimeUTC"]),
+                home_team=home_team,
+                away_team=away_team,
+            )
+        )
+    return ScoreboardResponse(games=games, total_games=len(games)).model_dump()["games"]
+
+
+def cpu_per_poll(fn, polls, encode):
+    start = time.process_time()
+    for games_data in polls:
+        games = fn(games_data)
+        if encode:
+            encode_frame(games)
+    return (time.process_time() - start) / len(polls)
+
+
+def memory_per_poll(fn, polls):
+    tracemalloc.start()
+    peaks = []
+    for games_data in polls:
+        tracemalloc.reset_peak()
+        before = tracemalloc.get_traced_memory()[0]
+        encode_frame(fn(games_data))
+        peaks.append(tracemalloc.get_traced_memory()[1] - before)
+    tracemalloc.stop()
+    return statistics.mean(peaks)
+
+
+def main(args):
+    polls = make_polls(args.games, args.polls, args.seed)
+    mismatches = sum(
+        encode_frame(models(p)) != encode_frame(scoreboard_games(p)) for p in polls
+    )
+    print(
+        f"{args.games} games, {args.polls} polls, median of {args.rounds} rounds; "
+        f"{mismatches} frames differ"
+    )
+    for name, fn in (("models", models), ("transform", scoreboard_games)):
+        mapping = statistics.median(
+            cpu_per_poll(fn, polls, False) for _ in range(args.rounds)
+        )
+        total = statistics.median(
+            cpu_per_poll(fn, polls, True) for _ in range(args.rounds)
+        )
+        peak = memory_per_poll(fn, polls)
+        print(
+            f"  {name:<10} map {mapping * 1e6:8.1f}us   "
+            f"map + encode {total * 1e6:8.1f}us   "
+            f"allocated {peak / 1024:6.1f} KiB (peak)"
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--games", type=int, default=15)
+    parser.add_argument("--polls", type=int, default=2000)
+    parser.add_argument("--rounds", type=int, default=5)
+    parser.add_argument("--seed", type=int, default=2025)
+    main(parser.parse_args())
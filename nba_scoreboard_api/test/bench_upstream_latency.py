@@ -0,0 +1,158 @@
+"""
+Benchmark: REST latency while the live scoreboard poller is running.
+
+Replaces ``scoreboard.ScoreBoard`` with a fake that blocks for a configurable
+amount of time (like a real NBA.com round trip) and measures p50/p99 latency of
+a REST route in three scenarios:
+
+  idle     - no poller
+  inline   - poller calling nba_api directly on the event loop (old behaviour)
+  offload  - the real ``fetch_scoreboard_updates`` using the upstream worker pool
+
+Usage (from nba_scoreboard_api/):
+    python test/bench_upstream_latency.py --requests 300 --upstream-latency 0.3
+"""
+
+import argparse
+import asyncio
+import os
+import statistics
+import sys
+import time
+
+sys.path.append(os.path.join(os.path.dirname(os.path.dirname(__file__)), "api"))
+os.environ.setdefault("TESTING", "True")
+
+import httpx
+
+import main
+from app.services import scoreboard as scoreboard_service
+
+UPSTREAM_LATENCY = 0.3
+
+
+class _FakeDataSet:
+    def __init__(self, data):
+        self._data = data
+
+    def get_dict(self):
+        return self._data
+
+
+class FakeScoreBoard:
+    """Stand-in for nba_api's ScoreBoard that blocks like a network call."""
+
+    def __init__(self, timeout=30, **kwargs):
+        time.sleep(UPSTREAM_LATENCY)
+        tick = int(time.time())
+        self.games = _FakeDataSet(
+            [
+                {
+                    "gameId": f"00224000{i:02d}",
+                    "gameStatus": 2,
+                    "period": 3,
+                    "gameClock": f"PT0{i % 10}M{tick % 60:02d}.00S",
+                    "gameTimeUTC": "2025-02-17T00:30:00Z",
+                    "homeTeam": {
+                        "teamId": 1610612700 + i,
+                        "teamName": "Home",
+                        "teamCity": "City",
+                        "teamTricode": "HOM",
+                        "score": 60 + tick % 40,
+                    },
+                    "awayTeam": {
+                        "teamId": 1610612750 + i,
+                        "teamName": "Away",
+                        "teamCity": "City",
+                        "teamTricode": "AWY",
+                        "score": 58 + tick % 40,
+                    },
+                }
+                for i in range(10)
+            ]
+        )
+
+
+async def inline_poller():
+    """The pre-upstream-pool poller: blocking call straight on the loop."""
+    while True:
+        FakeScoreBoard()
+        await asyncio.sleep(0.5)
+
+
+async def measure(client: httpx.AsyncClient, n_requests: int, path: str, gap: float):
+    """
+    Open-loop load: request ``i`` is due at ``t0 + i * gap`` and its latency is
+    measured from that due time, so a stalled event loop is charged to every
+    request that should have been served while it was blocked.
+    """
+    latencies = []
+
+    async def one(due: float):
+        await asyncio.sleep(max(0.0, due - time.perf_counter()))
+        response = await client.get(path)
+        latencies.append((time.perf_counter() - due) * 1000)
+        response.raise_for_status()
+
+    t0 = time.perf_counter()
+    await asyncio.gather(*(one(t0 + i * gap) for i in range(n_requests)))
+    latencies.sort()
+    return {
+        "p50": statistics.median(latencies),
+        "p99": latencies[min(len(latencies) - 1, int(len(latencies) * 0.99))],
+        "max": latencies[-1],
+    }
+
+
+async def run_scenario(name, poller_factory, n_requests, path, gap):
+    app = main.create_app()
+    transport = httpx.ASGITransport(app=app)
+    task = asyncio.create_task(poller_factory()) if poller_factory else None
+    # Let the poller get going before we start measuring
+    await asyncio.sleep(0.1)
+    try:
+        async with httpx.AsyncClient(
+            transport=transport, base_url="http://bench"
+        ) as client:
+            result = await measure(client, n_requests, path, gap)
+    finally:
+        if task:
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+    print(
+        f"{name:<8} p50={result['p50']:8.2f}ms  p99={result['p99']:8.2f}ms  "
+        f"max={result['max']:8.2f}ms"
+    )
+    return result
+
+
+async def main_async(args):
+    global UPSTREAM_LATENCY
+    UPSTREAM_LATENCY = args.upstream_latency
+    scoreboard_service.scoreboard.ScoreBoard = FakeScoreBoard
+
+    print(
+        f"{args.requests} requests to {args.path} every {args.gap * 1000:.0f}ms, "
+        f"simulated upstream latency {args.upstream_latency * 1000:.0f}ms"
+    )
+    for name, poller in (
+        ("idle", None),
+        ("inline", inline_poller),
+        ("offload", main.fetch_scoreboard_updates),
+    ):
+        await run_scenario(name, poller, args.requests, args.path, args.gap)
+    scoreboard_service.upstream_client.shutdown()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--requests", type=int, default=300)
+    parser.add_argument("--upstream-latency", type=float, default=0.3)
+    parser.add_argument(
+        "--gap", type=float, default=0.01, help="Seconds between requests"
+    )
+    parser.add_argument("--path", default="/docs")
+    asyncio.run(main_async(parser.parse_args()))
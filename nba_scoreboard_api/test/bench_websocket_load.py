@@ -0,0 +1,500 @@
+"""
+Load test: thousands of scoreboard and play-by-play WebSocket clients against the app.
+
+Runs the real app under uvicorn in a subprocess with UPSTREAM_SOURCE=replay,
+serving a recording of ``--games`` live games (generated here: scoreboard
+states from bench_polling's simulated games, play-by-play actions arriving
+every ``--action-interval`` seconds on average, each game starting with
+``--initial-actions``), or ``--recording`` if given. Then:
+
+  1. ``--clients`` scoreboard clients (protocol version 2) and
+     ``--pbp-clients`` play-by-play clients spread over the games connect
+     from ``--client-processes`` processes
+  2. everyone listens for ``--duration`` seconds
+
+Reported:
+
+  connect            - WebSocket handshake time, and time to the first frame
+  latency            - from the start of ScoreboardManager.broadcast /
+                       PlayByPlayManager._publish (logged by the server) until
+                       a client received the frame, per frame and client
+  memory/connection  - server RSS growth while connecting, per connection
+  CPU/broadcast      - server process CPU time over the listening window,
+                       divided by the broadcasts and publishes in it; also
+                       the event-loop thread's CPU inside the calls
+
+The server wraps both managers to log every broadcast; clients and server
+share the machine's clock. Linux only (reads /proc).
+
+Usage (from nba_scoreboard_api/):
+    python test/bench_websocket_load.py --clients 2000 --pbp-clients 500 --duration 60
+"""
+
+import argparse
+import asyncio
+import json
+import math
+import multiprocessing
+import os
+import random
+import re
+import socket
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import urllib.request
+from datetime import datetime, timedelta, timezone
+
+API_DIR = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "api"
+)
+sys.path.append(API_DIR)
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+os.environ.setdefault("TESTING", "True")
+
+from bench_playbyplay import make_action
+from bench_polling import FEED_PHASE, SimulatedGame
+from nba_api.live.nba.endpoints import playbyplay, scoreboard
+from websockets.asyncio.client import connect
+
+from app.services.sources import open_recording, request_key
+
+ET = timezone(timedelta(hours=-5))
+WINDOW_START = datetime(2025, 2, 27, 20, 0, tzinfo=ET).timestamp()
+SEQ = re.compile(r'"seq":(\d+)')
+
+
+def write_recording(path, n_games, seconds, action_interval, initial_actions, seed):
+    """Record ``seconds`` of ``n_games`` live games, all tipped off 30 min before."""
+    rng = random.Random(seed)
+    games = [SimulatedGame(i, WINDOW_START - 30 * 60, rng) for i in range(n_games)]
+    scoreboard_key = request_key(scoreboard.ScoreBoard, (), {})
+    records = []  # (t, key, response)
+
+    def publish_tick(t):
+        # NBA.com republishes the feeds once a second
+        return math.ceil(t - FEED_PHASE) + FEED_PHASE
+
+    end = WINDOW_START + seconds
+    ticks = sorted(
+        {WINDOW_START}
+        | {
+            publish_tick(t)
+            for game in games
+            for t in game.times
+            if WINDOW_START < t < end
+        }
+    )
+    for t in ticks:
+        board = {
+            "scoreboard": {
+                "gameDate": "2025-02-27",
+                "games": [game.live_json(t) for game in games],
+            }
+        }
+        records.append((t, scoreboard_key, json.dumps(board)))
+
+    for game in games:
+        game_id = game.live_json(WINDOW_START)["gameId"]
+        key = request_key(playbyplay.PlayByPlay, (game_id,), {})
+        actions = [make_action(number, rng) for number in range(1, initial_actions + 1)]
+        t = WINDOW_START
+        while t < end:
+            records.append(
+                (t, key, json.dumps({"game": {"gameId": game_id, "actions": actions}}))
+            )
+            t = publish_tick(t + rng.expovariate(1 / action_interval))
+            actions = actions + [make_action(len(actions) + 1, rng)]
+
+    records.sort(key=lambda record: record[0])
+    with open_recording(path, "w") as file:
+        file.write(json.dumps({"recording": 1, "started": WINDOW_START}) + "\n")
+        for t, key, response in records:
+            file.write(
+                json.dumps(
+                    {
+                        "t": round(t - WINDOW_START, 3),
+                        "endpoint": key.split("(")[0].lower(),
+                        "key": key,
+                        "elapsed": 0.05,
+                        "url": None,
+                        "response": response,
+                    }
+                )
+                + "\n"
+            )
+    return [game.live_json(WINDOW_START)["gameId"] for game in games]
+
+
+def recorded_game_ids(path):
+    """Game IDs on the first recorded live scoreboard."""
+    scoreboard_key = request_key(scoreboard.ScoreBoard, (), {})
+    with open_recording(path, "r") as file:
+        for line in file:
+            record = json.loads(line)
+            if record.get("key") == scoreboard_key:
+                return [
+                    game["gameId"]
+                    for game in json.loads(record["response"])["scoreboard"]["games"]
+                ]
+    return []
+
+
+# Server side
+
+
+def serve(args):
+    """Run the app, logging every broadcast: kind, frame key, start time, loop CPU."""
+    import uvicorn
+
+    import main
+    from app.services.scoreboard import playbyplay_manager, scoreboard_manager
+
+    log = open(args.serve_log, "a", buffering=1)
+    broadcast = scoreboard_manager.broadcast
+    publish = playbyplay_manager._publish
+
+    async def logged_broadcast(data):
+        start, cpu = time.time(), time.thread_time()
+        sent = await broadcast(data)
+        if sent:
+            log.write(
+                f"scoreboard {scoreboard_manager.sequence} {start} "
+                f"{time.thread_time() - cpu}\n"
+            )
+        return sent
+
+    async def logged_publish(game_id, actions):
+        before = playbyplay_manager.last_action_number.get(game_id, 0)
+        start, cpu = time.time(), time.thread_time()
+        await publish(game_id, actions)
+        after = playbyplay_manager.last_action_number.get(game_id, 0)
+        if after > before:
+            log.write(
+                f"playbyplay {game_id}:{after} {start} {time.thread_time() - cpu}\n"
+            )
+
+    scoreboard_manager.broadcast = logged_broadcast
+    playbyplay_manager._publish = logged_publish
+    uvicorn.run(
+        main.app, host="127.0.0.1", port=args.port, log_level="warning", backlog=4096
+    )
+
+
+def proc_cpu(pid):
+    with open(f"/proc/{pid}/stat") as file:
+        fields = file.read().rsplit(")", 1)[1].split()
+    return (int(fields[11]) + int(fields[12])) / os.sysconf("SC_CLK_TCK")
+
+
+def proc_rss(pid):
+    with open(f"/proc/{pid}/status") as file:
+        for line in file:
+            if line.startswith("VmRSS:"):
+                return int(line.split()[1]) * 1024
+    return 0
+
+
+# Client side
+
+
+async def client(url, kind, semaphore, stats, stop):
+    start = time.perf_counter()
+    try:
+        async with semaphore:
+            websocket = await connect(
+                url, max_size=None, open_timeout=60, compression=stats["compression"]
+            )
+        stats["connect"].append(time.perf_counter() - start)
+        await websocket.recv()
+        stats["first_frame"].append(time.perf_counter() - start)
+    except Exception:
+        stats["failed"] += 1
+        return
+    stats["connected"] += 1
+
+    receipts = stats["receipts"]
+    try:
+        while not stop.is_set():
+            frame = await websocket.recv()
+            received = time.time()
+            if kind == "scoreboard":
+                match = SEQ.search(frame, 0, 40)
+                if frame.startswith('{"type":"patch"') and match:
+                    receipts.append((f"scoreboard {match.group(1)}", received))
+            elif frame.startswith('{"type":"actions"'):
+                game = json.loads(frame)["game"]
+                if game["actions"]:
+                    number = max(action["actionNumber"] for action in game["actions"])
+                    receipts.append((f"playbyplay {game['gameId']}:{number}", received))
+    except asyncio.CancelledError:
+        pass
+    except Exception:
+        if not stop.is_set():
+            stats["dropped"] += 1
+    finally:
+        await websocket.close()
+
+
+async def run_clients(
+    port, specs, connect_concurrency, compression, connected, stop, results
+):
+    stats = {
+        "connect": [],
+        "first_frame": [],
+        "receipts": [],
+        "connected": 0,
+        "failed": 0,
+        "dropped": 0,
+        "compression": "deflate" if compression else None,
+    }
+    local_stop = asyncio.Event()
+    semaphore = asyncio.Semaphore(connect_concurrency)
+    tasks = [
+        asyncio.create_task(
+            client(f"ws://127.0.0.1:{port}{path}", kind, semaphore, stats, local_stop)
+        )
+        for kind, path in specs
+    ]
+    while stats["connected"] + stats["failed"] < len(specs):
+        await asyncio.sleep(0.05)
+    connected.put((stats["connected"], stats["failed"]))
+
+    await asyncio.get_running_loop().run_in_executor(None, stop.wait)
+    local_stop.set()
+    for task in tasks:
+        task.cancel()
+    await asyncio.gather(*tasks, return_exceptions=True)
+    stats.pop("compression")
+    results.put(stats)
+
+
+def client_process(
+    port, specs, connect_concurrency, compression, connected, stop, results
+):
+    asyncio.run(
+        run_clients(
+            port, specs, connect_concurrency, compression, connected, stop, results
+        )
+    )
+
+
+# Driver
+
+
+def percentiles(values, unit=1000):
+    if not values:
+        return "n/a"
+    values = sorted(values)
+    pick = lambda share: values[min(len(values) - 1, int(len(values) * share))] * unit
+    return (
+        f"p50 {pick(0.5):8.1f}ms  p95 {pick(0.95):8.1f}ms  "
+        f"p99 {pick(0.99):8.1f}ms  max {values[-1] * unit:8.1f}ms"
+    )
+
+
+def free_port():
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def wait_until_up(port, server, timeout=60):
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        if server.poll() is not None:
+            raise RuntimeError("Server exited during startup")
+        try:
+            with urllib.request.urlopen(
+                f"http://127.0.0.1:{port}/health", timeout=1
+            ) as response:
+                if json.load(response)["scoreboard_age_seconds"] is not None:
+                    return
+        except OSError:
+            pass
+        time.sleep(0.2)
+    raise RuntimeError("Server did not come up")
+
+
+def main(args):
+    directory = tempfile.TemporaryDirectory()
+    path = args.recording
+    if path is None:
+        path = os.path.join(directory.name, "night.jsonl")
+        game_ids = write_recording(
+            path,
+            args.games,
+            args.duration + 120,
+            args.action_interval,
+            args.initial_actions,
+            args.seed,
+        )
+    else:
+        game_ids = recorded_game_ids(path)
+    serve_log = os.path.join(directory.name, "broadcasts.log")
+    port = free_port()
+
+    env = dict(
+        os.environ,
+        UPSTREAM_SOURCE="replay",
+        UPSTREAM_RECORDING_PATH=path,
+        SQLALCHEMY_DATABASE_URL=f"sqlite:///{os.path.join(directory.name, 'load.db')}",
+        TESTING="True",
+    )
+    server_output = open(os.path.join(directory.name, "server.log"), "w")
+    server = subprocess.Popen(
+        [
+            sys.executable,
+            os.path.abspath(__file__),
+            "--serve",
+            "--port",
+            str(port),
+            "--serve-log",
+            serve_log,
+        ],
+        cwd=API_DIR,
+        env=env,
+        stdout=server_output,
+        stderr=subprocess.STDOUT,
+    )
+    try:
+        wait_until_up(port, server)
+        rss_base = proc_rss(server.pid)
+
+        specs = [("scoreboard", "/api/v1/scoreboard/ws?version=2")] * args.clients + [
+            (
+                "playbyplay",
+                f"/api/v1/scoreboard/ws/playbyplay/{game_ids[i % len(game_ids)]}",
+            )
+            for i in range(args.pbp_clients)
+        ]
+        context = multiprocessing.get_context("spawn")
+        connected, results, stop = context.Queue(), context.Queue(), context.Event()
+        processes = [
+            context.Process(
+                target=client_process,
+                args=(
+                    port,
+                    specs[i :: args.client_processes],
+                    args.connect_concurrency,
+                    args.compression,
+                    connected,
+                    stop,
+                    results,
+                ),
+            )
+            for i in range(args.client_processes)
+        ]
+        connect_start = time.perf_counter()
+        for process in processes:
+            process.start()
+        counts = [connected.get() for _ in processes]
+        connect_elapsed = time.perf_counter() - connect_start
+        n_connected = sum(count[0] for count in counts)
+
+        time.sleep(2)  # Let play-by-play polling and snapshots settle
+        rss_connected = proc_rss(server.pid)
+        window_start, cpu_start = time.time(), proc_cpu(server.pid)
+        time.sleep(args.duration)
+        window_end, cpu_end = time.time(), proc_cpu(server.pid)
+
+        stop.set()
+        stats = [results.get() for _ in processes]
+        for process in processes:
+            process.join()
+    finally:
+        server.terminate()
+        server.wait()
+        server_output.close()
+
+    broadcasts = {}
+    with open(serve_log) as file:
+        for line in file:
+            kind, key, start, cpu = line.split()
+            broadcasts[f"{kind} {key}"] = (kind, float(start), float(cpu))
+    in_window = {
+        key: value
+        for key, value in broadcasts.items()
+        if window_start <= value[1] <= window_end
+    }
+    latencies = {"scoreboard": [], "playbyplay": []}
+    for stat in stats:
+        for key, received in stat["receipts"]:
+            if key in in_window:
+                kind, start, _ = in_window[key]
+                latencies[kind].append(received - start)
+
+    print(
+        f"{args.clients} scoreboard + {args.pbp_clients} play-by-play clients "
+        f"on {len(game_ids)} games, "
+        f"{args.client_processes} client processes, "
+        f"compression {'on' if args.compression else 'off'}"
+    )
+    print(
+        f"connect: {n_connected} connected, {sum(c[1] for c in counts)} failed "
+        f"in {connect_elapsed:.1f}s (with client startup); "
+        f"dropped while listening: {sum(s['dropped'] for s in stats)}"
+    )
+    print(f"  handshake    {percentiles([t for s in stats for t in s['connect']])}")
+    print(f"  first frame  {percentiles([t for s in stats for t in s['first_frame']])}")
+    for kind in ("scoreboard", "playbyplay"):
+        count = sum(1 for value in in_window.values() if value[0] == kind)
+        print(
+            f"latency {kind:<11} {count:4d} broadcasts, "
+            f"{len(latencies[kind]):7d} frames  {percentiles(latencies[kind])}"
+        )
+    print(
+        f"memory: {rss_base / 2**20:.0f} MiB idle -> "
+        f"{rss_connected / 2**20:.0f} MiB connected, "
+        f"{(rss_connected - rss_base) / max(1, n_connected) / 1024:.1f} KiB "
+        "per connection"
+    )
+    total = len(in_window)
+    loop_cpu = {
+        kind: [value[2] for value in in_window.values() if value[0] == kind]
+        for kind in ("scoreboard", "playbyplay")
+    }
+    print(
+        f"CPU: server {cpu_end - cpu_start:.1f}s over {window_end - window_start:.0f}s "
+        f"({(cpu_end - cpu_start) / (window_end - window_start) * 100:.0f}%), "
+        f"{(cpu_end - cpu_start) / max(1, total) * 1000:.1f}ms per broadcast/publish"
+    )
+    for kind, values in loop_cpu.items():
+        if values:
+            print(
+                f"  event loop in {kind:<11} "
+                f"mean {statistics.mean(values) * 1000:6.2f}ms  "
+                f"max {max(values) * 1000:6.2f}ms"
+            )
+    directory.cleanup()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--clients", type=int, default=2000)
+    parser.add_argument("--pbp-clients", type=int, default=500)
+    parser.add_argument("--duration", type=float, default=60.0)
+    parser.add_argument("--games", type=int, default=8)
+    parser.add_argument("--action-interval", type=float, default=10.0)
+    parser.add_argument("--initial-actions", type=int, default=250)
+    parser.add_argument(
+        "--recording", help="Replay this recording instead of generating one"
+    )
+    parser.add_argument("--client-processes", type=int, default=4)
+    parser.add_argument(
+        "--connect-concurrency", type=int, default=200, help="Per client process"
+    )
+    parser.add_argument(
+        "--compression", action="store_true", help="Negotiate permessage-deflate"
+    )
+    parser.add_argument("--seed", type=int, default=2025)
+    parser.add_argument("--serve", action="store_true", help=argparse.SUPPRESS)
+    parser.add_argument("--port", type=int, help=argparse.SUPPRESS)
+    parser.add_argument("--serve-log", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+    if args.serve:
+        serve(args)
+    else:
+        main(args)